@@ -259,6 +259,7 @@ for filename in sorted(glob.glob("../src/awkward/**/*.py", recursive=True),
                                       .replace("/structure.py",   "%")
                                       .replace("/reducers.py",    "&")
                                       .replace("/categorical.py", "'")
+                                      .replace("/strings.py",     "(")
 
                                       .replace("/_", "/~")):
 
@@ -273,6 +274,7 @@ for filename in sorted(glob.glob("../src/awkward/**/*.py", recursive=True),
                            .replace(".operations.describe", "")
                            .replace(".operations.structure", "")
                            .replace(".operations.reducers", "")
+                           .replace(".operations.strings", ".strings")
                            .replace(".behaviors.mixins", "")
                            .replace(".behaviors.categorical", "")
                            .replace(".behaviors.string", ""))
@@ -478,6 +478,16 @@ namespace awkward {
                      bool stable,
                      bool unique = false) const;
 
+    /// @brief Assigns an integer code to each byte range
+    /// `[starts[i], stops[i])` of this one-dimensional `uint8` array, such
+    /// that equal ranges have equal codes, numbered in order of first
+    /// appearance (for dictionary encoding).
+    ///
+    /// Raises an error unless `0 <= starts[i] <= stops[i] <= length()` for
+    /// each range.
+    const Index64
+      dictionary_encode(const Index64& starts, const Index64& stops) const;
+
     const ContentPtr
       argsort_next(int64_t negaxis,
                    const Index64& starts,
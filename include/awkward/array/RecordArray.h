@@ -370,6 +370,31 @@ namespace awkward {
                    bool stable,
                    bool keepdims) const override;
 
+    /// @brief Sorts the rows of this RecordArray within each group of
+    /// `offsets` lexicographically by the fields named in `keys`, returning
+    /// the permutation.
+    ///
+    /// @param offsets Boundaries of the groups (starting at `0`, ending at
+    /// #length or less); rows are only reordered within a group.
+    /// @param keys Names of one-dimensional numeric fields, most significant
+    /// first.
+    /// @param ascending One flag per key: if `false`, that key is ordered
+    /// from largest to smallest. NaN values come after all numbers in
+    /// either direction.
+    /// @param stable If `true`, rows with equal keys keep their relative
+    /// order.
+    /// @param local If `true`, return positions relative to the start of
+    /// each group (like #argsort); otherwise, positions in this array.
+    ///
+    /// All keys are compared in a single pass, in place, without
+    /// materializing a combined key.
+    const Index64
+      argsort_by(const Index64& offsets,
+                 const std::vector<std::string>& keys,
+                 const std::vector<bool>& ascending,
+                 bool stable,
+                 bool local) const;
+
     const ContentPtr
       localindex(int64_t axis, int64_t depth) const override;
 
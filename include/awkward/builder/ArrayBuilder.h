@@ -107,6 +107,24 @@ namespace awkward {
     void
       real(double x);
 
+    /// @brief Adds an integer value `x` to the accumulated data, stored as
+    /// a given `dtype` (any boolean, integer, floating-point, or complex
+    /// type up to 64 bits per component).
+    ///
+    /// Unsigned 64-bit integers are passed as the same bit pattern in `x`.
+    void
+      typedinteger(int64_t x, util::dtype dtype);
+
+    /// @brief Adds a real value `x` to the accumulated data, stored as
+    /// a given `dtype` (such as `float32`).
+    void
+      typedreal(double x, util::dtype dtype);
+
+    /// @brief Adds a complex value `x` to the accumulated data, stored as
+    /// a given `dtype` (such as `complex64`).
+    void
+      typedcomplex(std::complex<double> x, util::dtype dtype);
+
     /// @brief Adds an unencoded, null-terminated bytestring value `x` to the
     /// accumulated data.
     void
@@ -287,6 +305,15 @@ namespace awkward {
     void
       extend(const ContentPtr& array);
 
+    /// @brief Extend the accumulated data with an entire `array` by
+    /// copying its values, rather than referencing them.
+    ///
+    /// Contiguous numbers are copied into the Builder's buffers with
+    /// `memcpy` and list offsets are shifted in one pass; see
+    /// {@link Builder#extend Builder::extend}.
+    void
+      extend_copy(const ContentPtr& array);
+
   private:
     /// @brief Internal function to replace the root node of the ArrayBuilder's
     /// Builder tree with a new root.
@@ -330,6 +357,31 @@ extern "C" {
     awkward_ArrayBuilder_real(void* arraybuilder,
                               double x);
 
+  /// @brief C interface to
+  /// {@link awkward::ArrayBuilder#typedinteger ArrayBuilder::typedinteger},
+  /// with the `dtype` given by name (e.g. `"int8"`).
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_ArrayBuilder_typedinteger(void* arraybuilder,
+                                      int64_t x,
+                                      const char* dtype);
+
+  /// @brief C interface to
+  /// {@link awkward::ArrayBuilder#typedreal ArrayBuilder::typedreal},
+  /// with the `dtype` given by name (e.g. `"float32"`).
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_ArrayBuilder_typedreal(void* arraybuilder,
+                                   double x,
+                                   const char* dtype);
+
+  /// @brief C interface to
+  /// {@link awkward::ArrayBuilder#typedcomplex ArrayBuilder::typedcomplex},
+  /// with the `dtype` given by name (e.g. `"complex64"`).
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_ArrayBuilder_typedcomplex(void* arraybuilder,
+                                      double real,
+                                      double imag,
+                                      const char* dtype);
+
   /// @brief C interface to
   /// {@link awkward::ArrayBuilder#bytestring ArrayBuilder::bytestring}.
   LIBAWKWARD_EXPORT_SYMBOL uint8_t
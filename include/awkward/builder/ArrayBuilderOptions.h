@@ -24,6 +24,21 @@ namespace awkward {
     /// {@link GrowableBuffer#reserved reserved}.
     ArrayBuilderOptions(int64_t initial, double resize);
 
+    /// @brief Creates an ArrayBuilderOptions with a page length for paged
+    /// GrowableBuffers.
+    ///
+    /// @param initial The initial number of
+    /// {@link GrowableBuffer#reserved reserved} entries for a GrowableBuffer.
+    /// @param resize The factor with which a GrowableBuffer is resized
+    /// when its {@link GrowableBuffer#length length} reaches its
+    /// {@link GrowableBuffer#reserved reserved}.
+    /// @param page_length If positive, a GrowableBuffer stops resizing
+    /// when its reservation reaches this many entries and instead appends
+    /// into new pages of this size, which are only concatenated when its
+    /// {@link GrowableBuffer#ptr ptr} is requested. If `0`, the buffer is
+    /// always contiguous.
+    ArrayBuilderOptions(int64_t initial, double resize, int64_t page_length);
+
     /// @brief The initial number of
     /// {@link GrowableBuffer#reserved reserved} entries for a GrowableBuffer.
     int64_t
@@ -35,11 +50,18 @@ namespace awkward {
     double
       resize() const;
 
+    /// @brief The number of entries in each page of a paged GrowableBuffer,
+    /// or `0` if GrowableBuffers are contiguous.
+    int64_t
+      page_length() const;
+
   private:
     /// See #initial.
     int64_t initial_;
     /// See #resize.
     double resize_;
+    /// See #page_length.
+    int64_t page_length_;
   };
 }
 
@@ -3,6 +3,7 @@
 #ifndef AWKWARD_FILLABLE_H_
 #define AWKWARD_FILLABLE_H_
 
+#include <complex>
 #include <string>
 #include <vector>
 
@@ -71,6 +72,29 @@ namespace awkward {
     virtual const BuilderPtr
       real(double x) = 0;
 
+    /// @brief Adds an integer value `x` to the accumulated data, to be
+    /// stored as a given `dtype` (rather than `int64`).
+    ///
+    /// Unsigned 64-bit integers are passed as the same bit pattern in `x`.
+    /// If `dtype` is not an integer type, `x` is converted to it.
+    virtual const BuilderPtr
+      typedinteger(int64_t x, util::dtype dtype) = 0;
+
+    /// @brief Adds a real value `x` to the accumulated data, to be stored
+    /// as a given `dtype` (rather than `float64`).
+    ///
+    /// If `dtype` is not a floating-point type, `x` is converted to it.
+    virtual const BuilderPtr
+      typedreal(double x, util::dtype dtype) = 0;
+
+    /// @brief Adds a complex value `x` to the accumulated data, to be
+    /// stored as a given `dtype` (`complex64` or `complex128`).
+    ///
+    /// If `dtype` is not a complex type, the real part of `x` is converted
+    /// to it.
+    virtual const BuilderPtr
+      typedcomplex(std::complex<double> x, util::dtype dtype) = 0;
+
     /// @brief Adds a string value `x` with a given `length` and `encoding`
     /// to the accumulated data.
     ///
@@ -143,6 +167,33 @@ namespace awkward {
     /// that shares data with the provided `array`.
     virtual const BuilderPtr
       append(const ContentPtr& array, int64_t at) = 0;
+
+    /// @brief Append every element of an arbitrary `array` (Content
+    /// instance) to the accumulated data by copying its values.
+    ///
+    /// Unlike #append, the resulting #snapshot does not share data with
+    /// the provided `array`.
+    ///
+    /// This default implementation walks over the `array`, calling
+    /// #boolean, #integer, #real, #string, #beginlist, etc. for each
+    /// element. Builders override it to copy contiguous numbers and
+    /// list offsets in bulk when the `array` matches their type.
+    /// Elements of types that cannot be described by these calls (such
+    /// as unions) are appended by reference, as in #append.
+    ///
+    /// Record names (the `"__record__"` parameter) and string types are
+    /// kept, but other parameters of the `array`, such as
+    /// `"__array__": "categorical"`, are not copied.
+    virtual const BuilderPtr
+      extend(const ContentPtr& array);
+
+  protected:
+    /// @brief Returns the `array` as a
+    /// {@link ListOffsetArrayOf ListOffsetArray64} if it is any kind of
+    /// list (ListArray, ListOffsetArray, or RegularArray); otherwise,
+    /// returns `nullptr`.
+    static const ContentPtr
+      aslistoffsetarray64(const ContentPtr& array);
   };
 }
 
@@ -67,6 +67,15 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      typedinteger(int64_t x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedreal(double x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedcomplex(std::complex<double> x, util::dtype dtype) override;
+
     const BuilderPtr
       string(const char* x, int64_t length, const char* encoding) override;
 
@@ -97,6 +106,13 @@ namespace awkward {
     const BuilderPtr
       append(const ContentPtr& array, int64_t at) override;
 
+    /// @copydoc Builder::extend()
+    ///
+    /// A one-dimensional NumpyArray of `float64` is copied into the #buffer
+    /// with a single `memcpy`.
+    const BuilderPtr
+      extend(const ContentPtr& array) override;
+
   private:
     const ArrayBuilderOptions options_;
     GrowableBuffer<double> buffer_;
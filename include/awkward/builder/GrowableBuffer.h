@@ -4,7 +4,9 @@
 #define AWKWARD_GROWABLEBUFFER_H_
 
 #include <cmath>
+#include <complex>
 #include <cstring>
+#include <vector>
 
 #include "awkward/common.h"
 #include "awkward/builder/ArrayBuilderOptions.h"
@@ -39,6 +41,15 @@ namespace awkward {
   /// delete or take advantage of. However, many operations require buffers
   /// to be rewritten; under normal circumstances, it would soon be replaced
   /// by a more appropriately sized buffer.
+  ///
+  /// If {@link ArrayBuilderOptions#page_length ArrayBuilderOptions::page_length}
+  /// is positive, the buffer is paged: once its reservation reaches the
+  /// page length, it no longer reallocates and copies, but closes the
+  /// current page and appends into a new one. The pages are concatenated
+  /// into one contiguous buffer only when #ptr is requested (as in a
+  /// snapshot), and each page is released as soon as it has been copied,
+  /// so that the peak memory use stays close to the final size of the
+  /// array, rather than `1 + resize` times it.
   template <typename T>
   class LIBAWKWARD_EXPORT_SYMBOL GrowableBuffer {
   public:
@@ -102,6 +113,8 @@ namespace awkward {
     GrowableBuffer(const ArrayBuilderOptions& options);
 
     /// @brief Reference-counted pointer to the array buffer.
+    ///
+    /// If the buffer is paged, this concatenates the pages first.
     const std::shared_ptr<T>
       ptr() const;
 
@@ -152,19 +165,43 @@ namespace awkward {
     void
       append(T datum);
 
+    /// @brief Inserts `length` elements from a contiguous array at `ptr`
+    /// with a single `memcpy` (one per page, if paged), possibly
+    /// triggering a reallocation.
+    ///
+    /// This increases the #length by `length`.
+    void
+      extend(const T* ptr, int64_t length);
+
     /// @brief Returns the element at a given position in the array, without
     /// handling negative indexing or bounds-checking.
     T
       getitem_at_nowrap(int64_t at) const;
 
   private:
+    /// @brief Makes room for at least one more element in the current
+    /// page, either by reallocating or (if paged) by starting a new page.
+    void
+      grow();
+
+    /// @brief Copies all closed pages and the current page into one
+    /// contiguous buffer, which becomes the current page.
+    void
+      concatenate() const;
+
     const ArrayBuilderOptions options_;
-    // @brief See #ptr.
-    std::shared_ptr<T> ptr_;
-    // @brief See #length.
-    int64_t length_;
-    // @brief See #reserved.
-    int64_t reserved_;
+    // @brief See #ptr; if paged, only the current page.
+    mutable std::shared_ptr<T> ptr_;
+    // @brief See #length; if paged, only in the current page.
+    mutable int64_t length_;
+    // @brief See #reserved; if paged, only in the current page.
+    mutable int64_t reserved_;
+    // @brief Closed pages, which precede the current page.
+    mutable std::vector<std::shared_ptr<T>> pages_;
+    // @brief Number of elements in each of the #pages_.
+    mutable std::vector<int64_t> pagelengths_;
+    // @brief Total number of elements in the #pages_.
+    mutable int64_t pagedlength_;
   };
 }
 
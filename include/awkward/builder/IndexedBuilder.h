@@ -62,6 +62,15 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      typedinteger(int64_t x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedreal(double x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedcomplex(std::complex<double> x, util::dtype dtype) override;
+
     const BuilderPtr
       string(const char* x, int64_t length, const char* encoding) override;
 
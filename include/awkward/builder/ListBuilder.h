@@ -70,6 +70,15 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      typedinteger(int64_t x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedreal(double x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedcomplex(std::complex<double> x, util::dtype dtype) override;
+
     const BuilderPtr
       string(const char* x, int64_t length, const char* encoding) override;
 
@@ -100,6 +109,14 @@ namespace awkward {
     const BuilderPtr
       append(const ContentPtr& array, int64_t at) override;
 
+    /// @copydoc Builder::extend()
+    ///
+    /// If not #active, the offsets of any kind of list are shifted and
+    /// appended in one pass and the #content is extended with all of the
+    /// list contents at once.
+    const BuilderPtr
+      extend(const ContentPtr& array) override;
+
   private:
     const ArrayBuilderOptions options_;
     GrowableBuffer<int64_t> offsets_;
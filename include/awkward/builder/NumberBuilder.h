@@ -0,0 +1,164 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#ifndef AWKWARD_NUMBERBUILDER_H_
+#define AWKWARD_NUMBERBUILDER_H_
+
+#include <complex>
+
+#include "awkward/common.h"
+#include "awkward/builder/ArrayBuilderOptions.h"
+#include "awkward/builder/GrowableBuffer.h"
+#include "awkward/builder/Builder.h"
+
+namespace awkward {
+  /// @class NumberBuilder
+  ///
+  /// @brief Builder node that accumulates numbers of an explicitly chosen
+  /// type `T`, such as `int8_t`, `float`, or `std::complex<float>`.
+  ///
+  /// NumberBuilders are only filled by Builder#typedinteger,
+  /// Builder#typedreal, and Builder#typedcomplex with a matching `dtype`,
+  /// so the accumulated array is never wider than requested. Numbers of
+  /// any other (or unspecified) type start a union, which is simplified
+  /// into a single NumpyArray of the common type in the #snapshot.
+  ///
+  /// The `int64`, `float64`, and `bool` types are handled by Int64Builder,
+  /// Float64Builder, and BoolBuilder instead; see
+  /// #numberbuilder_fromdtype.
+  template <typename T>
+  class LIBAWKWARD_EXPORT_SYMBOL NumberBuilder: public Builder {
+  public:
+    /// @brief Create an empty NumberBuilder.
+    /// @param options Configuration options for building an array;
+    /// these are passed to every Builder's constructor.
+    static const BuilderPtr
+      fromempty(const ArrayBuilderOptions& options);
+
+    /// @brief Create a NumberBuilder from a full set of parameters.
+    ///
+    /// @param options Configuration options for building an array;
+    /// these are passed to every Builder's constructor.
+    /// @param buffer Contains the accumulated numbers.
+    NumberBuilder(const ArrayBuilderOptions& options,
+                  const GrowableBuffer<T>& buffer);
+
+    /// @brief Contains the accumulated numbers.
+    const GrowableBuffer<T>
+      buffer() const;
+
+    /// @brief The type of the accumulated numbers.
+    util::dtype
+      dtype() const;
+
+    /// @brief User-friendly name of this class: `"NumberBuilder"`.
+    const std::string
+      classname() const override;
+
+    int64_t
+      length() const override;
+
+    void
+      clear() override;
+
+    const ContentPtr
+      snapshot() const override;
+
+    /// @copydoc Builder::active()
+    ///
+    /// A NumberBuilder is never active.
+    bool
+      active() const override;
+
+    const BuilderPtr
+      null() override;
+
+    const BuilderPtr
+      boolean(bool x) override;
+
+    const BuilderPtr
+      integer(int64_t x) override;
+
+    const BuilderPtr
+      real(double x) override;
+
+    const BuilderPtr
+      typedinteger(int64_t x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedreal(double x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedcomplex(std::complex<double> x, util::dtype dtype) override;
+
+    const BuilderPtr
+      string(const char* x, int64_t length, const char* encoding) override;
+
+    const BuilderPtr
+      beginlist() override;
+
+    const BuilderPtr
+      endlist() override;
+
+    const BuilderPtr
+      begintuple(int64_t numfields) override;
+
+    const BuilderPtr
+      index(int64_t index) override;
+
+    const BuilderPtr
+      endtuple() override;
+
+    const BuilderPtr
+      beginrecord(const char* name, bool check) override;
+
+    const BuilderPtr
+      field(const char* key, bool check) override;
+
+    const BuilderPtr
+      endrecord() override;
+
+    const BuilderPtr
+      append(const ContentPtr& array, int64_t at) override;
+
+    /// @copydoc Builder::extend()
+    ///
+    /// A one-dimensional NumpyArray of the same #dtype is copied into the #buffer
+    /// with a single `memcpy`.
+    const BuilderPtr
+      extend(const ContentPtr& array) override;
+
+  private:
+    const ArrayBuilderOptions options_;
+    GrowableBuffer<T> buffer_;
+  };
+
+  using Int8Builder = NumberBuilder<int8_t>;
+  using Int16Builder = NumberBuilder<int16_t>;
+  using Int32Builder = NumberBuilder<int32_t>;
+  using UInt8Builder = NumberBuilder<uint8_t>;
+  using UInt16Builder = NumberBuilder<uint16_t>;
+  using UInt32Builder = NumberBuilder<uint32_t>;
+  using UInt64Builder = NumberBuilder<uint64_t>;
+  using Float32Builder = NumberBuilder<float>;
+  using Complex64Builder = NumberBuilder<std::complex<float>>;
+  using Complex128Builder = NumberBuilder<std::complex<double>>;
+
+  /// @brief Create an empty Builder for numbers of a given `dtype`:
+  /// a BoolBuilder, Int64Builder, Float64Builder, or NumberBuilder.
+  /// @param options Configuration options for building an array;
+  /// these are passed to every Builder's constructor.
+  /// @param dtype The type of numbers to accumulate.
+  ///
+  /// Raises an error if the `dtype` is not supported.
+  LIBAWKWARD_EXPORT_SYMBOL const BuilderPtr
+    numberbuilder_fromdtype(const ArrayBuilderOptions& options,
+                            util::dtype dtype);
+
+  /// @brief Returns `true` if a `builder` accumulates numbers of exactly
+  /// the given `dtype` (whether a NumberBuilder or one of the untyped
+  /// builders).
+  LIBAWKWARD_EXPORT_SYMBOL bool
+    numberbuilder_holds(const Builder* builder, util::dtype dtype);
+}
+
+#endif // AWKWARD_NUMBERBUILDER_H_
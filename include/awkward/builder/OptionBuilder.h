@@ -77,6 +77,15 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      typedinteger(int64_t x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedreal(double x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedcomplex(std::complex<double> x, util::dtype dtype) override;
+
     const BuilderPtr
       string(const char* x, int64_t length, const char* encoding) override;
 
@@ -107,6 +116,13 @@ namespace awkward {
     const BuilderPtr
       append(const ContentPtr& array, int64_t at) override;
 
+    /// @copydoc Builder::extend()
+    ///
+    /// If not #active and the `array` has no missing values, the #content
+    /// is extended with the whole `array` at once.
+    const BuilderPtr
+      extend(const ContentPtr& array) override;
+
   private:
     const ArrayBuilderOptions options_;
     GrowableBuffer<int64_t> index_;
@@ -88,6 +88,15 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      typedinteger(int64_t x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedreal(double x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedcomplex(std::complex<double> x, util::dtype dtype) override;
+
     const BuilderPtr
       string(const char* x, int64_t length, const char* encoding) override;
 
@@ -118,6 +127,14 @@ namespace awkward {
     const BuilderPtr
       append(const ContentPtr& array, int64_t at) override;
 
+    /// @copydoc Builder::extend()
+    ///
+    /// If not #active and the `array` is a RecordArray with the same name,
+    /// each field's Builder is extended with the whole field at once;
+    /// fields that the `array` does not have are filled with None.
+    const BuilderPtr
+      extend(const ContentPtr& array) override;
+
   private:
     const BuilderPtr
       field_fast(const char* key);
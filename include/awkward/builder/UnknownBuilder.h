@@ -59,6 +59,15 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      typedinteger(int64_t x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedreal(double x, util::dtype dtype) override;
+
+    const BuilderPtr
+      typedcomplex(std::complex<double> x, util::dtype dtype) override;
+
     const BuilderPtr
       string(const char* x, int64_t length, const char* encoding) override;
 
@@ -89,6 +98,16 @@ namespace awkward {
     const BuilderPtr
       append(const ContentPtr& array, int64_t at) override;
 
+    /// @copydoc Builder::extend()
+    ///
+    /// The first `array` determines the type: a one-dimensional NumpyArray
+    /// becomes a NumberBuilder (or BoolBuilder, Int64Builder, Float64Builder)
+    /// of its `dtype`, a list becomes a ListBuilder, strings become a
+    /// StringBuilder, and records become a RecordBuilder or TupleBuilder,
+    /// all of which are then filled in bulk.
+    const BuilderPtr
+      extend(const ContentPtr& array) override;
+
   private:
     const ArrayBuilderOptions options_;
     int64_t nullcount_;
@@ -12,6 +12,7 @@
 
 namespace awkward {
   class Content;
+  class Form;
 
   /// @class ToJson
   ///
@@ -294,12 +295,16 @@ namespace awkward {
   /// representation in JSON format
   /// @param minus_infinity_string user-defined string for a negative
   /// infinity representation in JSON format
+  /// @param form If not `nullptr`, the data must be a single JSON array
+  /// whose items match this Form; they are written directly into typed
+  /// buffers without an ArrayBuilder's type discovery.
   LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
     FromJsonString(const char* source,
                    const ArrayBuilderOptions& options,
                    const char* nan_string = nullptr,
                    const char* infinity_string = nullptr,
-                   const char* minus_infinity_string = nullptr);
+                   const char* minus_infinity_string = nullptr,
+                   const std::shared_ptr<Form>& form = nullptr);
 
   /// @brief Convert a JSON-encoded file into a Content array using an
   /// ArrayBuilder.
@@ -314,13 +319,82 @@ namespace awkward {
   /// representation in JSON format
   /// @param minus_infinity_string user-defined string for a negative
   /// infinity representation in JSON format
+  /// @param form If not `nullptr`, the data must be a single JSON array
+  /// whose items match this Form; they are written directly into typed
+  /// buffers without an ArrayBuilder's type discovery.
   LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
     FromJsonFile(FILE* source,
                  const ArrayBuilderOptions& options,
                  int64_t buffersize,
                  const char* nan_string = nullptr,
                  const char* infinity_string = nullptr,
-                 const char* minus_infinity_string = nullptr);
+                 const char* minus_infinity_string = nullptr,
+                 const std::shared_ptr<Form>& form = nullptr);
+
+
+  /// @class FromJsonFileChunks
+  ///
+  /// @brief Reads a file containing a sequence of JSON documents, such as
+  /// JSON Lines (newline-delimited JSON), in chunks of a bounded number of
+  /// documents or bytes.
+  ///
+  /// Only the intermediate buffer and the current chunk are held in memory;
+  /// each call to #next starts a new ArrayBuilder, so arrays returned by
+  /// earlier calls remain valid and each chunk's type is discovered
+  /// independently.
+  class LIBAWKWARD_EXPORT_SYMBOL FromJsonFileChunks {
+  public:
+    /// @brief Creates a FromJsonFileChunks with a full set of parameters.
+    ///
+    /// @param source C file handle to a file containing a sequence of JSON
+    /// documents. The handle is not closed by this object.
+    /// @param options Configuration options for building an array with an
+    /// ArrayBuilder.
+    /// @param buffersize Number of bytes for an intermediate buffer.
+    /// @param nan_string user-defined string for a not-a-number (NaN) value
+    /// representation in JSON format
+    /// @param infinity_string user-defined string for a positive infinity
+    /// representation in JSON format
+    /// @param minus_infinity_string user-defined string for a negative
+    /// infinity representation in JSON format
+    /// @param form If not `nullptr`, each JSON document must match this
+    /// Form (see FromJsonFile).
+    FromJsonFileChunks(FILE* source,
+                       const ArrayBuilderOptions& options,
+                       int64_t buffersize,
+                       const char* nan_string = nullptr,
+                       const char* infinity_string = nullptr,
+                       const char* minus_infinity_string = nullptr,
+                       const std::shared_ptr<Form>& form = nullptr);
+    /// @brief Empty destructor; required for some C++ reason.
+    ~FromJsonFileChunks();
+
+    /// @brief Not copyable, since it owns its intermediate buffer.
+    FromJsonFileChunks(const FromJsonFileChunks&) = delete;
+
+    /// @brief Not copyable, since it owns its intermediate buffer.
+    FromJsonFileChunks&
+      operator=(const FromJsonFileChunks&) = delete;
+
+    /// @brief Reads the next chunk of JSON documents as an array with one
+    /// entry per document, or returns `nullptr` if the file is exhausted.
+    ///
+    /// @param maxentries Maximum number of documents in the chunk or `-1`
+    /// for no limit.
+    /// @param maxbytes The chunk ends with the first document that brings
+    /// the number of bytes read to at least this value, or `-1` for no
+    /// limit.
+    const std::shared_ptr<Content>
+      next(int64_t maxentries, int64_t maxbytes);
+
+    /// @brief Number of bytes read from the file so far.
+    int64_t
+      tell() const;
+
+  private:
+    class Impl;
+    Impl* impl_;
+  };
 
 }
 
@@ -1715,6 +1715,29 @@ namespace awkward {
       bool ascending,
       bool stable);
 
+    ERROR ListOffsetArray_argsort_strings(
+      kernel::lib ptr_lib,
+      int64_t* tocarry,
+      const uint8_t* stringdata,
+      const int64_t* stringstarts,
+      const int64_t* stringstops,
+      int64_t length,
+      const int64_t* offsets,
+      int64_t offsetslength,
+      bool ascending,
+      bool stable,
+      bool local);
+
+    ERROR NumpyArray_dictionary_encode_uint8(
+      kernel::lib ptr_lib,
+      int64_t* tocodes,
+      int64_t* tolength,
+      const uint8_t* fromptr,
+      const int64_t* fromstarts,
+      const int64_t* fromstops,
+      int64_t length,
+      int64_t lencontent);
+
     template <typename T>
     ERROR NumpyArray_sort_asstrings(
       kernel::lib ptr_lib,
@@ -3,6 +3,10 @@
 #ifndef AWKWARD_KERNEL_UTILS_H_
 #define AWKWARD_KERNEL_UTILS_H_
 
+#include <algorithm>
+#include <thread>
+#include <vector>
+
 #include "common.h"
 
 extern "C" {
@@ -111,6 +115,121 @@ extern "C" {
   EXPORT_SYMBOL void* awkward_malloc(int64_t bytelength);
   EXPORT_SYMBOL void awkward_free(void const *ptr);
 
+  /// @brief Sets the maximum number of threads that parallelizable CPU
+  /// kernels may use; `1` (the default) runs everything serially and
+  /// `0` uses as many threads as the hardware supports.
+  EXPORT_SYMBOL void
+    awkward_set_num_threads(
+      int64_t num_threads);
+
+  /// @brief The maximum number of threads that parallelizable CPU kernels
+  /// may use (at least `1`).
+  EXPORT_SYMBOL int64_t
+    awkward_num_threads();
+
+}
+
+/// @brief Kernels with fewer items than this run serially, since starting
+/// threads would cost more than it saves.
+const int64_t kParallelMinimum = 65536;
+
+/// @brief Calls `f(start, stop)` on the consecutive ranges in `bounds`
+/// (of length `numranges + 1`), each in its own thread but the first.
+template <typename F>
+void awkward_parallel_bounds(
+  const std::vector<int64_t>& bounds,
+  const F& f) {
+  std::vector<std::thread> threads;
+  for (size_t t = 2;  t < bounds.size();  t++) {
+    if (bounds[t - 1] < bounds[t]) {
+      threads.emplace_back(f, bounds[t - 1], bounds[t]);
+    }
+  }
+  f(bounds[0], bounds[1]);
+  for (auto& thread : threads) {
+    thread.join();
+  }
+}
+
+/// @brief Calls `f(start, stop)` on consecutive ranges covering
+/// `[0, length)` of independent sublists, in parallel if
+/// #awkward_num_threads allows and the work is large enough.
+///
+/// If `offsets` (of length `length + 1`) is not `nullptr`, the ranges are
+/// chosen to have about the same number of items, rather than of sublists.
+/// Each sublist is handled by exactly one call of `f`.
+template <typename F>
+void awkward_parallel_ranges(
+  int64_t length,
+  const int64_t* offsets,
+  const F& f) {
+  int64_t numthreads = std::min(awkward_num_threads(), length);
+  int64_t work = (offsets == nullptr ? length : offsets[length] - offsets[0]);
+  if (numthreads <= 1  ||  work < kParallelMinimum) {
+    f(0, length);
+    return;
+  }
+  std::vector<int64_t> bounds((size_t)numthreads + 1, length);
+  bounds[0] = 0;
+  for (int64_t t = 1;  t < numthreads;  t++) {
+    int64_t bound;
+    if (offsets == nullptr) {
+      bound = (length / numthreads) * t;
+    }
+    else {
+      int64_t target = offsets[0] + (work / numthreads) * t;
+      bound = std::lower_bound(offsets, offsets + length, target) - offsets;
+    }
+    bounds[(size_t)t] = std::max(bound, bounds[(size_t)t - 1]);
+  }
+  awkward_parallel_bounds(bounds, f);
+}
+
+/// @brief Calls `f(start, stop)` on consecutive ranges covering
+/// `[0, lenparents)`, in parallel if #awkward_num_threads allows, the work
+/// is large enough, and `parents` is non-decreasing.
+///
+/// Ranges are only split where the parent changes, so each output (parent)
+/// is accumulated by exactly one call of `f`, in the same order as a serial
+/// loop: the result is bit-for-bit the same as `f(0, lenparents)`.
+template <typename F>
+void awkward_parallel_parents(
+  const int64_t* parents,
+  int64_t lenparents,
+  const F& f) {
+  int64_t numthreads = std::min(awkward_num_threads(), lenparents);
+  if (numthreads <= 1  ||  lenparents < kParallelMinimum) {
+    f(0, lenparents);
+    return;
+  }
+  std::vector<int64_t> bounds((size_t)numthreads + 1, lenparents);
+  bounds[0] = 0;
+  for (int64_t t = 1;  t < numthreads;  t++) {
+    int64_t bound = std::max((lenparents / numthreads) * t,
+                             bounds[(size_t)t - 1]);
+    while (bound > 0  &&  bound < lenparents  &&
+           parents[bound] == parents[bound - 1]) {
+      bound++;
+    }
+    bounds[(size_t)t] = bound;
+  }
+  std::vector<char> sorted((size_t)numthreads, 1);
+  awkward_parallel_bounds(bounds, [&](int64_t start, int64_t stop) {
+    size_t t = (size_t)(std::upper_bound(bounds.begin(), bounds.end(), start)
+                        - bounds.begin()) - 1;
+    for (int64_t i = std::max(start, (int64_t)1);  i < stop;  i++) {
+      if (parents[i - 1] > parents[i]) {
+        sorted[t] = 0;
+        return;
+      }
+    }
+  });
+  if (std::find(sorted.begin(), sorted.end(), 0) == sorted.end()) {
+    awkward_parallel_bounds(bounds, f);
+  }
+  else {
+    f(0, lenparents);
+  }
 }
 
 #endif // AWKWARD_KERNEL_UTILS_H_
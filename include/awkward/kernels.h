@@ -2550,6 +2550,29 @@ extern "C" {
     int64_t lenparents,
     int64_t outlength);
 
+  EXPORT_SYMBOL ERROR
+  awkward_ListOffsetArray_argsort_strings(
+    int64_t* tocarry,
+    const uint8_t* stringdata,
+    const int64_t* stringstarts,
+    const int64_t* stringstops,
+    int64_t length,
+    const int64_t* offsets,
+    int64_t offsetslength,
+    bool ascending,
+    bool stable,
+    bool local);
+
+  EXPORT_SYMBOL ERROR
+  awkward_NumpyArray_dictionary_encode_uint8(
+    int64_t* tocodes,
+    int64_t* tolength,
+    const uint8_t* fromptr,
+    const int64_t* fromstarts,
+    const int64_t* fromstops,
+    int64_t length,
+    int64_t lencontent);
+
   EXPORT_SYMBOL ERROR
   awkward_NumpyArray_sort_asstrings_uint8(
     uint8_t* toptr,
@@ -8,6 +8,7 @@
 #include <pybind11/pybind11.h>
 
 #include "awkward/kernel-dispatch.h"
+#include "awkward/kernel-utils.h"
 
 namespace py = pybind11;
 namespace ak = awkward;
@@ -45,8 +45,9 @@ public:
     Py_INCREF(pyobj_);
   }
   /// @brief Called by `std::shared_ptr` when its reference count reaches
-  /// zero.
+  /// zero, which may happen in C++ code that has released the GIL.
   void operator()(T const *p) {
+    py::gil_scoped_acquire acquire;
     Py_DECREF(pyobj_);
   }
 private:
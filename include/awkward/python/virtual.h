@@ -7,6 +7,7 @@
 
 #include "awkward/virtual/ArrayGenerator.h"
 #include "awkward/virtual/ArrayCache.h"
+#include "awkward/virtual/VirtualArrayRecorder.h"
 
 namespace py = pybind11;
 namespace ak = awkward;
@@ -19,7 +20,8 @@ public:
                    int64_t length,
                    const py::object& callable,
                    const py::tuple& args,
-                   const py::dict& kwargs);
+                   const py::dict& kwargs,
+                   bool accepts_range);
 
   const py::object
     callable() const;
@@ -33,6 +35,14 @@ public:
   const ak::ContentPtr
     generate() const override;
 
+  bool
+    accepts_range() const override;
+
+  /// @brief Calls the #callable with `start` and `stop` keyword arguments
+  /// (in addition to #args and #kwargs) if it #accepts_range.
+  const ak::ContentPtr
+    generate_range(int64_t start, int64_t stop) const override;
+
   const std::string
     tostring_part(const std::string& indent,
                   const std::string& pre,
@@ -63,6 +73,7 @@ private:
   const py::object callable_;
   const py::tuple args_;
   const py::dict kwargs_;
+  const bool accepts_range_;
 };
 
 py::class_<PyArrayGenerator, std::shared_ptr<PyArrayGenerator>>
@@ -103,4 +114,24 @@ private:
 py::class_<PyArrayCache, std::shared_ptr<PyArrayCache>>
 make_PyArrayCache(const py::handle& m, const std::string& name);
 
+////////// BoundedArrayCache
+
+py::class_<ak::BoundedArrayCache, std::shared_ptr<ak::BoundedArrayCache>>
+make_BoundedArrayCache(const py::handle& m, const std::string& name);
+
+////////// VirtualArrayRecorder
+
+py::class_<ak::VirtualArrayRecorder, std::shared_ptr<ak::VirtualArrayRecorder>>
+make_VirtualArrayRecorder(const py::handle& m, const std::string& name);
+
+/// @brief Converts a PyArrayCache or BoundedArrayCache into its Python
+/// object, or `None` for `nullptr`.
+py::object
+box_cache(const ak::ArrayCachePtr& cache);
+
+/// @brief Converts a Python ArrayCache or BoundedArrayCache (or `None`) into
+/// a C++ ArrayCache.
+ak::ArrayCachePtr
+unbox_cache(const py::object& cache);
+
 #endif // AWKWARDPY_VIRTUAL_H_
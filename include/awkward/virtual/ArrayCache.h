@@ -3,6 +3,12 @@
 #ifndef AWKWARD_ARRAYCACHE_H_
 #define AWKWARD_ARRAYCACHE_H_
 
+#include <mutex>
+#include <set>
+#include <tuple>
+#include <unordered_map>
+#include <vector>
+
 #include "awkward/Content.h"
 
 namespace awkward {
@@ -49,6 +55,133 @@ namespace awkward {
   // large), define it in this file and implement it in
   // src/libawkward/virtual/ArrayCache.cpp.
 
+  /// @class BoundedArrayCache
+  ///
+  /// @brief Pure C++ cache that holds at most #limit_bytes of arrays (as
+  /// measured by {@link Content#nbytes Content::nbytes}), evicting the
+  /// least recently used (`"lru"`) or least frequently used (`"lfu"`)
+  /// arrays first.
+  ///
+  /// All methods are protected by a mutex, so the cache may be shared among
+  /// threads. Arrays that are replaced or evicted are destroyed after the
+  /// mutex is released, so none of them call into Python while holding it.
+  class LIBAWKWARD_EXPORT_SYMBOL BoundedArrayCache: public ArrayCache {
+  public:
+    /// @brief Eviction policies.
+    enum class Policy {lru, lfu};
+
+    /// @brief Creates a BoundedArrayCache.
+    ///
+    /// @param limit_bytes Maximum total number of bytes to hold; an array
+    /// that is larger than this on its own is not stored at all.
+    /// @param policy Which arrays to evict first.
+    BoundedArrayCache(int64_t limit_bytes, Policy policy);
+
+    /// @brief Converts `"lru"` or `"lfu"` into a Policy.
+    static Policy
+      policy_from_name(const std::string& name);
+
+    /// @brief Maximum total number of bytes to hold.
+    int64_t
+      limit_bytes() const;
+
+    /// @brief The eviction policy.
+    Policy
+      policy() const;
+
+    /// @brief Name of the eviction policy, `"lru"` or `"lfu"`.
+    const std::string
+      policy_name() const;
+
+    /// @brief Total number of bytes currently held.
+    int64_t
+      nbytes() const;
+
+    /// @brief Number of arrays currently held.
+    int64_t
+      length() const;
+
+    /// @brief Number of times #get found an array.
+    int64_t
+      hits() const;
+
+    /// @brief Number of times #get did not find an array.
+    int64_t
+      misses() const;
+
+    /// @brief Number of arrays removed to make room for others (not
+    /// including explicit #remove or #clear).
+    int64_t
+      evictions() const;
+
+    /// @brief Keys of the arrays currently held, in the order in which
+    /// they would be evicted.
+    const std::vector<std::string>
+      keys() const;
+
+    /// @brief Returns true if `key` is held, without counting it as a hit
+    /// or a miss or affecting its eviction order.
+    bool
+      contains(const std::string& key) const;
+
+    ContentPtr
+      get(const std::string& key) const override;
+
+    void
+      set(const std::string& key, const ContentPtr& value) override;
+
+    /// @brief Removes the array at `key`; returns false if there was none.
+    bool
+      remove(const std::string& key);
+
+    /// @brief Removes all arrays and resets the counters.
+    void
+      clear();
+
+    bool
+      is_broken() const override;
+
+    const std::string
+      tostring_part(const std::string& indent,
+                    const std::string& pre,
+                    const std::string& post) const override;
+
+  private:
+    struct Entry {
+      ContentPtr value;
+      int64_t nbytes;
+      int64_t frequency;
+      int64_t tick;
+    };
+
+    /// @brief Eviction order: (frequency or 0, last access, key).
+    using Order = std::tuple<int64_t, int64_t, std::string>;
+
+    const Order
+      order(const std::string& key, const Entry& entry) const;
+
+    /// @brief Removes entries until #nbytes is at most `limit`; must be
+    /// called with the mutex locked.
+    ///
+    /// The evicted arrays are moved into `dropped`, so that the caller can
+    /// destroy them after releasing the mutex: a Python-owned buffer takes
+    /// the GIL in its deleter, and a thread holding the GIL may be waiting
+    /// for the mutex.
+    void
+      evict(int64_t limit, std::vector<ContentPtr>& dropped);
+
+    const int64_t limit_bytes_;
+    const Policy policy_;
+    mutable std::mutex mutex_;
+    mutable std::unordered_map<std::string, Entry> entries_;
+    mutable std::set<Order> order_;
+    mutable int64_t clock_;
+    mutable int64_t hits_;
+    mutable int64_t misses_;
+    int64_t evictions_;
+    int64_t nbytes_;
+  };
+
 }
 
 #endif // AWKWARD_ARRAYCACHE_H_
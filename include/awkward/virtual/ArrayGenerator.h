@@ -58,6 +58,32 @@ namespace awkward {
     const ContentPtr
       generate_and_check();
 
+    /// @brief Returns `true` if this generator can create a range of its
+    /// array, from `start` to `stop`, without creating the whole array.
+    ///
+    /// The default is `false`. Generators that can read only part of their
+    /// data, such as a range of rows from a file, override it (and
+    /// #generate_range).
+    virtual bool
+      accepts_range() const;
+
+    /// @brief Creates the range from `start` to `stop` of the array but
+    /// does not check it against the #form.
+    ///
+    /// The default implementation generates the whole array and slices it.
+    ///
+    /// @param start The inclusive starting position, already regularized
+    /// to be non-negative.
+    /// @param stop The exclusive stopping position, already regularized to
+    /// be no less than `start` and no greater than #length.
+    virtual const ContentPtr
+      generate_range(int64_t start, int64_t stop) const;
+
+    /// @brief Creates the range from `start` to `stop` of the array and
+    /// checks it against the #form and the length of the range.
+    const ContentPtr
+      generate_range_and_check(int64_t start, int64_t stop) const;
+
     /// @brief Returns a string representation of this ArrayGenerator.
     virtual const std::string
       tostring_part(const std::string& indent,
@@ -114,6 +140,14 @@ namespace awkward {
     const ContentPtr
       generate() const override;
 
+    /// @brief Returns `true` if the #slice is a single range with step 1,
+    /// so that a range within it can be passed down to the #content.
+    bool
+      accepts_range() const override;
+
+    const ContentPtr
+      generate_range(int64_t start, int64_t stop) const override;
+
     const std::string
       tostring_part(const std::string& indent,
                     const std::string& pre,
@@ -0,0 +1,96 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#ifndef AWKWARD_VIRTUALARRAYRECORDER_H_
+#define AWKWARD_VIRTUALARRAYRECORDER_H_
+
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <vector>
+
+#include "awkward/common.h"
+
+namespace awkward {
+  class VirtualArrayRecorder;
+  using VirtualArrayRecorderPtr = std::shared_ptr<VirtualArrayRecorder>;
+
+  /// @class VirtualArrayRecorder
+  ///
+  /// @brief Counts what happens when VirtualArrays are materialized, per
+  /// {@link VirtualArray#cache_key VirtualArray::cache_key}: how many times
+  /// the array was found in the cache, how many times it was generated, how
+  /// long generating took, and how many bytes were generated.
+  ///
+  /// Recording is opt-in: a recorder only receives events between #start
+  /// and #stop, and when no recorder is active, VirtualArray does not even
+  /// read the clock. Several recorders may be active at once, and all
+  /// methods may be called from any thread.
+  class LIBAWKWARD_EXPORT_SYMBOL VirtualArrayRecorder {
+  public:
+    /// @brief Statistics for one `cache_key`.
+    struct Entry {
+      /// @brief Number of times the array was found in the cache.
+      int64_t hits;
+      /// @brief Number of times the ArrayGenerator was called.
+      int64_t generated;
+      /// @brief Total wall time spent in the ArrayGenerator, in seconds.
+      double seconds;
+      /// @brief Total {@link Content#nbytes Content::nbytes} of the
+      /// generated arrays.
+      int64_t nbytes;
+    };
+
+    /// @brief Creates an inactive, empty VirtualArrayRecorder.
+    VirtualArrayRecorder();
+
+    /// @brief Statistics for every `cache_key` seen while active.
+    const std::map<std::string, Entry>
+      entries() const;
+
+    /// @brief Forgets all statistics.
+    void
+      clear();
+
+    /// @brief True if this recorder is receiving events.
+    bool
+      active() const;
+
+    /// @brief Begins receiving events; does nothing if already active.
+    static void
+      start(const VirtualArrayRecorderPtr& recorder);
+
+    /// @brief Stops receiving events; does nothing if not active.
+    static void
+      stop(const VirtualArrayRecorderPtr& recorder);
+
+    /// @brief True if any recorder is active; cheap enough to call for
+    /// every materialization.
+    static bool
+      recording();
+
+    /// @brief Tells all active recorders that the array at `cache_key` was
+    /// found in a cache.
+    static void
+      record_hit(const std::string& cache_key);
+
+    /// @brief Tells all active recorders that the array at `cache_key` was
+    /// generated in `seconds` and is `nbytes` large.
+    static void
+      record_generated(const std::string& cache_key,
+                       double seconds,
+                       int64_t nbytes);
+
+  private:
+    void
+      hit(const std::string& cache_key);
+
+    void
+      generated(const std::string& cache_key, double seconds, int64_t nbytes);
+
+    mutable std::mutex mutex_;
+    std::map<std::string, Entry> entries_;
+  };
+}
+
+#endif // AWKWARD_VIRTUALARRAYRECORDER_H_
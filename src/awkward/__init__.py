@@ -41,6 +41,7 @@ behavior = {}
 from awkward.highlevel import Array
 from awkward.highlevel import Record
 from awkward.highlevel import ArrayBuilder
+from awkward.highlevel import TypedArrayBuilder
 
 # behaviors
 from awkward.behaviors.mixins import *
@@ -52,6 +53,7 @@ from awkward.operations.convert import *
 from awkward.operations.describe import *
 from awkward.operations.structure import *
 from awkward.operations.reducers import *
+import awkward.operations.strings as strings
 
 # version
 __version__ = awkward._ext.__version__
@@ -63,6 +63,8 @@ def register():
     n.UnionArrayType = awkward._connect._numba.layout.UnionArrayType
     n.ArrayBuilderType = awkward._connect._numba.builder.ArrayBuilderType
     n.ArrayBuilderModel = awkward._connect._numba.builder.ArrayBuilderModel
+    n.TypedArrayBuilderType = awkward._connect._numba.builder.TypedArrayBuilderType
+    n.TypedArrayBuilderModel = awkward._connect._numba.builder.TypedArrayBuilderModel
 
     @numba.extending.typeof_impl.register(ak.highlevel.Array)
     def typeof_Array(obj, c):
@@ -76,6 +78,10 @@ def register():
     def typeof_ArrayBuilder(obj, c):
         return obj.numba_type
 
+    @numba.extending.typeof_impl.register(ak.highlevel.TypedArrayBuilder)
+    def typeof_TypedArrayBuilder(obj, c):
+        return obj.numba_type
+
 
 def repr_behavior(behavior):
     return repr(behavior)
@@ -5,9 +5,12 @@ from __future__ import absolute_import
 import numba
 import numba.core.typing
 import numba.core.typing.ctypes_utils
+import numba.np.numpy_support
+import numba.typed
 
 import awkward as ak
 
+np = ak.nplike.NumpyMetadata.instance()
 numpy = ak.nplike.Numpy.instance()
 
 dynamic_addrs = {}
@@ -27,6 +30,17 @@ def globalstring(context, builder, pyvalue):
     )
 
 
+def typed_dtype(dtypetype):
+    if isinstance(dtypetype, numba.types.NumberClass):
+        return numba.np.numpy_support.as_dtype(dtypetype.instance_type).name
+    elif isinstance(dtypetype, numba.types.DType):
+        return numba.np.numpy_support.as_dtype(dtypetype.dtype).name
+    elif isinstance(dtypetype, numba.types.StringLiteral):
+        return np.dtype(dtypetype.literal_value).name
+    else:
+        return None
+
+
 class ArrayBuilderType(numba.types.Type):
     def __init__(self, behavior):
         super(ArrayBuilderType, self).__init__(
@@ -186,6 +200,13 @@ class type_methods(numba.core.typing.templates.AttributeTemplate):
             and isinstance(args[0], numba.types.Integer)
         ):
             return numba.types.none(args[0])
+        elif (
+            len(args) == 2
+            and len(kwargs) == 0
+            and isinstance(args[0], numba.types.Integer)
+            and typed_dtype(args[1]) is not None
+        ):
+            return numba.types.none(args[0], args[1])
         else:
             raise TypeError(
                 "wrong number or types of arguments for ArrayBuilder.integer"
@@ -200,12 +221,44 @@ class type_methods(numba.core.typing.templates.AttributeTemplate):
             and isinstance(args[0], (numba.types.Integer, numba.types.Float))
         ):
             return numba.types.none(args[0])
+        elif (
+            len(args) == 2
+            and len(kwargs) == 0
+            and isinstance(args[0], (numba.types.Integer, numba.types.Float))
+            and typed_dtype(args[1]) is not None
+        ):
+            return numba.types.none(args[0], args[1])
         else:
             raise TypeError(
                 "wrong number or types of arguments for ArrayBuilder.real"
                 + ak._util.exception_suffix(__file__)
             )
 
+    @numba.core.typing.templates.bound_function("complex")
+    def resolve_complex(self, arraybuildertype, args, kwargs):
+        if (
+            len(args) == 1
+            and len(kwargs) == 0
+            and isinstance(
+                args[0], (numba.types.Integer, numba.types.Float, numba.types.Complex)
+            )
+        ):
+            return numba.types.none(args[0])
+        elif (
+            len(args) == 2
+            and len(kwargs) == 0
+            and isinstance(
+                args[0], (numba.types.Integer, numba.types.Float, numba.types.Complex)
+            )
+            and typed_dtype(args[1]) is not None
+        ):
+            return numba.types.none(args[0], args[1])
+        else:
+            raise TypeError(
+                "wrong number or types of arguments for ArrayBuilder.complex"
+                + ak._util.exception_suffix(__file__)
+            )
+
     @numba.core.typing.templates.bound_function("begin_list")
     def resolve_begin_list(self, arraybuildertype, args, kwargs):
         if len(args) == 0 and len(kwargs) == 0:
@@ -422,26 +475,97 @@ def lower_integer(context, builder, sig, args):
     return context.get_dummy_value()
 
 
+def tofloat64(context, builder, xtype, xval):
+    if isinstance(xtype, numba.types.Integer) and xtype.signed:
+        return builder.sitofp(xval, context.get_value_type(numba.types.float64))
+    elif isinstance(xtype, numba.types.Integer):
+        return builder.uitofp(xval, context.get_value_type(numba.types.float64))
+    elif xtype.bitwidth < 64:
+        return builder.fpext(xval, context.get_value_type(numba.types.float64))
+    elif xtype.bitwidth > 64:
+        return builder.fptrunc(xval, context.get_value_type(numba.types.float64))
+    else:
+        return xval
+
+
 @numba.extending.lower_builtin("real", ArrayBuilderType, numba.types.Integer)
 @numba.extending.lower_builtin("real", ArrayBuilderType, numba.types.Float)
 def lower_real(context, builder, sig, args):
     arraybuildertype, xtype = sig.args
     arraybuilderval, xval = args
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
-    if isinstance(xtype, numba.types.Integer) and xtype.signed:
-        x = builder.sitofp(xval, context.get_value_type(numba.types.float64))
-    elif isinstance(xtype, numba.types.Integer):
-        x = builder.uitofp(xval, context.get_value_type(numba.types.float64))
-    elif xtype.bitwidth < 64:
-        x = builder.fpext(xval, context.get_value_type(numba.types.float64))
-    elif xtype.bitwidth > 64:
-        x = builder.fptrunc(xval, context.get_value_type(numba.types.float64))
-    else:
-        x = xval
+    x = tofloat64(context, builder, xtype, xval)
     call(context, builder, ak._libawkward.ArrayBuilder_real, (proxyin.rawptr, x))
     return context.get_dummy_value()
 
 
+@numba.extending.lower_builtin(
+    "integer", ArrayBuilderType, numba.types.Integer, numba.types.Any
+)
+def lower_typedinteger(context, builder, sig, args):
+    arraybuildertype, xtype, dtypetype = sig.args
+    arraybuilderval, xval, dtypeval = args
+    proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
+    x = ak._connect._numba.castint(context, builder, xtype, numba.int64, xval)
+    dtype = globalstring(context, builder, typed_dtype(dtypetype))
+    call(
+        context,
+        builder,
+        ak._libawkward.ArrayBuilder_typedinteger,
+        (proxyin.rawptr, x, dtype),
+    )
+    return context.get_dummy_value()
+
+
+@numba.extending.lower_builtin(
+    "real", ArrayBuilderType, numba.types.Integer, numba.types.Any
+)
+@numba.extending.lower_builtin(
+    "real", ArrayBuilderType, numba.types.Float, numba.types.Any
+)
+def lower_typedreal(context, builder, sig, args):
+    arraybuildertype, xtype, dtypetype = sig.args
+    arraybuilderval, xval, dtypeval = args
+    proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
+    x = tofloat64(context, builder, xtype, xval)
+    dtype = globalstring(context, builder, typed_dtype(dtypetype))
+    call(
+        context,
+        builder,
+        ak._libawkward.ArrayBuilder_typedreal,
+        (proxyin.rawptr, x, dtype),
+    )
+    return context.get_dummy_value()
+
+
+@numba.extending.lower_builtin("complex", ArrayBuilderType, numba.types.Number)
+@numba.extending.lower_builtin(
+    "complex", ArrayBuilderType, numba.types.Number, numba.types.Any
+)
+def lower_complex(context, builder, sig, args):
+    arraybuildertype, xtype = sig.args[:2]
+    arraybuilderval, xval = args[:2]
+    proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
+    if isinstance(xtype, numba.types.Complex):
+        proxyx = context.make_complex(builder, xtype, value=xval)
+        real = tofloat64(context, builder, xtype.underlying_float, proxyx.real)
+        imag = tofloat64(context, builder, xtype.underlying_float, proxyx.imag)
+    else:
+        real = tofloat64(context, builder, xtype, xval)
+        imag = context.get_constant(numba.types.float64, 0.0)
+    if len(sig.args) == 3:
+        dtype = globalstring(context, builder, typed_dtype(sig.args[2]))
+    else:
+        dtype = globalstring(context, builder, "complex128")
+    call(
+        context,
+        builder,
+        ak._libawkward.ArrayBuilder_typedcomplex,
+        (proxyin.rawptr, real, imag, dtype),
+    )
+    return context.get_dummy_value()
+
+
 @numba.extending.lower_builtin("begin_list", ArrayBuilderType)
 def lower_beginlist(context, builder, sig, args):
     (arraybuildertype,) = sig.args
@@ -744,3 +868,320 @@ def lower_extend_array(context, builder, sig, args):
         )
 
     return context.get_dummy_value()
+
+
+########## TypedArrayBuilder
+
+typed_buffer = numba.types.Array(numba.uint8, 1, "C")
+
+# the NumPy function and dtype themselves (not the NumpyLike method and
+# NumpyMetadata attribute), so that Numba recognizes them
+typed_empty = numpy._module.empty
+typed_uint8 = numpy._module.uint8
+
+
+def typed_buffers(buffers):
+    if isinstance(buffers, numba.typed.List):
+        return buffers
+    out = numba.typed.List.empty_list(typed_buffer)
+    for buffer in buffers:
+        out.append(buffer)
+    return out
+
+
+def typed_root_buffers(root):
+    # compiled code grows buffers by replacing them in this list, so the
+    # builder keeps the typed List that it was unboxed with
+    root._buffers = typed_buffers(root._buffers)
+    return root._buffers
+
+
+class TypedArrayBuilderType(numba.types.Type):
+    def __init__(self, form, node, behavior):
+        super(TypedArrayBuilderType, self).__init__(
+            name="ak.TypedArrayBuilderType({0}, {1}, {2})".format(
+                form.tojson(), node, ak._connect._numba.repr_behavior(behavior)
+            )
+        )
+        self.form = form
+        self.node = node
+        self.behavior = behavior
+        self.nodes = ak.highlevel.TypedArrayBuilder._flatten(form)
+
+    @property
+    def here(self):
+        return self.nodes[self.node]
+
+    def at(self, node):
+        return TypedArrayBuilderType(self.form, node, self.behavior)
+
+    def expect(self, method, *kinds):
+        if self.here.kind not in kinds:
+            raise TypeError(
+                "TypedArrayBuilder.{0} can't be used on a {1}".format(
+                    method, type(self.here.form).__name__
+                )
+                + ak._util.exception_suffix(__file__)
+            )
+
+
+@numba.extending.register_model(TypedArrayBuilderType)
+class TypedArrayBuilderModel(numba.core.datamodel.models.StructModel):
+    def __init__(self, dmm, fe_type):
+        members = [
+            ("buffers", numba.types.ListType(typed_buffer)),
+            ("lengths", numba.types.Array(numba.int64, 1, "C")),
+        ]
+        super(TypedArrayBuilderModel, self).__init__(dmm, fe_type, members)
+
+
+numba.extending.make_attribute_wrapper(TypedArrayBuilderType, "buffers", "_buffers")
+numba.extending.make_attribute_wrapper(TypedArrayBuilderType, "lengths", "_lengths")
+
+
+@numba.extending.unbox(TypedArrayBuilderType)
+def unbox_TypedArrayBuilder(buildertype, builderobj, c):
+    root_obj = c.pyapi.object_getattr_string(builderobj, "_root")
+    typed_root_buffers_obj = c.pyapi.unserialize(
+        c.pyapi.serialize_object(typed_root_buffers)
+    )
+    buffers_obj = c.pyapi.call_function_objargs(typed_root_buffers_obj, (root_obj,))
+    lengths_obj = c.pyapi.object_getattr_string(root_obj, "_lengths")
+
+    proxyout = c.context.make_helper(c.builder, buildertype)
+    proxyout.buffers = c.pyapi.to_native_value(
+        numba.types.ListType(typed_buffer), buffers_obj
+    ).value
+    proxyout.lengths = c.pyapi.to_native_value(
+        numba.types.Array(numba.int64, 1, "C"), lengths_obj
+    ).value
+
+    c.pyapi.decref(root_obj)
+    c.pyapi.decref(typed_root_buffers_obj)
+    c.pyapi.decref(buffers_obj)
+    c.pyapi.decref(lengths_obj)
+
+    is_error = numba.core.cgutils.is_not_null(c.builder, c.pyapi.err_occurred())
+    return numba.extending.NativeValue(proxyout._getvalue(), is_error)
+
+
+@numba.extending.box(TypedArrayBuilderType)
+def box_TypedArrayBuilder(buildertype, builderval, c):
+    TypedArrayBuilder_obj = c.pyapi.unserialize(
+        c.pyapi.serialize_object(ak.highlevel.TypedArrayBuilder)
+    )
+    spec_obj = c.pyapi.unserialize(
+        c.pyapi.serialize_object(
+            (buildertype.form.tojson(), buildertype.node, buildertype.behavior)
+        )
+    )
+
+    proxyin = c.context.make_helper(c.builder, buildertype, builderval)
+    buffers_obj = c.pyapi.from_native_value(
+        numba.types.ListType(typed_buffer), proxyin.buffers
+    )
+    lengths_obj = c.pyapi.from_native_value(
+        numba.types.Array(numba.int64, 1, "C"), proxyin.lengths
+    )
+
+    out = c.pyapi.call_method(
+        TypedArrayBuilder_obj, "_wrap", (spec_obj, buffers_obj, lengths_obj)
+    )
+
+    c.pyapi.decref(TypedArrayBuilder_obj)
+    c.pyapi.decref(spec_obj)
+    c.pyapi.decref(buffers_obj)
+    c.pyapi.decref(lengths_obj)
+
+    return out
+
+
+@numba.extending.register_jitable
+def typed_reserve(buffers, which, nbytes):
+    buffer = buffers[which]
+    if nbytes > len(buffer):
+        grown = typed_empty(max(nbytes, 2 * len(buffer)), typed_uint8)
+        grown[: len(buffer)] = buffer
+        buffers[which] = grown
+        return grown
+    return buffer
+
+
+typed_casts = {}
+
+
+def typed_cast(outtype):
+    # all TypedArrayBuilderTypes have the same data model: only the type changes
+    if outtype not in typed_casts:
+
+        @numba.extending.intrinsic
+        def cast(typingctx, buildertype):
+            def codegen(context, builder, sig, args):
+                return numba.core.imputils.impl_ret_borrowed(
+                    context, builder, sig.return_type, args[0]
+                )
+
+            return outtype(buildertype), codegen
+
+        typed_casts[outtype] = cast
+
+    return typed_casts[outtype]
+
+
+@numba.extending.overload(len)
+def overload_TypedArrayBuilder_len(builder):
+    if isinstance(builder, TypedArrayBuilderType):
+        node = builder.node
+
+        def impl(builder):
+            return builder._lengths[node]
+
+        return impl
+
+
+@numba.extending.overload_attribute(TypedArrayBuilderType, "content")
+def overload_TypedArrayBuilder_content(builder):
+    builder.expect("content", "list", "regular", "option")
+    cast = typed_cast(builder.at(builder.here.children[0]))
+
+    def impl(builder):
+        return cast(builder)
+
+    return impl
+
+
+@numba.extending.overload_method(TypedArrayBuilderType, "field")
+def overload_TypedArrayBuilder_field(builder, key):
+    builder.expect("field", "record")
+    here = builder.here
+
+    if isinstance(key, numba.types.IntegerLiteral):
+        index = key.literal_value
+    elif isinstance(key, numba.types.StringLiteral):
+        name = key.literal_value
+        index = here.keys.index(name) if name in here.keys else -1
+    else:
+
+        def impl(builder, key):
+            return numba.literally(key)
+
+        return impl
+
+    if not 0 <= index < len(here.children):
+        raise ValueError(
+            "key {0} not found in record".format(repr(key.literal_value))
+            + ak._util.exception_suffix(__file__)
+        )
+    cast = typed_cast(builder.at(here.children[index]))
+
+    def impl(builder, key):
+        return cast(builder)
+
+    return impl
+
+
+@numba.extending.overload_method(TypedArrayBuilderType, "append")
+def overload_TypedArrayBuilder_append(builder, x):
+    builder.expect("append", "numpy")
+    node = builder.node
+    which = builder.here.buffer
+    dtype = builder.here.dtype.type
+    itemsize = builder.here.dtype.itemsize
+
+    def impl(builder, x):
+        at = builder._lengths[node]
+        data = typed_reserve(builder._buffers, which, (at + 1) * itemsize)
+        data.view(dtype)[at] = x
+        builder._lengths[node] = at + 1
+
+    return impl
+
+
+@numba.extending.overload_method(TypedArrayBuilderType, "begin_list")
+def overload_TypedArrayBuilder_begin_list(builder):
+    builder.expect("begin_list", "list", "regular")
+
+    def impl(builder):
+        pass
+
+    return impl
+
+
+@numba.extending.overload_method(TypedArrayBuilderType, "end_list")
+def overload_TypedArrayBuilder_end_list(builder):
+    builder.expect("end_list", "list", "regular")
+    node = builder.node
+    child = builder.here.children[0]
+
+    if builder.here.kind == "list":
+        which = builder.here.buffer
+        dtype = builder.here.dtype.type
+        itemsize = builder.here.dtype.itemsize
+
+        def impl(builder):
+            at = builder._lengths[node]
+            data = typed_reserve(builder._buffers, which, (at + 2) * itemsize)
+            data.view(dtype)[at + 1] = builder._lengths[child]
+            builder._lengths[node] = at + 1
+
+    else:
+        size = builder.here.size
+
+        def impl(builder):
+            at = builder._lengths[node] + 1
+            if builder._lengths[child] != at * size:
+                raise ValueError("list in a RegularForm has the wrong number of items")
+            builder._lengths[node] = at
+
+    return impl
+
+
+@numba.extending.overload_method(TypedArrayBuilderType, "begin_record")
+def overload_TypedArrayBuilder_begin_record(builder):
+    builder.expect("begin_record", "record")
+
+    def impl(builder):
+        pass
+
+    return impl
+
+
+@numba.extending.overload_method(TypedArrayBuilderType, "end_record")
+def overload_TypedArrayBuilder_end_record(builder):
+    builder.expect("end_record", "record")
+    node = builder.node
+
+    def impl(builder):
+        builder._lengths[node] += 1
+
+    return impl
+
+
+def overload_TypedArrayBuilder_index(builder, method, child):
+    builder.expect(method, "option")
+    node = builder.node
+    which = builder.here.buffer
+    dtype = builder.here.dtype.type
+    itemsize = builder.here.dtype.itemsize
+    content = builder.here.children[0]
+
+    def impl(builder):
+        at = builder._lengths[node]
+        data = typed_reserve(builder._buffers, which, (at + 1) * itemsize)
+        if child:
+            data.view(dtype)[at] = builder._lengths[content]
+        else:
+            data.view(dtype)[at] = -1
+        builder._lengths[node] = at + 1
+
+    return impl
+
+
+@numba.extending.overload_method(TypedArrayBuilderType, "null")
+def overload_TypedArrayBuilder_null(builder):
+    return overload_TypedArrayBuilder_index(builder, "null", False)
+
+
+@numba.extending.overload_method(TypedArrayBuilderType, "valid")
+def overload_TypedArrayBuilder_valid(builder):
+    return overload_TypedArrayBuilder_index(builder, "valid", True)
@@ -4,7 +4,9 @@ from __future__ import absolute_import
 
 import warnings
 import sys
+import collections
 import distutils.version
+import threading
 import types
 
 import awkward as ak
@@ -67,18 +69,46 @@ def getArguments(names, local_dict=None, global_dict=None):
     return arguments
 
 
+def getContext(numexpr, kwargs):
+    try:
+        return numexpr.necompiler.getContext(kwargs, frame_depth=1)
+    except TypeError:
+        # numexpr 2.8 removed the frame_depth argument
+        return numexpr.necompiler.getContext(kwargs)
+
+
+class NamesCache(threading.local):
+    def __init__(self):
+        self.entries = collections.OrderedDict()
+
+
+names_cache = NamesCache()
+names_cache_size = 256
+
+
+def getExprNames(numexpr, expression, context):
+    # numexpr 2.8 made its own _names_cache thread-local, so mirror it here
+    # as a per-thread LRU cache of at most names_cache_size entries
+    entries = names_cache.entries
+    expr_key = (expression, tuple(sorted(context.items())))
+    try:
+        value = entries.pop(expr_key)
+    except KeyError:
+        value = numexpr.necompiler.getExprNames(expression, context)
+        if len(entries) >= names_cache_size:
+            entries.popitem(last=False)
+    entries[expr_key] = value
+    names, ex_uses_vml = value
+    return names
+
+
 def evaluate(
     expression, local_dict=None, global_dict=None, order="K", casting="safe", **kwargs
 ):
     numexpr = import_numexpr()
 
-    context = numexpr.necompiler.getContext(kwargs, frame_depth=1)
-    expr_key = (expression, tuple(sorted(context.items())))
-    if expr_key not in numexpr.necompiler._names_cache:
-        numexpr.necompiler._names_cache[expr_key] = numexpr.necompiler.getExprNames(
-            expression, context
-        )
-    names, ex_uses_vml = numexpr.necompiler._names_cache[expr_key]
+    context = getContext(numexpr, kwargs)
+    names = getExprNames(numexpr, expression, context)
     arguments = getArguments(names, local_dict, global_dict)
 
     arrays = [
@@ -117,6 +147,100 @@ def evaluate(
 evaluate.evaluate = evaluate
 
 
+def evaluate_many(
+    expressions,
+    local_dict=None,
+    global_dict=None,
+    order="K",
+    casting="safe",
+    as_record=True,
+    **kwargs
+):
+    """
+    Args:
+        expressions (dict or iterable of (str, str) pairs): Names of the
+            outputs and the numexpr expressions that compute them.
+        local_dict, global_dict, order, casting, kwargs: as in
+            `numexpr.evaluate`.
+        as_record (bool): If True, return a single array of records with one
+            field per expression; otherwise, return a dict of arrays.
+
+    Evaluates several expressions over the same (jagged) inputs. The union of
+    their inputs is broadcast only once, and every expression is computed on
+    the same flat buffers at each leaf, rather than broadcasting everything
+    again for each call of #ak.numexpr.evaluate.
+
+        >>> a = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+        >>> b = ak.Array([100, 200, 300])
+        >>> out = ak.numexpr.evaluate_many({"sum": "a + b", "prod": "a * b"})
+        >>> out.sum
+        <Array [[101, 102, 103], [], [304, 306]] type='3 * var * float64'>
+        >>> out.prod
+        <Array [[110, 220, 330], [], [1.32e+03, 1.65e+03]] type='3 * var * float64'>
+
+    The record has one field per expression at the top level (like #ak.zip with
+    `depth_limit=1`), so each field has the same type as the corresponding
+    #ak.numexpr.evaluate result.
+    """
+    numexpr = import_numexpr()
+
+    if isinstance(expressions, dict):
+        expressions = list(expressions.items())
+    else:
+        expressions = list(expressions)
+    if len(expressions) == 0:
+        raise ValueError(
+            "at least one expression is required" + ak._util.exception_suffix(__file__)
+        )
+
+    context = getContext(numexpr, kwargs)
+    names = []
+    for key, expression in expressions:
+        for name in getExprNames(numexpr, expression, context):
+            if name not in names:
+                names.append(name)
+    arguments = getArguments(names, local_dict, global_dict)
+
+    arrays = [
+        ak.operations.convert.to_layout(x, allow_record=True, allow_other=True)
+        for x in arguments
+    ]
+
+    def getfunction(inputs):
+        if all(
+            isinstance(x, ak.layout.NumpyArray) or not isinstance(x, ak.layout.Content)
+            for x in inputs
+        ):
+            leaves = dict(zip(names, inputs))
+            return lambda: tuple(
+                ak.layout.NumpyArray(
+                    numexpr.evaluate(
+                        expression, leaves, {}, order=order, casting=casting, **kwargs
+                    )
+                )
+                for key, expression in expressions
+            )
+        else:
+            return None
+
+    behavior = ak._util.behaviorof(*arrays)
+    out = ak._util.broadcast_and_apply(
+        arrays, getfunction, behavior, allow_records=False, pass_depth=False
+    )
+    assert isinstance(out, tuple) and len(out) == len(expressions)
+    keys = [key for key, expression in expressions]
+
+    if as_record:
+        if any(isinstance(x, ak.layout.Record) for x in out):
+            raise ValueError(
+                "cannot combine records into a record of results; use "
+                "as_record=False" + ak._util.exception_suffix(__file__)
+            )
+        return ak._util.wrap(ak.layout.RecordArray(list(out), keys), behavior)
+    else:
+        return dict((key, ak._util.wrap(x, behavior)) for key, x in zip(keys, out))
+
+
 def re_evaluate(local_dict=None):
     numexpr = import_numexpr()
 
@@ -156,4 +280,5 @@ def re_evaluate(local_dict=None):
 
 ak.numexpr = types.ModuleType("numexpr")
 ak.numexpr.evaluate = evaluate
+ak.numexpr.evaluate_many = evaluate_many
 ak.numexpr.re_evaluate = re_evaluate
@@ -56,6 +56,36 @@ ArrayBuilder_real.name = "ArrayBuilder.real"
 ArrayBuilder_real.argtypes = [ctypes.c_voidp, ctypes.c_double]
 ArrayBuilder_real.restype = ctypes.c_uint8
 
+# bool awkward_ArrayBuilder_typedinteger(void* fillablearray,
+#                                        int64_t x,
+#                                        const char* dtype);
+ArrayBuilder_typedinteger = lib.awkward_ArrayBuilder_typedinteger
+ArrayBuilder_typedinteger.name = "ArrayBuilder.typedinteger"
+ArrayBuilder_typedinteger.argtypes = [ctypes.c_voidp, ctypes.c_int64, ctypes.c_voidp]
+ArrayBuilder_typedinteger.restype = ctypes.c_uint8
+
+# bool awkward_ArrayBuilder_typedreal(void* fillablearray,
+#                                     double x,
+#                                     const char* dtype);
+ArrayBuilder_typedreal = lib.awkward_ArrayBuilder_typedreal
+ArrayBuilder_typedreal.name = "ArrayBuilder.typedreal"
+ArrayBuilder_typedreal.argtypes = [ctypes.c_voidp, ctypes.c_double, ctypes.c_voidp]
+ArrayBuilder_typedreal.restype = ctypes.c_uint8
+
+# bool awkward_ArrayBuilder_typedcomplex(void* fillablearray,
+#                                        double real,
+#                                        double imag,
+#                                        const char* dtype);
+ArrayBuilder_typedcomplex = lib.awkward_ArrayBuilder_typedcomplex
+ArrayBuilder_typedcomplex.name = "ArrayBuilder.typedcomplex"
+ArrayBuilder_typedcomplex.argtypes = [
+    ctypes.c_voidp,
+    ctypes.c_double,
+    ctypes.c_double,
+    ctypes.c_voidp,
+]
+ArrayBuilder_typedcomplex.restype = ctypes.c_uint8
+
 # bool awkward_ArrayBuilder_beginlist(void* fillablearray);
 ArrayBuilder_beginlist = lib.awkward_ArrayBuilder_beginlist
 ArrayBuilder_beginlist.name = "ArrayBuilder.beginlist"
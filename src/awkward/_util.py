@@ -5,6 +5,7 @@ from __future__ import absolute_import
 import re
 import sys
 import os
+import pickle
 import warnings
 
 try:
@@ -998,12 +999,17 @@ def broadcast_and_apply(  # noqa: C901
                     break
             nextinputs = ak.partition.partition_as(sample, inputs)
 
-            outputs = []
-            for part_inputs in ak.partition.iterate(sample.numpartitions, nextinputs):
+            def apply_partition(part_inputs):
                 isscalar = []
                 part = apply(broadcast_pack(part_inputs, isscalar), 0, None)
                 assert isinstance(part, tuple)
-                outputs.append(tuple(broadcast_unpack(x, isscalar) for x in part))
+                return tuple(broadcast_unpack(x, isscalar) for x in part)
+
+            outputs = ak.partition.map_partitions(
+                apply_partition,
+                ak.partition.iterate(sample.numpartitions, nextinputs),
+            )
+            part = outputs[-1]
 
             out = ()
             for i in range(len(part)):
@@ -1084,7 +1090,9 @@ def recursively_apply(
         # the rest of this is one switch statement
         if isinstance(layout, ak.partition.PartitionedArray):
             return ak.partition.IrregularlyPartitionedArray(
-                [apply(x, depth, user) for x in layout.partitions]
+                ak.partition.map_partitions(
+                    lambda x: apply(x, depth, user), layout.partitions
+                )
             )
 
         elif isinstance(layout, ak.layout.NumpyArray):
@@ -1354,11 +1362,14 @@ def find_caches(layout):
     # Both of the implementations below find referentially unique mutablemappings,
     # but the PartitionedArray case is optimized for many unique values (with a set)
     # and the non-partitioned case is optimized for few (O(n^2) algo, but no hashmap).
+    # BoundedArrayCaches are owned by the layout, so they don't need to be held.
     if isinstance(layout, ak.partition.PartitionedArray):
         seen = set()
         mutablemappings = []
         for partition in layout.partitions:
             for cache in partition.caches:
+                if isinstance(cache, ak.layout.BoundedArrayCache):
+                    continue
                 x = cache.mutablemapping
                 if id(x) not in seen:
                     seen.add(id(x))
@@ -1366,6 +1377,8 @@ def find_caches(layout):
     else:
         mutablemappings = []
         for cache in layout.caches:
+            if isinstance(cache, ak.layout.BoundedArrayCache):
+                continue
             x = cache.mutablemapping
             for y in mutablemappings:
                 if x is y:
@@ -1721,6 +1734,25 @@ def union_to_record(unionarray, anonymous):
         return ak.layout.RecordArray(all_fields, all_names, len(unionarray))
 
 
+def reduce_out_of_band(reduced, protocol, index):
+    """
+    Replaces the container of buffers in the state of a `reduced` tuple (from
+    `object.__reduce_ex__`) with `pickle.PickleBuffer` views, so that pickle
+    protocol 5 can pass them out-of-band (without copying them into the stream).
+
+    The `index` is the position of the container in the state tuple.
+    """
+    if protocol < 5 or not hasattr(pickle, "PickleBuffer"):
+        return reduced
+
+    state = list(reduced[2])
+    state[index] = dict(
+        (key, pickle.PickleBuffer(ak.nplike.numpy.ascontiguousarray(value)))
+        for key, value in state[index].items()
+    )
+    return reduced[:2] + (tuple(state),) + reduced[3:]
+
+
 def adjust_old_pickle(form, container, num_partitions, behavior):
     def key_format(**v):
         if num_partitions is None:
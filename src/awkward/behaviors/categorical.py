@@ -14,44 +14,120 @@ class CategoricalBehavior(ak.highlevel.Array):
 ak.behavior["categorical"] = CategoricalBehavior
 
 
-class _HashableDict(object):
-    def __init__(self, obj):
-        self.keys = tuple(sorted(obj))
-        self.values = tuple(_hashable(obj[k]) for k in self.keys)
-        self.hash = hash((_HashableDict,) + self.keys, self.values)
-
-    def __hash__(self):
-        return self.hash
-
-    def __eq__(self, other):
-        return (
-            isinstance(other, _HashableDict)
-            and self.keys == other.keys
-            and self.values == other.values
-        )
+def _dictionary_encode(data, starts, stops):
+    # codes of the byte ranges data[starts[i]:stops[i]], by first appearance
+    numpy = ak.nplike.numpy
+    encoded = ak.layout.NumpyArray(
+        numpy.asarray(data).view(np.uint8)
+    ).dictionary_encode(
+        ak.layout.Index64(numpy.asarray(starts, dtype=np.int64)),
+        ak.layout.Index64(numpy.asarray(stops, dtype=np.int64)),
+    )
+    return numpy.asarray(encoded)
+
+
+def _encode_rows(values):
+    # codes of the rows of a two-dimensional array, compared bytewise
+    numpy = ak.nplike.numpy
+    values = numpy.ascontiguousarray(values)
+    width = values.shape[1] * values.itemsize
+    starts = numpy.arange(len(values), dtype=np.int64) * width
+    return _dictionary_encode(values.reshape(-1).view(np.uint8), starts, starts + width)
 
 
-class _HashableList(object):
-    def __init__(self, obj):
-        self.values = tuple(obj)
-        self.hash = hash((_HashableList,) + self.values)
+def _normalized(values):
+    # equal floating-point values must have equal bytes: -0.0 == 0.0, and
+    # all NaNs are one category
+    numpy = ak.nplike.numpy
+    if values.dtype.kind in ("f", "c"):
+        values = values + values.dtype.type(0)
+        values[numpy.isnan(values)] = numpy.nan
+    return values
 
-    def __hash__(self):
-        return self.hash
 
-    def __eq__(self, other):
-        return isinstance(other, _HashableList) and self.values == other.values
+def _encode(layout):
+    """
+    Returns an integer code for each item of `layout`, such that equal items
+    (as in #ak.to_list) have equal codes, numbered by first appearance.
+    """
+    numpy = ak.nplike.numpy
+
+    if isinstance(layout, ak.layout.VirtualArray):
+        return _encode(layout.array)
+
+    elif isinstance(layout, ak.layout.EmptyArray):
+        return numpy.zeros(0, np.int64)
+
+    elif isinstance(layout, ak.layout.NumpyArray):
+        values = _normalized(numpy.asarray(layout))
+        # an explicit width, since reshape can't infer -1 for an empty array
+        width = int(numpy.prod(values.shape[1:], dtype=np.int64))
+        return _encode_rows(values.reshape(len(values), width))
+
+    elif isinstance(layout, ak._util.listtypes):
+        offsets = layout.compact_offsets64(True)
+        content = layout.broadcast_tooffsets64(offsets).content
+        offsets = numpy.asarray(offsets)
+        if isinstance(content, ak.layout.NumpyArray) and content.ndim == 1:
+            # strings and lists of numbers: compare the data directly
+            data = _normalized(numpy.asarray(content))
+        else:
+            data = _encode(content)
+        data = numpy.ascontiguousarray(data)
+        return _dictionary_encode(
+            data.view(np.uint8),
+            offsets[:-1] * data.itemsize,
+            offsets[1:] * data.itemsize,
+        )
 
+    elif isinstance(layout, ak.layout.RecordArray):
+        if layout.numfields == 0:
+            return numpy.zeros(len(layout), np.int64)
+        fields = [
+            _encode(layout.field(i)[: len(layout)]) for i in range(layout.numfields)
+        ]
+        return _encode_rows(numpy.stack(fields, axis=1))
+
+    elif isinstance(layout, ak._util.optiontypes):
+        if not isinstance(layout, ak._util.indexedoptiontypes):
+            layout = layout.toIndexedOptionArray64()
+        index = numpy.asarray(layout.index)
+        codes = _encode(layout.content)
+        out = numpy.full(len(index), -1, np.int64)
+        valid = index >= 0
+        out[valid] = codes[index[valid]]
+        return _encode_rows(out.reshape(-1, 1))
+
+    elif isinstance(layout, ak._util.indexedtypes):
+        codes = _encode(layout.content)
+        return _encode_rows(codes[numpy.asarray(layout.index)].reshape(-1, 1))
+
+    elif isinstance(layout, ak._util.uniontypes):
+        tags = numpy.asarray(layout.tags).astype(np.int64)
+        index = numpy.asarray(layout.index).astype(np.int64)
+        values = numpy.empty(len(tags), np.int64)
+        for tag in range(layout.numcontents):
+            selected = tags == tag
+            values[selected] = _encode(layout.content(tag))[index[selected]]
+        return _encode_rows(numpy.stack([tags, values], axis=1))
 
-def _hashable(obj):
-    if isinstance(obj, dict):
-        return _HashableDict(obj)
-    elif isinstance(obj, tuple):
-        return tuple(_hashable(x) for x in obj)
-    elif isinstance(obj, list):
-        return _HashableList(obj)
     else:
-        return obj
+        raise AssertionError(
+            "unrecognized layout: "
+            + type(layout).__name__
+            + ak._util.exception_suffix(__file__)
+        )
+
+
+def _first_appearances(codes):
+    # True where a code appears for the first time (codes count up from 0)
+    numpy = ak.nplike.numpy
+    out = numpy.empty(len(codes), np.bool_)
+    if len(codes) != 0:
+        running = numpy.maximum.accumulate(codes)
+        out[0] = True
+        out[1:] = running[1:] > running[:-1]
+    return out
 
 
 def _categorical_equal(one, two):
@@ -75,15 +151,18 @@ def _categorical_equal(one, two):
         one_mapped = one_index
 
     else:
-        one_list = ak.operations.convert.to_list(one_content)
-        two_list = ak.operations.convert.to_list(two_content)
-        one_hashable = [_hashable(x) for x in one_list]
-        two_hashable = [_hashable(x) for x in two_list]
-        two_lookup = {x: i for i, x in enumerate(two_hashable)}
-
-        one_to_two = ak.nplike.numpy.empty(len(one_hashable) + 1, dtype=np.int64)
-        for i, x in enumerate(one_hashable):
-            one_to_two[i] = two_lookup.get(x, len(two_hashable))
+        # encode both sets of categories together to match them up
+        both = ak.operations.structure.concatenate(
+            [one.content, two.content], highlevel=False
+        )
+        codes = _encode(both)
+        one_codes, two_codes = codes[: len(one.content)], codes[len(one.content) :]
+
+        two_lookup = ak.nplike.numpy.full(len(codes), len(two_codes), np.int64)
+        two_lookup[two_codes] = ak.nplike.numpy.arange(len(two_codes))
+
+        one_to_two = ak.nplike.numpy.empty(len(one_codes) + 1, dtype=np.int64)
+        one_to_two[:-1] = two_lookup[one_codes]
         one_to_two[-1] = -1
 
         one_mapped = one_to_two[one_index]
@@ -229,9 +308,10 @@ def to_categorical(array, highlevel=True):
         >>> ak.to_list(categorical_records) == ak.to_list(records)
         True
 
-    The check for uniqueness is currently implemented in a Python loop, so
-    conversion to categorical should be regarded as expensive. (This can
-    change, but it would always be an _n log(n)_ operation.)
+    Distinct values are found by hashing their bytes in compiled code (for
+    strings, lists, and records, after encoding their contents and fields),
+    which is linear in the size of the data. Floating-point values follow
+    Python equality, except that all NaNs are one category.
 
     See also #ak.is_categorical, #ak.categories, #ak.from_categorical.
     """
@@ -257,20 +337,8 @@ def to_categorical(array, highlevel=True):
                 content = layout
                 cls = ak.layout.IndexedArray64
 
-            content_list = ak.operations.convert.to_list(content)
-            hashable = [_hashable(x) for x in content_list]
-
-            lookup = {}
-            is_first = ak.nplike.numpy.empty(len(hashable), dtype=np.bool_)
-            mapping = ak.nplike.numpy.empty(len(hashable), dtype=np.int64)
-            for i, x in enumerate(hashable):
-                if x in lookup:
-                    is_first[i] = False
-                    mapping[i] = lookup[x]
-                else:
-                    is_first[i] = True
-                    lookup[x] = j = len(lookup)
-                    mapping[i] = j
+            mapping = _encode(content)
+            is_first = _first_appearances(mapping)
 
             if isinstance(layout, ak._util.indexedoptiontypes):
                 original_index = ak.nplike.numpy.asarray(layout.index)
@@ -317,8 +385,8 @@ def from_categorical(array, highlevel=True):
     removing the label that declares it as such).
 
     This is a metadata-only operation; the running time does not scale with the
-    size of the dataset. (Conversion to categorical is expensive; conversion
-    from categorical is cheap.)
+    size of the dataset. (Conversion to categorical requires a pass over the
+    data; conversion from categorical is cheap.)
 
     See also #ak.is_categorical, #ak.categories, #ak.to_categorical,
     #ak.from_categorical.
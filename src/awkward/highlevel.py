@@ -3,7 +3,9 @@
 from __future__ import absolute_import
 
 import re
+import json
 import keyword
+import numbers
 
 try:
     from collections.abc import Iterable
@@ -1457,6 +1459,10 @@ class Array(
             behavior = self._behavior
         return form, length, container, behavior
 
+    def __reduce_ex__(self, protocol):
+        reduced = super(Array, self).__reduce_ex__(protocol)
+        return ak._util.reduce_out_of_band(reduced, protocol, 2)
+
     def __setstate__(self, state):
         if isinstance(state[1], dict):
             form, container, num_partitions, behavior = state
@@ -2054,6 +2060,10 @@ class Record(ak._connect._numpy.NDArrayOperatorsMixin):
             behavior = self._behavior
         return form, length, container, behavior, self._layout.at
 
+    def __reduce_ex__(self, protocol):
+        reduced = super(Record, self).__reduce_ex__(protocol)
+        return ak._util.reduce_out_of_band(reduced, protocol, 2)
+
     def __setstate__(self, state):
         if isinstance(state[1], dict):
             form, container, num_partitions, behavior, at = state
@@ -2101,6 +2111,12 @@ class ArrayBuilder(Iterable, Sized):
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        page_length (int): If positive, buffers used by
+            #ak.layout.ArrayBuilder stop resizing when they reach this many
+            items and instead grow by adding pages of this size, which are
+            concatenated only when a snapshot is taken; this keeps the peak
+            memory use close to the final size of the array. If 0, buffers
+            are contiguous and resized as usual.
 
     General tool for building arrays of nested data structures from a sequence
     of commands. Most data types can be constructed by calling commands in the
@@ -2212,8 +2228,10 @@ class ArrayBuilder(Iterable, Sized):
     be considered the "least effort" approach.
     """
 
-    def __init__(self, behavior=None, initial=1024, resize=1.5):
-        self._layout = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+    def __init__(self, behavior=None, initial=1024, resize=1.5, page_length=0):
+        self._layout = ak.layout.ArrayBuilder(
+            initial=initial, resize=resize, page_length=page_length
+        )
         self.behavior = behavior
 
     @classmethod
@@ -2424,19 +2442,51 @@ class ArrayBuilder(Iterable, Sized):
         """
         self._layout.boolean(x)
 
-    def integer(self, x):
+    def integer(self, x, dtype=None):
         """
+        Args:
+            x (int): The integer to append.
+            dtype (None or dtype): If None, the integer is stored as int64;
+                otherwise, it is stored as this NumPy dtype (e.g. `np.int8`).
+
         Appends an integer `x` at the current position in the accumulated
         array.
+
+        Numbers appended with a `dtype` are collected in a buffer of exactly
+        that type, so an array built this way is never wider than requested.
+        Mixing numbers with different (or no) dtypes in the same position
+        yields their common type.
         """
-        self._layout.integer(x)
+        self._layout.integer(x, dtype)
 
-    def real(self, x):
+    def real(self, x, dtype=None):
         """
+        Args:
+            x (float): The number to append.
+            dtype (None or dtype): If None, the number is stored as float64;
+                otherwise, it is stored as this NumPy dtype (e.g. `np.float32`).
+
         Appends a floating point number `x` at the current position in the
         accumulated array.
+
+        See #integer for the meaning of `dtype`.
+        """
+        self._layout.real(x, dtype)
+
+    def complex(self, x, dtype=None):
+        """
+        Args:
+            x (complex): The number to append.
+            dtype (None or dtype): If None, the number is stored as
+                complex128; otherwise, it is stored as this NumPy dtype
+                (e.g. `np.complex64`).
+
+        Appends a complex number `x` at the current position in the
+        accumulated array.
+
+        See #integer for the meaning of `dtype`.
         """
-        self._layout.real(x)
+        self._layout.complex(x, dtype)
 
     def bytestring(self, x):
         """
@@ -2601,6 +2651,9 @@ class ArrayBuilder(Iterable, Sized):
         new structure, since it avoids copying and even walking over the
         old data structure (matters more when the structures are large).
 
+        If `obj` is a NumPy array, it is appended as one list whose values
+        are copied in bulk (see #extend), keeping its dtype.
+
         If `obj` is an arbitrary Python object, this is equivalent to
         #ak.from_iter except that it fills an existing #ak.ArrayBuilder,
         rather than creating a new one.
@@ -2615,6 +2668,14 @@ class ArrayBuilder(Iterable, Sized):
                 self._layout.beginlist()
                 self._layout.extend(obj.layout)
                 self._layout.endlist()
+            elif (
+                isinstance(obj, np.ndarray)
+                and obj.dtype != np.dtype("O")
+                and obj.ndim > 0
+            ):
+                self._layout.beginlist()
+                self.extend(obj)
+                self._layout.endlist()
             else:
                 self._layout.fromiter(obj)
 
@@ -2627,22 +2688,50 @@ class ArrayBuilder(Iterable, Sized):
                     "'obj' is an ak.Array" + ak._util.exception_suffix(__file__)
                 )
 
-    def extend(self, obj):
+    def extend(self, obj, copy=False):
         """
         Args:
-            obj (#ak.Array): The Array to concatenate with the data in this
-                ArrayBuilder.
+            obj (#ak.Array or NumPy array): The array to concatenate with the
+                data in this ArrayBuilder.
+            copy (bool): If True, copy the values of an #ak.Array, rather
+                than referencing them.
+
+        Appends every value from `obj`. An #ak.Array is appended by
+        reference (see #append) unless `copy` is True; a NumPy array is
+        always copied.
 
-        Appends every value from `obj`, by reference (see #append).
+        Copies are made in bulk, without walking over the values in Python:
+        contiguous numbers are copied into the ArrayBuilder's buffers with
+        `memcpy` and list offsets are shifted in one pass. This is the
+        fastest way to stitch together arrays from many sources into one
+        new array. NumPy dtypes, such as `float32`, are preserved.
+
+        A copy keeps record names (see #ak.with_name) and strings, but no
+        other parameters: for instance, a categorical array is copied as
+        its plain values.
         """
         if isinstance(obj, Array):
-            self._layout.extend(obj.layout)
+            layout = obj.layout
+        elif isinstance(obj, np.ndarray) and obj.dtype != np.dtype("O"):
+            if obj.ndim == 0:
+                raise TypeError(
+                    "'extend' method requires an array, not a scalar"
+                    + ak._util.exception_suffix(__file__)
+                )
+            layout = ak.operations.convert.from_numpy(obj, highlevel=False)
+            copy = True
         else:
             raise TypeError(
-                "'extend' method requires an ak.Array"
+                "'extend' method requires an ak.Array or a NumPy array"
                 + ak._util.exception_suffix(__file__)
             )
 
+        if isinstance(layout, ak.partition.PartitionedArray):
+            for partition in layout.partitions:
+                self._layout.extend(partition, copy)
+        else:
+            self._layout.extend(layout, copy)
+
     class _Nested(object):
         def __init__(self, arraybuilder):
             self._arraybuilder = arraybuilder
@@ -2766,3 +2855,440 @@ class ArrayBuilder(Iterable, Sized):
         can't be used in Numba.
         """
         return self.Record(self, name)
+
+
+class _TypedNode(object):
+    def __init__(self, form, kind, dtype=None, keys=None, size=None):
+        self.form = form
+        self.kind = kind
+        self.dtype = dtype
+        self.keys = keys
+        self.size = size
+        self.buffer = None
+        self.children = []
+
+
+class TypedArrayBuilder(Sized):
+    """
+    Args:
+        form (#ak.forms.Form or str/dict equivalent): The form of the array to
+            build.
+        behavior (None or dict): Custom #ak.behavior for arrays built by
+            this TypedArrayBuilder.
+        initial (int): Initial size (in bytes) of each buffer.
+
+    Builds an array whose type is known in advance, described by `form`.
+    Unlike #ak.ArrayBuilder, which discovers the type as data are appended,
+    a TypedArrayBuilder has one typed buffer for each node of the `form`
+    and fills the buffers directly, so no type information is checked or
+    updated per value. In Numba, its methods compile to plain stores into
+    those buffers.
+
+    The builder is navigated with the structure of the `form`: #content
+    and #field return builders for the nodes below the current one, which
+    fill the same buffers. For example,
+
+        >>> form = ak.forms.Form.fromjson('''
+        ... {"class": "ListOffsetArray64",
+        ...  "offsets": "i64",
+        ...  "content": {"class": "RecordArray",
+        ...              "contents": {"x": "int64", "y": "float64"}}}''')
+        >>> builder = ak.TypedArrayBuilder(form)
+        >>> records = builder.content
+        >>> builder.begin_list()
+        >>> records.field("x").append(1)
+        >>> records.field("y").append(1.1)
+        >>> records.end_record()
+        >>> builder.end_list()
+        >>> builder.begin_list()
+        >>> builder.end_list()
+        >>> builder.snapshot()
+        <Array [[{x: 1, y: 1.1}], []] type='2 * var * {"x": int64, "y": float64}'>
+
+    The supported forms are #ak.forms.NumpyForm (of booleans and numbers,
+    without inner dimensions), #ak.forms.ListOffsetForm,
+    #ak.forms.RegularForm, #ak.forms.RecordForm, and
+    #ak.forms.IndexedOptionForm, nested in any way. Each kind of node
+    has its own methods:
+
+       * NumpyForm: #append a number.
+       * ListOffsetForm and RegularForm: #begin_list, fill #content, and
+         #end_list.
+       * RecordForm: #begin_record, fill each #field, and #end_record.
+       * IndexedOptionForm: #null for a missing value, or #valid followed
+         by filling #content.
+
+    A TypedArrayBuilder can be passed into Numba-compiled functions and
+    returned from them, like #ak.ArrayBuilder. Field names must then be
+    compile-time constants.
+    """
+
+    def __init__(self, form, behavior=None, initial=1024):
+        if isinstance(form, str) or (
+            ak._util.py27 and isinstance(form, ak._util.unicode)
+        ):
+            form = ak.forms.Form.fromjson(form)
+        elif isinstance(form, dict):
+            form = ak.forms.Form.fromjson(json.dumps(form))
+
+        self._root = self
+        self._node = 0
+        self._form = form
+        self._nodes = self._flatten(form)
+        self.behavior = behavior
+
+        initial = max(16, -(-initial // 16) * 16)
+        self._buffers = []
+        for node in self._nodes:
+            if node.buffer is not None:
+                # offsets and index buffers start with the leading 0 offset
+                self._buffers.append(numpy.zeros(initial, np.uint8))
+        self._lengths = numpy.zeros(len(self._nodes), np.int64)
+
+    @classmethod
+    def _flatten(cls, form):
+        nodes = []
+        buffers = []
+        index_dtypes = {
+            "i32": np.dtype(np.int32),
+            "u32": np.dtype(np.uint32),
+            "i64": np.dtype(np.int64),
+        }
+
+        def recurse(form):
+            if isinstance(form, ak.forms.NumpyForm):
+                dtype = form.to_numpy()
+                if (
+                    dtype.subdtype is not None
+                    or dtype.kind not in "biufc"
+                    or dtype.itemsize > 16
+                ):
+                    raise TypeError(
+                        "TypedArrayBuilder can only fill NumpyForms of booleans "
+                        "and numbers without inner dimensions, not {0}".format(
+                            repr(str(dtype))
+                        )
+                        + ak._util.exception_suffix(__file__)
+                    )
+                node = _TypedNode(form, "numpy", dtype=dtype)
+            elif isinstance(form, ak.forms.ListOffsetForm):
+                node = _TypedNode(form, "list", dtype=index_dtypes[form.offsets])
+            elif isinstance(form, ak.forms.RegularForm):
+                node = _TypedNode(form, "regular", size=form.size)
+            elif isinstance(form, ak.forms.RecordForm):
+                node = _TypedNode(form, "record", keys=form.keys())
+            elif isinstance(form, ak.forms.IndexedOptionForm):
+                node = _TypedNode(form, "option", dtype=index_dtypes[form.index])
+            else:
+                raise TypeError(
+                    "TypedArrayBuilder can't fill {0}; only NumpyForm, "
+                    "ListOffsetForm, RegularForm, RecordForm, and "
+                    "IndexedOptionForm are supported".format(type(form).__name__)
+                    + ak._util.exception_suffix(__file__)
+                )
+
+            index = len(nodes)
+            nodes.append(node)
+            if node.dtype is not None:
+                node.buffer = len(buffers)
+                buffers.append(index)
+
+            if node.kind == "record":
+                node.children = [
+                    recurse(form.content(i)) for i in range(form.numfields)
+                ]
+            elif node.kind != "numpy":
+                node.children = [recurse(form.content)]
+            return index
+
+        recurse(form)
+        return nodes
+
+    @classmethod
+    def _wrap(cls, spec, buffers, lengths):
+        """
+        Args:
+            spec (tuple): The form (as JSON), node index, and behavior of the
+                builder.
+            buffers (list of arrays): Buffers filled by the builder.
+            lengths (array): Number of items in each node of the builder.
+
+        Wraps the state of a TypedArrayBuilder returned from a Numba-compiled
+        function.
+        """
+        form, node, behavior = spec
+        root = cls.__new__(cls)
+        root._root = root
+        root._node = 0
+        root._form = ak.forms.Form.fromjson(form)
+        root._nodes = cls._flatten(root._form)
+        root.behavior = behavior
+        root._buffers = buffers
+        root._lengths = lengths
+        return root._at(node)
+
+    def _at(self, node):
+        out = type(self).__new__(type(self))
+        out._root = self._root
+        out._node = node
+        return out
+
+    @property
+    def _here(self):
+        return self._root._nodes[self._node]
+
+    def _expect(self, method, *kinds):
+        if self._here.kind not in kinds:
+            raise TypeError(
+                "TypedArrayBuilder.{0} can't be used on a {1}".format(
+                    method, type(self._here.form).__name__
+                )
+                + ak._util.exception_suffix(__file__)
+            )
+
+    def _push(self, value, offset=0):
+        root = self._root
+        node = self._here
+        at = root._lengths[self._node]
+        nbytes = (at + 1 + offset) * node.dtype.itemsize
+        buffer = root._buffers[node.buffer]
+        if nbytes > len(buffer):
+            grown = numpy.empty(max(nbytes, 2 * len(buffer)), np.uint8)
+            grown[: len(buffer)] = buffer
+            root._buffers[node.buffer] = grown
+            buffer = grown
+        buffer.view(node.dtype)[at + offset] = value
+        root._lengths[self._node] = at + 1
+
+    @property
+    def form(self):
+        """
+        The #ak.forms.Form of the node that this builder fills.
+        """
+        return self._here.form
+
+    @property
+    def behavior(self):
+        """
+        The `behavior` parameter passed into this TypedArrayBuilder's
+        constructor.
+
+        See #ak.ArrayBuilder.behavior.
+        """
+        return self._root._behavior
+
+    @behavior.setter
+    def behavior(self, behavior):
+        if behavior is None or isinstance(behavior, dict):
+            self._root._behavior = behavior
+        else:
+            raise TypeError(
+                "behavior must be None or a dict" + ak._util.exception_suffix(__file__)
+            )
+
+    def __len__(self):
+        """
+        The number of items filled at this builder's node.
+        """
+        return int(self._root._lengths[self._node])
+
+    def __repr__(self):
+        return "<TypedArrayBuilder of {0} with {1} items>".format(
+            type(self._here.form).__name__, len(self)
+        )
+
+    @property
+    def numba_type(self):
+        """
+        The type of this TypedArrayBuilder when it is used in Numba.
+
+        Passing a TypedArrayBuilder into a Numba-compiled function converts
+        its list of buffers into a `numba.typed.List`, so that compiled code
+        can replace buffers when they need to grow.
+        """
+        import awkward._connect._numba
+
+        ak._connect._numba.register_and_check()
+        import awkward._connect._numba.builder  # noqa: F401
+
+        return ak._connect._numba.builder.TypedArrayBuilderType(
+            self._root._form, self._node, self._root._behavior
+        )
+
+    @property
+    def content(self):
+        """
+        The builder for the content of a ListOffsetForm, RegularForm, or
+        IndexedOptionForm node.
+        """
+        self._expect("content", "list", "regular", "option")
+        return self._at(self._here.children[0])
+
+    def field(self, key):
+        """
+        Args:
+            key (str or int): Name or position of the field.
+
+        The builder for one field of a RecordForm node.
+        """
+        self._expect("field", "record")
+        node = self._here
+        if isinstance(key, (numbers.Integral, np.integer)):
+            index = int(key)
+        elif key in node.keys:
+            index = node.keys.index(key)
+        else:
+            index = -1
+        if not 0 <= index < len(node.children):
+            raise ValueError(
+                "key {0} not found in record".format(repr(key))
+                + ak._util.exception_suffix(__file__)
+            )
+        return self._at(node.children[index])
+
+    def append(self, x):
+        """
+        Appends a number `x` to a NumpyForm node.
+        """
+        self._expect("append", "numpy")
+        self._push(x)
+
+    def begin_list(self):
+        """
+        Begins a list in a ListOffsetForm or RegularForm node; its items are
+        filled through #content.
+        """
+        self._expect("begin_list", "list", "regular")
+
+    def end_list(self):
+        """
+        Ends a list in a ListOffsetForm or RegularForm node. Lists in a
+        RegularForm must have exactly its `size` items.
+        """
+        self._expect("end_list", "list", "regular")
+        node = self._here
+        lengths = self._root._lengths
+        if node.kind == "list":
+            self._push(lengths[node.children[0]], offset=1)
+        else:
+            at = lengths[self._node] + 1
+            if lengths[node.children[0]] != at * node.size:
+                raise ValueError(
+                    "list in a RegularForm of size {0} has the wrong number "
+                    "of items".format(node.size)
+                    + ak._util.exception_suffix(__file__)
+                )
+            lengths[self._node] = at
+
+    def begin_record(self):
+        """
+        Begins a record in a RecordForm node; its fields are filled through
+        #field.
+        """
+        self._expect("begin_record", "record")
+
+    def end_record(self):
+        """
+        Ends a record in a RecordForm node.
+        """
+        self._expect("end_record", "record")
+        self._root._lengths[self._node] += 1
+
+    def null(self):
+        """
+        Appends a missing value to an IndexedOptionForm node.
+        """
+        self._expect("null", "option")
+        self._push(-1)
+
+    def valid(self):
+        """
+        Appends a present value to an IndexedOptionForm node. The value
+        itself must then be filled through #content.
+        """
+        self._expect("valid", "option")
+        self._push(self._root._lengths[self._here.children[0]])
+
+    def snapshot(self):
+        """
+        Converts the data filled so far into an #ak.Array with the builder's
+        `form`. Only the root builder (not those returned by #content or
+        #field) can take a snapshot.
+
+        Like #ak.ArrayBuilder.snapshot, this does not copy the buffers. It is
+        safe to continue filling the builder, since that only affects data
+        outside the range viewed by old snapshots.
+        """
+        if self._node != 0:
+            raise ValueError(
+                "a snapshot can only be taken from the root TypedArrayBuilder"
+                + ak._util.exception_suffix(__file__)
+            )
+        layout = self._snapshot(0, len(self))
+        return ak._util.wrap(layout, self._root._behavior)
+
+    def _snapshot(self, index, length):
+        root = self._root
+        node = root._nodes[index]
+        parameters = node.form.parameters
+
+        if root._lengths[index] < length:
+            raise ValueError(
+                "{0} has {1} items but {2} are needed; a list, record, or "
+                "option value is incomplete".format(
+                    type(node.form).__name__, root._lengths[index], length
+                )
+                + ak._util.exception_suffix(__file__)
+            )
+
+        if node.dtype is not None:
+            data = numpy.asarray(root._buffers[node.buffer]).view(node.dtype)
+
+        if node.kind == "numpy":
+            return ak.layout.NumpyArray(data[:length], parameters=parameters)
+
+        elif node.kind == "list":
+            offsets = data[: length + 1]
+            content = self._snapshot(node.children[0], int(offsets[-1]))
+            if node.form.offsets == "i32":
+                return ak.layout.ListOffsetArray32(
+                    ak.layout.Index32(offsets), content, parameters=parameters
+                )
+            elif node.form.offsets == "u32":
+                return ak.layout.ListOffsetArrayU32(
+                    ak.layout.IndexU32(offsets), content, parameters=parameters
+                )
+            else:
+                return ak.layout.ListOffsetArray64(
+                    ak.layout.Index64(offsets), content, parameters=parameters
+                )
+
+        elif node.kind == "regular":
+            content = self._snapshot(node.children[0], length * node.size)
+            return ak.layout.RegularArray(
+                content, node.size, length, parameters=parameters
+            )
+
+        elif node.kind == "record":
+            contents = [self._snapshot(x, length) for x in node.children]
+            return ak.layout.RecordArray(
+                contents,
+                None if node.form.istuple else node.keys,
+                length,
+                parameters=parameters,
+            )
+
+        else:
+            index = data[:length]
+            present = index[index >= 0]
+            content = self._snapshot(
+                node.children[0], 0 if len(present) == 0 else int(present[-1]) + 1
+            )
+            if node.form.index == "i32":
+                return ak.layout.IndexedOptionArray32(
+                    ak.layout.Index32(index), content, parameters=parameters
+                )
+            else:
+                return ak.layout.IndexedOptionArray64(
+                    ak.layout.Index64(index), content, parameters=parameters
+                )
@@ -52,5 +52,7 @@ from awkward._ext import VirtualArray
 from awkward._ext import ArrayGenerator
 from awkward._ext import SliceGenerator
 from awkward._ext import ArrayCache
+from awkward._ext import BoundedArrayCache
+from awkward._ext import VirtualArrayRecorder
 
 from awkward._ext import kernel_lib
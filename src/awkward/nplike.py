@@ -200,6 +200,10 @@ class NumpyLike(Singleton):
         # array
         return self._module.unique(*args, **kwargs)
 
+    def bincount(self, *args, **kwargs):
+        # array[, weights=, minlength=]
+        return self._module.bincount(*args, **kwargs)
+
     def concatenate(self, *args, **kwargs):
         # arrays
         return self._module.concatenate(*args, **kwargs)
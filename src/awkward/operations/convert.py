@@ -12,9 +12,11 @@ import distutils.version
 
 try:
     from collections.abc import Iterable
+    from collections.abc import Iterator
     from collections.abc import MutableMapping
 except ImportError:
     from collections import Iterable
+    from collections import Iterator
     from collections import MutableMapping
 
 import awkward as ak
@@ -630,7 +632,14 @@ def to_kernels(array, kernels, highlevel=True, behavior=None):
 
 
 def from_iter(
-    iterable, highlevel=True, behavior=None, allow_record=True, initial=1024, resize=1.5
+    iterable,
+    highlevel=True,
+    behavior=None,
+    allow_record=True,
+    initial=1024,
+    resize=1.5,
+    page_length=0,
+    dtype=None,
 ):
     """
     Args:
@@ -647,6 +656,17 @@ def from_iter(
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        page_length (int): If positive, buffers used by
+            #ak.layout.ArrayBuilder stop resizing when they reach this many
+            items and instead grow by adding pages of this size, which are
+            concatenated only once, when the array is made; this keeps the
+            peak memory use close to the final size of the array. If 0,
+            buffers are contiguous and resized as usual.
+        dtype (None, dtype, or dict of str to dtype): If not None, numbers
+            are stored with this NumPy dtype instead of int64/float64. If a
+            dict, each record field named in it uses its own dtype (for all
+            numbers nested within that field) and other fields are not
+            affected.
 
     Converts Python data into an Awkward Array.
 
@@ -661,6 +681,8 @@ def from_iter(
        * bool, including `np.bool_`: converted into #ak.layout.NumpyArray.
        * int, including `np.integer`: converted into #ak.layout.NumpyArray.
        * float, including `np.floating`: converted into #ak.layout.NumpyArray.
+       * complex, including `np.complexfloating`: converted into
+         #ak.layout.NumpyArray.
        * bytes: converted into #ak.layout.ListOffsetArray with parameter
          `"__array__"` equal to `"bytestring"` (unencoded bytes).
        * str: converted into #ak.layout.ListOffsetArray with parameter
@@ -682,15 +704,19 @@ def from_iter(
                 behavior=behavior,
                 initial=initial,
                 resize=resize,
+                page_length=page_length,
+                dtype=dtype,
             )[0]
         else:
             raise ValueError(
                 "cannot produce an array from a dict"
                 + ak._util.exception_suffix(__file__)
             )
-    out = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+    out = ak.layout.ArrayBuilder(
+        initial=initial, resize=resize, page_length=page_length
+    )
     for x in iterable:
-        out.fromiter(x)
+        out.fromiter(x, dtype)
     layout = out.snapshot()
     if highlevel:
         return ak._util.wrap(layout, behavior)
@@ -741,29 +767,29 @@ def to_list(array):
     elif ak.operations.describe.parameters(array).get("__array__") == "char":
         return ak.behaviors.string.CharBehavior(array).__str__()
 
-    elif isinstance(array, ak.highlevel.Array):
-        return [to_list(x) for x in array]
-
-    elif isinstance(array, ak.highlevel.Record):
+    elif isinstance(array, (ak.highlevel.Array, ak.highlevel.Record)):
         return to_list(array.layout)
 
     elif isinstance(array, ak.highlevel.ArrayBuilder):
         return to_list(array.snapshot())
 
-    elif isinstance(array, ak.layout.Record) and array.istuple:
-        return tuple(to_list(x) for x in array.fields())
-
     elif isinstance(array, ak.layout.Record):
-        return {n: to_list(x) for n, x in array.fielditems()}
+        return array.tolist()
 
     elif isinstance(array, ak.layout.ArrayBuilder):
-        return [to_list(x) for x in array.snapshot()]
+        return array.snapshot().tolist()
 
     elif isinstance(array, ak.layout.NumpyArray):
         return ak.nplike.of(array).asarray(array).tolist()
 
-    elif isinstance(array, (ak.layout.Content, ak.partition.PartitionedArray)):
-        return [to_list(x) for x in array]
+    elif isinstance(array, ak.layout.Content):
+        return array.tolist()
+
+    elif isinstance(array, ak.partition.PartitionedArray):
+        out = []
+        for partition in array.partitions:
+            out.extend(partition.tolist())
+        return out
 
     elif isinstance(array, dict):
         return dict((n, to_list(x)) for n, x in array.items())
@@ -787,11 +813,16 @@ def from_json(
     behavior=None,
     initial=1024,
     resize=1.5,
+    page_length=0,
     buffersize=65536,
+    chunk_size=None,
+    chunk_bytes=None,
+    form=None,
 ):
     """
     Args:
-        source (str): JSON-formatted string to convert into an array.
+        source (str): JSON-formatted string or name of a file to convert
+            into an array.
         nan_string (None or str): If not None, strings with this value will be
             interpreted as floating-point NaN values.
         infinity_string (None or str): If not None, strings with this value will
@@ -807,11 +838,53 @@ def from_json(
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        page_length (int): If positive, buffers used by
+            #ak.layout.ArrayBuilder stop resizing when they reach this many
+            items and instead grow by adding pages of this size, which are
+            concatenated only once, when the array is made; this keeps the
+            peak memory use close to the final size of the array. If 0,
+            buffers are contiguous and resized as usual.
         buffersize (int): Size (in bytes) of the buffer used by the JSON
             parser.
+        chunk_size (None or int): If not None, `source` must be a file and
+            this function returns an iterator over arrays of at most
+            `chunk_size` JSON documents each.
+        chunk_bytes (None or int): If not None, `source` must be a file and
+            this function returns an iterator over arrays, each of which
+            ends with the first document that brings the number of bytes
+            read in that chunk to at least `chunk_bytes`.
+        form (None, #ak.forms.Form, str, or dict): If not None, the expected
+            form of the output array (as an object, JSON string, or
+            JSON-derived dict), which skips type discovery.
 
     Converts a JSON string into an Awkward Array.
 
+    If `source` contains a sequence of JSON documents, such as a JSON Lines
+    (newline-delimited JSON) file, each document becomes an element of the
+    output array. With `chunk_size` and/or `chunk_bytes`, a large file can
+    be read piecemeal: only the parser's buffer and the current chunk are
+    in memory at a time. For example,
+
+        for chunk in ak.from_json("logs.jsonl", chunk_size=100000):
+            process(chunk)
+
+    Every chunk is an array of documents, even if it contains only one.
+
+    If a `form` is given, the JSON data are written directly into arrays of
+    that form, which is faster than discovering the type and yields the same
+    layout for every input. Without chunking, the data must be a single JSON
+    array whose items match the form; with chunking, each JSON document must
+    match the form. Object keys that are not in the form are skipped, and
+    missing keys are None if the corresponding field is an option type.
+    Any other mismatch raises an error. Union types are not supported, and
+    all option types become #ak.layout.IndexedOptionArray64. For example,
+
+        >>> form = ak.forms.Form.fromjson('{"class": "RecordArray", '
+        ...     '"contents": {"x": "int32", "y": {"class": "ListOffsetArray64", '
+        ...     '"offsets": "i64", "content": "float64"}}}')
+        >>> ak.from_json('[{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}]', form=form)
+        <Array [{x: 1, y: [1.1, 2.2], ... x: 2, y: []}] type='2 * {"x": int32, "y": var ...'>
+
     Internally, this function uses #ak.layout.ArrayBuilder (see the high-level
     #ak.ArrayBuilder documentation for a more complete description), so it
     has the same flexibility and the same constraints. Any heterogeneous
@@ -820,6 +893,39 @@ def from_json(
 
     See also #ak.to_json.
     """
+    if isinstance(form, str) or (ak._util.py27 and isinstance(form, ak._util.unicode)):
+        form = ak.forms.Form.fromjson(form)
+    elif isinstance(form, dict):
+        form = ak.forms.Form.fromjson(json.dumps(form))
+
+    if chunk_size is not None or chunk_bytes is not None:
+        if not os.path.isfile(source):
+            raise ValueError(
+                "chunk_size and chunk_bytes can only be used if the source "
+                "is a file" + ak._util.exception_suffix(__file__)
+            )
+        for name, value in (("chunk_size", chunk_size), ("chunk_bytes", chunk_bytes)):
+            if value is not None and value <= 0:
+                raise ValueError(
+                    "{0} must be positive, not {1}".format(name, value)
+                    + ak._util.exception_suffix(__file__)
+                )
+        return _from_json_chunks(
+            source,
+            nan_string,
+            infinity_string,
+            minus_infinity_string,
+            highlevel,
+            behavior,
+            initial,
+            resize,
+            page_length,
+            buffersize,
+            chunk_size,
+            chunk_bytes,
+            form,
+        )
+
     if os.path.isfile(source):
         layout = ak._ext.fromjsonfile(
             source,
@@ -828,7 +934,9 @@ def from_json(
             minus_infinity_string=minus_infinity_string,
             initial=initial,
             resize=resize,
+            page_length=page_length,
             buffersize=buffersize,
+            form=form,
         )
     else:
         layout = ak._ext.fromjson(
@@ -838,7 +946,9 @@ def from_json(
             minus_infinity_string=minus_infinity_string,
             initial=initial,
             resize=resize,
+            page_length=page_length,
             buffersize=buffersize,
+            form=form,
         )
 
     if highlevel:
@@ -847,6 +957,48 @@ def from_json(
         return layout
 
 
+def _from_json_chunks(
+    source,
+    nan_string,
+    infinity_string,
+    minus_infinity_string,
+    highlevel,
+    behavior,
+    initial,
+    resize,
+    page_length,
+    buffersize,
+    chunk_size,
+    chunk_bytes,
+    form,
+):
+    chunks = ak._ext.FromJsonFileChunks(
+        source,
+        nan_string=nan_string,
+        infinity_string=infinity_string,
+        minus_infinity_string=minus_infinity_string,
+        initial=initial,
+        resize=resize,
+        page_length=page_length,
+        buffersize=buffersize,
+        form=form,
+    )
+    try:
+        while True:
+            layout = chunks.next(
+                -1 if chunk_size is None else chunk_size,
+                -1 if chunk_bytes is None else chunk_bytes,
+            )
+            if layout is None:
+                break
+            elif highlevel:
+                yield ak._util.wrap(layout, behavior)
+            else:
+                yield layout
+    finally:
+        chunks.close()
+
+
 def to_json(
     array,
     destination=None,
@@ -2592,11 +2744,15 @@ def to_parquet(
     list_to32=False,
     string_to32=True,
     bytestring_to32=True,
+    row_group_size=None,
+    row_group_bytes=None,
     **options  # NOTE: a comma after **options breaks Python 2
 ):
     """
     Args:
-        array: Data to write to a Parquet file.
+        array: Data to write to a Parquet file. If this is an iterator (such
+            as a generator) of arrays, each array is converted and written
+            before the next is requested.
         where (str, Path, file-like object): Where to write the Parquet file.
         explode_records (bool): If True, lists of records are written as
             records of lists, so that nested fields become top-level fields
@@ -2607,9 +2763,18 @@ def to_parquet(
             all others map to Arrow `LargeListType`.
         string_to32 (bool): Same as the above for Arrow `string` and `large_string`.
         bytestring_to32 (bool): Same as the above for Arrow `binary` and `large_binary`.
+        row_group_size (None or int): If not None, the maximum number of
+            entries in each row group. Arrays and partitions are split or
+            combined to make row groups of this size.
+        row_group_bytes (None or int): If not None, the maximum (uncompressed,
+            in-memory) number of bytes in each row group, estimated from the
+            average size of the entries. May be combined with `row_group_size`,
+            in which case the smaller limit applies.
         options: All other options are passed to pyarrow.parquet.ParquetWriter.
             In particular, if no `schema` is given, a schema is derived from
-            the array type.
+            the array type. The `compression` may be a dict and `use_dictionary`
+            a list of column names, which may be dotted paths to nested fields,
+            such as `"jets.pt"`.
 
     Writes an Awkward Array to a Parquet file (through pyarrow).
 
@@ -2624,22 +2789,140 @@ def to_parquet(
     there is no distinction between `?union[X, Y, Z]]` type and `union[?X, ?Y, ?Z]` type.
     Be aware of these type distinctions when passing data through Arrow or Parquet.
 
+    If neither `row_group_size` nor `row_group_bytes` is given, each array
+    (or each partition of a partitioned array) becomes one row group. Otherwise,
+    no more than one row group's worth of data is held in memory at a time, so
+    an iterator of arrays can be written without ever having the whole dataset
+    in memory:
+
+        >>> def generate():
+        ...     for i in range(1000):
+        ...         yield ak.Array([{"x": i, "y": [i] * i}])
+        ...
+        >>> ak.to_parquet(generate(), "generated.parquet", row_group_size=100)
+
+    To write arrays as they become available, rather than pulling them from an
+    iterator, use #ak.to_parquet.writer, which takes the same arguments (other
+    than `array`):
+
+        >>> with ak.to_parquet.writer("generated.parquet", row_group_size=100) as w:
+        ...     for i in range(1000):
+        ...         w.write(ak.Array([{"x": i, "y": [i] * i}]))
+
     See also #ak.to_arrow, which is used as an intermediate step.
     See also #ak.from_parquet.
     """
-    pyarrow = _import_pyarrow("ak.to_parquet")
-    import pyarrow.parquet
+    writer = _ParquetWriter(
+        where,
+        explode_records=explode_records,
+        list_to32=list_to32,
+        string_to32=string_to32,
+        bytestring_to32=bytestring_to32,
+        row_group_size=row_group_size,
+        row_group_bytes=row_group_bytes,
+        **options
+    )
+    try:
+        if isinstance(array, Iterator):
+            for x in array:
+                writer.write(x)
+        else:
+            writer.write(array)
+    finally:
+        writer.close()
+
+    if writer.num_entries is None:
+        raise ValueError(
+            "no arrays to write and no schema to make an empty file"
+            + ak._util.exception_suffix(__file__)
+        )
+
+
+class _ParquetWriter(object):
+    """
+    Args:
+        where (str, Path, file-like object): Where to write the Parquet file.
+        options: All other arguments are the same as for #ak.to_parquet.
 
-    options["where"] = where
+    Writes arrays to a Parquet file as they are passed to `write`, buffering
+    at most one row group at a time (if `row_group_size` or `row_group_bytes`
+    is given). Use it as a context manager or call `close` to finish the file.
+
+        >>> with ak.to_parquet.writer("output.parquet", row_group_size=100) as w:
+        ...     for array in arrays:
+        ...         w.write(array)
+
+    The schema is derived from the first array written (unless a `schema` is
+    passed), and all later arrays must have the same type, except that
+    non-nullable values can be written to nullable columns. (To write missing
+    values after a first array without them, pass an explicit `schema`.)
+    """
+
+    def __init__(
+        self,
+        where,
+        explode_records=False,
+        list_to32=False,
+        string_to32=True,
+        bytestring_to32=True,
+        row_group_size=None,
+        row_group_bytes=None,
+        **options  # NOTE: a comma after **options breaks Python 2
+    ):
+        pyarrow = _import_pyarrow("ak.to_parquet")
+        import pyarrow.parquet  # noqa: F401
+
+        if row_group_size is not None and row_group_size < 1:
+            raise ValueError(
+                "row_group_size must be a positive integer"
+                + ak._util.exception_suffix(__file__)
+            )
+        if row_group_bytes is not None and row_group_bytes < 1:
+            raise ValueError(
+                "row_group_bytes must be a positive integer"
+                + ak._util.exception_suffix(__file__)
+            )
+
+        self._where = where
+        self._explode_records = explode_records
+        self._list_to32 = list_to32
+        self._string_to32 = string_to32
+        self._bytestring_to32 = bytestring_to32
+        self._row_group_size = row_group_size
+        self._row_group_bytes = row_group_bytes
+        self._options = options
+
+        self._writer = None
+        self._schema = options.get("schema")
+        self._tables = []
+        self._num_rows = 0
+        self._num_bytes = 0
+        self._num_entries = None
+
+    @property
+    def num_entries(self):
+        """
+        Number of entries written so far (including any that are buffered),
+        or None if the file has not been started.
+        """
+        return self._num_entries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def _batches(self, layout):
+        pyarrow = _import_pyarrow("ak.to_parquet")
 
-    def batch_iterator(layout):
         if isinstance(layout, ak.partition.PartitionedArray):
             for partition in layout.partitions:
-                for x in batch_iterator(partition):
+                for x in self._batches(partition):
                     yield x
 
         else:
-            if explode_records or isinstance(
+            if self._explode_records or isinstance(
                 ak.operations.describe.type(layout), ak.types.RecordType
             ):
                 names = layout.keys()
@@ -2654,9 +2937,9 @@ def to_parquet(
                 pa_arrays.append(
                     to_arrow(
                         content,
-                        list_to32=list_to32,
-                        string_to32=string_to32,
-                        bytestring_to32=bytestring_to32,
+                        list_to32=self._list_to32,
+                        string_to32=self._string_to32,
+                        bytestring_to32=self._bytestring_to32,
                     )
                 )
                 pa_fields.append(
@@ -2666,30 +2949,264 @@ def to_parquet(
                         )
                     )
                 )
-            yield pyarrow.RecordBatch.from_arrays(
+            batch = pyarrow.RecordBatch.from_arrays(
                 pa_arrays, schema=pyarrow.schema(pa_fields)
             )
+            yield batch, layout.nbytes
 
-    layout = to_layout(array, allow_record=False, allow_other=False)
-    iterator = batch_iterator(layout)
-    first = next(iterator)
+    def _open(self):
+        pyarrow = _import_pyarrow("ak.to_parquet")
 
-    if "schema" not in options:
-        options["schema"] = first.schema
+        options = dict(self._options)
+        options["schema"] = self._schema
+
+        compression = options.get("compression")
+        use_dictionary = options.get("use_dictionary")
+        if isinstance(compression, dict) or isinstance(use_dictionary, (list, tuple)):
+            # write an empty file in memory to learn the Parquet column paths
+            probe = dict(options)
+            probe.pop("compression", None)
+            probe.pop("use_dictionary", None)
+            sink = pyarrow.BufferOutputStream()
+            pyarrow.parquet.ParquetWriter(sink, **probe).close()
+            parquet_schema = pyarrow.parquet.ParquetFile(
+                pyarrow.BufferReader(sink.getvalue())
+            ).schema
+            leaf_paths = _parquet_leaf_paths(parquet_schema, self._schema)
+
+            if isinstance(compression, dict):
+                options["compression"] = {}
+                for name, codec in compression.items():
+                    for path in _parquet_resolve(name, leaf_paths, self._where):
+                        options["compression"][path] = codec
+            if isinstance(use_dictionary, (list, tuple)):
+                options["use_dictionary"] = []
+                for name in use_dictionary:
+                    options["use_dictionary"].extend(
+                        _parquet_resolve(name, leaf_paths, self._where)
+                    )
 
-    writer = pyarrow.parquet.ParquetWriter(**options)
-    writer.write_table(pyarrow.Table.from_batches([first]))
+        self._writer = pyarrow.parquet.ParquetWriter(self._where, **options)
+        self._num_entries = 0
 
-    try:
-        while True:
-            try:
-                record_batch = next(iterator)
-            except StopIteration:
-                break
+    def write(self, array):
+        """
+        Args:
+            array: Data to write, which may be partitioned.
+
+        Converts `array` to Arrow and writes it, or buffers it until a full
+        row group is available.
+        """
+        pyarrow = _import_pyarrow("ak.to_parquet")
+
+        if self._writer is False:
+            raise ValueError(
+                "cannot write to a closed Parquet writer"
+                + ak._util.exception_suffix(__file__)
+            )
+
+        layout = to_layout(array, allow_record=False, allow_other=False)
+        for batch, nbytes in self._batches(layout):
+            if self._schema is None:
+                self._schema = batch.schema
+            if self._writer is None:
+                self._open()
+
+            table = pyarrow.Table.from_batches([batch])
+            if not table.schema.equals(self._schema):
+                try:
+                    table = table.cast(self._schema)
+                except (ValueError, TypeError, NotImplementedError):
+                    raise ValueError(
+                        "cannot write array of type\n\n    {0}\n\nto a Parquet file "
+                        "with schema\n\n    {1}".format(
+                            str(table.schema).replace("\n", "\n    "),
+                            str(self._schema).replace("\n", "\n    "),
+                        )
+                        + ak._util.exception_suffix(__file__)
+                    )
+
+            self._tables.append(table)
+            self._num_rows += table.num_rows
+            self._num_bytes += nbytes
+            self._num_entries += table.num_rows
+            self._flush(False)
+
+    def _target(self):
+        target = self._row_group_size
+        if self._row_group_bytes is not None and self._num_bytes > 0:
+            estimate = max(1, self._row_group_bytes * self._num_rows // self._num_bytes)
+            if target is None or estimate < target:
+                target = estimate
+        return target
+
+    def _flush(self, final):
+        pyarrow = _import_pyarrow("ak.to_parquet")
+
+        target = self._target()
+        if target is None:
+            for table in self._tables:
+                self._writer.write_table(table)
+            remainder = []
+
+        elif self._num_rows != 0 and (self._num_rows >= target or final):
+            table = pyarrow.concat_tables(self._tables)
+            if final:
+                stop = table.num_rows
             else:
-                writer.write_table(pyarrow.Table.from_batches([record_batch]))
-    finally:
-        writer.close()
+                stop = (table.num_rows // target) * target
+            self._writer.write_table(table.slice(0, stop), row_group_size=target)
+            if stop < table.num_rows:
+                remainder = [table.slice(stop)]
+            else:
+                remainder = []
+
+        else:
+            return
+
+        num_rows = sum(x.num_rows for x in remainder)
+        if self._num_rows != 0:
+            self._num_bytes = self._num_bytes * num_rows // self._num_rows
+        self._tables = remainder
+        self._num_rows = num_rows
+
+    def close(self):
+        """
+        Writes any buffered data and finishes the file.
+        """
+        if self._writer is False:
+            return
+        if self._writer is None and self._schema is not None:
+            self._open()
+        if self._writer is not None:
+            try:
+                self._flush(True)
+            finally:
+                self._writer.close()
+        self._writer = False
+
+
+to_parquet.writer = _ParquetWriter
+
+
+def _to_parquet_dataset(directory, filenames=None, filename_extension=".parquet"):
+    """
+    Args:
+        directory (str or Path): A local directory in which to write
+            `_common_metadata` and `_metadata`, making the directory of Parquet
+            files into a dataset.
+        filenames (None or list of str or Path): If None, the `directory` is
+            recursively searched for files ending in `filename_extension`,
+            which are sorted lexicographically. Otherwise, this explicit list
+            of files is taken and row groups are concatenated in its given
+            order. Relative filenames are interpreted relative to `directory`.
+        filename_extension (str): Filename extension (including `.`) to use to
+            search for files recursively. Ignored if `filenames` is not None.
+
+    Creates a `_common_metadata` and a `_metadata` file in a directory of
+    Parquet files. The `_metadata` file is an index of the row groups in all
+    of the files (their lengths, column statistics, and file paths), so that
+    #ak.from_parquet can open the directory by reading only this one file.
+
+        >>> ak.to_parquet(array1, "/directory/arr1.parquet")
+        >>> ak.to_parquet(array2, "/directory/arr2.parquet")
+        >>> ak.to_parquet.dataset("/directory")
+        >>> ak.from_parquet("/directory", lazy=True)
+
+    The files must all have the same schema. Rewrite the index if any files
+    are added, removed, or changed.
+
+    See also #ak.to_parquet and #ak.from_parquet.
+    """
+    pyarrow = _import_pyarrow("ak.to_parquet.dataset")
+    import pyarrow.parquet
+
+    directory = _regularize_path(directory)
+    if not os.path.isdir(directory):
+        raise ValueError(
+            "{0} is not a local filesystem directory".format(repr(directory))
+            + ak._util.exception_suffix(__file__)
+        )
+
+    if filenames is None:
+        filenames = _parquet_directory_files(directory, filename_extension)
+    else:
+        filenames = [os.path.join(directory, _regularize_path(x)) for x in filenames]
+    if len(filenames) == 0:
+        raise ValueError(
+            "no Parquet files found in {0}".format(repr(directory))
+            + ak._util.exception_suffix(__file__)
+        )
+
+    schema = None
+    collector = []
+    for filename in filenames:
+        metadata = pyarrow.parquet.read_metadata(filename)
+        if schema is None:
+            schema = metadata.schema
+        elif not schema.equals(metadata.schema):
+            raise ValueError(
+                "schema of {0} differs from the schema of {1}".format(
+                    repr(filename), repr(filenames[0])
+                )
+                + ak._util.exception_suffix(__file__)
+            )
+        metadata.set_file_path(
+            os.path.relpath(filename, directory).replace(os.sep, "/")
+        )
+        collector.append(metadata)
+
+    arrow_schema = schema.to_arrow_schema()
+    pyarrow.parquet.write_metadata(
+        arrow_schema, os.path.join(directory, "_common_metadata")
+    )
+    pyarrow.parquet.write_metadata(
+        arrow_schema,
+        os.path.join(directory, "_metadata"),
+        metadata_collector=collector,
+    )
+
+
+to_parquet.dataset = _to_parquet_dataset
+
+
+def _regularize_path(path):
+    if hasattr(path, "__fspath__"):
+        return path.__fspath__()
+    else:
+        return path
+
+
+def _parquet_directory_files(directory, filename_extension):
+    out = []
+    for root, dirs, files in os.walk(directory):
+        for filename in files:
+            if filename.endswith(filename_extension):
+                out.append(os.path.join(root, filename))
+    return sorted(out)
+
+
+def _parquet_dataset_files(source):
+    # None if 'source' is a single file; otherwise (directory or None, filenames)
+    source = _regularize_path(source)
+
+    if isinstance(source, str) or (
+        ak._util.py27 and isinstance(source, ak._util.unicode)
+    ):
+        if os.path.isdir(source):
+            return source, _parquet_directory_files(source, ".parquet")
+        elif not os.path.exists(source) and any(x in source for x in "*?["):
+            import glob
+
+            return None, sorted(glob.glob(source))
+        else:
+            return None
+
+    elif isinstance(source, (list, tuple)):
+        return None, [_regularize_path(x) for x in source]
+
+    else:
+        return None
 
 
 class _ParquetState(object):
@@ -2699,8 +3216,20 @@ class _ParquetState(object):
         self.source = source
         self.options = options
 
-    def __call__(self, row_group, column):
-        as_arrow = self.file.read_row_group(row_group, [column], self.use_threads)
+    def parquet_file(self):
+        if self.file is None:
+            pyarrow = _import_pyarrow("ak.from_parquet")
+            import pyarrow.parquet
+
+            self.file = pyarrow.parquet.ParquetFile(self.source, **self.options)
+        return self.file
+
+    def __call__(self, row_group, column, paths=None):
+        if paths is None:
+            paths = [column]
+        as_arrow = self.parquet_file().read_row_group(
+            row_group, paths, self.use_threads
+        )
         return _from_arrow(as_arrow, False, highlevel=False)[column]
 
     def __getstate__(self):
@@ -2711,12 +3240,177 @@ class _ParquetState(object):
         }
 
     def __setstate__(self, state):
-        pyarrow = _import_pyarrow("ak.to_parquet")
-
         self.use_threads = state["use_threads"]
         self.source = state["source"]
         self.options = state["options"]
-        self.file = pyarrow.parquet.ParquetFile(self.source, **self.options)
+        self.file = None
+
+
+def _parquet_field_path(schema, path):
+    # Parquet column paths include the structural nodes of lists, such as
+    # "jets.list.item.pt"; walk the Arrow schema to drop them ("jets.pt").
+    pyarrow = _import_pyarrow("ak.from_parquet")
+
+    index = schema.get_field_index(path[0])
+    if index < 0:
+        return path
+    tpe = schema[index].type
+    out = [path[0]]
+    i = 1
+    while i < len(path):
+        if isinstance(tpe, pyarrow.DictionaryType):
+            tpe = tpe.value_type
+        elif isinstance(
+            tpe, (pyarrow.ListType, pyarrow.LargeListType, pyarrow.FixedSizeListType)
+        ):
+            tpe = tpe.value_type
+            i += 2
+        elif isinstance(tpe, pyarrow.StructType) and tpe.get_field_index(path[i]) >= 0:
+            tpe = tpe[tpe.get_field_index(path[i])].type
+            out.append(path[i])
+            i += 1
+        else:
+            out.extend(path[i:])
+            break
+    return out
+
+
+def _parquet_leaf_paths(parquet_schema, schema):
+    out = []
+    for i in range(len(parquet_schema)):
+        path = parquet_schema.column(i).path
+        out.append((".".join(_parquet_field_path(schema, path.split("."))), path))
+    return out
+
+
+def _parquet_resolve(column, leaf_paths, source):
+    out = []
+    for name, path in leaf_paths:
+        for x in (name, path):
+            if x == column or x.startswith(column + "."):
+                out.append(path)
+                break
+    if len(out) == 0:
+        raise ValueError(
+            "column {0} does not exist in file {1}".format(repr(column), repr(source))
+            + ak._util.exception_suffix(__file__)
+        )
+    return out
+
+
+_parquet_filter_ops = {
+    "==": lambda lo, hi, value: lo <= value <= hi,
+    "=": lambda lo, hi, value: lo <= value <= hi,
+    "!=": lambda lo, hi, value: not lo == hi == value,
+    "<": lambda lo, hi, value: lo < value,
+    "<=": lambda lo, hi, value: lo <= value,
+    ">": lambda lo, hi, value: hi > value,
+    ">=": lambda lo, hi, value: hi >= value,
+    "in": lambda lo, hi, value: any(lo <= x <= hi for x in value),
+    "not in": lambda lo, hi, value: not (lo == hi and lo in value),
+}
+
+
+def _parquet_filter_row_groups(metadata, filters, leaf_paths, source):
+    if len(filters) != 0 and isinstance(filters[0], tuple):
+        filters = [filters]
+
+    conjunctions = []
+    for conjunction in filters:
+        predicates = []
+        for predicate in conjunction:
+            if not isinstance(predicate, tuple) or len(predicate) != 3:
+                raise TypeError(
+                    "filters must be a list of (column, op, value) tuples or "
+                    "a list of lists of such tuples, not {0}".format(repr(predicate))
+                    + ak._util.exception_suffix(__file__)
+                )
+            column, op, value = predicate
+            if op not in _parquet_filter_ops:
+                raise ValueError(
+                    "unrecognized filter operator {0}; must be one of {1}".format(
+                        repr(op), ", ".join(repr(x) for x in _parquet_filter_ops)
+                    )
+                    + ak._util.exception_suffix(__file__)
+                )
+            paths = _parquet_resolve(column, leaf_paths, source)
+            if len(paths) != 1:
+                raise ValueError(
+                    "filter column {0} is not a leaf (numeric or string) column; "
+                    "it corresponds to {1} Parquet columns".format(
+                        repr(column), len(paths)
+                    )
+                    + ak._util.exception_suffix(__file__)
+                )
+            index = [path for name, path in leaf_paths].index(paths[0])
+            predicates.append((index, _parquet_filter_ops[op], value))
+        conjunctions.append(predicates)
+
+    def might_match(row_group):
+        for predicates in conjunctions:
+            for index, op, value in predicates:
+                statistics = row_group.column(index).statistics
+                if statistics is not None and statistics.has_min_max:
+                    if not op(statistics.min, statistics.max, value):
+                        break
+            else:
+                return True
+        return False
+
+    return [i for i, x in enumerate(metadata) if might_match(x)]
+
+
+def _parquet_dataset_pieces(directory, filenames, source, use_threads, options):
+    # Only metadata (file footers or the '_metadata' index) are read here.
+    pyarrow = _import_pyarrow("ak.from_parquet")
+    import pyarrow.parquet
+
+    states = []
+    pieces = []
+
+    if directory is not None and os.path.exists(os.path.join(directory, "_metadata")):
+        metadata = pyarrow.parquet.read_metadata(os.path.join(directory, "_metadata"))
+        state_indexes = {}
+        counters = []
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            file_path = row_group.column(0).file_path
+            if file_path not in state_indexes:
+                state_indexes[file_path] = len(states)
+                states.append(
+                    _ParquetState(
+                        None, use_threads, os.path.join(directory, file_path), options
+                    )
+                )
+                counters.append(0)
+            state_index = state_indexes[file_path]
+            pieces.append((state_index, counters[state_index], row_group))
+            counters[state_index] += 1
+        return metadata.schema, states, pieces
+
+    if len(filenames) == 0:
+        raise ValueError(
+            "no Parquet files found in {0}".format(repr(source))
+            + ak._util.exception_suffix(__file__)
+        )
+
+    schema = None
+    for filename in filenames:
+        metadata = pyarrow.parquet.read_metadata(filename)
+        if schema is None:
+            schema = metadata.schema
+        elif not schema.equals(metadata.schema):
+            raise ValueError(
+                "schema of {0} differs from the schema of {1}".format(
+                    repr(filename), repr(filenames[0])
+                )
+                + ak._util.exception_suffix(__file__)
+            )
+        for i in range(metadata.num_row_groups):
+            pieces.append((len(states), i, metadata.row_group(i)))
+        states.append(_ParquetState(None, use_threads, filename, options))
+
+    return schema, states, pieces
 
 
 _from_parquet_key_number = 0
@@ -2735,6 +3429,7 @@ def from_parquet(
     source,
     columns=None,
     row_groups=None,
+    filters=None,
     use_threads=True,
     lazy=False,
     lazy_cache="new",
@@ -2745,21 +3440,37 @@ def from_parquet(
 ):
     """
     Args:
-        source (str, Path, file-like object, pyarrow.NativeFile): Where to
-            get the Parquet file.
+        source (str, Path, file-like object, pyarrow.NativeFile, or list of
+            str or Path): Where to get the Parquet file(s). A directory is
+            read as a dataset of all files ending in `.parquet` (recursively,
+            lexicographically sorted); a string containing `*`, `?`, or `[`
+            that is not an existing file is a glob pattern; a list is taken as
+            an ordered list of files.
         columns (None or list of str): If None, read all columns; otherwise,
-            read a specified set of columns.
+            read a specified set of columns. Nested fields may be selected
+            with dotted paths, such as `"jets.pt"`, which reads only that
+            field of the records in the `"jets"` column.
         row_groups (None, int, or list of int): If None, read all row groups;
-            otherwise, read a single or list of row groups.
+            otherwise, read a single or list of row groups. For a dataset of
+            several files, row groups are numbered consecutively through all
+            of the files.
+        filters (None, list of tuples, or list of lists of tuples): If not None,
+            only read row groups whose column statistics might satisfy the
+            predicate. Each tuple is `(column, op, value)`, where `column` is
+            a (possibly dotted) leaf column, `op` is one of `"=="`, `"="`,
+            `"!="`, `"<"`, `"<="`, `">"`, `">="`, `"in"`, `"not in"`. A list
+            of tuples is a conjunction (AND) and a list of lists of tuples is
+            a disjunction (OR) of conjunctions, as in pyarrow.
         use_threads (bool): Passed to the pyarrow.parquet.ParquetFile.read
             functions; if True, do multithreaded reading.
         lazy (bool): If True, read columns in row groups on demand (as
             #ak.layout.VirtualArray, possibly in #ak.partition.PartitionedArray
             if the file has more than one row group); if False, read all
             requested data immediately.
-        lazy_cache (None, "new", or MutableMapping): If lazy, pass this
-            cache to the VirtualArrays. If "new", a new dict (keep-forever cache)
-            is created. If None, no cache is used.
+        lazy_cache (None, "new", MutableMapping, or #ak.layout.BoundedArrayCache):
+            If lazy, pass this cache to the VirtualArrays. If "new", a new dict
+            (keep-forever cache) is created; a #ak.layout.BoundedArrayCache
+            keeps memory use bounded. If None, no cache is used.
         lazy_cache_key (None or str): If lazy, pass this cache_key to the
             VirtualArrays. If None, a process-unique string is constructed.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
@@ -2773,26 +3484,87 @@ def from_parquet(
         >>> ak.from_parquet("array1.parquet")
         <Array [[1, 2, 3], [], ... [], [6, 7, 8, 9]] type='6 * var * ?int64'>
 
+    The `filters` are only checked against the minimum and maximum values
+    recorded in each row group's metadata: row groups that cannot contain a
+    match are never read, but rows within the selected row groups are not
+    filtered individually. (Select rows with an ordinary slice afterward.)
+
+        >>> ak.from_parquet("events.parquet", columns=["jets.pt"],
+        ...                 filters=[("run", ">=", 300000)])
+
+    If `source` is a directory, glob pattern, or list of files, all of the
+    files must have the same schema. The result is a single array, whose
+    partitions (if lazy) are the row groups of all files. Opening a dataset
+    only reads metadata: if the directory contains a `_metadata` index (see
+    #ak.to_parquet.dataset), only that file is read; otherwise, the footer of
+    each file is read. No data are read until they are needed.
+
+        >>> ak.from_parquet("/directory/*.parquet", lazy=True)
+
     See also #ak.from_arrow, which is used as an intermediate step.
-    See also #ak.to_parquet.
+    See also #ak.to_parquet and #ak.to_parquet.dataset.
     """
     pyarrow = _import_pyarrow("ak.from_parquet")
     import pyarrow.parquet
 
-    file = pyarrow.parquet.ParquetFile(source, **options)
-    schema = file.schema.to_arrow_schema()
+    dataset = _parquet_dataset_files(source)
+    if dataset is None:
+        file = pyarrow.parquet.ParquetFile(source, **options)
+        parquet_schema = file.schema
+        states = [_ParquetState(file, use_threads, source, options)]
+        pieces = [
+            (0, i, file.metadata.row_group(i)) for i in range(file.num_row_groups)
+        ]
+    else:
+        file = None
+        parquet_schema, states, pieces = _parquet_dataset_pieces(
+            dataset[0], dataset[1], source, use_threads, options
+        )
+    schema = parquet_schema.to_arrow_schema()
     all_columns = schema.names
 
     if columns is None:
         columns = all_columns
+
+    # top-level column name -> Parquet column paths (None if unprojected)
+    projections = collections.OrderedDict()
+    leaf_paths = None
     for x in columns:
-        if x not in all_columns:
+        if x in all_columns:
+            projections[x] = None
+        else:
+            if leaf_paths is None:
+                leaf_paths = _parquet_leaf_paths(parquet_schema, schema)
+            paths = _parquet_resolve(x, leaf_paths, source)
+            top = _parquet_field_path(schema, paths[0].split("."))[0]
+            if top not in projections:
+                projections[top] = []
+            if projections[top] is not None:
+                projections[top].extend(y for y in paths if y not in projections[top])
+    columns = list(projections)
+
+    if row_groups is None:
+        row_groups = list(range(len(pieces)))
+    elif isinstance(row_groups, (numbers.Integral, np.integer)):
+        row_groups = [row_groups]
+    else:
+        row_groups = list(row_groups)
+    for x in row_groups:
+        if not 0 <= x < len(pieces):
             raise ValueError(
-                "column {0} does not exist in file {1}".format(repr(x), repr(source))
+                "row group {0} does not exist in {1}".format(x, repr(source))
                 + ak._util.exception_suffix(__file__)
             )
 
-    if file.num_row_groups == 0:
+    if filters is not None:
+        if leaf_paths is None:
+            leaf_paths = _parquet_leaf_paths(parquet_schema, schema)
+        selected = _parquet_filter_row_groups(
+            [pieces[x][2] for x in row_groups], filters, leaf_paths, source
+        )
+        row_groups = [row_groups[i] for i in selected]
+
+    if len(row_groups) == 0:
         out = ak.layout.RecordArray(
             [ak.layout.EmptyArray() for x in columns], columns, 0
         )
@@ -2803,8 +3575,6 @@ def from_parquet(
 
     hold_cache = None
     if lazy:
-        state = _ParquetState(file, use_threads, source, options)
-
         if lazy_cache == "new":
             hold_cache = ak._util.MappingProxy({})
             lazy_cache = ak.layout.ArrayCache(hold_cache)
@@ -2813,7 +3583,7 @@ def from_parquet(
             hold_cache = ak._util.MappingProxy({})
             lazy_cache = ak.layout.ArrayCache(hold_cache)
         elif lazy_cache is not None and not isinstance(
-            lazy_cache, ak.layout.ArrayCache
+            lazy_cache, (ak.layout.ArrayCache, ak.layout.BoundedArrayCache)
         ):
             hold_cache = ak._util.MappingProxy.maybe_wrap(lazy_cache)
             if not isinstance(hold_cache, MutableMapping):
@@ -2825,22 +3595,31 @@ def from_parquet(
 
         partitions = []
         offsets = [0]
-        for row_group in range(file.num_row_groups):
-            length = file.metadata.row_group(row_group).num_rows
+        for row_group in row_groups:
+            state_index, file_row_group, metadata = pieces[row_group]
+            state = states[state_index]
+            length = metadata.num_rows
             offsets.append(offsets[-1] + length)
 
             fields = []
             for column in columns:
+                paths = projections[column]
+                if paths is None:
+                    args = (file_row_group, column)
+                    key = column
+                else:
+                    args = (file_row_group, column, paths)
+                    key = "{0}{{{1}}}".format(column, ",".join(paths))
                 generator = ak.layout.ArrayGenerator(
                     state,
-                    (row_group, column),
+                    args,
                     # form=???      # FIXME: need Arrow schema -> Awkward Forms
                     length=length,
                 )
                 if all_columns == [""]:
                     cache_key = "{0}[{1}]".format(lazy_cache_key, row_group)
                 else:
-                    cache_key = "{0}.{1}[{2}]".format(lazy_cache_key, column, row_group)
+                    cache_key = "{0}.{1}[{2}]".format(lazy_cache_key, key, row_group)
                 fields.append(ak.layout.VirtualArray(generator, lazy_cache, cache_key))
 
             if all_columns == [""]:
@@ -2859,8 +3638,44 @@ def from_parquet(
             return out
 
     else:
+        paths = []
+        for column in columns:
+            if projections[column] is None:
+                paths.append(column)
+            else:
+                paths.extend(projections[column])
+
+        if file is not None and row_groups == list(range(file.num_row_groups)):
+            table = file.read(paths, use_threads=use_threads)
+        else:
+            # consecutive row groups from the same file are read together
+            tables = []
+            start = 0
+            while start < len(row_groups):
+                state_index = pieces[row_groups[start]][0]
+                stop = start + 1
+                while (
+                    stop < len(row_groups)
+                    and pieces[row_groups[stop]][0] == state_index
+                ):
+                    stop += 1
+                tables.append(
+                    states[state_index]
+                    .parquet_file()
+                    .read_row_groups(
+                        [pieces[x][1] for x in row_groups[start:stop]],
+                        paths,
+                        use_threads=use_threads,
+                    )
+                )
+                start = stop
+            if len(tables) == 1:
+                table = tables[0]
+            else:
+                table = pyarrow.concat_tables(tables)
+
         out = _from_arrow(
-            file.read(columns, use_threads=use_threads),
+            table,
             False,
             highlevel=highlevel,
             behavior=behavior,
@@ -3296,6 +4111,9 @@ _index_form_to_dtype = _index_form_to_index = _form_to_layout_class = None
 
 
 def _asbuf(obj):
+    if isinstance(obj, bytes):
+        # numpy.asarray would copy it into a zero-dimensional bytestring array
+        return numpy.frombuffer(obj, np.uint8)
     try:
         tmp = numpy.asarray(obj)
     except Exception:
@@ -3304,6 +4122,14 @@ def _asbuf(obj):
         return tmp.reshape(-1).view(np.uint8)
 
 
+def _asbuf_range(obj, start, stop):
+    # slice before converting, so that buffers backed by files (memory maps,
+    # HDF5 datasets, etc.) only read the bytes from start to stop
+    if getattr(obj, "dtype", None) == np.uint8 and getattr(obj, "ndim", None) == 1:
+        return _asbuf(obj[start:stop])
+    return _asbuf(obj)[start:stop]
+
+
 def _form_to_layout(
     form,
     container,
@@ -3312,6 +4138,8 @@ def _form_to_layout(
     length,
     lazy_cache,
     lazy_cache_key,
+    start=None,
+    stop=None,
 ):
     global _index_form_to_dtype, _index_form_to_index, _form_to_layout_class
 
@@ -3357,6 +4185,19 @@ def _form_to_layout(
     else:
         identities = None
 
+    if start is not None:
+        return _form_to_layout_range(
+            form,
+            container,
+            partnum,
+            key_format,
+            length,
+            lazy_cache,
+            lazy_cache_key,
+            start,
+            stop,
+        )
+
     parameters = form.parameters
     fk = form.form_key
 
@@ -3720,6 +4561,7 @@ def _form_to_layout(
             args,
             form=form.form,
             length=length,
+            accepts_range=True,
         )
         node_cache_key = key_format(
             form_key=form.form.form_key, attribute="virtual", partition=partnum
@@ -3736,6 +4578,179 @@ def _form_to_layout(
         )
 
 
+def _form_to_layout_range(
+    form,
+    container,
+    partnum,
+    key_format,
+    length,
+    lazy_cache,
+    lazy_cache_key,
+    start,
+    stop,
+):
+    parameters = form.parameters
+    fk = form.form_key
+
+    if isinstance(form, ak.forms.ByteMaskedForm):
+        itemsize = _index_form_to_dtype[form.mask].itemsize
+        raw_mask = _asbuf_range(
+            container[key_format(form_key=fk, attribute="mask", partition=partnum)],
+            start * itemsize,
+            stop * itemsize,
+        )
+        mask = _index_form_to_index[form.mask](
+            raw_mask.view(_index_form_to_dtype[form.mask])
+        )
+
+        content = _form_to_layout(
+            form.content,
+            container,
+            partnum,
+            key_format,
+            length,
+            lazy_cache,
+            lazy_cache_key,
+            start,
+            stop,
+        )
+
+        return ak.layout.ByteMaskedArray(
+            mask, content, form.valid_when, None, parameters
+        )
+
+    elif isinstance(form, ak.forms.ListOffsetForm):
+        itemsize = _index_form_to_dtype[form.offsets].itemsize
+        raw_offsets = _asbuf_range(
+            container[key_format(form_key=fk, attribute="offsets", partition=partnum)],
+            start * itemsize,
+            (stop + 1) * itemsize,
+        )
+        array_offsets = raw_offsets.view(_index_form_to_dtype[form.offsets])
+
+        content = _form_to_layout(
+            form.content,
+            container,
+            partnum,
+            key_format,
+            None,
+            lazy_cache,
+            lazy_cache_key,
+            int(array_offsets[0]),
+            int(array_offsets[-1]),
+        )
+
+        offsets = _index_form_to_index[form.offsets](array_offsets - array_offsets[0])
+        return _form_to_layout_class[type(form), form.offsets](
+            offsets, content, None, parameters
+        )
+
+    elif isinstance(form, ak.forms.NumpyForm):
+        dtype_inner_shape = form.to_numpy()
+        if dtype_inner_shape.subdtype is None:
+            dtype, inner_shape = dtype_inner_shape, ()
+        else:
+            dtype, inner_shape = dtype_inner_shape.subdtype
+
+        raw_array = _asbuf_range(
+            container[key_format(form_key=fk, attribute="data", partition=partnum)],
+            start * dtype_inner_shape.itemsize,
+            stop * dtype_inner_shape.itemsize,
+        )
+        array = raw_array.view(dtype).reshape((stop - start,) + inner_shape)
+
+        return ak.layout.NumpyArray(array, None, parameters)
+
+    elif isinstance(form, ak.forms.RecordForm):
+        items = list(form.contents.items())
+        if form.istuple:
+            items.sort(key=lambda x: int(x[0]))
+        contents = []
+        keys = []
+        for key, content_form in items:
+            keys.append(key)
+            contents.append(
+                _form_to_layout(
+                    content_form,
+                    container,
+                    partnum,
+                    key_format,
+                    length,
+                    lazy_cache,
+                    lazy_cache_key,
+                    start,
+                    stop,
+                )
+            )
+
+        return ak.layout.RecordArray(
+            contents,
+            None if form.istuple else keys,
+            stop - start,
+            None,
+            parameters,
+        )
+
+    elif isinstance(form, ak.forms.RegularForm):
+        content = _form_to_layout(
+            form.content,
+            container,
+            partnum,
+            key_format,
+            None if length is None else length * form.size,
+            lazy_cache,
+            lazy_cache_key,
+            start * form.size,
+            stop * form.size,
+        )
+
+        return ak.layout.RegularArray(
+            content, form.size, stop - start, None, parameters
+        )
+
+    elif isinstance(form, ak.forms.UnmaskedForm):
+        content = _form_to_layout(
+            form.content,
+            container,
+            partnum,
+            key_format,
+            length,
+            lazy_cache,
+            lazy_cache_key,
+            start,
+            stop,
+        )
+
+        return ak.layout.UnmaskedArray(content, None, parameters)
+
+    elif isinstance(form, ak.forms.VirtualForm) and length is None:
+        # without the full length, the nested VirtualArray could not be
+        # sliced lazily (below), so make a VirtualArray of just this range
+        generator = ak.layout.ArrayGenerator(
+            _form_to_layout,
+            (form.form, container, partnum, key_format, None, lazy_cache),
+            {"lazy_cache_key": lazy_cache_key, "start": start, "stop": stop},
+            form=form.form,
+            length=stop - start,
+        )
+        return ak.layout.VirtualArray(generator, None)
+
+    else:
+        # the other node types do not know which range of their contents they
+        # need without reading their whole index, so read it all and slice
+        # (which, for a VirtualArray with a length, is lazy)
+        layout = _form_to_layout(
+            form,
+            container,
+            partnum,
+            key_format,
+            length,
+            lazy_cache,
+            lazy_cache_key,
+        )
+        return layout[start:stop]
+
+
 _from_buffers_key_number = 0
 _from_buffers_key_lock = threading.Lock()
 
@@ -3808,10 +4823,13 @@ def from_buffers(
             #ak.layout.VirtualArray, possibly in #ak.partition.PartitionedArray
             if `num_partitions` is not None); if False, read all requested data
             immediately. Any RecordArray child nodes will additionally be
-            read on demand.
-        lazy_cache (None, "new", or MutableMapping): If lazy, pass this
-            cache to the VirtualArrays. If "new", a new dict (keep-forever cache)
-            is created. If None, no cache is used.
+            read on demand. Slicing a lazy array by a range of entries only
+            reads the parts of the buffers that cover that range, where the
+            node types make this possible.
+        lazy_cache (None, "new", MutableMapping, or #ak.layout.BoundedArrayCache):
+            If lazy, pass this cache to the VirtualArrays. If "new", a new dict
+            (keep-forever cache) is created; a #ak.layout.BoundedArrayCache
+            keeps memory use bounded. If None, no cache is used.
         lazy_cache_key (None or str): If lazy, pass this cache_key to the
             VirtualArrays. If None, a process-unique string is constructed.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
@@ -3867,7 +4885,7 @@ def from_buffers(
             hold_cache = ak._util.MappingProxy({})
             lazy_cache = ak.layout.ArrayCache(hold_cache)
         elif lazy_cache is not None and not isinstance(
-            lazy_cache, ak.layout.ArrayCache
+            lazy_cache, (ak.layout.ArrayCache, ak.layout.BoundedArrayCache)
         ):
             hold_cache = ak._util.MappingProxy.maybe_wrap(lazy_cache)
             if not isinstance(hold_cache, MutableMapping):
@@ -3896,6 +4914,7 @@ def from_buffers(
                 args + (lazy_cache, lazy_cache_key),
                 form=form,
                 length=length,
+                accepts_range=True,
             )
             out = ak.layout.VirtualArray(generator, lazy_cache, lazy_cache_key)
 
@@ -3917,6 +4936,7 @@ def from_buffers(
                     args + (partlen, lazy_cache, lazy_cache_key_part),
                     form=form,
                     length=length[part],
+                    accepts_range=True,
                 )
 
                 partitions.append(
@@ -4212,9 +5232,10 @@ def from_arrayset(
             if `num_partitions` is not None); if False, read all requested data
             immediately. Any RecordArray child nodes will additionally be
             read on demand.
-        lazy_cache (None, "new", or MutableMapping): If lazy, pass this
-            cache to the VirtualArrays. If "new", a new dict (keep-forever cache)
-            is created. If None, no cache is used.
+        lazy_cache (None, "new", MutableMapping, or #ak.layout.BoundedArrayCache):
+            If lazy, pass this cache to the VirtualArrays. If "new", a new dict
+            (keep-forever cache) is created; a #ak.layout.BoundedArrayCache
+            keeps memory use bounded. If None, no cache is used.
         lazy_cache_key (None or str): If lazy, pass this cache_key to the
             VirtualArrays. If None, a process-unique string is constructed.
         lazy_lengths (None, int, or iterable of ints): If lazy and
@@ -4626,6 +5647,7 @@ __all__ = [
         "math",
         "threading",
         "Iterable",
+        "Iterator",
         "numpy",
         "np",
         "awkward",
@@ -2,6 +2,8 @@
 
 from __future__ import absolute_import
 
+import numbers
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
@@ -828,6 +830,204 @@ def moment(x, n, weight=None, axis=None, keepdims=False, mask_identity=True):
         return ak.nplike.of(sumwxn, sumw).true_divide(sumwxn, sumw)
 
 
+def _moment_records(layout):
+    # the records of sums below any lists and missing values, for axis=None
+    if isinstance(layout, ak.partition.PartitionedArray):
+        return [x for p in layout.partitions for x in _moment_records(p)]
+    elif isinstance(layout, ak._util.virtualtypes):
+        return _moment_records(layout.array)
+    elif isinstance(layout, ak._util.unknowntypes):
+        return []
+    elif isinstance(layout, ak._util.indexedtypes + ak._util.optiontypes):
+        return _moment_records(layout.project())
+    elif isinstance(layout, ak._util.uniontypes):
+        return [
+            x
+            for i in range(layout.numcontents)
+            for x in _moment_records(layout.project(i))
+        ]
+    elif isinstance(layout, ak._util.listtypes):
+        return _moment_records(layout.flatten(axis=1))
+    else:
+        return [layout]
+
+
+def _moment_sums(x, y, weight, axis, keepdims, mask_identity, keys):
+    # The weights and the weighted first and second powers of x (and y) that
+    # are named in keys ("w", "wx", "wxx", "wy", "wyy", "wxy") are built in one
+    # broadcast as the fields of a record, which is reduced in a single pass.
+    # Values are shifted by a representative value (the mean of the first
+    # block of finite values) so that the sums of squares do not lose
+    # precision when the mean is far from zero.
+    names = ["x"]
+    arrays = [x]
+    if y is not None:
+        names.append("y")
+        arrays.append(y)
+    if weight is not None:
+        names.append("weight")
+        arrays.append(weight)
+    behavior = ak._util.behaviorof(*arrays)
+    layouts = [
+        ak.operations.convert.to_layout(a, allow_record=False, allow_other=True)
+        for a in arrays
+    ]
+
+    shifts = {}
+
+    def shifted(nplike, name, values):
+        values = nplike.asarray(values)
+        if values.dtype.kind != "c":
+            values = values.astype(np.float64)
+        if name not in shifts:
+            # partitions may be processed in parallel: the first shift wins
+            finite = values[values - values == 0]
+            shifts.setdefault(name, finite.mean().item() if len(finite) > 0 else 0.0)
+        return values - shifts[name]
+
+    def getfunction(inputs):
+        if all(
+            isinstance(x, ak.layout.NumpyArray) or not isinstance(x, ak.layout.Content)
+            for x in inputs
+        ):
+            nplike = ak.nplike.of(*inputs)
+            columns = dict(zip(names, inputs))
+            dx = shifted(nplike, "x", columns["x"])
+
+            # without weights, the weighted values are the values themselves
+            if weight is None:
+                w = nplike.ones_like(dx)
+                wdx = dx
+            else:
+                if isinstance(columns["weight"], ak.layout.Content):
+                    w = nplike.asarray(columns["weight"])
+                    if w.dtype.kind not in "fc":
+                        w = w.astype(np.float64)
+                else:
+                    w = nplike.ones_like(dx) * columns["weight"]
+                wdx = w * dx
+
+            channels = {"w": w, "wx": wdx}
+            if "wxx" in keys:
+                channels["wxx"] = wdx * dx
+            if y is not None:
+                dy = shifted(nplike, "y", columns["y"])
+                wdy = dy if weight is None else w * dy
+                channels["wy"] = wdy
+                if "wyy" in keys:
+                    channels["wyy"] = wdy * dy
+                if "wxy" in keys:
+                    channels["wxy"] = wdx * dy
+
+            return lambda: (
+                ak.layout.RecordArray(
+                    [ak.layout.NumpyArray(channels[key]) for key in keys], keys
+                ),
+            )
+        else:
+            return None
+
+    out = ak._util.broadcast_and_apply(
+        layouts,
+        getfunction,
+        behavior,
+        allow_records=False,
+        pass_depth=False,
+        numpy_to_regular=True,
+    )
+    assert isinstance(out, tuple) and len(out) == 1
+
+    if axis is None:
+        # the records of all lists are reduced as the items of one list
+        sums = dict((key, 0.0) for key in keys)
+        for records in _moment_records(out[0]):
+            nplike = ak.nplike.of(records)
+            offsets = ak.layout.Index64(nplike.array([0, len(records)], np.int64))
+            reduced = ak.layout.ListOffsetArray64(offsets, records).sum(axis=-1)
+            for key in keys:
+                sums[key] = sums[key] + nplike.asarray(reduced.field(key))[0]
+    else:
+        reduced = sum(
+            ak._util.wrap(out[0], None),
+            axis=axis,
+            keepdims=keepdims,
+            mask_identity=mask_identity,
+        )
+        sums = dict((key, reduced[key]) for key in keys)
+    return sums, shifts
+
+
+def _mean(sums, shifts, name):
+    nplike = ak.nplike.of(sums["w" + name], sums["w"])
+    return nplike.true_divide(sums["w" + name], sums["w"]) + shifts[name]
+
+
+def _squares(sums, name):
+    # sum of weighted squares about the mean; rounding can leave it slightly
+    # negative if all values in a group are equal
+    out = sums["w" + name + name] - ak.nplike.of(sums["w"]).true_divide(
+        sums["w" + name] * sums["w" + name], sums["w"]
+    )
+    return abs(out) * (out > 0)
+
+
+def _var(sums, name, ddof):
+    return ak.nplike.of(sums["w"]).true_divide(_squares(sums, name), sums["w"] - ddof)
+
+
+def _covar(sums):
+    nplike = ak.nplike.of(sums["w"])
+    products = sums["wxy"] - nplike.true_divide(sums["wx"] * sums["wy"], sums["w"])
+    return nplike.true_divide(products, sums["w"])
+
+
+def _corr(sums):
+    nplike = ak.nplike.of(sums["w"])
+    products = sums["wxy"] - nplike.true_divide(sums["wx"] * sums["wy"], sums["w"])
+    return nplike.true_divide(
+        products, nplike.sqrt(_squares(sums, "x") * _squares(sums, "y"))
+    )
+
+
+def _record_of(nplike, contents, keys, name, behavior):
+    contents = [
+        ak.operations.convert.to_layout(x, allow_record=True, allow_other=True)
+        for x in contents
+    ]
+
+    scalar = False
+    for i, x in enumerate(contents):
+        if not isinstance(
+            x, (ak.layout.Content, ak.layout.Record, ak.partition.PartitionedArray)
+        ):
+            contents[i] = ak.layout.NumpyArray(nplike.array([x]))
+            scalar = True
+
+    sample = None
+    for x in contents:
+        if isinstance(x, ak.partition.PartitionedArray):
+            sample = x
+            break
+
+    if sample is not None:
+        contents = ak.partition.partition_as(sample, contents)
+        output = []
+        for parts in ak.partition.iterate(sample.numpartitions, contents):
+            output.append(
+                ak.layout.RecordArray(
+                    list(parts), keys, parameters={"__record__": name}
+                )
+            )
+        out = ak.partition.IrregularlyPartitionedArray(output)
+
+    else:
+        out = ak.layout.RecordArray(contents, keys, parameters={"__record__": name})
+        if scalar:
+            out = out[0]
+
+    return ak._util.wrap(out, behavior)
+
+
 @ak._connect._numpy.implements("mean")
 def mean(x, weight=None, axis=None, keepdims=False, mask_identity=True):
     """
@@ -890,21 +1090,12 @@ def mean(x, weight=None, axis=None, keepdims=False, mask_identity=True):
     See #ak.sum for a complete description of handling nested lists and
     missing values (None) in reducers.
     """
+
     with np.errstate(invalid="ignore"):
-        if weight is None:
-            sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwx = sum(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-        else:
-            sumw = sum(
-                x * 0 + weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwx = sum(
-                x * weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-        return ak.nplike.of(sumwx, sumw).true_divide(sumwx, sumw)
+        sums, shifts = _moment_sums(
+            x, None, weight, axis, keepdims, mask_identity, ["w", "wx"]
+        )
+        return _mean(sums, shifts, "x")
 
 
 @ak._connect._numpy.implements("var")
@@ -956,37 +1147,12 @@ def var(x, weight=None, ddof=0, axis=None, keepdims=False, mask_identity=True):
     missing values (None) in reducers, and #ak.mean for an example with another
     non-reducer.
     """
+
     with np.errstate(invalid="ignore"):
-        xmean = mean(
-            x, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+        sums, shifts = _moment_sums(
+            x, None, weight, axis, keepdims, mask_identity, ["w", "wx", "wxx"]
         )
-        if weight is None:
-            sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwxx = sum(
-                (x - xmean) ** 2,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-        else:
-            sumw = sum(
-                x * 0 + weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwxx = sum(
-                (x - xmean) ** 2 * weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-        if ddof != 0:
-            return ak.nplike.of(sumwxx, sumw).true_divide(sumwxx, sumw) * ak.nplike.of(
-                sumw
-            ).true_divide(sumw, sumw - ddof)
-        else:
-            return ak.nplike.of(sumwxx, sumw).true_divide(sumwxx, sumw)
+        return _var(sums, "x", ddof)
 
 
 @ak._connect._numpy.implements("std")
@@ -1083,35 +1249,12 @@ def covar(x, y, weight=None, axis=None, keepdims=False, mask_identity=True):
     missing values (None) in reducers, and #ak.mean for an example with another
     non-reducer.
     """
+
     with np.errstate(invalid="ignore"):
-        xmean = mean(
-            x, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-        )
-        ymean = mean(
-            y, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+        sums, shifts = _moment_sums(
+            x, y, weight, axis, keepdims, mask_identity, ["w", "wx", "wy", "wxy"]
         )
-        if weight is None:
-            sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwxy = sum(
-                (x - xmean) * (y - ymean),
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-        else:
-            sumw = sum(
-                x * 0 + weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwxy = sum(
-                (x - xmean) * (y - ymean) * weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-        return ak.nplike.of(sumwxy, sumw).true_divide(sumwxy, sumw)
+        return _covar(sums)
 
 
 def corr(x, y, weight=None, axis=None, keepdims=False, mask_identity=True):
@@ -1154,46 +1297,18 @@ def corr(x, y, weight=None, axis=None, keepdims=False, mask_identity=True):
     missing values (None) in reducers, and #ak.mean for an example with another
     non-reducer.
     """
+
     with np.errstate(invalid="ignore"):
-        xmean = mean(
-            x, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-        )
-        ymean = mean(
-            y, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+        sums, shifts = _moment_sums(
+            x,
+            y,
+            weight,
+            axis,
+            keepdims,
+            mask_identity,
+            ["w", "wx", "wy", "wxx", "wyy", "wxy"],
         )
-        xdiff = x - xmean
-        ydiff = y - ymean
-        if weight is None:
-            sumwxx = sum(
-                xdiff ** 2, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-            sumwyy = sum(
-                ydiff ** 2, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-            sumwxy = sum(
-                xdiff * ydiff, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-        else:
-            sumwxx = sum(
-                (xdiff ** 2) * weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwyy = sum(
-                (ydiff ** 2) * weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwxy = sum(
-                (xdiff * ydiff) * weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-        nplike = ak.nplike.of(sumwxy, sumwxx, sumwyy)
-        return nplike.true_divide(sumwxy, nplike.sqrt(sumwxx * sumwyy))
+        return _corr(sums)
 
 
 def linear_fit(x, y, weight=None, axis=None, keepdims=False, mask_identity=True):
@@ -1249,146 +1364,508 @@ def linear_fit(x, y, weight=None, axis=None, keepdims=False, mask_identity=True)
     missing values (None) in reducers, and #ak.mean for an example with another
     non-reducer.
     """
+
     with np.errstate(invalid="ignore"):
-        nplike = ak.nplike.of(x, y, weight)
-        if weight is None:
-            sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwx = sum(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwy = sum(y, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwxx = sum(
-                x ** 2, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-            sumwxy = sum(
-                x * y, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-        else:
-            sumw = sum(
-                x * 0 + weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwx = sum(
-                x * weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-            sumwy = sum(
-                y * weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-            sumwxx = sum(
-                (x ** 2) * weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwxy = sum(
-                x * y * weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
+        sums, shifts = _moment_sums(
+            x,
+            y,
+            weight,
+            axis,
+            keepdims,
+            mask_identity,
+            ["w", "wx", "wy", "wxx", "wxy"],
+        )
+        nplike = ak.nplike.of(sums["w"], sums["wx"])
+        sumw, sumwx, sumwy = sums["w"], sums["wx"], sums["wy"]
+        sumwxx, sumwxy = sums["wxx"], sums["wxy"]
+
+        # the sums are about (shiftx, shifty); delta and slope do not depend on
+        # the shifts, but the intercept and its error do
         delta = (sumw * sumwxx) - (sumwx * sumwx)
-        intercept = nplike.true_divide(((sumwxx * sumwy) - (sumwx * sumwxy)), delta)
         slope = nplike.true_divide(((sumw * sumwxy) - (sumwx * sumwy)), delta)
-        intercept_error = nplike.sqrt(nplike.true_divide(sumwxx, delta))
+        intercept = (
+            nplike.true_divide(((sumwxx * sumwy) - (sumwx * sumwxy)), delta)
+            + shifts["y"]
+            - slope * shifts["x"]
+        )
+        sumwxx_unshifted = sumwxx + 2 * shifts["x"] * sumwx + shifts["x"] ** 2 * sumw
+        intercept_error = nplike.sqrt(nplike.true_divide(sumwxx_unshifted, delta))
         slope_error = nplike.sqrt(nplike.true_divide(sumw, delta))
 
-        intercept = ak.operations.convert.to_layout(
-            intercept, allow_record=True, allow_other=True
+        return _record_of(
+            nplike,
+            [intercept, slope, intercept_error, slope_error],
+            ["intercept", "slope", "intercept_error", "slope_error"],
+            "LinearFit",
+            ak._util.behaviorof(x, y),
         )
-        slope = ak.operations.convert.to_layout(
-            slope, allow_record=True, allow_other=True
+
+
+def moments(
+    x, y=None, weight=None, ddof=0, axis=None, keepdims=False, mask_identity=True
+):
+    """
+    Args:
+        x: the data on which to compute the moments.
+        y: if not None, the other coordinate for the covariance and
+            correlation with `x`; it must be broadcastable to `x`.
+        weight: data that can be broadcasted to `x` (and `y`) to give each
+            value a weight. Weighting values equally is the same as no weights;
+            weighting some values higher increases the significance of those
+            values. Weights can be zero or negative.
+        ddof (int): "delta degrees of freedom": the divisor used in the
+            calculation of `var` and `std` is `sum(weights) - ddof`.
+        axis (None or int): If None, combine all values from the array into
+            a single scalar result; if an int, group by that axis: `0` is the
+            outermost, `1` is the first level of nested lists, etc., and
+            negative `axis` counts from the innermost: `-1` is the innermost,
+            `-2` is the next level up, etc.
+        keepdims (bool): If False, this function descreases the number of
+            dimensions by 1; if True, the output values are wrapped in a new
+            length-1 dimension so that the result of this operation may be
+            broadcasted with the original array.
+        mask_identity (bool): If True, the application of this function on
+            empty lists results in None (an option type); otherwise, the
+            calculation is followed through with the reducers' identities,
+            usually resulting in floating-point `nan`.
+
+    Computes the sum of weights, #ak.mean, #ak.var, and #ak.std of `x` in
+    each group of elements and, if `y` is given, the #ak.covar and #ak.corr
+    of `x` and `y`, in a single pass over the data. The grouping is performed
+    the same way as for reducers, though this operation is not a reducer and
+    has no identity.
+
+    The results are given as an #ak.Record with fields `sumw`, `mean`, `var`,
+    and `std`, as well as `covar` and `corr` if `y` is given. The values of
+    these fields might be arrays or even nested arrays; they match the
+    structure of `x`.
+
+        >>> array = ak.Array([[0, 1, 2, 3], [], [4, 5]])
+        >>> ak.moments(array, axis=-1).tolist()
+        [{'sumw': 4.0, 'mean': 1.5, 'var': 1.25, 'std': 1.118033988749895},
+         {'sumw': None, 'mean': None, 'var': None, 'std': None},
+         {'sumw': 2.0, 'mean': 4.5, 'var': 0.25, 'std': 0.5}]
+
+    All of the sums that these quantities depend on are reduced together,
+    as the fields of one record, so asking for several of them costs about as
+    much as asking for one. Before squaring, values are shifted by the mean
+    of a block of the data, which keeps the sums of squares precise unless a
+    group's mean is many orders of magnitude farther from that shift than its
+    standard deviation.
+
+    See #ak.sum for a complete description of handling nested lists and
+    missing values (None) in reducers, and #ak.mean for an example with another
+    non-reducer.
+    """
+    with np.errstate(invalid="ignore"):
+        keys = ["w", "wx", "wxx"]
+        if y is not None:
+            keys.extend(["wy", "wyy", "wxy"])
+        sums, shifts = _moment_sums(x, y, weight, axis, keepdims, mask_identity, keys)
+        nplike = ak.nplike.of(sums["w"], sums["wx"])
+        variance = _var(sums, "x", ddof)
+        contents = [
+            sums["w"],
+            _mean(sums, shifts, "x"),
+            variance,
+            nplike.sqrt(variance),
+        ]
+        keys = ["sumw", "mean", "var", "std"]
+        if y is not None:
+            contents.extend([_covar(sums), _corr(sums)])
+            keys.extend(["covar", "corr"])
+        return _record_of(
+            nplike, contents, keys, "Moments", ak._util.behaviorof(x, y, weight)
         )
-        intercept_error = ak.operations.convert.to_layout(
-            intercept_error, allow_record=True, allow_other=True
+
+
+def _expand_ranges(nplike, starts, stops, parents):
+    # indexes of all elements in [starts[i], stops[i]) for each i, in order,
+    # and parents repeated to match
+    counts = stops - starts
+    offsets = nplike.empty(len(counts) + 1, np.int64)
+    offsets[0] = 0
+    nplike.cumsum(counts, out=offsets[1:])
+    index = nplike.arange(offsets[-1], dtype=np.int64) - nplike.repeat(
+        offsets[:-1] - starts, counts
+    )
+    if parents is not None:
+        parents = nplike.repeat(parents, counts)
+    return index, parents
+
+
+def _histogram_leaves(layout, selection, parents, out, columns):
+    # Appends (leaf, selection, parents) for each leaf of the layout: the
+    # selection is None (all), a slice, or an index array of the elements
+    # that are reachable and not None, so the leaves are never copied.
+    # If parents is not None, the selection is always an index array and
+    # parents[i] is the list that element selection[i] belongs to.
+    # If columns is not None, the leaves are the records that histogram
+    # builds, with those fields; otherwise, they are the user's numbers.
+    nplike = ak.nplike.of(layout)
+
+    if isinstance(layout, ak._util.virtualtypes):
+        _histogram_leaves(layout.array, selection, parents, out, columns)
+
+    elif isinstance(layout, ak._util.unknowntypes):
+        pass
+
+    elif layout.parameter("__array__") in ("string", "bytestring", "char", "byte"):
+        raise ValueError(
+            "cannot make a histogram of strings" + ak._util.exception_suffix(__file__)
         )
-        slope_error = ak.operations.convert.to_layout(
-            slope_error, allow_record=True, allow_other=True
+
+    elif isinstance(layout, ak.layout.RecordArray) and columns is None:
+        raise ValueError(
+            "cannot make a histogram of records" + ak._util.exception_suffix(__file__)
         )
 
-        scalar = False
-        if not isinstance(
-            intercept,
-            (
-                ak.layout.Content,
-                ak.layout.Record,
-                ak.partition.PartitionedArray,
-            ),
-        ):
-            intercept = ak.layout.NumpyArray(nplike.array([intercept]))
-            scalar = True
-        if not isinstance(
-            slope,
-            (
-                ak.layout.Content,
-                ak.layout.Record,
-                ak.partition.PartitionedArray,
-            ),
-        ):
-            slope = ak.layout.NumpyArray(nplike.array([slope]))
-            scalar = True
-        if not isinstance(
-            intercept_error,
-            (
-                ak.layout.Content,
-                ak.layout.Record,
-                ak.partition.PartitionedArray,
-            ),
-        ):
-            intercept_error = ak.layout.NumpyArray(nplike.array([intercept_error]))
-            scalar = True
-        if not isinstance(
-            slope_error,
-            (
-                ak.layout.Content,
-                ak.layout.Record,
-                ak.partition.PartitionedArray,
-            ),
-        ):
-            slope_error = ak.layout.NumpyArray(nplike.array([slope_error]))
-            scalar = True
+    elif isinstance(layout, (ak.layout.NumpyArray, ak.layout.RecordArray)):
+        out.append((layout, selection, parents))
 
-        sample = None
-        if isinstance(intercept, ak.partition.PartitionedArray):
-            sample = intercept
-        elif isinstance(slope, ak.partition.PartitionedArray):
-            sample = slope
-        elif isinstance(intercept_error, ak.partition.PartitionedArray):
-            sample = intercept_error
-        elif isinstance(slope_error, ak.partition.PartitionedArray):
-            sample = slope_error
-
-        if sample is not None:
-            (
-                intercept,
-                slope,
-                intercept_error,
-                slope_error,
-            ) = ak.partition.partition_as(
-                sample, (intercept, slope, intercept_error, slope_error)
+    elif isinstance(layout, ak.layout.RegularArray):
+        size = layout.size
+        if selection is None:
+            selection = slice(0, len(layout) * size)
+        elif isinstance(selection, slice):
+            selection = slice(selection.start * size, selection.stop * size)
+        else:
+            selection, parents = _expand_ranges(
+                nplike, selection * size, selection * size + size, parents
+            )
+        _histogram_leaves(layout.content, selection, parents, out, columns)
+
+    elif isinstance(layout, ak._util.listtypes):
+        if (
+            isinstance(
+                layout,
+                (
+                    ak.layout.ListOffsetArray32,
+                    ak.layout.ListOffsetArrayU32,
+                    ak.layout.ListOffsetArray64,
+                ),
             )
-            output = []
-            for a, b, c, d in ak.partition.iterate(
-                sample.numpartitions, (intercept, slope, intercept_error, slope_error)
-            ):
-                output.append(
-                    ak.layout.RecordArray(
-                        [a, b, c, d],
-                        ["intercept", "slope", "intercept_error", "slope_error"],
-                        parameters={"__record__": "LinearFit"},
-                    )
+            and (selection is None or isinstance(selection, slice))
+        ):
+            # contiguous lists select a contiguous range of the content
+            offsets = nplike.asarray(layout.offsets)
+            if selection is None:
+                selection = slice(0, len(layout))
+            if selection.start < selection.stop:
+                selection = slice(
+                    int(offsets[selection.start]), int(offsets[selection.stop])
                 )
-            out = ak.partition.IrregularlyPartitionedArray(output)
+            else:
+                selection = slice(0, 0)
+        else:
+            starts = nplike.asarray(layout.starts).astype(np.int64)
+            stops = nplike.asarray(layout.stops).astype(np.int64)
+            if selection is not None:
+                starts, stops = starts[selection], stops[selection]
+            selection, parents = _expand_ranges(nplike, starts, stops, parents)
+        _histogram_leaves(layout.content, selection, parents, out, columns)
+
+    elif isinstance(layout, (ak._util.indexedtypes, ak._util.indexedoptiontypes)):
+        index = nplike.asarray(layout.index).astype(np.int64)
+        if selection is not None:
+            index = index[selection]
+        if isinstance(layout, ak._util.indexedoptiontypes):
+            valid = index >= 0
+            index = index[valid]
+            if parents is not None:
+                parents = parents[valid]
+        _histogram_leaves(layout.content, index, parents, out, columns)
+
+    elif isinstance(layout, ak.layout.UnmaskedArray):
+        _histogram_leaves(layout.content, selection, parents, out, columns)
+
+    elif isinstance(layout, ak._util.optiontypes):
+        valid = nplike.asarray(layout.bytemask()) == 0
+        if selection is None:
+            selection = nplike.nonzero(valid)[0]
+        elif isinstance(selection, slice):
+            selection = nplike.nonzero(valid[selection])[0] + selection.start
+        else:
+            valid = valid[selection]
+            selection = selection[valid]
+            if parents is not None:
+                parents = parents[valid]
+        _histogram_leaves(layout.content, selection, parents, out, columns)
+
+    elif isinstance(layout, ak._util.uniontypes):
+        tags = nplike.asarray(layout.tags)
+        index = nplike.asarray(layout.index).astype(np.int64)
+        if selection is not None:
+            tags, index = tags[selection], index[selection]
+        for tag in range(layout.numcontents):
+            chosen = tags == tag
+            _histogram_leaves(
+                layout.content(tag),
+                index[chosen],
+                None if parents is None else parents[chosen],
+                out,
+                columns,
+            )
 
+    else:
+        raise AssertionError(
+            "unrecognized Content type: {0}".format(type(layout))
+            + ak._util.exception_suffix(__file__)
+        )
+
+
+def _histogram_columns(leaf, selection, columns):
+    # values, weights (or None), and mask (or None) of the selected elements
+    if columns is None:
+        fields = {"x": leaf}
+    else:
+        fields = dict((key, leaf.field(i)) for i, key in enumerate(columns))
+    out = []
+    for key in ("x", "weight", "mask"):
+        if key in fields:
+            column = ak.nplike.of(fields[key]).asarray(fields[key])
+            if selection is not None:
+                column = column[selection]
+            out.append(column.reshape(-1))
         else:
-            out = ak.layout.RecordArray(
-                [intercept, slope, intercept_error, slope_error],
-                ["intercept", "slope", "intercept_error", "slope_error"],
-                parameters={"__record__": "LinearFit"},
+            out.append(None)
+    values, weights, mask = out
+    if values.dtype.kind not in "iuf":
+        values = values.astype(np.float64)
+    return values, weights, mask
+
+
+def _histogram_edges(nplike, bins, range, leaves, columns):
+    if isinstance(bins, (numbers.Integral, np.integer)):
+        if bins < 1:
+            raise ValueError(
+                "bins must be a positive integer or a sequence of bin edges"
+                + ak._util.exception_suffix(__file__)
+            )
+        if range is None:
+            low, high = None, None
+            for leaf, selection, parents in leaves:
+                values, weights, mask = _histogram_columns(leaf, selection, columns)
+                if mask is not None:
+                    values = values[mask]
+                values = values[values - values == 0]
+                if len(values) > 0:
+                    if low is None or values.min() < low:
+                        low = values.min()
+                    if high is None or values.max() > high:
+                        high = values.max()
+            if low is None:
+                low, high = 0.0, 1.0
+        else:
+            low, high = range
+        low, high = float(low), float(high)
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        if not low < high:
+            raise ValueError(
+                "histogram range must be finite, with the low edge less than the "
+                "high edge" + ak._util.exception_suffix(__file__)
+            )
+        edges = nplike.arange(bins + 1, dtype=np.float64) * ((high - low) / bins) + low
+        edges[-1] = high
+        return edges, True
+
+    else:
+        if range is not None:
+            raise ValueError(
+                "range cannot be given with a sequence of bin edges"
+                + ak._util.exception_suffix(__file__)
+            )
+        edges = nplike.asarray(bins, dtype=np.float64)
+        if (
+            len(edges.shape) != 1
+            or len(edges) < 2
+            or not nplike.all(edges[1:] >= edges[:-1])
+        ):
+            raise ValueError(
+                "bin edges must be a one-dimensional, increasing sequence of at "
+                "least two values" + ak._util.exception_suffix(__file__)
             )
-            if scalar:
-                out = out[0]
+        return edges, False
+
 
-        return ak._util.wrap(out, ak._util.behaviorof(x, y))
+def _histogram_fill(nplike, values, weights, mask, parents, edges, uniform, length):
+    numbins = len(edges) - 1
+    low, high = edges[0], edges[-1]
+
+    selected = (values >= low) & (values <= high)
+    if mask is not None:
+        selected &= mask
+    values = values[selected]
+
+    if uniform:
+        index = ((values - low) * (numbins / (high - low))).astype(np.int64)
+        index = index.clip(0, numbins - 1)
+        # correct rounding at the edges, as in numpy.histogram
+        index -= values < edges[index]
+        index += (values >= edges[index + 1]) & (index != numbins - 1)
+    else:
+        index = nplike.searchsorted(edges, values, side="right") - 1
+        index = index.clip(0, numbins - 1)
+
+    if parents is not None:
+        index += parents[selected] * numbins
+    if weights is not None:
+        weights = weights[selected]
+    return nplike.bincount(index, weights=weights, minlength=length * numbins)
+
+
+def histogram(
+    array, bins=10, range=None, weight=None, mask=None, axis=None, highlevel=True
+):
+    """
+    Args:
+        array: Numerical data to histogram, possibly within lists, missing
+            values (None), etc.
+        bins (int or sequence of numbers): If an int, the number of bins of
+            equal width in `range`; otherwise, the bin edges, which must be
+            increasing and may have different widths.
+        range (None or (number, number)): The low and high edges of the bins
+            if `bins` is an int. If None, the minimum and maximum of the
+            finite values are used.
+        weight: None or data that can be broadcasted to `array` to give each
+            value a weight.
+        mask: None or booleans that can be broadcasted to `array`; only values
+            for which it is True are counted.
+        axis (None or -1): If None, fill one histogram with all values from
+            the array; if `-1`, fill one histogram for each innermost list.
+        highlevel (bool): If True, return the per-list histograms as an
+            #ak.Array; otherwise, return a low-level #ak.layout.Content
+            subclass.
+
+    Returns a tuple of the bin contents and the bin edges, like
+    [np.histogram](https://numpy.org/doc/stable/reference/generated/numpy.histogram.html):
+    bins include their low edge and exclude their high edge, except for the
+    last bin, which includes both. Values outside the bins, NaN, and None are
+    not counted. Without weights, the bin contents are integer counts;
+    with weights, they are sums of weights.
+
+        >>> array = ak.Array([[1.1, 2.2, None, 3.3], [], [4.4, 5.5]])
+        >>> ak.histogram(array, bins=2, range=(0, 6))
+        (array([2, 3]), array([0., 3., 6.]))
+
+    With `axis=-1`, each innermost list is replaced by its histogram, a
+    regular dimension of length `bins`:
+
+        >>> counts, edges = ak.histogram(array, bins=2, range=(0, 6), axis=-1)
+        >>> counts
+        <Array [[2, 1], [0, 0], [0, 2]] type='3 * 2 * int64'>
+
+    The values are read in place from the array's buffers, following the
+    lists and missing values at any depth, instead of flattening the array
+    (and the weights) into new arrays first.
+    """
+    if axis is not None and axis != -1:
+        raise ValueError(
+            "ak.histogram only supports axis=None or axis=-1"
+            + ak._util.exception_suffix(__file__)
+        )
+
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    if isinstance(layout, ak.partition.PartitionedArray):
+        layout = layout.toContent()
+    behavior = ak._util.behaviorof(array, weight, mask)
+    nplike = ak.nplike.of(layout)
+
+    # scalar weights and masks are applied after filling; arrays are
+    # broadcasted to the layout once and carried along as record fields
+    # (broadcasting rejects records in the user's arrays)
+    scalarweight, scalarmask = None, None
+    names, layouts = ["x"], [layout]
+    for name, value in (("weight", weight), ("mask", mask)):
+        if value is None:
+            continue
+        value = ak.operations.convert.to_layout(
+            value, allow_record=False, allow_other=True
+        )
+        if isinstance(value, ak.partition.PartitionedArray):
+            value = value.toContent()
+        if isinstance(value, ak.layout.Content):
+            names.append(name)
+            layouts.append(value)
+        elif name == "weight":
+            scalarweight = value
+        else:
+            scalarmask = bool(value)
+
+    if len(layouts) > 1:
+
+        def getfunction(inputs):
+            if all(isinstance(x, ak.layout.NumpyArray) for x in inputs):
+                return lambda: (ak.layout.RecordArray(inputs, names),)
+            else:
+                return None
+
+        out = ak._util.broadcast_and_apply(
+            layouts,
+            getfunction,
+            behavior,
+            allow_records=False,
+            pass_depth=False,
+            numpy_to_regular=True,
+        )
+        assert isinstance(out, tuple) and len(out) == 1
+        layout = out[0]
+        columns = names
+    else:
+        columns = None
+
+    def fill(leaves, length):
+        out = None
+        for leaf, selection, parents in leaves:
+            values, weights, leafmask = _histogram_columns(leaf, selection, columns)
+            if weights is None and scalarweight is not None:
+                weights = nplike.full(len(values), scalarweight, np.float64)
+            if leafmask is not None:
+                leafmask = leafmask.astype(np.bool_)
+            counts = _histogram_fill(
+                nplike, values, weights, leafmask, parents, edges, uniform, length
+            )
+            out = counts if out is None else out + counts
+        if out is None:
+            out = nplike.zeros(length * (len(edges) - 1), np.int64)
+        if scalarmask is False:
+            out = out * 0
+        return out
+
+    leaves = []
+    _histogram_leaves(layout, None, None, leaves, columns)
+    edges, uniform = _histogram_edges(nplike, bins, range, leaves, columns)
+
+    if axis is None or layout.purelist_depth == 1:
+        return fill(leaves, 1), edges
+
+    def getfunction(layout):
+        if (
+            isinstance(layout, ak._util.listtypes)
+            and layout.purelist_depth == 2
+            and layout.parameter("__array__") not in ("string", "bytestring")
+        ):
+            length = len(layout)
+            parents = nplike.arange(length, dtype=np.int64)
+            innerleaves = []
+            _histogram_leaves(layout, parents, parents, innerleaves, columns)
+            counts = fill(innerleaves, length)
+            return lambda: ak.layout.RegularArray(
+                ak.layout.NumpyArray(counts), len(edges) - 1
+            )
+        else:
+            return None
+
+    out = ak._util.recursively_apply(
+        layout, getfunction, pass_depth=False, numpy_to_regular=True
+    )
+    if highlevel:
+        return ak._util.wrap(out, behavior), edges
+    else:
+        return out, edges
 
 
 def softmax(x, axis=None, keepdims=False, mask_identity=False):
@@ -1438,5 +1915,6 @@ def softmax(x, axis=None, keepdims=False, mask_identity=False):
 __all__ = [
     x
     for x in list(globals())
-    if not x.startswith("_") and x not in ("absolute_import", "np", "awkward")
+    if not x.startswith("_")
+    and x not in ("absolute_import", "numbers", "np", "awkward")
 ]
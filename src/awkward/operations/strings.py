@@ -0,0 +1,357 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import numbers
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def _isstring(layout):
+    return isinstance(layout, ak._util.listtypes) and layout.parameter("__array__") in (
+        "string",
+        "bytestring",
+    )
+
+
+def _apply(array, function, highlevel):
+    def getfunction(layout):
+        if _isstring(layout):
+            nplike = ak.nplike.of(layout)
+            if (
+                isinstance(
+                    layout,
+                    (
+                        ak.layout.ListOffsetArray32,
+                        ak.layout.ListOffsetArrayU32,
+                        ak.layout.ListOffsetArray64,
+                    ),
+                )
+                and isinstance(layout.content, ak.layout.NumpyArray)
+            ):
+                # offsets need not start at zero: use the buffers as they are
+                offsets = nplike.asarray(layout.offsets).astype(np.int64)
+                content = layout.content
+            else:
+                offsets = layout.compact_offsets64(True)
+                content = layout.broadcast_tooffsets64(offsets).content
+                offsets = nplike.asarray(offsets)
+            chars = nplike.asarray(content)[: offsets[-1]]
+            return lambda: function(layout, nplike, offsets, chars)
+
+        elif isinstance(layout, ak.layout.NumpyArray):
+            raise ValueError(
+                "string operations can only be applied to strings or bytestrings, "
+                "possibly within lists, records, etc."
+                + ak._util.exception_suffix(__file__)
+            )
+
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    out = ak._util.recursively_apply(layout, getfunction, pass_depth=False)
+    if highlevel:
+        return ak._util.wrap(out, ak._util.behaviorof(array))
+    else:
+        return out
+
+
+def _asbytes(pattern):
+    if isinstance(pattern, bytes):
+        return pattern
+    elif isinstance(pattern, str) or (
+        ak._util.py27 and isinstance(pattern, ak._util.unicode)
+    ):
+        return pattern.encode("utf-8")
+    else:
+        raise TypeError(
+            "pattern must be a str or bytes, not {0}".format(type(pattern).__name__)
+            + ak._util.exception_suffix(__file__)
+        )
+
+
+def _cumulative(nplike, values):
+    # out[i] is the sum of values[:i]
+    out = nplike.empty(len(values) + 1, np.int64)
+    out[0] = 0
+    nplike.cumsum(values, out=out[1:])
+    return out
+
+
+def _segment_sum(nplike, values, offsets):
+    # sum of values[offsets[i]:offsets[i + 1]] for each i
+    cumulative = _cumulative(nplike, values)
+    return cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+
+
+def _matches_at(nplike, chars, pattern):
+    # True at each position of chars where pattern begins (ignoring boundaries)
+    length = len(chars) - len(pattern) + 1
+    if length <= 0:
+        return nplike.zeros(0, np.bool_)
+    out = nplike.ones(length, np.bool_)
+    for i, x in enumerate(bytearray(pattern)):
+        out &= chars[i : i + length] == x
+    return out
+
+
+def _matches_from(nplike, chars, positions, pattern):
+    # True for each position of chars where pattern begins (must fit in chars)
+    out = nplike.ones(len(positions), np.bool_)
+    for i, x in enumerate(bytearray(pattern)):
+        out &= chars[positions + i] == x
+    return out
+
+
+def _ischarstart(layout, nplike, chars):
+    # UTF-8 continuation bytes are 0b10xxxxxx; bytestrings are all bytes
+    if layout.parameter("__array__") == "string":
+        return (chars & 0xC0) != 0x80
+    else:
+        return nplike.ones(len(chars), np.bool_)
+
+
+def length(array, highlevel=True):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly within lists,
+            records, etc.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    Returns the length of each string in characters (UTF-8 code points) or
+    each bytestring in bytes, in place of the strings.
+
+        >>> ak.strings.length(ak.Array([["one", "thréé"], [], ["four"]]))
+        <Array [[3, 5], [], [4]] type='3 * var * int64'>
+
+    Unlike #ak.num with `axis=-1`, this counts characters, not bytes.
+    """
+
+    def function(layout, nplike, offsets, chars):
+        ischarstart = _ischarstart(layout, nplike, chars)
+        return ak.layout.NumpyArray(_segment_sum(nplike, ischarstart, offsets))
+
+    return _apply(array, function, highlevel)
+
+
+def startswith(array, prefix, highlevel=True):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly within lists,
+            records, etc.
+        prefix (str or bytes): The prefix to look for.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    Returns booleans in place of the strings, True if the string starts with
+    `prefix`.
+
+        >>> ak.strings.startswith(ak.Array(["HLT_Mu", "L1_Mu", "HLT_Ele"]), "HLT_")
+        <Array [True, False, True] type='3 * bool'>
+    """
+    prefix = _asbytes(prefix)
+
+    def function(layout, nplike, offsets, chars):
+        starts, stops = offsets[:-1], offsets[1:]
+        possible = nplike.nonzero(stops - starts >= len(prefix))[0]
+        out = nplike.zeros(len(starts), np.bool_)
+        out[possible] = _matches_from(nplike, chars, starts[possible], prefix)
+        return ak.layout.NumpyArray(out)
+
+    return _apply(array, function, highlevel)
+
+
+def endswith(array, suffix, highlevel=True):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly within lists,
+            records, etc.
+        suffix (str or bytes): The suffix to look for.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    Returns booleans in place of the strings, True if the string ends with
+    `suffix`.
+
+        >>> ak.strings.endswith(ak.Array(["data.root", "data.parquet"]), ".root")
+        <Array [True, False] type='2 * bool'>
+    """
+    suffix = _asbytes(suffix)
+
+    def function(layout, nplike, offsets, chars):
+        starts, stops = offsets[:-1], offsets[1:]
+        possible = nplike.nonzero(stops - starts >= len(suffix))[0]
+        out = nplike.zeros(len(starts), np.bool_)
+        out[possible] = _matches_from(
+            nplike, chars, stops[possible] - len(suffix), suffix
+        )
+        return ak.layout.NumpyArray(out)
+
+    return _apply(array, function, highlevel)
+
+
+def contains(array, pattern, highlevel=True):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly within lists,
+            records, etc.
+        pattern (str or bytes): The substring to look for (not a regular
+            expression).
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    Returns booleans in place of the strings, True if `pattern` occurs
+    anywhere in the string.
+
+        >>> ak.strings.contains(ak.Array([["HLT_IsoMu24"], ["HLT_Ele32"]]), "Mu")
+        <Array [[True], [False]] type='2 * var * bool'>
+
+    The search makes one vectorized pass over all characters per character
+    of `pattern`, so it is fastest for short patterns.
+    """
+    pattern = _asbytes(pattern)
+
+    def function(layout, nplike, offsets, chars):
+        starts, stops = offsets[:-1], offsets[1:]
+        out = nplike.zeros(len(starts), np.bool_)
+        if len(pattern) == 0:
+            out[:] = True
+            return ak.layout.NumpyArray(out)
+
+        # count the matches that begin in [start, stop - len(pattern)]
+        matches = _matches_at(nplike, chars, pattern)
+        possible = nplike.nonzero(stops - starts >= len(pattern))[0]
+        cumulative = _cumulative(nplike, matches)
+        last = stops[possible] - len(pattern) + 1
+        out[possible] = cumulative[last] - cumulative[starts[possible]] > 0
+        return ak.layout.NumpyArray(out)
+
+    return _apply(array, function, highlevel)
+
+
+def _translate(array, table, highlevel):
+    def function(layout, nplike, offsets, chars):
+        content = ak.layout.NumpyArray(
+            nplike.asarray(table)[chars], parameters=layout.content.parameters
+        )
+        return ak.layout.ListOffsetArray64(
+            ak.layout.Index64(offsets), content, parameters=layout.parameters
+        )
+
+    return _apply(array, function, highlevel)
+
+
+_lower = ak.nplike.numpy.arange(256, dtype=np.uint8)
+_lower[ord("A") : ord("Z") + 1] += ord("a") - ord("A")
+_upper = ak.nplike.numpy.arange(256, dtype=np.uint8)
+_upper[ord("a") : ord("z") + 1] -= ord("a") - ord("A")
+
+
+def lower(array, highlevel=True):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly within lists,
+            records, etc.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    Returns the strings with ASCII letters converted to lowercase; all other
+    bytes, including non-ASCII characters, are unchanged.
+
+        >>> ak.strings.lower(ak.Array(["HLT_IsoMu24", "Ünïcode"])).tolist()
+        ['hlt_isomu24', 'Ünïcode']
+    """
+    return _translate(array, _lower, highlevel)
+
+
+def upper(array, highlevel=True):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly within lists,
+            records, etc.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    Returns the strings with ASCII letters converted to uppercase; all other
+    bytes, including non-ASCII characters, are unchanged.
+
+        >>> ak.strings.upper(ak.Array(["hlt_isomu24"])).tolist()
+        ['HLT_ISOMU24']
+    """
+    return _translate(array, _upper, highlevel)
+
+
+def substring(array, start=None, stop=None, highlevel=True):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly within lists,
+            records, etc.
+        start (None or int): Index of the first character to keep; negative
+            values count from the end of each string, as in Python.
+        stop (None or int): Index after the last character to keep; negative
+            values count from the end of each string, as in Python.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    Returns `string[start:stop]` for each string, counting characters (UTF-8
+    code points) in strings and bytes in bytestrings.
+
+        >>> ak.strings.substring(ak.Array(["HLT_IsoMu24", "HLT_Ele32"]), 4, -2)
+        <Array ['IsoMu', 'Ele'] type='2 * string'>
+
+    The output shares the characters of `array`: only new starts and stops
+    are computed.
+    """
+    for name, value in (("start", start), ("stop", stop)):
+        if value is not None and not isinstance(value, (numbers.Integral, np.integer)):
+            raise TypeError(
+                "{0} must be None or an integer".format(name)
+                + ak._util.exception_suffix(__file__)
+            )
+
+    def function(layout, nplike, offsets, chars):
+        starts, stops = offsets[:-1], offsets[1:]
+        ischarstart = _ischarstart(layout, nplike, chars)
+        cumulative = _cumulative(nplike, ischarstart)
+        counts = cumulative[stops] - cumulative[starts]
+
+        # byte position of each character; first[i] is string i's first
+        positions = nplike.nonzero(ischarstart)[0]
+        first = cumulative[starts]
+
+        def bytepos(index, default):
+            if index is None:
+                index = default
+            elif index < 0:
+                index = (counts + index).clip(0, None)
+            else:
+                index = counts.clip(None, index)
+            index = index + nplike.zeros(len(counts), np.int64)
+            out = stops.copy()
+            inside = nplike.nonzero(index < counts)[0]
+            out[inside] = positions[first[inside] + index[inside]]
+            return out
+
+        newstarts = bytepos(start, 0)
+        newstops = bytepos(stop, counts)
+        empty = newstops < newstarts
+        newstops[empty] = newstarts[empty]
+        return ak.layout.ListArray64(
+            ak.layout.Index64(newstarts),
+            ak.layout.Index64(newstops),
+            ak.layout.NumpyArray(chars, parameters=layout.content.parameters),
+            parameters=layout.parameters,
+        )
+
+    return _apply(array, function, highlevel)
+
+
+__all__ = [
+    x
+    for x in list(globals())
+    if not x.startswith("_")
+    and x not in ("absolute_import", "numbers", "np", "awkward")
+]
@@ -1572,9 +1572,7 @@ def flatten(array, axis=1, highlevel=True):
                 return layout
 
         if isinstance(layout, ak.partition.PartitionedArray):
-            out = ak.partition.IrregularlyPartitionedArray(
-                [apply(x) for x in layout.partitions]
-            )
+            out = ak.partition.apply(apply, layout)
         else:
             out = apply(layout)
 
@@ -1677,6 +1675,331 @@ def unflatten(array, counts, highlevel=True):
         return out
 
 
+def _run_leaf(layout):
+    while True:
+        if isinstance(layout, ak.layout.VirtualArray):
+            layout = layout.array
+        elif isinstance(layout, ak._util.indexedtypes):
+            layout = layout.project()
+        elif isinstance(layout, ak._util.optiontypes):
+            raise ValueError(
+                "cannot find runs of values that may be missing (None)"
+                + ak._util.exception_suffix(__file__)
+            )
+        elif isinstance(layout, ak.layout.NumpyArray) and layout.ndim == 1:
+            return layout
+        elif isinstance(layout, ak._util.listtypes) and layout.parameter(
+            "__array__"
+        ) in ("string", "bytestring"):
+            return layout
+        else:
+            return None
+
+
+def _run_value(layout):
+    # like _run_leaf, but lists of numbers or strings, at any depth, are also
+    # values (compared as a whole), as the elements of an outer axis may be
+    leaf = _run_leaf(layout)
+    if leaf is not None:
+        return leaf
+    while True:
+        if isinstance(layout, ak.layout.VirtualArray):
+            layout = layout.array
+        elif isinstance(layout, ak._util.indexedtypes):
+            layout = layout.project()
+        else:
+            break
+    if isinstance(layout, ak.layout.EmptyArray):
+        return layout.toNumpyArray()
+    elif isinstance(layout, ak.layout.NumpyArray):
+        layout = layout.toRegularArray()
+    if isinstance(layout, ak._util.listtypes):
+        offsets = layout.compact_offsets64(True)
+        content = _run_value(layout.broadcast_tooffsets64(offsets).content)
+        if content is not None:
+            return ak.layout.ListOffsetArray64(offsets, content)
+    return None
+
+
+def _run_differs(leaf, left, right):
+    # differs[i] is True if leaf[left[i]] != leaf[right[i]]
+    numpy = ak.nplike.numpy
+    if isinstance(leaf, ak.layout.NumpyArray):
+        values = numpy.asarray(leaf)
+        return values[left] != values[right]
+
+    # lists (including strings) differ if their lengths or any of their items
+    # differ
+    offsets = leaf.compact_offsets64(True)
+    content = leaf.broadcast_tooffsets64(offsets).content
+    offsets = numpy.asarray(offsets)
+    lengths = offsets[1:] - offsets[:-1]
+    differs = lengths[left] != lengths[right]
+    same = numpy.nonzero(~differs & (lengths[left] > 0))[0]
+    if len(same) != 0:
+        samelen = lengths[left[same]]
+        segments = numpy.empty(len(same), np.int64)
+        segments[0] = 0
+        numpy.cumsum(samelen[:-1], out=segments[1:])
+        local = numpy.arange(segments[-1] + samelen[-1]) - numpy.repeat(
+            segments, samelen
+        )
+        itemsdiffer = _run_differs(
+            content,
+            numpy.repeat(offsets[left[same]], samelen) + local,
+            numpy.repeat(offsets[right[same]], samelen) + local,
+        )
+        differs[same] = numpy.logical_or.reduceat(itemsdiffer, segments)
+    return differs
+
+
+def _run_offsets(offsets, columns):
+    # returns the offsets of the runs and the offsets of runs in each list
+    numpy = ak.nplike.numpy
+    offsets = numpy.asarray(offsets)
+    length = offsets[-1]
+    isstart = numpy.zeros(length, np.bool_)
+    if length > 1:
+        left = numpy.arange(length - 1)
+        for leaf in columns:
+            isstart[1:] |= _run_differs(leaf, left, left + 1)
+    nonempty = offsets[:-1][offsets[:-1] < offsets[1:]]
+    isstart[nonempty] = True
+    starts = numpy.nonzero(isstart)[0]
+    runoffsets = numpy.empty(len(starts) + 1, np.int64)
+    runoffsets[:-1] = starts
+    runoffsets[-1] = length
+    listoffsets = numpy.searchsorted(starts, offsets, side="left").astype(np.int64)
+    return ak.layout.Index64(runoffsets), ak.layout.Index64(listoffsets)
+
+
+def _runs_apply(array, axis, columns_of, apply, highlevel):
+    def nothing_to_compare():
+        return ValueError(
+            "runs can only be found in numbers or strings, possibly within "
+            "lists, not in records or unions" + ak._util.exception_suffix(__file__)
+        )
+
+    # axis=-1 is the innermost lists, in which strings are values
+    def getfunction_innermost(layout, depth):
+        if depth == 1:
+            columns = columns_of(layout, _run_leaf)
+            if columns is not None:
+                offsets = ak.layout.Index64(
+                    ak.nplike.numpy.array([0, len(layout)], np.int64)
+                )
+                runoffsets, listoffsets = _run_offsets(offsets, columns)
+                return lambda: apply(layout, runoffsets, None)
+
+        if isinstance(layout, ak._util.listtypes) and _run_leaf(layout) is None:
+            offsets = layout.compact_offsets64(True)
+            content = layout.broadcast_tooffsets64(offsets).content
+            columns = columns_of(content, _run_leaf)
+            if columns is not None:
+                runoffsets, listoffsets = _run_offsets(offsets, columns)
+                return lambda: apply(content, runoffsets, listoffsets)
+
+        elif isinstance(layout, ak.layout.NumpyArray) or _run_leaf(layout) is not None:
+            raise nothing_to_compare()
+
+    # other axes count strings as lists, and the elements at that axis (which
+    # may be lists) are compared as a whole
+    def getfunction(layout, depth, posaxis):
+        posaxis = layout.axis_wrap_if_negative(posaxis)
+        if posaxis == 0:
+            columns = columns_of(layout, _run_value)
+            if columns is None:
+                raise nothing_to_compare()
+            offsets = ak.layout.Index64(
+                ak.nplike.numpy.array([0, len(layout)], np.int64)
+            )
+            runoffsets, listoffsets = _run_offsets(offsets, columns)
+            return lambda: apply(layout, runoffsets, None)
+
+        elif posaxis == depth and isinstance(layout, ak._util.listtypes):
+            offsets = layout.compact_offsets64(True)
+            content = layout.broadcast_tooffsets64(offsets).content
+            columns = columns_of(content, _run_value)
+            if columns is None:
+                raise nothing_to_compare()
+            runoffsets, listoffsets = _run_offsets(offsets, columns)
+            return lambda: apply(content, runoffsets, listoffsets)
+
+        elif posaxis >= depth and isinstance(layout, ak.layout.NumpyArray):
+            raise ValueError(
+                "array has no axis {0}".format(axis)
+                + ak._util.exception_suffix(__file__)
+            )
+
+        else:
+            return posaxis
+
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    if axis == -1:
+        out = ak._util.recursively_apply(
+            layout, getfunction_innermost, pass_depth=True, numpy_to_regular=True
+        )
+    else:
+        if isinstance(layout, ak.partition.PartitionedArray):
+            # runs at axis=0 may cross partition boundaries
+            if layout.partitions[0].axis_wrap_if_negative(axis) == 0:
+                layout = layout.toContent()
+        out = ak._util.recursively_apply(
+            layout,
+            getfunction,
+            pass_depth=True,
+            pass_user=True,
+            user=axis,
+            numpy_to_regular=True,
+        )
+    if highlevel:
+        return ak._util.wrap(out, ak._util.behaviorof(array))
+    else:
+        return out
+
+
+def run_lengths(array, axis=-1, highlevel=True):
+    """
+    Args:
+        array: Data containing runs of equal consecutive values, possibly
+            within nested lists.
+        axis (int): The dimension at which runs are found. The outermost
+            dimension is `0`, followed by `1`, etc., and negative values
+            count backward from the innermost: `-1` is the innermost
+            dimension, `-2` is the next level up, etc.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    Returns the lengths of the runs of equal consecutive values in the lists
+    at `axis` of `array` (or in `array` itself, if `axis=0` or it is not
+    nested). The values may be numbers or strings; a run never crosses a
+    list boundary.
+
+        >>> ak.run_lengths(ak.Array([[1, 1, 2, 2, 2, 1], [], [3, 3]]))
+        <Array [[2, 3, 1], [], [2]] type='3 * var * int64'>
+        >>> ak.run_lengths(ak.Array(["b", "b", "a", "b"]))
+        <Array [2, 1, 1] type='3 * int64'>
+
+    At an outer `axis`, the values are lists, which are equal if all of their
+    items are equal:
+
+        >>> ak.run_lengths(ak.Array([[1, 2], [1, 2], [3], [1, 2]]), axis=0)
+        <Array [2, 1, 1] type='3 * int64'>
+
+    With `axis=-1`, strings are values, but like other functions, a
+    non-negative `axis` (or any other negative one) counts strings as lists
+    of characters.
+
+    Sorting first turns the runs into groups of equal values, which can be
+    used to partition other arrays with the same structure by #ak.unflatten:
+
+        >>> flavour = ak.sort(jets.flavour)
+        >>> counts = ak.run_lengths(flavour)
+        >>> ak.unflatten(ak.flatten(flavour), ak.flatten(counts))
+
+    or, more directly, with #ak.group_runs.
+    """
+
+    def columns_of(content, value_of):
+        leaf = value_of(content)
+        if leaf is None:
+            return None
+        else:
+            return [leaf]
+
+    def apply(content, runoffsets, listoffsets):
+        counts = ak.nplike.numpy.asarray(runoffsets)
+        counts = ak.layout.NumpyArray(counts[1:] - counts[:-1])
+        if listoffsets is None:
+            return counts
+        else:
+            return ak.layout.ListOffsetArray64(listoffsets, counts)
+
+    return _runs_apply(array, axis, columns_of, apply, highlevel)
+
+
+def group_runs(array, by=None, axis=-1, highlevel=True):
+    """
+    Args:
+        array: Data to group, possibly within nested lists.
+        by (None, str, or list of str): If None, the lists at `axis` are
+            grouped by their values; otherwise, they must contain records and
+            are grouped by these fields, starting a new group when any of
+            them changes.
+        axis (int): The dimension at which runs are grouped. The outermost
+            dimension is `0`, followed by `1`, etc., and negative values
+            count backward from the innermost: `-1` is the innermost
+            dimension, `-2` is the next level up, etc.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    Adds a level of lists that groups equal consecutive values (or records
+    with equal `by` fields) in the lists at `axis`. Unlike #ak.unflatten
+    with #ak.run_lengths, no intermediate arrays are built.
+
+        >>> ak.group_runs(ak.Array([[1, 1, 2, 2, 2, 1], [], [3, 3]])).tolist()
+        [[[1, 1], [2, 2, 2], [1]], [], [[3, 3]]]
+        >>> ak.group_runs(ak.Array([[1, 2], [1, 2], [3]]), axis=0).tolist()
+        [[[1, 2], [1, 2]], [[3]]]
+
+    Values are numbers or strings (see #ak.run_lengths for strings and
+    `axis`) or, at an outer `axis`, lists of them.
+
+    Combined with #ak.sort and `by`, this groups records by a key, such as
+    the jets in each event by flavour:
+
+        >>> jets = ak.sort(events.jets, by="flavour")
+        >>> grouped = ak.group_runs(jets, by="flavour")
+        >>> grouped.flavour[:, :, 0]    # the flavour of each group
+
+    Runs never cross list boundaries.
+    """
+    if by is not None:
+        if isinstance(by, str):
+            by = [by]
+        else:
+            by = list(by)
+
+    def columns_of(content, value_of):
+        if by is None:
+            leaf = value_of(content)
+            if leaf is None:
+                return None
+            else:
+                return [leaf]
+        records = content
+        while isinstance(records, (ak.layout.VirtualArray,) + ak._util.indexedtypes):
+            if isinstance(records, ak.layout.VirtualArray):
+                records = records.array
+            else:
+                records = records.project()
+        if not isinstance(records, ak.layout.RecordArray) or not all(
+            key in records.keys() for key in by
+        ):
+            return None
+        columns = []
+        for key in by:
+            leaf = value_of(records.field(key))
+            if leaf is None:
+                raise ValueError(
+                    "field {0} must contain numbers or strings".format(repr(key))
+                    + ak._util.exception_suffix(__file__)
+                )
+            columns.append(leaf)
+        return columns
+
+    def apply(content, runoffsets, listoffsets):
+        out = ak.layout.ListOffsetArray64(runoffsets, content)
+        if listoffsets is None:
+            return out
+        else:
+            return ak.layout.ListOffsetArray64(listoffsets, out)
+
+    return _runs_apply(array, axis, columns_of, apply, highlevel)
+
+
 def local_index(array, axis=-1, highlevel=True):
     """
     Args:
@@ -1752,7 +2075,7 @@ def local_index(array, axis=-1, highlevel=True):
 
 
 @ak._connect._numpy.implements("sort")
-def sort(array, axis=-1, ascending=True, stable=True, highlevel=True):
+def sort(array, axis=-1, ascending=True, stable=True, by=None, highlevel=True):
     """
     Args:
         array: Data to sort, possibly within nested lists.
@@ -1767,6 +2090,11 @@ def sort(array, axis=-1, ascending=True, stable=True, highlevel=True):
             a hybrid of quicksort, heapsort, and insertion sort); if False,
             use a sorting algorithm that is not guaranteed to be stable
             (heapsort).
+        by (None, str, or list of str): If not None, the records in the
+            lists at `axis` are reordered as whole rows, lexicographically by
+            these fields (most significant first), rather than sorting each
+            field independently. With `by`, `ascending` may be a list with one
+            flag per field.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
 
@@ -1774,7 +2102,22 @@ def sort(array, axis=-1, ascending=True, stable=True, highlevel=True):
 
         >>> ak.sort(ak.Array([[7, 5, 7], [], [2], [8, 2]]))
         <Array [[5, 7, 7], [], [2], [2, 8]] type='4 * var * int64'>
+
+    With `by`, records stay intact and all of the keys are compared in a
+    single pass over each list:
+
+        >>> particles = ak.Array([[{"charge": 1, "pt": 10.0},
+        ...                        {"charge": -1, "pt": 30.0},
+        ...                        {"charge": 1, "pt": 20.0}], []])
+        >>> ak.sort(particles, by=["charge", "pt"], ascending=[True, False]).tolist()
+        [[{'charge': -1, 'pt': 30.0}, {'charge': 1, 'pt': 20.0},
+          {'charge': 1, 'pt': 10.0}], []]
+
+    The `by` fields must be numbers without missing values.
     """
+    if by is not None:
+        return _sort_by(array, axis, ascending, stable, by, False, highlevel)
+
     layout = ak.operations.convert.to_layout(
         array, allow_record=False, allow_other=False
     )
@@ -1786,7 +2129,7 @@ def sort(array, axis=-1, ascending=True, stable=True, highlevel=True):
 
 
 @ak._connect._numpy.implements("argsort")
-def argsort(array, axis=-1, ascending=True, stable=True, highlevel=True):
+def argsort(array, axis=-1, ascending=True, stable=True, by=None, highlevel=True):
     """
     Args:
         array: Data for which to get a sorting index, possibly within nested
@@ -1802,6 +2145,11 @@ def argsort(array, axis=-1, ascending=True, stable=True, highlevel=True):
             a hybrid of quicksort, heapsort, and insertion sort); if False,
             use a sorting algorithm that is not guaranteed to be stable
             (heapsort).
+        by (None, str, or list of str): If not None, the records in the
+            lists at `axis` are reordered as whole rows, lexicographically by
+            these fields (most significant first), rather than sorting each
+            field independently. With `by`, `ascending` may be a list with one
+            flag per field.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
 
@@ -1819,7 +2167,15 @@ def argsort(array, axis=-1, ascending=True, stable=True, highlevel=True):
         <Array [[1, 0, 2], [], [0], [1, 0]] type='4 * var * int64'>
         >>> data[index]
         <Array [[5, 7, 7], [], [2], [2, 8]] type='4 * var * int64'>
+
+    With `by`, the index orders whole records (see #ak.sort):
+
+        >>> ak.argsort(particles, by=["charge", "pt"], ascending=[True, False])
+        <Array [[1, 2, 0], []] type='2 * var * int64'>
     """
+    if by is not None:
+        return _sort_by(array, axis, ascending, stable, by, True, highlevel)
+
     layout = ak.operations.convert.to_layout(
         array, allow_record=False, allow_other=False
     )
@@ -1830,6 +2186,106 @@ def argsort(array, axis=-1, ascending=True, stable=True, highlevel=True):
         return out
 
 
+def _sort_by(array, axis, ascending, stable, by, local, highlevel):
+    if isinstance(by, str):
+        by = [by]
+    else:
+        by = list(by)
+    if isinstance(ascending, (bool, np.bool_)):
+        ascending = [bool(ascending)] * len(by)
+    else:
+        ascending = [bool(x) for x in ascending]
+    if len(by) == 0 or len(ascending) != len(by):
+        raise ValueError(
+            "'by' must name at least one field, and 'ascending' must be a bool "
+            "or have one flag per field" + ak._util.exception_suffix(__file__)
+        )
+
+    def records_of(layout):
+        while True:
+            if isinstance(layout, ak.layout.VirtualArray):
+                layout = layout.array
+            elif isinstance(layout, ak._util.indexedtypes):
+                layout = layout.project()
+            elif isinstance(layout, ak._util.optiontypes):
+                if records_of(layout.content) is not None:
+                    raise ValueError(
+                        "cannot sort records by fields if some records are "
+                        "missing (None)" + ak._util.exception_suffix(__file__)
+                    )
+                return None
+            elif isinstance(layout, ak.layout.RecordArray):
+                return layout
+            else:
+                return None
+
+    def target(records, depth):
+        if records is None:
+            return False
+        elif axis == -1:
+            return all(key in records.keys() for key in by)
+        else:
+            return axis == depth
+
+    def reorder(content, records, offsets):
+        index = records.argsort_by(offsets, by, ascending, stable, local)
+        index = ak.nplike.of(content).asarray(index)
+        if local:
+            return ak.layout.NumpyArray(index)
+        else:
+            return content[index]
+
+    found = []
+
+    def getfunction(layout, depth):
+        if isinstance(layout, ak.layout.RegularArray):
+            listoffsetarray = layout.toListOffsetArray64(True)
+            records = records_of(listoffsetarray.content)
+            if target(records, depth):
+                found.append(True)
+                content = listoffsetarray.content
+                offsets = listoffsetarray.offsets
+                return lambda: ak.layout.RegularArray(
+                    reorder(content, records, offsets),
+                    layout.size,
+                    len(layout),
+                    parameters=layout.parameters,
+                )
+
+        elif isinstance(layout, ak._util.listtypes):
+            offsets = layout.compact_offsets64(True)
+            content = layout.broadcast_tooffsets64(offsets).content
+            records = records_of(content)
+            if target(records, depth):
+                found.append(True)
+                return lambda: ak.layout.ListOffsetArray64(
+                    offsets,
+                    reorder(content, records, offsets),
+                    parameters=layout.parameters,
+                )
+
+        elif isinstance(layout, ak.layout.RecordArray) and target(layout, depth - 1):
+            found.append(True)
+            offsets = ak.layout.Index64(
+                ak.nplike.numpy.array([0, len(layout)], np.int64)
+            )
+            return lambda: reorder(layout, layout, offsets)
+
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    out = ak._util.recursively_apply(layout, getfunction, pass_depth=True)
+    if len(found) == 0:
+        raise ValueError(
+            "no records with fields {0} at axis={1}".format(by, axis)
+            + ak._util.exception_suffix(__file__)
+        )
+    if highlevel:
+        return ak._util.wrap(out, ak._util.behaviorof(array))
+    else:
+        return out
+
+
 def is_unique(array, highlevel=True):
     """
     Args:
@@ -2529,18 +2985,17 @@ def cartesian(
 
         partition_arrays = ak.partition.partition_as(sample, new_arrays)
 
-        output = []
-        for part_arrays in ak.partition.iterate(sample.numpartitions, partition_arrays):
-            output.append(
-                cartesian(
-                    part_arrays,
-                    axis=axis,
-                    nested=nested,
-                    parameters=parameters,
-                    with_name=None,  # already set: see above
-                    highlevel=False,
-                )
-            )
+        output = ak.partition.map_partitions(
+            lambda part_arrays: cartesian(
+                part_arrays,
+                axis=axis,
+                nested=nested,
+                parameters=parameters,
+                with_name=None,  # already set: see above
+                highlevel=False,
+            ),
+            ak.partition.iterate(sample.numpartitions, partition_arrays),
+        )
 
         result = ak.partition.IrregularlyPartitionedArray(output)
 
@@ -3128,6 +3583,7 @@ def virtual(
     parameters=None,
     highlevel=True,
     behavior=None,
+    accepts_range=False,
 ):
     """
     Args:
@@ -3144,8 +3600,9 @@ def virtual(
             array is unknown until it is generated, which might require it to
             be generated earlier than intended; if a non-negative int, use this
             to predict the length and verify that the generated array complies.
-        cache (None, "new", or MutableMapping): If "new", a new dict (keep-forever
-            cache) is created. If None, no cache is used.
+        cache (None, "new", MutableMapping, or #ak.layout.BoundedArrayCache):
+            If "new", a new dict (keep-forever cache) is created. If None, no
+            cache is used.
         cache_key (None or str): If None, a unique string is generated for this
             virtual array for use with the `cache` (unique per Python process);
             otherwise, the explicitly provided key is used (which ought to
@@ -3157,6 +3614,10 @@ def virtual(
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        accepts_range (bool): If True, `generate` can also be called with
+            `start` and `stop` keyword arguments to make only that range of
+            the array; slices of the virtual array use this instead of
+            materializing the whole array. Requires a `length`.
 
     Creates a virtual array, an array that is created on demand.
 
@@ -3271,6 +3732,20 @@ def virtual(
 
     Functions with a `lazy` option, such as #ak.from_parquet and #ak.from_buffers,
     construct #ak.layout.RecordArray of #ak.layout.VirtualArray in this way.
+
+    If `generate` can make part of the array without making all of it (for
+    instance, by reading only some rows from a file), pass `accepts_range=True`
+    and let it take `start` and `stop` keyword arguments. Then materializing a
+    slice of the virtual array calls `generate` for just that range.
+
+        >>> def generate(start=0, stop=3):
+        ...     print("generating", start, stop)
+        ...     return ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])[start:stop]
+        ...
+        >>> array = ak.virtual(generate, length=3, accepts_range=True)
+        >>> array[1:]
+        generating 1 3
+        <Array [[], [4.4, 5.5]] type='2 * var * float64'>
     """
     if isinstance(form, str) and form in (
         "float64",
@@ -3295,11 +3770,15 @@ def virtual(
     elif form is not None and not isinstance(form, ak.forms.Form):
         form = ak.forms.Form.fromjson(json.dumps(form))
 
-    gen = ak.layout.ArrayGenerator(generate, args, kwargs, form=form, length=length)
+    gen = ak.layout.ArrayGenerator(
+        generate, args, kwargs, form=form, length=length, accepts_range=accepts_range
+    )
     if cache == "new":
         hold_cache = ak._util.MappingProxy({})
         cache = ak.layout.ArrayCache(hold_cache)
-    elif cache is not None and not isinstance(cache, ak.layout.ArrayCache):
+    elif cache is not None and not isinstance(
+        cache, (ak.layout.ArrayCache, ak.layout.BoundedArrayCache)
+    ):
         hold_cache = ak._util.MappingProxy.maybe_wrap(cache)
         cache = ak.layout.ArrayCache(hold_cache)
 
@@ -3320,7 +3799,8 @@ def with_cache(array, cache, highlevel=True):
             mapping with `__setitem__`, retrieved with `__getitem__`, and only
             re-generated if `__getitem__` raises a `KeyError`. This mapping may
             evict elements according to any caching algorithm (LRU, LFR, RR,
-            TTL, etc.). If "new", a new dict (keep-forever cache) is created.
+            TTL, etc.), such as #ak.layout.BoundedArrayCache. If "new", a new
+            dict (keep-forever cache) is created.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
 
@@ -3355,7 +3835,9 @@ def with_cache(array, cache, highlevel=True):
     if cache == "new":
         hold_cache = ak._util.MappingProxy({})
         cache = ak.layout.ArrayCache(hold_cache)
-    elif cache is not None and not isinstance(cache, ak.layout.ArrayCache):
+    elif cache is not None and not isinstance(
+        cache, (ak.layout.ArrayCache, ak.layout.BoundedArrayCache)
+    ):
         hold_cache = ak._util.MappingProxy.maybe_wrap(cache)
         cache = ak.layout.ArrayCache(hold_cache)
 
@@ -3384,6 +3866,106 @@ def with_cache(array, cache, highlevel=True):
         return out
 
 
+def record_virtual():
+    """
+    Returns an #ak.layout.VirtualArrayRecorder, a context manager that
+    records what happens to every #ak.layout.VirtualArray materialized
+    within its `with` block, keyed by `cache_key`.
+
+    For example:
+
+        >>> cache = {}
+        >>> array = ak.virtual(lambda: [1, 2, 3], length=3, cache=cache, cache_key="x")
+        >>> with ak.record_virtual() as recorder:
+        ...     array.tolist()
+        ...     array.tolist()
+        ...
+        [1, 2, 3]
+        [1, 2, 3]
+        >>> recorder.entries()
+        {'x': {'hits': 1, 'generated': 1, 'seconds': 2.4e-05, 'nbytes': 24}}
+
+    For each `cache_key`, the entries are
+
+       * `"hits"`: number of times the array was found in its cache;
+       * `"generated"`: number of times its generator was called;
+       * `"seconds"`: total wall time spent in the generator;
+       * `"nbytes"`: total size of the generated arrays, in bytes.
+
+    Recording is off unless a recorder is active, and it covers all threads.
+    The recorder can also be controlled with `start()` and `stop()`, and the
+    counts reset with `clear()`. Use it to find out which columns of a lazy
+    #ak.from_parquet or #ak.from_buffers are read, how often, and at what
+    cost.
+
+    See #ak.virtual and #ak.with_cache.
+    """
+    return ak.layout.VirtualArrayRecorder()
+
+
+def num_threads():
+    """
+    Returns the maximum number of threads that CPU kernels may use (at least
+    `1`). See #ak.set_num_threads.
+    """
+    return ak._ext.num_threads()
+
+
+class _RestoreNumThreads(object):
+    def __init__(self, previous):
+        self.previous = previous
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        ak._ext.set_num_threads(self.previous)
+
+    def __repr__(self):
+        return "<ak.set_num_threads previous={0}>".format(self.previous)
+
+
+def set_num_threads(num_threads):
+    """
+    Args:
+        num_threads (None or int): Maximum number of threads that CPU kernels
+            may use. If `1` (the default), all kernels run serially; if None,
+            as many threads as the hardware supports are used.
+
+    Lets kernels that operate on independent sublists split the outermost
+    dimension across threads: currently, sorting (#ak.sort and #ak.argsort),
+    the reducers #ak.sum, #ak.prod, #ak.min, and #ak.max, and
+    #ak.combinations of variable-length lists. Small arrays are still
+    processed serially, since starting threads would cost more than it saves.
+
+    The results are bit-for-bit the same as in serial mode: each sublist is
+    processed by a single thread, and floating-point sums are accumulated in
+    the same order.
+
+    The setting applies to the whole process. The return value is a context
+    manager that restores the previous setting, so that it can be limited to
+    a block:
+
+        >>> with ak.set_num_threads(16):
+        ...     out = ak.sort(array)
+        ...
+
+    See also #ak.num_threads.
+    """
+    if num_threads is None:
+        num_threads = 0
+    elif not isinstance(num_threads, (numbers.Integral, np.integer)) or num_threads < 1:
+        raise ValueError(
+            "num_threads must be None or a positive integer, not {0}".format(
+                repr(num_threads)
+            )
+            + ak._util.exception_suffix(__file__)
+        )
+    previous = ak._ext.num_threads()
+    ak._ext.set_num_threads(num_threads)
+    return _RestoreNumThreads(previous)
+
+
 @ak._connect._numpy.implements("size")
 def size(array, axis=None):
     """
@@ -2,7 +2,9 @@
 
 from __future__ import absolute_import
 
+import collections
 import numbers
+import threading
 
 try:
     from collections.abc import Iterable
@@ -91,8 +93,243 @@ def iterate(numpartitions, arrays):
             yield out
 
 
+_executor = None
+_max_in_flight = None
+_worker = threading.local()
+
+
+class _RestoreExecutor(object):
+    def __init__(self, previous):
+        self.previous = previous
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        set_executor(*self.previous)
+
+    def __repr__(self):
+        return "<ak.partition.set_executor previous={0}>".format(self.previous)
+
+
+def set_executor(executor, max_in_flight=None):
+    """
+    Args:
+        executor (None or concurrent.futures.Executor): The executor that
+            runs operations on partitions concurrently, or None to run them
+            one after another in the calling thread (the default).
+        max_in_flight (None or positive int): The maximum number of
+            partitions that are submitted to `executor` but not yet collected.
+            If None, all partitions of an operation are submitted at once.
+
+    Sets the executor for operations on #ak.partition.PartitionedArray, such
+    as ufuncs, reducers, and structure operations, which process each
+    partition independently. Results are reassembled in the original order of
+    the partitions.
+
+    The setting applies to the whole process. The return value is a context
+    manager that restores the previous setting, so that it can be limited to
+    a block:
+
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> with ak.partition.set_executor(ThreadPoolExecutor(8), 16):
+        ...     out = ak.sum(array, axis=1)   # partitions reduced in parallel
+        ...
+
+    The reducers and sorting release the GIL while they run, so a thread pool
+    can run them on several partitions at once. Other operations mostly spend
+    their time in NumPy. A process pool can only be used with
+    #ak.partition.apply and functions that can be pickled.
+
+    Each in-flight partition holds its intermediate arrays, so
+    `max_in_flight` bounds the memory used by an operation (apart from its
+    results) when partitions are large or are generated lazily. Operations on
+    partitions that are themselves run by the executor are not submitted
+    again, but run in the worker that called them.
+    """
+    global _executor, _max_in_flight
+    if max_in_flight is not None and (
+        not isinstance(max_in_flight, (numbers.Integral, np.integer))
+        or max_in_flight < 1
+    ):
+        raise ValueError(
+            "max_in_flight must be None or a positive integer, not {0}".format(
+                repr(max_in_flight)
+            )
+            + ak._util.exception_suffix(__file__)
+        )
+    previous = (_executor, _max_in_flight)
+    _executor, _max_in_flight = executor, max_in_flight
+    return _RestoreExecutor(previous)
+
+
+def _in_worker(function, args):
+    _worker.active = True
+    try:
+        return function(*args)
+    finally:
+        _worker.active = False
+
+
+def map_partitions(function, *iterables):
+    """
+    Returns a list of `function(*args)` for each `args` in `zip(*iterables)`,
+    in order, running them with the executor given to
+    #ak.partition.set_executor, if any.
+    """
+    executor, max_in_flight = _executor, _max_in_flight
+    if executor is None or getattr(_worker, "active", False):
+        return [function(*args) for args in zip(*iterables)]
+
+    out = []
+    pending = collections.deque()
+    try:
+        for args in zip(*iterables):
+            if max_in_flight is not None and len(pending) >= max_in_flight:
+                out.append(pending.popleft().result())
+            pending.append(executor.submit(_in_worker, function, args))
+        while len(pending) > 0:
+            out.append(pending.popleft().result())
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+    return out
+
+
 def apply(function, array):
-    return IrregularlyPartitionedArray([function(x) for x in array.partitions])
+    return IrregularlyPartitionedArray(map_partitions(function, array.partitions))
+
+
+def _children(layout):
+    if isinstance(layout, ak.layout.VirtualArray):
+        peek = layout.peek_array
+        return [] if peek is None else [peek]
+    elif isinstance(
+        layout,
+        (
+            ak.layout.RecordArray,
+            ak.layout.UnionArray8_32,
+            ak.layout.UnionArray8_U32,
+            ak.layout.UnionArray8_64,
+        ),
+    ):
+        return layout.contents
+    elif isinstance(layout, (ak.layout.NumpyArray, ak.layout.EmptyArray)):
+        return []
+    else:
+        return [layout.content]
+
+
+def _touched_paths(layout, path, out):
+    if isinstance(layout, ak.layout.VirtualArray) and layout.peek_array is not None:
+        out.add(path)
+    for i, child in enumerate(_children(layout)):
+        _touched_paths(child, path + (i,), out)
+
+
+def _materialize_paths(layout, paths):
+    for path in paths:
+        node = layout
+        for i in path:
+            if isinstance(node, ak.layout.VirtualArray):
+                node = node.array
+                continue
+            children = _children(node)
+            if i >= len(children):
+                break
+            node = children[i]
+        else:
+            if isinstance(node, ak.layout.VirtualArray):
+                node.array
+
+
+def read_ahead(array, numpartitions=1, executor=None):
+    """
+    Args:
+        array: Partitioned array to iterate over, usually the result of a lazy
+            #ak.from_parquet or #ak.from_buffers.
+        numpartitions (positive int): Number of partitions to read ahead of
+            the one that is being processed.
+        executor (None or concurrent.futures.Executor): Executor that reads
+            the partitions. If None, a thread pool with `numpartitions`
+            threads is used for the duration of the iteration.
+
+    Yields the partitions of `array` in order (as #ak.Array if `array` is
+    high-level), while the next `numpartitions` partitions are materialized
+    in the background.
+
+    Only the #ak.layout.VirtualArray nodes that have been materialized in
+    the partitions yielded so far are read ahead, so columns that the loop
+    never touches are not read. The arrays are read into each VirtualArray's
+    cache, so VirtualArrays without a cache are never read ahead. A partition
+    is only yielded after its reads have finished, and errors raised while
+    reading are raised by the iteration.
+
+        >>> array = ak.from_parquet("/directory", lazy=True)
+        >>> for partition in ak.partition.read_ahead(array, 2):
+        ...     compute(partition.x, partition.y)
+        ...
+
+    While the first partition is processed, nothing is known to be needed,
+    so reading ahead starts with the second. The cache must be large enough
+    to hold `numpartitions + 1` partitions of the touched columns, or read
+    ahead arrays are evicted before they are used.
+    """
+    if not isinstance(numpartitions, (numbers.Integral, np.integer)) or (
+        numpartitions < 1
+    ):
+        raise ValueError(
+            "numpartitions must be a positive integer, not {0}".format(
+                repr(numpartitions)
+            )
+            + ak._util.exception_suffix(__file__)
+        )
+
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    behavior = ak._util.behaviorof(array)
+    if isinstance(layout, PartitionedArray):
+        partitions = layout.partitions
+    else:
+        partitions = [layout]
+
+    owned = None
+    if executor is None:
+        import concurrent.futures
+
+        executor = owned = concurrent.futures.ThreadPoolExecutor(numpartitions)
+
+    touched = set()
+    requested = [set() for x in partitions]
+    pending = [[] for x in partitions]
+    try:
+        for i, partition in enumerate(partitions):
+            futures, pending[i] = pending[i], []
+            for future in futures:
+                future.result()
+
+            if isinstance(array, ak.highlevel.Array):
+                yield ak._util.wrap(partition, behavior)
+            else:
+                yield partition
+
+            _touched_paths(partition, (), touched)
+            for j in range(i + 1, min(i + 1 + numpartitions, len(partitions))):
+                paths = touched - requested[j]
+                if len(paths) > 0:
+                    requested[j].update(paths)
+                    pending[j].append(
+                        executor.submit(_materialize_paths, partitions[j], paths)
+                    )
+
+    finally:
+        for futures in pending:
+            for future in futures:
+                future.cancel()
+        if owned is not None:
+            owned.shutdown(wait=False)
 
 
 class PartitionedArray(object):
@@ -244,7 +481,9 @@ class PartitionedArray(object):
         if first(self).axis_wrap_if_negative(axis) == 0:
             return sum(x.num(axis) for x in self.partitions)
         else:
-            return self.replace_partitions([x.num(axis) for x in self.partitions])
+            return self.replace_partitions(
+                map_partitions(lambda x: x.num(axis), self.partitions)
+            )
 
     def flatten(self, *args, **kwargs):
         return apply(lambda x: x.flatten(*args, **kwargs), self)
@@ -254,7 +493,7 @@ class PartitionedArray(object):
             return self.toContent().rpad(length, axis)
         else:
             return self.replace_partitions(
-                [x.rpad(length, axis) for x in self.partitions]
+                map_partitions(lambda x: x.rpad(length, axis), self.partitions)
             )
 
     def rpad_and_clip(self, length, axis):
@@ -262,19 +501,22 @@ class PartitionedArray(object):
             return self.toContent().rpad_and_clip(length, axis)
         else:
             return self.replace_partitions(
-                [x.rpad_and_clip(length, axis) for x in self.partitions]
+                map_partitions(lambda x: x.rpad_and_clip(length, axis), self.partitions)
             )
 
-    def reduce(self, name, axis, mask, keepdims):
+    def reduce(self, name, axis, mask, keepdims, **kwargs):
         branch, depth = first(self).branch_depth
         negaxis = -axis
         if not branch and negaxis <= 0:
             negaxis += depth
         if not branch and negaxis == depth:
-            return getattr(self.toContent(), name)(axis, mask, keepdims)
+            return getattr(self.toContent(), name)(axis, mask, keepdims, **kwargs)
         else:
             return self.replace_partitions(
-                [getattr(x, name)(axis, mask, keepdims) for x in self.partitions]
+                map_partitions(
+                    lambda x: getattr(x, name)(axis, mask, keepdims, **kwargs),
+                    self.partitions,
+                )
             )
 
     def count(self, axis, mask, keepdims):
@@ -295,11 +537,11 @@ class PartitionedArray(object):
     def all(self, axis, mask, keepdims):
         return self.reduce("all", axis, mask, keepdims)
 
-    def min(self, axis, mask, keepdims):
-        return self.reduce("min", axis, mask, keepdims)
+    def min(self, axis, mask, keepdims, initial=None):
+        return self.reduce("min", axis, mask, keepdims, initial=initial)
 
-    def max(self, axis, mask, keepdims):
-        return self.reduce("max", axis, mask, keepdims)
+    def max(self, axis, mask, keepdims, initial=None):
+        return self.reduce("max", axis, mask, keepdims, initial=initial)
 
     def argmin(self, axis, mask, keepdims):
         return self.reduce("argmin", axis, mask, keepdims)
@@ -334,7 +576,7 @@ class PartitionedArray(object):
 
         else:
             return self.replace_partitions(
-                [x.localindex(axis) for x in self.partitions]
+                map_partitions(lambda x: x.localindex(axis), self.partitions)
             )
 
     def combinations(self, n, replacement, keys, parameters, axis):
@@ -342,10 +584,10 @@ class PartitionedArray(object):
             return self.toContent().combinations(n, replacement, keys, parameters, axis)
         else:
             return self.replace_partitions(
-                [
-                    x.combinations(n, replacement, keys, parameters, axis)
-                    for x in self.partitions
-                ]
+                map_partitions(
+                    lambda x: x.combinations(n, replacement, keys, parameters, axis),
+                    self.partitions,
+                )
             )
 
     def __len__(self):
@@ -2,9 +2,36 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_ListArray_combinations.cpp", line)
 
+#include <vector>
+
 #include "awkward/kernels.h"
 #include "awkward/kernel-utils.h"
 
+static int64_t awkward_ListArray_combinations_count(
+  int64_t size,
+  int64_t n,
+  bool replacement) {
+  if (replacement) {
+    size += (n - 1);
+  }
+  int64_t thisn = n;
+  if (thisn > size) {
+    return 0;
+  }
+  else if (thisn == size) {
+    return 1;
+  }
+  if (thisn * 2 > size) {
+    thisn = size - thisn;
+  }
+  int64_t combinationslen = size;
+  for (int64_t j = 2;  j <= thisn;  j++) {
+    combinationslen *= (size - j + 1);
+    combinationslen /= j;
+  }
+  return combinationslen;
+}
+
 template <typename C>
 ERROR awkward_ListArray_combinations(
   int64_t** tocarry,
@@ -15,6 +42,38 @@ ERROR awkward_ListArray_combinations(
   const C* starts,
   const C* stops,
   int64_t length) {
+  if (awkward_num_threads() > 1) {
+    // each list starts filling tocarry at the total of its predecessors, so
+    // ranges of lists can be filled in parallel with their own indexes
+    std::vector<int64_t> tooffsets((size_t)length + 1);
+    tooffsets[0] = 0;
+    for (int64_t i = 0;  i < length;  i++) {
+      tooffsets[(size_t)i + 1] = tooffsets[(size_t)i] +
+        awkward_ListArray_combinations_count(
+          (int64_t)(stops[i] - starts[i]), n, replacement);
+    }
+    awkward_parallel_ranges(length, tooffsets.data(),
+                            [&](int64_t begin, int64_t end) {
+      std::vector<int64_t> localto((size_t)n, tooffsets[(size_t)begin]);
+      std::vector<int64_t> localfrom((size_t)n, 0);
+      for (int64_t i = begin;  i < end;  i++) {
+        localfrom[0] = (int64_t)starts[i];
+        awkward_ListArray_combinations_step_64(
+          tocarry,
+          localto.data(),
+          localfrom.data(),
+          0,
+          (int64_t)stops[i],
+          n,
+          replacement);
+      }
+    });
+    for (int64_t j = 0;  j < n;  j++) {
+      toindex[j] = tooffsets[(size_t)length];
+    }
+    return success();
+  }
+
   for (int64_t j = 0;  j < n;  j++) {
     toindex[j] = 0;
   }
@@ -0,0 +1,183 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_ListOffsetArray_argsort_strings.cpp", line)
+
+#include <algorithm>
+#include <cstring>
+#include <numeric>
+#include <vector>
+
+#include "awkward/kernels.h"
+#include "awkward/kernel-utils.h"
+
+// below this size, a bucket is sorted by insertion instead of radix passes
+const int64_t kStringInsertionSort = 32;
+// 256 byte values and one bucket for strings that end before 'depth'
+const int64_t kStringBuckets = 257;
+
+struct StringSortTask {
+  int64_t begin;
+  int64_t end;
+  int64_t depth;
+};
+
+// The bucket of string 'i' at character 'depth': strings that have ended
+// come first in ascending order and last in descending order.
+static inline int64_t
+awkward_string_bucket(
+  const uint8_t* stringdata,
+  const int64_t* stringstarts,
+  const int64_t* stringstops,
+  int64_t i,
+  int64_t depth,
+  bool ascending) {
+  int64_t start = stringstarts[i] + depth;
+  if (start >= stringstops[i]) {
+    return ascending ? 0 : kStringBuckets - 1;
+  }
+  int64_t c = (int64_t)stringdata[start];
+  return ascending ? c + 1 : 255 - c;
+}
+
+// True if string 'i' must be strictly before string 'j', comparing only
+// the characters from 'depth' on (all before are equal).
+static inline bool
+awkward_string_before(
+  const uint8_t* stringdata,
+  const int64_t* stringstarts,
+  const int64_t* stringstops,
+  int64_t i,
+  int64_t j,
+  int64_t depth,
+  bool ascending) {
+  int64_t ilen = stringstops[i] - stringstarts[i] - depth;
+  int64_t jlen = stringstops[j] - stringstarts[j] - depth;
+  int64_t common = ilen < jlen ? ilen : jlen;
+  int cmp = 0;
+  if (common > 0) {
+    cmp = std::memcmp(stringdata + stringstarts[i] + depth,
+                      stringdata + stringstarts[j] + depth,
+                      (size_t)common);
+  }
+  if (cmp == 0) {
+    return ascending ? ilen < jlen : ilen > jlen;
+  }
+  return ascending ? cmp < 0 : cmp > 0;
+}
+
+// Stable MSD radix sort of the string indexes in index[begin, end),
+// using aux[begin, end) as scratch space.
+static void
+awkward_string_msd_sort(
+  int64_t* index,
+  int64_t* aux,
+  int64_t begin,
+  int64_t end,
+  const uint8_t* stringdata,
+  const int64_t* stringstarts,
+  const int64_t* stringstops,
+  bool ascending) {
+  int64_t ended = ascending ? 0 : kStringBuckets - 1;
+  std::vector<StringSortTask> tasks;
+  tasks.push_back({ begin, end, 0 });
+  int64_t counts[kStringBuckets + 1];
+
+  while (!tasks.empty()) {
+    StringSortTask task = tasks.back();
+    tasks.pop_back();
+    int64_t length = task.end - task.begin;
+    if (length < 2) {
+      continue;
+    }
+
+    if (length <= kStringInsertionSort) {
+      for (int64_t i = task.begin + 1;  i < task.end;  i++) {
+        int64_t x = index[i];
+        int64_t j = i;
+        while (j > task.begin  &&
+               awkward_string_before(stringdata, stringstarts, stringstops,
+                                     x, index[j - 1], task.depth, ascending)) {
+          index[j] = index[j - 1];
+          j--;
+        }
+        index[j] = x;
+      }
+      continue;
+    }
+
+    std::fill(counts, counts + kStringBuckets + 1, 0);
+    for (int64_t i = task.begin;  i < task.end;  i++) {
+      counts[awkward_string_bucket(stringdata, stringstarts, stringstops,
+                                   index[i], task.depth, ascending) + 1]++;
+    }
+
+    // a common prefix needs no reordering: go to the next character
+    int64_t first = awkward_string_bucket(stringdata, stringstarts,
+                                          stringstops, index[task.begin],
+                                          task.depth, ascending);
+    if (counts[first + 1] == length) {
+      if (first != ended) {
+        tasks.push_back({ task.begin, task.end, task.depth + 1 });
+      }
+      continue;
+    }
+
+    for (int64_t k = 0;  k < kStringBuckets;  k++) {
+      counts[k + 1] += counts[k];
+    }
+    for (int64_t k = 0;  k < kStringBuckets + 1;  k++) {
+      counts[k] += task.begin;
+    }
+    for (int64_t i = task.begin;  i < task.end;  i++) {
+      int64_t k = awkward_string_bucket(stringdata, stringstarts, stringstops,
+                                        index[i], task.depth, ascending);
+      aux[counts[k]++] = index[i];
+    }
+    std::copy(aux + task.begin, aux + task.end, index + task.begin);
+
+    // after the scatter, counts[k] is the end of bucket k
+    int64_t start = task.begin;
+    for (int64_t k = 0;  k < kStringBuckets;  k++) {
+      if (k != ended  &&  counts[k] - start > 1) {
+        tasks.push_back({ start, counts[k], task.depth + 1 });
+      }
+      start = counts[k];
+    }
+  }
+}
+
+ERROR awkward_ListOffsetArray_argsort_strings(
+  int64_t* tocarry,
+  const uint8_t* stringdata,
+  const int64_t* stringstarts,
+  const int64_t* stringstops,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool stable,
+  bool local) {
+  // MSD radix sort is stable, so 'stable' does not change the algorithm
+  std::vector<int64_t> index(length);
+  std::vector<int64_t> aux(length);
+  std::iota(index.begin(), index.end(), 0);
+
+  awkward_parallel_ranges(offsetslength - 1, offsets,
+                          [&](int64_t begin, int64_t end) {
+    for (int64_t i = begin;  i < end;  i++) {
+      awkward_string_msd_sort(index.data(),
+                              aux.data(),
+                              offsets[i],
+                              offsets[i + 1],
+                              stringdata,
+                              stringstarts,
+                              stringstops,
+                              ascending);
+      for (int64_t j = offsets[i];  j < offsets[i + 1];  j++) {
+        tocarry[j] = local ? index[j] - offsets[i] : index[j];
+      }
+    }
+  });
+
+  return success();
+}
@@ -0,0 +1,94 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_NumpyArray_dictionary_encode_uint8.cpp", line)
+
+#include <cstring>
+#include <vector>
+
+#include "awkward/kernels.h"
+
+// MurmurHash64A mixing, 8 bytes at a time
+static inline uint64_t
+awkward_hash_bytes(const uint8_t* data, int64_t length) {
+  const uint64_t m = 0xc6a4a7935bd1e995ULL;
+  const int r = 47;
+  uint64_t h = 0x8445d61a4e774912ULL ^ ((uint64_t)length * m);
+
+  int64_t i = 0;
+  for (;  i + 8 <= length;  i += 8) {
+    uint64_t k;
+    std::memcpy(&k, data + i, 8);
+    k *= m;
+    k ^= k >> r;
+    k *= m;
+    h ^= k;
+    h *= m;
+  }
+  if (i < length) {
+    uint64_t k = 0;
+    std::memcpy(&k, data + i, (size_t)(length - i));
+    h ^= k;
+    h *= m;
+  }
+
+  h ^= h >> r;
+  h *= m;
+  h ^= h >> r;
+  return h;
+}
+
+ERROR awkward_NumpyArray_dictionary_encode_uint8(
+  int64_t* tocodes,
+  int64_t* tolength,
+  const uint8_t* fromptr,
+  const int64_t* fromstarts,
+  const int64_t* fromstops,
+  int64_t length,
+  int64_t lencontent) {
+  // open addressing with linear probing; at most half full
+  uint64_t capacity = 16;
+  while (capacity < 2 * (uint64_t)length) {
+    capacity *= 2;
+  }
+  uint64_t mask = capacity - 1;
+  std::vector<int64_t> slots(capacity, -1);   // first item with this value
+  std::vector<uint64_t> hashes(capacity);
+
+  int64_t numcodes = 0;
+  for (int64_t i = 0;  i < length;  i++) {
+    int64_t start = fromstarts[i];
+    int64_t size = fromstops[i] - start;
+    if (start < 0) {
+      return failure("starts[i] < 0", i, kSliceNone, FILENAME(__LINE__));
+    }
+    if (size < 0) {
+      return failure("stops[i] < starts[i]", i, kSliceNone, FILENAME(__LINE__));
+    }
+    if (fromstops[i] > lencontent) {
+      return failure("stops[i] > len(content)", i, kSliceNone, FILENAME(__LINE__));
+    }
+    uint64_t h = awkward_hash_bytes(fromptr + start, size);
+    uint64_t slot = h & mask;
+    while (true) {
+      int64_t j = slots[slot];
+      if (j == -1) {
+        slots[slot] = i;
+        hashes[slot] = h;
+        tocodes[i] = numcodes;
+        numcodes++;
+        break;
+      }
+      if (hashes[slot] == h  &&
+          fromstops[j] - fromstarts[j] == size  &&
+          (size == 0  ||
+           std::memcmp(fromptr + fromstarts[j], fromptr + start, (size_t)size) == 0)) {
+        tocodes[i] = tocodes[j];
+        break;
+      }
+      slot = (slot + 1) & mask;
+    }
+  }
+
+  *tolength = numcodes;
+  return success();
+}
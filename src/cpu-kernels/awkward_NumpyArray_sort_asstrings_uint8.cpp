@@ -27,13 +27,8 @@ ERROR awkward_NumpyArray_sort_asstrings_uint8(
   for (int64_t k = 0;  k < offsetslength - 1;  k++) {
     int64_t start = offsets[k];
     int64_t stop = offsets[k + 1];
-    int64_t slen = start;
-    std::string strvar;
-    for (uint8_t i = (uint8_t)start;  slen < stop;  i++) {
-      slen++;
-      strvar += (char)fromptr[i];
-    }
-    words.emplace_back(strvar);
+    words.emplace_back(reinterpret_cast<const char*>(fromptr) + start,
+                       (size_t)(stop - start));
   }
 
   // sort the container
@@ -7,6 +7,7 @@
 #include <vector>
 
 #include "awkward/kernels.h"
+#include "awkward/kernel-utils.h"
 
 template <typename T>
 ERROR awkward_argsort(
@@ -20,54 +21,37 @@ ERROR awkward_argsort(
   std::vector<int64_t> result(length);
   std::iota(result.begin(), result.end(), 0);
 
-  if (ascending  &&  stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
+  // sublists are independent, so they can be sorted in parallel
+  awkward_parallel_ranges(offsetslength - 1, offsets,
+                          [&](int64_t begin, int64_t end) {
+    for (int64_t i = begin;  i < end;  i++) {
       auto start = std::next(result.begin(), offsets[i]);
       auto stop = std::next(result.begin(), offsets[i + 1]);
-      std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] < fromptr[i2];
-      });
-      std::transform(start, stop, start, [&](int64_t j) -> int64_t {
-        return j - offsets[i];
-      });
-    }
-  }
-  else if (!ascending  &&  stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(result.begin(), offsets[i]);
-      auto stop = std::next(result.begin(), offsets[i + 1]);
-      std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] > fromptr[i2];
-      });
-      std::transform(start, stop, start, [&](int64_t j) -> int64_t {
-        return j - offsets[i];
-      });
-    }
-  }
-  else if (ascending  &&  !stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(result.begin(), offsets[i]);
-      auto stop = std::next(result.begin(), offsets[i + 1]);
-      std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] < fromptr[i2];
-      });
+      if (ascending  &&  stable) {
+        std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
+          return fromptr[i1] < fromptr[i2];
+        });
+      }
+      else if (!ascending  &&  stable) {
+        std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
+          return fromptr[i1] > fromptr[i2];
+        });
+      }
+      else if (ascending  &&  !stable) {
+        std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
+          return fromptr[i1] < fromptr[i2];
+        });
+      }
+      else {
+        std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
+          return fromptr[i1] > fromptr[i2];
+        });
+      }
       std::transform(start, stop, start, [&](int64_t j) -> int64_t {
         return j - offsets[i];
       });
     }
-  }
-  else {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(result.begin(), offsets[i]);
-      auto stop = std::next(result.begin(), offsets[i + 1]);
-      std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] > fromptr[i2];
-      });
-      std::transform(start, stop, start, [&](int64_t j) -> int64_t {
-        return j - offsets[i];
-      });
-    }
-  }
+  });
 
   for (int64_t i = 0;  i < length;  i++) {
     toptr[i] = result[i];
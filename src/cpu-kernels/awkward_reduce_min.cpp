@@ -3,6 +3,7 @@
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_reduce_min.cpp", line)
 
 #include "awkward/kernels.h"
+#include "awkward/kernel-utils.h"
 
 template <typename OUT, typename IN>
 ERROR awkward_reduce_min(
@@ -15,10 +16,13 @@ ERROR awkward_reduce_min(
   for (int64_t i = 0;  i < outlength;  i++) {
     toptr[i] = identity;
   }
-  for (int64_t i = 0;  i < lenparents;  i++) {
-    IN x = fromptr[i];
-    toptr[parents[i]] = (x < toptr[parents[i]] ? x : toptr[parents[i]]);
-  }
+  awkward_parallel_parents(parents, lenparents,
+                           [&](int64_t start, int64_t stop) {
+    for (int64_t i = start;  i < stop;  i++) {
+      IN x = fromptr[i];
+      toptr[parents[i]] = (x < toptr[parents[i]] ? x : toptr[parents[i]]);
+    }
+  });
   return success();
 }
 ERROR awkward_reduce_min_int8_int8_64(
@@ -3,6 +3,7 @@
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_reduce_sum.cpp", line)
 
 #include "awkward/kernels.h"
+#include "awkward/kernel-utils.h"
 
 template <typename OUT, typename IN>
 ERROR awkward_reduce_sum(
@@ -14,9 +15,12 @@ ERROR awkward_reduce_sum(
   for (int64_t i = 0;  i < outlength;  i++) {
     toptr[i] = (OUT)0;
   }
-  for (int64_t i = 0;  i < lenparents;  i++) {
-    toptr[parents[i]] += (OUT)fromptr[i];
-  }
+  awkward_parallel_parents(parents, lenparents,
+                           [&](int64_t start, int64_t stop) {
+    for (int64_t i = start;  i < stop;  i++) {
+      toptr[parents[i]] += (OUT)fromptr[i];
+    }
+  });
   return success();
 }
 ERROR awkward_reduce_sum_int64_int8_64(
@@ -3,6 +3,7 @@
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_sort.cpp", line)
 
 #include "awkward/kernels.h"
+#include "awkward/kernel-utils.h"
 
 #include <algorithm>
 #include <numeric>
@@ -21,42 +22,34 @@ ERROR awkward_sort(
   std::vector<int64_t> index(length);
   std::iota(index.begin(), index.end(), 0);
 
-  if (ascending  &&  stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
+  // sublists are independent, so they can be sorted in parallel
+  awkward_parallel_ranges(offsetslength - 1, offsets,
+                          [&](int64_t begin, int64_t end) {
+    for (int64_t i = begin;  i < end;  i++) {
       auto start = std::next(index.begin(), offsets[i]);
       auto stop = std::next(index.begin(), offsets[i + 1]);
-      std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] < fromptr[i2];
-      });
+      if (ascending  &&  stable) {
+        std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
+          return fromptr[i1] < fromptr[i2];
+        });
+      }
+      else if (!ascending  &&  stable) {
+        std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
+          return fromptr[i1] > fromptr[i2];
+        });
+      }
+      else if (ascending  &&  !stable) {
+        std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
+          return fromptr[i1] < fromptr[i2];
+        });
+      }
+      else {
+        std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
+          return fromptr[i1] > fromptr[i2];
+        });
+      }
     }
-  }
-  else if (!ascending  &&  stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(index.begin(), offsets[i]);
-      auto stop = std::next(index.begin(), offsets[i + 1]);
-      std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] > fromptr[i2];
-      });
-    }
-  }
-  else if (ascending  &&  !stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(index.begin(), offsets[i]);
-      auto stop = std::next(index.begin(), offsets[i + 1]);
-      std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] < fromptr[i2];
-      });
-    }
-  }
-  else {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(index.begin(), offsets[i]);
-      auto stop = std::next(index.begin(), offsets[i + 1]);
-      std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] > fromptr[i2];
-      });
-    }
-  }
+  });
 
   for (int64_t i = 0;  i < parentslength;  i++) {
     toptr[i] = fromptr[index[i]];
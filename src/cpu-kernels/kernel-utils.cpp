@@ -2,6 +2,8 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/kernel-utils.cpp", line)
 
+#include <atomic>
+
 #include "awkward/kernel-utils.h"
 
 int8_t awkward_Index8_getitem_at_nowrap(
@@ -198,3 +200,17 @@ void awkward_ListArray_combinations_step_64(
       replacement
     );
 }
+
+static std::atomic<int64_t> num_threads_(1);
+
+void awkward_set_num_threads(
+  int64_t num_threads) {
+  if (num_threads <= 0) {
+    num_threads = (int64_t)std::thread::hardware_concurrency();
+  }
+  num_threads_ = (num_threads <= 0 ? 1 : num_threads);
+}
+
+int64_t awkward_num_threads() {
+  return num_threads_;
+}
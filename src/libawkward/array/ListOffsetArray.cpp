@@ -1643,6 +1643,72 @@ namespace awkward {
                                                       keepdims);
   }
 
+  namespace {
+    // Indexes that sort the strings (offsets, content) within each group of
+    // equal 'parents', local to the group (as NumpyArray::argsort_next
+    // returns for numbers) or global (to carry the strings themselves).
+    const Index64
+    argsort_strings(const Index64& offsets,
+                    const ContentPtr& content,
+                    const Index64& parents,
+                    bool ascending,
+                    bool stable,
+                    bool local) {
+      NumpyArray* rawcontent = dynamic_cast<NumpyArray*>(content.get());
+      if (rawcontent == nullptr  ||
+          rawcontent->ndim() != 1  ||
+          rawcontent->dtype() != util::dtype::uint8) {
+        throw std::invalid_argument(
+          std::string("cannot sort strings whose content is not an array of bytes")
+          + FILENAME(__LINE__));
+      }
+      NumpyArray bytes = rawcontent->contiguous();
+
+      int64_t length = offsets.length() - 1;
+      if (length != parents.length()) {
+        throw std::runtime_error(
+          std::string("offsets.length() - 1 != parents.length()") + FILENAME(__LINE__));
+      }
+      Index64 outindex(length);
+      if (length == 0) {
+        return outindex;
+      }
+
+      int64_t ranges_length = 0;
+      struct Error err1 = kernel::sorting_ranges_length(
+        kernel::lib::cpu,   // DERIVE
+        &ranges_length,
+        parents.data(),
+        parents.length());
+      util::handle_error(err1, "ListOffsetArray", nullptr);
+
+      Index64 ranges(ranges_length);
+      struct Error err2 = kernel::sorting_ranges(
+        kernel::lib::cpu,   // DERIVE
+        ranges.data(),
+        ranges_length,
+        parents.data(),
+        parents.length());
+      util::handle_error(err2, "ListOffsetArray", nullptr);
+
+      struct Error err3 = kernel::ListOffsetArray_argsort_strings(
+        kernel::lib::cpu,   // DERIVE
+        outindex.data(),
+        reinterpret_cast<uint8_t*>(bytes.data()),
+        offsets.data(),
+        offsets.data() + 1,
+        length,
+        ranges.data(),
+        ranges_length,
+        ascending,
+        stable,
+        local);
+      util::handle_error(err3, "ListOffsetArray", nullptr);
+
+      return outindex;
+    }
+  }
+
   template <>
   const ContentPtr ListOffsetArrayOf<int64_t>::sort_next(
     int64_t negaxis,
@@ -1654,18 +1720,24 @@ namespace awkward {
     bool keepdims) const {
 
     // if this is array of strings, axis parameter is ignored
-    // and this array is sorted
+    // and the strings are sorted within each group of parents
     if (util::parameter_isstring(parameters_, "__array__")) {
-      if (NumpyArray* content = dynamic_cast<NumpyArray*>(content_.get())) {
-        ContentPtr out = content->sort_asstrings(offsets_,
-                                                 ascending,
-                                                 stable);
-        return std::make_shared<RegularArray>(Identities::none(),
-                                              util::Parameters(),
-                                              out,
-                                              out.get()->length(),
-                                              length());
+      Index64 nextcarry = argsort_strings(offsets_,
+                                          content_,
+                                          parents,
+                                          ascending,
+                                          stable,
+                                          false);
+      ContentPtr out = carry(nextcarry, false);
+      if (keepdims) {
+        out = std::make_shared<RegularArray>(
+          Identities::none(),
+          util::Parameters(),
+          out,
+          parents.length() / starts.length(),
+          length());
       }
+      return out;
     }
 
     std::pair<bool, int64_t> branchdepth = branch_depth();
@@ -1821,10 +1893,24 @@ namespace awkward {
                                            bool stable,
                                            bool keepdims) const {
     // if this is array of strings, axis parameter is ignored
-    // and this array is sorted
+    // and the strings are sorted within each group of parents
     if (util::parameter_isstring(parameters_, "__array__")) {
-      throw std::runtime_error(
-        std::string("not implemented yet: argsort for strings") + FILENAME(__LINE__));
+      Index64 outindex = argsort_strings(offsets_,
+                                         content_,
+                                         parents,
+                                         ascending,
+                                         stable,
+                                         true);
+      ContentPtr out = std::make_shared<NumpyArray>(outindex);
+      if (keepdims) {
+        out = std::make_shared<RegularArray>(
+          Identities::none(),
+          util::Parameters(),
+          out,
+          parents.length() / starts.length(),
+          length());
+      }
+      return out;
     }
 
     std::pair<bool, int64_t> branchdepth = branch_depth();
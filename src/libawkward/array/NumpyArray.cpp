@@ -4,6 +4,7 @@
 #define FILENAME_C(line) FILENAME_FOR_EXCEPTIONS_C("src/libawkward/array/NumpyArray.cpp", line)
 
 #include <algorithm>
+#include <complex>
 #include <iomanip>
 #include <numeric>
 #include <sstream>
@@ -29,6 +30,106 @@
 #include "awkward/array/NumpyArray.h"
 
 namespace awkward {
+  namespace {
+    template <typename TO, typename FROM>
+    void
+    fill_complex_from(TO* toptr,
+                      int64_t tooffset,
+                      const FROM* fromptr,
+                      int64_t length) {
+      for (int64_t i = 0;  i < length;  i++) {
+        toptr[tooffset + i] = TO((typename TO::value_type)fromptr[i]);
+      }
+    }
+
+    template <typename TO, typename FROM>
+    void
+    fill_complex_from_complex(TO* toptr,
+                              int64_t tooffset,
+                              const FROM* fromptr,
+                              int64_t length) {
+      for (int64_t i = 0;  i < length;  i++) {
+        toptr[tooffset + i] = TO(fromptr[i]);
+      }
+    }
+
+    template <typename TO>
+    void
+    fill_complex(kernel::lib ptr_lib,
+                 TO* toptr,
+                 int64_t tooffset,
+                 const NumpyArray& array,
+                 int64_t length) {
+      if (ptr_lib != kernel::lib::cpu) {
+        throw std::runtime_error(
+          std::string("not implemented: merging complex numbers on ptr_lib other than cpu")
+          + FILENAME(__LINE__));
+      }
+      const void* fromptr = array.data();
+      switch (array.dtype()) {
+      case util::dtype::boolean:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const bool*>(fromptr), length);
+        break;
+      case util::dtype::int8:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const int8_t*>(fromptr), length);
+        break;
+      case util::dtype::int16:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const int16_t*>(fromptr), length);
+        break;
+      case util::dtype::int32:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const int32_t*>(fromptr), length);
+        break;
+      case util::dtype::int64:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const int64_t*>(fromptr), length);
+        break;
+      case util::dtype::uint8:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const uint8_t*>(fromptr), length);
+        break;
+      case util::dtype::uint16:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const uint16_t*>(fromptr), length);
+        break;
+      case util::dtype::uint32:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const uint32_t*>(fromptr), length);
+        break;
+      case util::dtype::uint64:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const uint64_t*>(fromptr), length);
+        break;
+      case util::dtype::float32:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const float*>(fromptr), length);
+        break;
+      case util::dtype::float64:
+        fill_complex_from(toptr, tooffset,
+                          reinterpret_cast<const double*>(fromptr), length);
+        break;
+      case util::dtype::complex64:
+        fill_complex_from_complex(
+          toptr, tooffset,
+          reinterpret_cast<const std::complex<float>*>(fromptr), length);
+        break;
+      case util::dtype::complex128:
+        fill_complex_from_complex(
+          toptr, tooffset,
+          reinterpret_cast<const std::complex<double>*>(fromptr), length);
+        break;
+      default:
+        throw std::runtime_error(
+          std::string("FIXME: merge from ")
+          + util::dtype_to_name(array.dtype()) + std::string(" to complex not implemented")
+          + FILENAME(__LINE__));
+      }
+    }
+  }
+
   ////////// NumpyForm
 
   NumpyForm::NumpyForm(bool has_identities,
@@ -2491,16 +2592,22 @@ namespace awkward {
 
       // to complex64
       case util::dtype::complex64:
-        throw std::runtime_error(
-          std::string("FIXME: merge to complex64 not implemented")
-          + FILENAME(__LINE__));
+        fill_complex(ptr_lib,
+                     reinterpret_cast<std::complex<float>*>(ptr.get()),
+                     flatlength_so_far,
+                     contiguous_array,
+                     flatlength);
+        err = success();
         break;
 
       // to complex128
       case util::dtype::complex128:
-        throw std::runtime_error(
-          std::string("FIXME: merge to complex128 not implemented")
-          + FILENAME(__LINE__));
+        fill_complex(ptr_lib,
+                     reinterpret_cast<std::complex<double>*>(ptr.get()),
+                     flatlength_so_far,
+                     contiguous_array,
+                     flatlength);
+        err = success();
         break;
 
       // to complex256
@@ -3350,6 +3457,35 @@ namespace awkward {
     return out;
   }
 
+  const Index64
+  NumpyArray::dictionary_encode(const Index64& starts,
+                                const Index64& stops) const {
+    if (ndim() != 1  ||  dtype_ != util::dtype::uint8) {
+      throw std::invalid_argument(
+        std::string("dictionary_encode requires a one-dimensional uint8 array")
+        + FILENAME(__LINE__));
+    }
+    if (starts.length() > stops.length()) {
+      throw std::invalid_argument(
+        std::string("len(starts) > len(stops)") + FILENAME(__LINE__));
+    }
+    NumpyArray bytes = contiguous();
+    int64_t length = starts.length();
+    Index64 codes(length);
+    int64_t numcodes;
+    struct Error err = kernel::NumpyArray_dictionary_encode_uint8(
+      kernel::lib::cpu,   // DERIVE
+      codes.data(),
+      &numcodes,
+      reinterpret_cast<uint8_t*>(bytes.data()),
+      starts.data(),
+      stops.data(),
+      length,
+      bytes.length());
+    util::handle_error(err, classname(), identities_.get());
+    return codes;
+  }
+
   const ContentPtr
   NumpyArray::getitem_next(const SliceAt& at,
                            const Slice& tail,
@@ -5,6 +5,7 @@
 
 #include <sstream>
 #include <algorithm>
+#include <cmath>
 
 #include "awkward/kernels.h"
 #include "awkward/kernel-utils.h"
@@ -1488,6 +1489,187 @@ namespace awkward {
                                          outlength);
   }
 
+  namespace {
+    template <typename T>
+    int
+    compare_sortkey(const void* data, int64_t i1, int64_t i2) {
+      const T* ptr = reinterpret_cast<const T*>(data);
+      return (ptr[i1] < ptr[i2] ? -1 : (ptr[i2] < ptr[i1] ? 1 : 0));
+    }
+
+    template <typename T>
+    bool
+    isnan_sortkey(const void* data, int64_t i) {
+      return std::isnan(reinterpret_cast<const T*>(data)[i]);
+    }
+
+    struct SortKey {
+      ContentPtr array;
+      const void* data;
+      int (*compare)(const void* data, int64_t i1, int64_t i2);
+      // nullptr for keys that can't be NaN
+      bool (*nancheck)(const void* data, int64_t i);
+      bool ascending;
+    };
+  }
+
+  const Index64
+  RecordArray::argsort_by(const Index64& offsets,
+                          const std::vector<std::string>& keys,
+                          const std::vector<bool>& ascending,
+                          bool stable,
+                          bool local) const {
+    if (keys.empty()) {
+      throw std::invalid_argument(
+        std::string("at least one sort key is required") + FILENAME(__LINE__));
+    }
+    if (keys.size() != ascending.size()) {
+      throw std::invalid_argument(
+        std::string("need one 'ascending' flag for each sort key")
+        + FILENAME(__LINE__));
+    }
+    if (offsets.length() == 0  ||
+        offsets.getitem_at_nowrap(0) != 0  ||
+        offsets.getitem_at_nowrap(offsets.length() - 1) > length()) {
+      throw std::invalid_argument(
+        std::string("offsets must start at 0 and not exceed the array length")
+        + FILENAME(__LINE__));
+    }
+
+    std::vector<SortKey> sortkeys;
+    for (size_t k = 0;  k < keys.size();  k++) {
+      ContentPtr array = field(keys[k]).get()->getitem_range_nowrap(0, length());
+      while (true) {
+        if (VirtualArray* raw = dynamic_cast<VirtualArray*>(array.get())) {
+          array = raw->array();
+        }
+        else if (IndexedArray32* raw =
+                 dynamic_cast<IndexedArray32*>(array.get())) {
+          array = raw->project();
+        }
+        else if (IndexedArrayU32* raw =
+                 dynamic_cast<IndexedArrayU32*>(array.get())) {
+          array = raw->project();
+        }
+        else if (IndexedArray64* raw =
+                 dynamic_cast<IndexedArray64*>(array.get())) {
+          array = raw->project();
+        }
+        else {
+          break;
+        }
+      }
+      NumpyArray* raw = dynamic_cast<NumpyArray*>(array.get());
+      if (raw == nullptr  ||  raw->ndim() != 1) {
+        throw std::invalid_argument(
+          std::string("sort key ") + util::quote(keys[k])
+          + std::string(" must be a one-dimensional array of numbers, without "
+                        "missing values") + FILENAME(__LINE__));
+      }
+      if (!raw->iscontiguous()) {
+        array = std::make_shared<NumpyArray>(raw->contiguous());
+        raw = dynamic_cast<NumpyArray*>(array.get());
+      }
+      int (*compare)(const void* data, int64_t i1, int64_t i2);
+      bool (*nancheck)(const void* data, int64_t i) = nullptr;
+      switch (raw->dtype()) {
+        case util::dtype::boolean:
+          compare = compare_sortkey<bool>;
+          break;
+        case util::dtype::int8:
+          compare = compare_sortkey<int8_t>;
+          break;
+        case util::dtype::int16:
+          compare = compare_sortkey<int16_t>;
+          break;
+        case util::dtype::int32:
+          compare = compare_sortkey<int32_t>;
+          break;
+        case util::dtype::int64:
+          compare = compare_sortkey<int64_t>;
+          break;
+        case util::dtype::uint8:
+          compare = compare_sortkey<uint8_t>;
+          break;
+        case util::dtype::uint16:
+          compare = compare_sortkey<uint16_t>;
+          break;
+        case util::dtype::uint32:
+          compare = compare_sortkey<uint32_t>;
+          break;
+        case util::dtype::uint64:
+          compare = compare_sortkey<uint64_t>;
+          break;
+        case util::dtype::float32:
+          compare = compare_sortkey<float>;
+          nancheck = isnan_sortkey<float>;
+          break;
+        case util::dtype::float64:
+          compare = compare_sortkey<double>;
+          nancheck = isnan_sortkey<double>;
+          break;
+        default:
+          throw std::invalid_argument(
+            std::string("cannot sort by key ") + util::quote(keys[k])
+            + std::string(" of type ") + raw->format() + FILENAME(__LINE__));
+      }
+      sortkeys.push_back(
+        { array, raw->data(), compare, nancheck, ascending[k] });
+    }
+
+    const int64_t* offsetsptr = offsets.data();
+    int64_t numgroups = offsets.length() - 1;
+    int64_t outlength = offsetsptr[numgroups];
+    Index64 out(outlength);
+    int64_t* outptr = out.data();
+    for (int64_t i = 0;  i < outlength;  i++) {
+      outptr[i] = i;
+    }
+
+    auto less = [&sortkeys](int64_t i1, int64_t i2) -> bool {
+      for (auto& key : sortkeys) {
+        // NaN compares unequal to everything, which is not a strict weak
+        // ordering; put NaNs after all numbers, in either direction
+        if (key.nancheck != nullptr) {
+          bool nan1 = key.nancheck(key.data, i1);
+          bool nan2 = key.nancheck(key.data, i2);
+          if (nan1  ||  nan2) {
+            if (nan1 != nan2) {
+              return nan2;
+            }
+            continue;
+          }
+        }
+        int comparison = key.compare(key.data, i1, i2);
+        if (comparison != 0) {
+          return key.ascending ? comparison < 0 : comparison > 0;
+        }
+      }
+      return false;
+    };
+
+    awkward_parallel_ranges(numgroups, offsetsptr,
+                            [&](int64_t begin, int64_t end) {
+      for (int64_t i = begin;  i < end;  i++) {
+        int64_t* start = outptr + offsetsptr[i];
+        int64_t* stop = outptr + offsetsptr[i + 1];
+        if (stable) {
+          std::stable_sort(start, stop, less);
+        }
+        else {
+          std::sort(start, stop, less);
+        }
+        if (local) {
+          for (int64_t* j = start;  j < stop;  j++) {
+            *j -= offsetsptr[i];
+          }
+        }
+      }
+    });
+
+    return out;
+  }
+
   const ContentPtr
   RecordArray::localindex(int64_t axis, int64_t depth) const {
     int64_t posaxis = axis_wrap_if_negative(axis);
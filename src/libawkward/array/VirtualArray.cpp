@@ -3,6 +3,7 @@
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/array/VirtualArray.cpp", line)
 #define FILENAME_C(line) FILENAME_FOR_EXCEPTIONS_C("src/libawkward/array/VirtualArray.cpp", line)
 
+#include <chrono>
 #include <iomanip>
 #include <sstream>
 #include <stdexcept>
@@ -11,6 +12,8 @@
 
 #include "awkward/array/RegularArray.h"
 
+#include "awkward/virtual/VirtualArrayRecorder.h"
+
 #include "awkward/array/VirtualArray.h"
 
 namespace awkward {
@@ -368,13 +371,28 @@ namespace awkward {
         out = cache_.get()->get(cache_key());
       }
     }
+    bool recording = VirtualArrayRecorder::recording();
     if (out.get() == nullptr) {
+      std::chrono::steady_clock::time_point start;
+      if (recording) {
+        start = std::chrono::steady_clock::now();
+      }
       if (src_ptrlib != ptr_lib_) {
         out = generator_.get()->generate_and_check()->copy_to(src_ptrlib);
       }
       else {
         out = generator_.get()->generate_and_check();
       }
+      if (recording) {
+        std::chrono::duration<double> seconds =
+          std::chrono::steady_clock::now() - start;
+        VirtualArrayRecorder::record_generated(cache_key_,
+                                               seconds.count(),
+                                               out.get()->nbytes());
+      }
+    }
+    else if (recording) {
+      VirtualArrayRecorder::record_hit(cache_key_);
     }
     if (cache_.get() != nullptr) {
       cache_.get()->set(kernel::fully_qualified_cache_key(ptr_lib_, cache_key()),
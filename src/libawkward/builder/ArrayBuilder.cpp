@@ -86,6 +86,21 @@ namespace awkward {
     maybeupdate(builder_.get()->real(x));
   }
 
+  void
+  ArrayBuilder::typedinteger(int64_t x, util::dtype dtype) {
+    maybeupdate(builder_.get()->typedinteger(x, dtype));
+  }
+
+  void
+  ArrayBuilder::typedreal(double x, util::dtype dtype) {
+    maybeupdate(builder_.get()->typedreal(x, dtype));
+  }
+
+  void
+  ArrayBuilder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    maybeupdate(builder_.get()->typedcomplex(x, dtype));
+  }
+
   void
   ArrayBuilder::bytestring(const char* x) {
     maybeupdate(builder_.get()->string(x, -1, no_encoding));
@@ -218,6 +233,11 @@ namespace awkward {
     }
   }
 
+  void
+  ArrayBuilder::extend_copy(const ContentPtr& array) {
+    maybeupdate(builder_.get()->extend(array));
+  }
+
   void
   ArrayBuilder::maybeupdate(const BuilderPtr& tmp) {
     if (tmp.get() != builder_.get()) {
@@ -307,6 +327,50 @@ uint8_t awkward_ArrayBuilder_real(void* arraybuilder,
   return 0;
 }
 
+uint8_t awkward_ArrayBuilder_typedinteger(void* arraybuilder,
+                                          int64_t x,
+                                          const char* dtype) {
+  awkward::ArrayBuilder* obj =
+    reinterpret_cast<awkward::ArrayBuilder*>(arraybuilder);
+  try {
+    obj->typedinteger(x, awkward::util::name_to_dtype(dtype));
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_ArrayBuilder_typedreal(void* arraybuilder,
+                                       double x,
+                                       const char* dtype) {
+  awkward::ArrayBuilder* obj =
+    reinterpret_cast<awkward::ArrayBuilder*>(arraybuilder);
+  try {
+    obj->typedreal(x, awkward::util::name_to_dtype(dtype));
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_ArrayBuilder_typedcomplex(void* arraybuilder,
+                                          double real,
+                                          double imag,
+                                          const char* dtype) {
+  awkward::ArrayBuilder* obj =
+    reinterpret_cast<awkward::ArrayBuilder*>(arraybuilder);
+  try {
+    obj->typedcomplex(std::complex<double>(real, imag),
+                      awkward::util::name_to_dtype(dtype));
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
 uint8_t awkward_ArrayBuilder_bytestring(void* arraybuilder,
                                         const char* x) {
   awkward::ArrayBuilder* obj =
@@ -5,7 +5,15 @@
 namespace awkward {
   ArrayBuilderOptions::ArrayBuilderOptions(int64_t initial, double resize)
       : initial_(initial)
-      , resize_(resize) { }
+      , resize_(resize)
+      , page_length_(0) { }
+
+  ArrayBuilderOptions::ArrayBuilderOptions(int64_t initial,
+                                           double resize,
+                                           int64_t page_length)
+      : initial_(initial)
+      , resize_(resize)
+      , page_length_(page_length) { }
 
   int64_t
   ArrayBuilderOptions::initial() const {
@@ -16,4 +24,9 @@ namespace awkward {
   ArrayBuilderOptions::resize() const {
     return resize_;
   }
+
+  int64_t
+  ArrayBuilderOptions::page_length() const {
+    return page_length_;
+  }
 }
@@ -85,6 +85,39 @@ namespace awkward {
     return out;
   }
 
+  const BuilderPtr
+  BoolBuilder::typedinteger(int64_t x, util::dtype dtype) {
+    if (dtype == util::dtype::boolean) {
+      buffer_.append(x != 0);
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedinteger(x, dtype);
+    return out;
+  }
+
+  const BuilderPtr
+  BoolBuilder::typedreal(double x, util::dtype dtype) {
+    if (dtype == util::dtype::boolean) {
+      buffer_.append(x != 0.0);
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedreal(x, dtype);
+    return out;
+  }
+
+  const BuilderPtr
+  BoolBuilder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    if (dtype == util::dtype::boolean) {
+      buffer_.append(x != std::complex<double>(0.0, 0.0));
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedcomplex(x, dtype);
+    return out;
+  }
+
   const BuilderPtr
   BoolBuilder::string(const char* x, int64_t length, const char* encoding) {
     BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
@@ -155,4 +188,18 @@ namespace awkward {
     return out;
   }
 
+  const BuilderPtr
+  BoolBuilder::extend(const ContentPtr& array) {
+    NumpyArray* raw = dynamic_cast<NumpyArray*>(array.get());
+    if (raw != nullptr  &&
+        raw->ndim() == 1  &&
+        raw->dtype() == util::dtype::boolean  &&
+        raw->ptr_lib() == kernel::lib::cpu) {
+      NumpyArray contiguous = raw->contiguous();
+      buffer_.extend(reinterpret_cast<const uint8_t*>(contiguous.data()),
+                     contiguous.length());
+      return shared_from_this();
+    }
+    return Builder::extend(array);
+  }
 }
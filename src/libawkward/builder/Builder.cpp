@@ -1,7 +1,262 @@
 // BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/builder/Builder.cpp", line)
+
+#include <stdexcept>
+
+#include "awkward/Index.h"
+#include "awkward/array/NumpyArray.h"
+#include "awkward/array/EmptyArray.h"
+#include "awkward/array/ListArray.h"
+#include "awkward/array/ListOffsetArray.h"
+#include "awkward/array/RegularArray.h"
+#include "awkward/array/IndexedArray.h"
+#include "awkward/array/ByteMaskedArray.h"
+#include "awkward/array/BitMaskedArray.h"
+#include "awkward/array/UnmaskedArray.h"
+#include "awkward/array/RecordArray.h"
+#include "awkward/array/VirtualArray.h"
+
 #include "awkward/builder/Builder.h"
 
 namespace awkward {
+  namespace {
+    const BuilderPtr
+    extend_number(const BuilderPtr& out, const NumpyArray* raw, int64_t at) {
+      const char* ptr = reinterpret_cast<const char*>(raw->data()) +
+                        at * (int64_t)raw->strides()[0];
+      util::dtype dtype = raw->dtype();
+      switch (dtype) {
+      case util::dtype::boolean:
+        return out.get()->boolean(*reinterpret_cast<const bool*>(ptr));
+      case util::dtype::int8:
+        return out.get()->typedinteger(
+          *reinterpret_cast<const int8_t*>(ptr), dtype);
+      case util::dtype::int16:
+        return out.get()->typedinteger(
+          *reinterpret_cast<const int16_t*>(ptr), dtype);
+      case util::dtype::int32:
+        return out.get()->typedinteger(
+          *reinterpret_cast<const int32_t*>(ptr), dtype);
+      case util::dtype::int64:
+        return out.get()->integer(*reinterpret_cast<const int64_t*>(ptr));
+      case util::dtype::uint8:
+        return out.get()->typedinteger(
+          *reinterpret_cast<const uint8_t*>(ptr), dtype);
+      case util::dtype::uint16:
+        return out.get()->typedinteger(
+          *reinterpret_cast<const uint16_t*>(ptr), dtype);
+      case util::dtype::uint32:
+        return out.get()->typedinteger(
+          *reinterpret_cast<const uint32_t*>(ptr), dtype);
+      case util::dtype::uint64:
+        return out.get()->typedinteger(
+          (int64_t)*reinterpret_cast<const uint64_t*>(ptr), dtype);
+      case util::dtype::float32:
+        return out.get()->typedreal(
+          *reinterpret_cast<const float*>(ptr), dtype);
+      case util::dtype::float64:
+        return out.get()->real(*reinterpret_cast<const double*>(ptr));
+      case util::dtype::complex64:
+        return out.get()->typedcomplex(
+          std::complex<double>(
+            *reinterpret_cast<const std::complex<float>*>(ptr)), dtype);
+      case util::dtype::complex128:
+        return out.get()->typedcomplex(
+          *reinterpret_cast<const std::complex<double>*>(ptr), dtype);
+      default:
+        throw std::invalid_argument(
+          std::string("ArrayBuilder cannot accumulate numbers of type ")
+          + util::dtype_to_name(dtype) + FILENAME(__LINE__));
+      }
+    }
+
+    template <typename T>
+    bool
+    extend_option(BuilderPtr& out, const ContentPtr& array) {
+      if (T* raw = dynamic_cast<T*>(array.get())) {
+        Index8 mask = raw->bytemask();
+        ContentPtr content = raw->project();
+        int64_t length = mask.length();
+        int64_t i = 0;
+        int64_t j = 0;
+        while (i < length) {
+          if (mask.getitem_at_nowrap(i) != 0) {
+            out = out.get()->null();
+            i++;
+          }
+          else {
+            // copy each run of non-missing values at once
+            int64_t start = j;
+            while (i < length  &&  mask.getitem_at_nowrap(i) == 0) {
+              i++;
+              j++;
+            }
+            out = out.get()->extend(content.get()->getitem_range_nowrap(start,
+                                                                        j));
+          }
+        }
+        return true;
+      }
+      return false;
+    }
+  }
+
   Builder::~Builder() = default;
+
+  const BuilderPtr
+  Builder::extend(const ContentPtr& array) {
+    BuilderPtr out = shared_from_this();
+
+    if (VirtualArray* raw = dynamic_cast<VirtualArray*>(array.get())) {
+      return out.get()->extend(raw->array());
+    }
+
+    else if (array.get()->kernels() == kernel::lib::cuda) {
+      return out.get()->extend(array.get()->copy_to(kernel::lib::cpu));
+    }
+
+    else if (dynamic_cast<EmptyArray*>(array.get())) {
+      return out;
+    }
+
+    else if (NumpyArray* raw = dynamic_cast<NumpyArray*>(array.get())) {
+      if (raw->ndim() != 1) {
+        return out.get()->extend(raw->toRegularArray());
+      }
+      for (int64_t i = 0;  i < raw->length();  i++) {
+        out = extend_number(out, raw, i);
+      }
+      return out;
+    }
+
+    else if (ContentPtr list = aslistoffsetarray64(array)) {
+      ListOffsetArray64* raw = dynamic_cast<ListOffsetArray64*>(list.get());
+      Index64 offsets = raw->offsets();
+      ContentPtr content = raw->content();
+      bool isstring = array.get()->parameter_equals("__array__",
+                                                    "\"string\"");
+      bool isbytestring = array.get()->parameter_equals("__array__",
+                                                        "\"bytestring\"");
+      if (isstring  ||  isbytestring) {
+        NumpyArray* chars = dynamic_cast<NumpyArray*>(content.get());
+        if (chars == nullptr) {
+          throw std::invalid_argument(
+            std::string("string content must be a NumpyArray, not ")
+            + content.get()->classname() + FILENAME(__LINE__));
+        }
+        NumpyArray contiguous = chars->contiguous();
+        const char* data = reinterpret_cast<const char*>(contiguous.data());
+        for (int64_t i = 0;  i < raw->length();  i++) {
+          int64_t start = offsets.getitem_at_nowrap(i);
+          int64_t stop = offsets.getitem_at_nowrap(i + 1);
+          out = out.get()->string(data + start,
+                                  stop - start,
+                                  isstring ? "utf-8" : nullptr);
+        }
+      }
+      else {
+        for (int64_t i = 0;  i < raw->length();  i++) {
+          out = out.get()->beginlist();
+          out = out.get()->extend(content.get()->getitem_range_nowrap(
+            offsets.getitem_at_nowrap(i), offsets.getitem_at_nowrap(i + 1)));
+          out = out.get()->endlist();
+        }
+      }
+      return out;
+    }
+
+    else if (IndexedArray32* raw = dynamic_cast<IndexedArray32*>(array.get())) {
+      return out.get()->extend(raw->project());
+    }
+    else if (IndexedArrayU32* raw = dynamic_cast<IndexedArrayU32*>(array.get())) {
+      return out.get()->extend(raw->project());
+    }
+    else if (IndexedArray64* raw = dynamic_cast<IndexedArray64*>(array.get())) {
+      return out.get()->extend(raw->project());
+    }
+
+    else if (extend_option<IndexedOptionArray32>(out, array)  ||
+             extend_option<IndexedOptionArray64>(out, array)  ||
+             extend_option<ByteMaskedArray>(out, array)  ||
+             extend_option<BitMaskedArray>(out, array)  ||
+             extend_option<UnmaskedArray>(out, array)) {
+      return out;
+    }
+
+    else if (RecordArray* raw = dynamic_cast<RecordArray*>(array.get())) {
+      // RecordBuilder and TupleBuilder take matching records a whole field
+      // at a time; this fills other builders (into a union) record by record
+      int64_t numfields = raw->numfields();
+      // the record name is the only parameter that a Builder can carry
+      bool isnamed = raw->parameter_isstring("__record__");
+      std::string name = isnamed ? raw->parameter_asstring("__record__")
+                                 : std::string("");
+      for (int64_t i = 0;  i < raw->length();  i++) {
+        if (raw->istuple()) {
+          out = out.get()->begintuple(numfields);
+        }
+        else if (isnamed) {
+          out = out.get()->beginrecord(name.c_str(), true);
+        }
+        else {
+          out = out.get()->beginrecord(nullptr, false);
+        }
+        for (int64_t j = 0;  j < numfields;  j++) {
+          if (raw->istuple()) {
+            out = out.get()->index(j);
+          }
+          else {
+            out = out.get()->field(raw->key(j).c_str(), true);
+          }
+          out = out.get()->extend(
+            raw->field(j).get()->getitem_range_nowrap(i, i + 1));
+        }
+        if (raw->istuple()) {
+          out = out.get()->endtuple();
+        }
+        else {
+          out = out.get()->endrecord();
+        }
+      }
+      return out;
+    }
+
+    else {
+      for (int64_t i = 0;  i < array.get()->length();  i++) {
+        out = out.get()->append(array, i);
+      }
+      return out;
+    }
+  }
+
+  const ContentPtr
+  Builder::aslistoffsetarray64(const ContentPtr& array) {
+    if (ListArray32* raw = dynamic_cast<ListArray32*>(array.get())) {
+      return raw->toListOffsetArray64(false);
+    }
+    else if (ListArrayU32* raw = dynamic_cast<ListArrayU32*>(array.get())) {
+      return raw->toListOffsetArray64(false);
+    }
+    else if (ListArray64* raw = dynamic_cast<ListArray64*>(array.get())) {
+      return raw->toListOffsetArray64(false);
+    }
+    else if (ListOffsetArray32* raw =
+             dynamic_cast<ListOffsetArray32*>(array.get())) {
+      return raw->toListOffsetArray64(false);
+    }
+    else if (ListOffsetArrayU32* raw =
+             dynamic_cast<ListOffsetArrayU32*>(array.get())) {
+      return raw->toListOffsetArray64(false);
+    }
+    else if (dynamic_cast<ListOffsetArray64*>(array.get())) {
+      return array;
+    }
+    else if (RegularArray* raw = dynamic_cast<RegularArray*>(array.get())) {
+      return raw->toListOffsetArray64(false);
+    }
+    else {
+      return ContentPtr(nullptr);
+    }
+  }
 }
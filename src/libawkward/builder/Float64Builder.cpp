@@ -98,6 +98,39 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  Float64Builder::typedinteger(int64_t x, util::dtype dtype) {
+    if (dtype == util::dtype::float64) {
+      buffer_.append((double)x);
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedinteger(x, dtype);
+    return out;
+  }
+
+  const BuilderPtr
+  Float64Builder::typedreal(double x, util::dtype dtype) {
+    if (dtype == util::dtype::float64) {
+      buffer_.append(x);
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedreal(x, dtype);
+    return out;
+  }
+
+  const BuilderPtr
+  Float64Builder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    if (dtype == util::dtype::float64) {
+      buffer_.append(x.real());
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedcomplex(x, dtype);
+    return out;
+  }
+
   const BuilderPtr
   Float64Builder::string(const char* x, int64_t length, const char* encoding) {
     BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
@@ -167,4 +200,19 @@ namespace awkward {
     out.get()->append(array, at);
     return out;
   }
+
+  const BuilderPtr
+  Float64Builder::extend(const ContentPtr& array) {
+    NumpyArray* raw = dynamic_cast<NumpyArray*>(array.get());
+    if (raw != nullptr  &&
+        raw->ndim() == 1  &&
+        raw->dtype() == util::dtype::float64  &&
+        raw->ptr_lib() == kernel::lib::cpu) {
+      NumpyArray contiguous = raw->contiguous();
+      buffer_.extend(reinterpret_cast<const double*>(contiguous.data()),
+                     contiguous.length());
+      return shared_from_this();
+    }
+    return Builder::extend(array);
+  }
 }
@@ -58,7 +58,8 @@ namespace awkward {
       : options_(options)
       , ptr_(ptr)
       , length_(length)
-      , reserved_(reserved) { }
+      , reserved_(reserved)
+      , pagedlength_(0) { }
 
   template <typename T>
   GrowableBuffer<T>::GrowableBuffer(const ArrayBuilderOptions& options)
@@ -70,18 +71,20 @@ namespace awkward {
   template <typename T>
   const std::shared_ptr<T>
   GrowableBuffer<T>::ptr() const {
+    concatenate();
     return ptr_;
   }
 
   template <typename T>
   int64_t
   GrowableBuffer<T>::length() const {
-    return length_;
+    return pagedlength_ + length_;
   }
 
   template <typename T>
   void
   GrowableBuffer<T>::set_length(int64_t newlength) {
+    concatenate();
     if (newlength > reserved_) {
       set_reserved(newlength);
     }
@@ -91,12 +94,13 @@ namespace awkward {
   template <typename T>
   int64_t
   GrowableBuffer<T>::reserved() const {
-    return reserved_;
+    return pagedlength_ + reserved_;
   }
 
   template <typename T>
   void
   GrowableBuffer<T>::set_reserved(int64_t minreserved) {
+    concatenate();
     if (minreserved > reserved_) {
       std::shared_ptr<T> ptr = kernel::malloc<T>(kernel::lib::cpu, minreserved*(int64_t)sizeof(T));
       memcpy(ptr.get(), ptr_.get(), (size_t)length_ * sizeof(T));
@@ -108,6 +112,9 @@ namespace awkward {
   template <typename T>
   void
   GrowableBuffer<T>::clear() {
+    pages_.clear();
+    pagelengths_.clear();
+    pagedlength_ = 0;
     length_ = 0;
     reserved_ = options_.initial();
     ptr_ = kernel::malloc<T>(kernel::lib::cpu, options_.initial()*(int64_t)sizeof(T));
@@ -117,18 +124,106 @@ namespace awkward {
   void
   GrowableBuffer<T>::append(T datum) {
     if (length_ == reserved_) {
-      set_reserved((int64_t)ceil(reserved_ * options_.resize()));
+      grow();
     }
     ptr_.get()[length_] = datum;
     length_++;
   }
 
+  template <typename T>
+  void
+  GrowableBuffer<T>::extend(const T* ptr, int64_t length) {
+    if (options_.page_length() <= 0) {
+      if (length_ + length > reserved_) {
+        int64_t newreserved = (int64_t)ceil(reserved_ * options_.resize());
+        set_reserved(newreserved > length_ + length ? newreserved
+                                                    : length_ + length);
+      }
+      memcpy(ptr_.get() + length_, ptr, (size_t)length * sizeof(T));
+      length_ += length;
+    }
+    else {
+      // fill the current page and as many new pages as needed
+      while (length > 0) {
+        if (length_ == reserved_) {
+          grow();
+        }
+        int64_t chunk = reserved_ - length_;
+        if (chunk > length) {
+          chunk = length;
+        }
+        memcpy(ptr_.get() + length_, ptr, (size_t)chunk * sizeof(T));
+        length_ += chunk;
+        ptr += chunk;
+        length -= chunk;
+      }
+    }
+  }
+
   template <typename T>
   T
   GrowableBuffer<T>::getitem_at_nowrap(int64_t at) const {
+    if (at >= pagedlength_) {
+      return ptr_.get()[at - pagedlength_];
+    }
+    for (size_t i = 0;  i < pages_.size();  i++) {
+      if (at < pagelengths_[i]) {
+        return pages_[i].get()[at];
+      }
+      at -= pagelengths_[i];
+    }
     return ptr_.get()[at];
   }
 
+  template <typename T>
+  void
+  GrowableBuffer<T>::grow() {
+    int64_t page_length = options_.page_length();
+    if (page_length <= 0) {
+      set_reserved((int64_t)ceil(reserved_ * options_.resize()));
+    }
+    else if (reserved_ >= page_length) {
+      // close the full page and start a new one, without copying
+      pages_.push_back(ptr_);
+      pagelengths_.push_back(length_);
+      pagedlength_ += length_;
+      ptr_ = kernel::malloc<T>(kernel::lib::cpu, page_length*(int64_t)sizeof(T));
+      length_ = 0;
+      reserved_ = page_length;
+    }
+    else {
+      // small buffers grow as usual until they reach one page
+      int64_t newreserved = (int64_t)ceil(reserved_ * options_.resize());
+      set_reserved(newreserved < page_length ? newreserved : page_length);
+    }
+  }
+
+  template <typename T>
+  void
+  GrowableBuffer<T>::concatenate() const {
+    if (pages_.empty()) {
+      return;
+    }
+    // keep the unused part of the current page's reservation
+    int64_t reserved = pagedlength_ + reserved_;
+    std::shared_ptr<T> ptr = kernel::malloc<T>(kernel::lib::cpu, reserved*(int64_t)sizeof(T));
+    T* rawptr = ptr.get();
+    int64_t offset = 0;
+    for (size_t i = 0;  i < pages_.size();  i++) {
+      memcpy(rawptr + offset, pages_[i].get(), (size_t)pagelengths_[i] * sizeof(T));
+      offset += pagelengths_[i];
+      // release each page as soon as it is copied (unless shared elsewhere)
+      pages_[i] = nullptr;
+    }
+    memcpy(rawptr + offset, ptr_.get(), (size_t)length_ * sizeof(T));
+    ptr_ = ptr;
+    length_ += pagedlength_;
+    reserved_ = reserved;
+    pages_.clear();
+    pagelengths_.clear();
+    pagedlength_ = 0;
+  }
+
   template class EXPORT_TEMPLATE_INST GrowableBuffer<bool>;
   template class EXPORT_TEMPLATE_INST GrowableBuffer<int8_t>;
   template class EXPORT_TEMPLATE_INST GrowableBuffer<int16_t>;
@@ -140,4 +235,6 @@ namespace awkward {
   template class EXPORT_TEMPLATE_INST GrowableBuffer<uint64_t>;
   template class EXPORT_TEMPLATE_INST GrowableBuffer<float>;
   template class EXPORT_TEMPLATE_INST GrowableBuffer<double>;
+  template class EXPORT_TEMPLATE_INST GrowableBuffer<std::complex<float>>;
+  template class EXPORT_TEMPLATE_INST GrowableBuffer<std::complex<double>>;
 }
@@ -79,6 +79,30 @@ namespace awkward {
     return out;
   }
 
+  template <typename T>
+  const BuilderPtr
+  IndexedBuilder<T>::typedinteger(int64_t x, util::dtype dtype) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedinteger(x, dtype);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  IndexedBuilder<T>::typedreal(double x, util::dtype dtype) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedreal(x, dtype);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  IndexedBuilder<T>::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedcomplex(x, dtype);
+    return out;
+  }
+
   template <typename T>
   const BuilderPtr
   IndexedBuilder<T>::string(const char* x,
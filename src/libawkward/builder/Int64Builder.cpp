@@ -92,6 +92,39 @@ namespace awkward {
     return out;
   }
 
+  const BuilderPtr
+  Int64Builder::typedinteger(int64_t x, util::dtype dtype) {
+    if (dtype == util::dtype::int64) {
+      buffer_.append(x);
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedinteger(x, dtype);
+    return out;
+  }
+
+  const BuilderPtr
+  Int64Builder::typedreal(double x, util::dtype dtype) {
+    if (dtype == util::dtype::int64) {
+      buffer_.append((int64_t)x);
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedreal(x, dtype);
+    return out;
+  }
+
+  const BuilderPtr
+  Int64Builder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    if (dtype == util::dtype::int64) {
+      buffer_.append((int64_t)x.real());
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedcomplex(x, dtype);
+    return out;
+  }
+
   const BuilderPtr
   Int64Builder::string(const char* x, int64_t length, const char* encoding) {
     BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
@@ -161,4 +194,19 @@ namespace awkward {
     out.get()->append(array, at);
     return out;
   }
+
+  const BuilderPtr
+  Int64Builder::extend(const ContentPtr& array) {
+    NumpyArray* raw = dynamic_cast<NumpyArray*>(array.get());
+    if (raw != nullptr  &&
+        raw->ndim() == 1  &&
+        raw->dtype() == util::dtype::int64  &&
+        raw->ptr_lib() == kernel::lib::cpu) {
+      NumpyArray contiguous = raw->contiguous();
+      buffer_.extend(reinterpret_cast<const int64_t*>(contiguous.data()),
+                     contiguous.length());
+      return shared_from_this();
+    }
+    return Builder::extend(array);
+  }
 }
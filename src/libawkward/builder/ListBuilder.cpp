@@ -116,6 +116,45 @@ namespace awkward {
     }
   }
 
+  const BuilderPtr
+  ListBuilder::typedinteger(int64_t x, util::dtype dtype) {
+    if (!begun_) {
+      BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+      out.get()->typedinteger(x, dtype);
+      return out;
+    }
+    else {
+      maybeupdate(content_.get()->typedinteger(x, dtype));
+      return shared_from_this();
+    }
+  }
+
+  const BuilderPtr
+  ListBuilder::typedreal(double x, util::dtype dtype) {
+    if (!begun_) {
+      BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+      out.get()->typedreal(x, dtype);
+      return out;
+    }
+    else {
+      maybeupdate(content_.get()->typedreal(x, dtype));
+      return shared_from_this();
+    }
+  }
+
+  const BuilderPtr
+  ListBuilder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    if (!begun_) {
+      BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+      out.get()->typedcomplex(x, dtype);
+      return out;
+    }
+    else {
+      maybeupdate(content_.get()->typedcomplex(x, dtype));
+      return shared_from_this();
+    }
+  }
+
   const BuilderPtr
   ListBuilder::string(const char* x, int64_t length, const char* encoding) {
     if (!begun_) {
@@ -254,4 +293,32 @@ namespace awkward {
       content_ = tmp;
     }
   }
+
+  const BuilderPtr
+  ListBuilder::extend(const ContentPtr& array) {
+    if (begun_) {
+      maybeupdate(content_.get()->extend(array));
+      return shared_from_this();
+    }
+    ContentPtr list = aslistoffsetarray64(array);
+    if (list.get() == nullptr  ||
+        list.get()->kernels() != kernel::lib::cpu  ||
+        array.get()->parameter_equals("__array__", "\"string\"")  ||
+        array.get()->parameter_equals("__array__", "\"bytestring\"")) {
+      return Builder::extend(array);
+    }
+    ListOffsetArray64* raw = dynamic_cast<ListOffsetArray64*>(list.get());
+    Index64 offsets = raw->offsets();
+    const int64_t* rawoffsets = offsets.data();
+    int64_t length = raw->length();
+    int64_t start = rawoffsets[0];
+    int64_t stop = rawoffsets[length];
+    int64_t shift = offsets_.getitem_at_nowrap(offsets_.length() - 1) - start;
+    for (int64_t i = 1;  i <= length;  i++) {
+      offsets_.append(rawoffsets[i] + shift);
+    }
+    maybeupdate(content_.get()->extend(
+      raw->content().get()->getitem_range_nowrap(start, stop)));
+    return shared_from_this();
+  }
 }
@@ -0,0 +1,402 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/builder/NumberBuilder.cpp", line)
+
+#include "awkward/Identities.h"
+#include "awkward/array/NumpyArray.h"
+#include "awkward/builder/OptionBuilder.h"
+#include "awkward/builder/UnionBuilder.h"
+#include "awkward/builder/BoolBuilder.h"
+#include "awkward/builder/Int64Builder.h"
+#include "awkward/builder/Float64Builder.h"
+
+#include "awkward/builder/NumberBuilder.h"
+
+namespace awkward {
+  namespace {
+    template <typename T>
+    T
+    fromcomplex(std::complex<double> x) {
+      return (T)x.real();
+    }
+
+    template <>
+    std::complex<float>
+    fromcomplex(std::complex<double> x) {
+      return std::complex<float>(x);
+    }
+
+    template <>
+    std::complex<double>
+    fromcomplex(std::complex<double> x) {
+      return x;
+    }
+  }
+
+  template <>
+  util::dtype
+  NumberBuilder<int8_t>::dtype() const {
+    return util::dtype::int8;
+  }
+
+  template <>
+  util::dtype
+  NumberBuilder<int16_t>::dtype() const {
+    return util::dtype::int16;
+  }
+
+  template <>
+  util::dtype
+  NumberBuilder<int32_t>::dtype() const {
+    return util::dtype::int32;
+  }
+
+  template <>
+  util::dtype
+  NumberBuilder<uint8_t>::dtype() const {
+    return util::dtype::uint8;
+  }
+
+  template <>
+  util::dtype
+  NumberBuilder<uint16_t>::dtype() const {
+    return util::dtype::uint16;
+  }
+
+  template <>
+  util::dtype
+  NumberBuilder<uint32_t>::dtype() const {
+    return util::dtype::uint32;
+  }
+
+  template <>
+  util::dtype
+  NumberBuilder<uint64_t>::dtype() const {
+    return util::dtype::uint64;
+  }
+
+  template <>
+  util::dtype
+  NumberBuilder<float>::dtype() const {
+    return util::dtype::float32;
+  }
+
+  template <>
+  util::dtype
+  NumberBuilder<std::complex<float>>::dtype() const {
+    return util::dtype::complex64;
+  }
+
+  template <>
+  util::dtype
+  NumberBuilder<std::complex<double>>::dtype() const {
+    return util::dtype::complex128;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::fromempty(const ArrayBuilderOptions& options) {
+    return std::make_shared<NumberBuilder<T>>(options,
+                                              GrowableBuffer<T>::empty(options));
+  }
+
+  template <typename T>
+  NumberBuilder<T>::NumberBuilder(const ArrayBuilderOptions& options,
+                                  const GrowableBuffer<T>& buffer)
+      : options_(options)
+      , buffer_(buffer) { }
+
+  template <typename T>
+  const GrowableBuffer<T>
+  NumberBuilder<T>::buffer() const {
+    return buffer_;
+  }
+
+  template <typename T>
+  const std::string
+  NumberBuilder<T>::classname() const {
+    return "NumberBuilder";
+  };
+
+  template <typename T>
+  int64_t
+  NumberBuilder<T>::length() const {
+    return buffer_.length();
+  }
+
+  template <typename T>
+  void
+  NumberBuilder<T>::clear() {
+    buffer_.clear();
+  }
+
+  template <typename T>
+  const ContentPtr
+  NumberBuilder<T>::snapshot() const {
+    std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+    std::vector<ssize_t> strides = { (ssize_t)sizeof(T) };
+    return std::make_shared<NumpyArray>(
+             Identities::none(),
+             util::Parameters(),
+             buffer_.ptr(),
+             shape,
+             strides,
+             0,
+             sizeof(T),
+             util::dtype_to_format(dtype()),
+             dtype(),
+             kernel::lib::cpu);
+  }
+
+  template <typename T>
+  bool
+  NumberBuilder<T>::active() const {
+    return false;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::null() {
+    BuilderPtr out = OptionBuilder::fromvalids(options_, shared_from_this());
+    out.get()->null();
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::boolean(bool x) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->boolean(x);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::integer(int64_t x) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->integer(x);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::real(double x) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->real(x);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::typedinteger(int64_t x, util::dtype dtype) {
+    if (dtype == this->dtype()) {
+      buffer_.append((T)x);
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedinteger(x, dtype);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::typedreal(double x, util::dtype dtype) {
+    if (dtype == this->dtype()) {
+      buffer_.append((T)x);
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedreal(x, dtype);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    if (dtype == this->dtype()) {
+      buffer_.append(fromcomplex<T>(x));
+      return shared_from_this();
+    }
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedcomplex(x, dtype);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::string(const char* x, int64_t length, const char* encoding) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->string(x, length, encoding);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::beginlist() {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->beginlist();
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::endlist() {
+    throw std::invalid_argument(
+      std::string("called 'end_list' without 'begin_list' at the same level before it")
+      + FILENAME(__LINE__));
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::begintuple(int64_t numfields) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->begintuple(numfields);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::index(int64_t index) {
+    throw std::invalid_argument(
+      std::string("called 'index' without 'begin_tuple' at the same level before it")
+      + FILENAME(__LINE__));
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::endtuple() {
+    throw std::invalid_argument(
+      std::string("called 'end_tuple' without 'begin_tuple' at the same level before it")
+      + FILENAME(__LINE__));
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::beginrecord(const char* name, bool check) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->beginrecord(name, check);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::field(const char* key, bool check) {
+    throw std::invalid_argument(
+      std::string("called 'field' without 'begin_record' at the same level before it")
+      + FILENAME(__LINE__));
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::endrecord() {
+    throw std::invalid_argument(
+      std::string("called 'end_record' without 'begin_record' at the same level before it")
+      + FILENAME(__LINE__));
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::append(const ContentPtr& array, int64_t at) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->append(array, at);
+    return out;
+  }
+
+  template <typename T>
+  const BuilderPtr
+  NumberBuilder<T>::extend(const ContentPtr& array) {
+    NumpyArray* raw = dynamic_cast<NumpyArray*>(array.get());
+    if (raw != nullptr  &&
+        raw->ndim() == 1  &&
+        raw->dtype() == dtype()  &&
+        raw->ptr_lib() == kernel::lib::cpu) {
+      NumpyArray contiguous = raw->contiguous();
+      buffer_.extend(reinterpret_cast<const T*>(contiguous.data()),
+                     contiguous.length());
+      return shared_from_this();
+    }
+    return Builder::extend(array);
+  }
+
+  const BuilderPtr
+  numberbuilder_fromdtype(const ArrayBuilderOptions& options,
+                          util::dtype dtype) {
+    switch (dtype) {
+    case util::dtype::boolean:
+      return BoolBuilder::fromempty(options);
+    case util::dtype::int8:
+      return Int8Builder::fromempty(options);
+    case util::dtype::int16:
+      return Int16Builder::fromempty(options);
+    case util::dtype::int32:
+      return Int32Builder::fromempty(options);
+    case util::dtype::int64:
+      return Int64Builder::fromempty(options);
+    case util::dtype::uint8:
+      return UInt8Builder::fromempty(options);
+    case util::dtype::uint16:
+      return UInt16Builder::fromempty(options);
+    case util::dtype::uint32:
+      return UInt32Builder::fromempty(options);
+    case util::dtype::uint64:
+      return UInt64Builder::fromempty(options);
+    case util::dtype::float32:
+      return Float32Builder::fromempty(options);
+    case util::dtype::float64:
+      return Float64Builder::fromempty(options);
+    case util::dtype::complex64:
+      return Complex64Builder::fromempty(options);
+    case util::dtype::complex128:
+      return Complex128Builder::fromempty(options);
+    default:
+      throw std::invalid_argument(
+        std::string("ArrayBuilder cannot accumulate numbers of type ")
+        + util::dtype_to_name(dtype) + FILENAME(__LINE__));
+    }
+  }
+
+  bool
+  numberbuilder_holds(const Builder* builder, util::dtype dtype) {
+    switch (dtype) {
+    case util::dtype::boolean:
+      return dynamic_cast<const BoolBuilder*>(builder) != nullptr;
+    case util::dtype::int8:
+      return dynamic_cast<const Int8Builder*>(builder) != nullptr;
+    case util::dtype::int16:
+      return dynamic_cast<const Int16Builder*>(builder) != nullptr;
+    case util::dtype::int32:
+      return dynamic_cast<const Int32Builder*>(builder) != nullptr;
+    case util::dtype::int64:
+      return dynamic_cast<const Int64Builder*>(builder) != nullptr;
+    case util::dtype::uint8:
+      return dynamic_cast<const UInt8Builder*>(builder) != nullptr;
+    case util::dtype::uint16:
+      return dynamic_cast<const UInt16Builder*>(builder) != nullptr;
+    case util::dtype::uint32:
+      return dynamic_cast<const UInt32Builder*>(builder) != nullptr;
+    case util::dtype::uint64:
+      return dynamic_cast<const UInt64Builder*>(builder) != nullptr;
+    case util::dtype::float32:
+      return dynamic_cast<const Float32Builder*>(builder) != nullptr;
+    case util::dtype::float64:
+      return dynamic_cast<const Float64Builder*>(builder) != nullptr;
+    case util::dtype::complex64:
+      return dynamic_cast<const Complex64Builder*>(builder) != nullptr;
+    case util::dtype::complex128:
+      return dynamic_cast<const Complex128Builder*>(builder) != nullptr;
+    default:
+      return false;
+    }
+  }
+
+  template class EXPORT_TEMPLATE_INST NumberBuilder<int8_t>;
+  template class EXPORT_TEMPLATE_INST NumberBuilder<int16_t>;
+  template class EXPORT_TEMPLATE_INST NumberBuilder<int32_t>;
+  template class EXPORT_TEMPLATE_INST NumberBuilder<uint8_t>;
+  template class EXPORT_TEMPLATE_INST NumberBuilder<uint16_t>;
+  template class EXPORT_TEMPLATE_INST NumberBuilder<uint32_t>;
+  template class EXPORT_TEMPLATE_INST NumberBuilder<uint64_t>;
+  template class EXPORT_TEMPLATE_INST NumberBuilder<float>;
+  template class EXPORT_TEMPLATE_INST NumberBuilder<std::complex<float>>;
+  template class EXPORT_TEMPLATE_INST NumberBuilder<std::complex<double>>;
+}
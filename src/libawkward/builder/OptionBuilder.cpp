@@ -7,6 +7,7 @@
 #include "awkward/Identities.h"
 #include "awkward/Index.h"
 #include "awkward/array/IndexedArray.h"
+#include "awkward/array/VirtualArray.h"
 #include "awkward/type/OptionType.h"
 
 #include "awkward/builder/OptionBuilder.h"
@@ -121,6 +122,45 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  OptionBuilder::typedinteger(int64_t x, util::dtype dtype) {
+    if (!content_.get()->active()) {
+      int64_t length = content_.get()->length();
+      maybeupdate(content_.get()->typedinteger(x, dtype));
+      index_.append(length);
+    }
+    else {
+      content_.get()->typedinteger(x, dtype);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  OptionBuilder::typedreal(double x, util::dtype dtype) {
+    if (!content_.get()->active()) {
+      int64_t length = content_.get()->length();
+      maybeupdate(content_.get()->typedreal(x, dtype));
+      index_.append(length);
+    }
+    else {
+      content_.get()->typedreal(x, dtype);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  OptionBuilder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    if (!content_.get()->active()) {
+      int64_t length = content_.get()->length();
+      maybeupdate(content_.get()->typedcomplex(x, dtype));
+      index_.append(length);
+    }
+    else {
+      content_.get()->typedcomplex(x, dtype);
+    }
+    return shared_from_this();
+  }
+
   const BuilderPtr
   OptionBuilder::string(const char* x, int64_t length, const char* encoding) {
     if (!content_.get()->active()) {
@@ -263,4 +303,25 @@ namespace awkward {
       content_ = tmp;
     }
   }
+
+  const BuilderPtr
+  OptionBuilder::extend(const ContentPtr& array) {
+    if (content_.get()->active()) {
+      content_.get()->extend(array);
+    }
+    else if (dynamic_cast<VirtualArray*>(array.get()) != nullptr  ||
+             array.get()->dimension_optiontype()) {
+      // missing values are filled one run at a time with null
+      return Builder::extend(array);
+    }
+    else {
+      int64_t start = content_.get()->length();
+      maybeupdate(content_.get()->extend(array));
+      int64_t stop = content_.get()->length();
+      for (int64_t i = start;  i < stop;  i++) {
+        index_.append(i);
+      }
+    }
+    return shared_from_this();
+  }
 }
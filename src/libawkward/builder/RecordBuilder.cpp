@@ -205,6 +205,69 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  RecordBuilder::typedinteger(int64_t x, util::dtype dtype) {
+    if (!begun_) {
+      BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+      out.get()->typedinteger(x, dtype);
+      return out;
+    }
+    else if (nextindex_ == -1) {
+      throw std::invalid_argument(
+        std::string("called 'integer' immediately after 'begin_record'; "
+                    "needs 'index' or 'end_record'") + FILENAME(__LINE__));
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->typedinteger(x, dtype));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->typedinteger(x, dtype);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  RecordBuilder::typedreal(double x, util::dtype dtype) {
+    if (!begun_) {
+      BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+      out.get()->typedreal(x, dtype);
+      return out;
+    }
+    else if (nextindex_ == -1) {
+      throw std::invalid_argument(
+        std::string("called 'real' immediately after 'begin_record'; "
+                    "needs 'index' or 'end_record'") + FILENAME(__LINE__));
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->typedreal(x, dtype));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->typedreal(x, dtype);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  RecordBuilder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    if (!begun_) {
+      BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+      out.get()->typedcomplex(x, dtype);
+      return out;
+    }
+    else if (nextindex_ == -1) {
+      throw std::invalid_argument(
+        std::string("called 'complex' immediately after 'begin_record'; "
+                    "needs 'index' or 'end_record'") + FILENAME(__LINE__));
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->typedcomplex(x, dtype));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->typedcomplex(x, dtype);
+    }
+    return shared_from_this();
+  }
+
   const BuilderPtr
   RecordBuilder::string(const char* x, int64_t length, const char* encoding) {
     if (!begun_) {
@@ -524,6 +587,76 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  RecordBuilder::extend(const ContentPtr& array) {
+    RecordArray* raw = dynamic_cast<RecordArray*>(array.get());
+    if (begun_  ||  raw == nullptr  ||  raw->istuple()  ||
+        raw->kernels() != kernel::lib::cpu) {
+      return Builder::extend(array);
+    }
+    else if (raw->length() == 0) {
+      return shared_from_this();
+    }
+    // the record name is the only parameter that a Builder can carry
+    bool isnamed = raw->parameter_isstring("__record__");
+    std::string name = isnamed ? raw->parameter_asstring("__record__")
+                               : std::string("");
+    if (length_ == -1) {
+      name_ = name;
+      nameptr_ = isnamed ? name_.c_str() : nullptr;
+      length_ = 0;
+    }
+    else if (isnamed ? (nameptr_ == nullptr  ||  name_ != name)
+                     : (nameptr_ != nullptr)) {
+      return Builder::extend(array);
+    }
+
+    int64_t length = raw->length();
+    std::vector<bool> filled(contents_.size(), false);
+    for (int64_t j = 0;  j < raw->numfields();  j++) {
+      std::string key = raw->key(j);
+      size_t i = 0;
+      while (i < keys_.size()  &&  keys_[i] != key) {
+        i++;
+      }
+      if (i == keys_.size()) {
+        if (length_ == 0) {
+          contents_.push_back(UnknownBuilder::fromempty(options_));
+        }
+        else {
+          contents_.push_back(
+            OptionBuilder::fromnulls(options_,
+                                     length_,
+                                     UnknownBuilder::fromempty(options_)));
+        }
+        keys_.push_back(key);
+        pointers_.push_back(nullptr);
+        filled.push_back(false);
+      }
+      else if (filled[i]) {
+        throw std::invalid_argument(
+          std::string("record field ") + util::quote(keys_[i])
+          + std::string(" filled more than once") + FILENAME(__LINE__));
+      }
+      maybeupdate((int64_t)i, contents_[i].get()->extend(
+        raw->field(j).get()->getitem_range_nowrap(0, length)));
+      filled[i] = true;
+    }
+    for (size_t i = 0;  i < contents_.size();  i++) {
+      // fields that this array does not have are None
+      while (contents_[i].get()->length() < length_ + length) {
+        maybeupdate((int64_t)i, contents_[i].get()->null());
+      }
+      if (contents_[i].get()->length() != length_ + length) {
+        throw std::invalid_argument(
+          std::string("record field ") + util::quote(keys_[i])
+          + std::string(" filled more than once") + FILENAME(__LINE__));
+      }
+    }
+    length_ += length;
+    return shared_from_this();
+  }
+
   void
   RecordBuilder::maybeupdate(int64_t i, const BuilderPtr& tmp) {
     if (tmp.get() != contents_[(size_t)i].get()) {
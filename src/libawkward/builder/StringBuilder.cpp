@@ -128,6 +128,27 @@ namespace awkward {
     return out;
   }
 
+  const BuilderPtr
+  StringBuilder::typedinteger(int64_t x, util::dtype dtype) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedinteger(x, dtype);
+    return out;
+  }
+
+  const BuilderPtr
+  StringBuilder::typedreal(double x, util::dtype dtype) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedreal(x, dtype);
+    return out;
+  }
+
+  const BuilderPtr
+  StringBuilder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+    out.get()->typedcomplex(x, dtype);
+    return out;
+  }
+
   const BuilderPtr
   StringBuilder::string(const char* x, int64_t length, const char* encoding) {
     if (length < 0) {
@@ -206,4 +227,38 @@ namespace awkward {
     out.get()->append(array, at);
     return out;
   }
+
+  const BuilderPtr
+  StringBuilder::extend(const ContentPtr& array) {
+    bool matches;
+    if (encoding_ == nullptr) {
+      matches = array.get()->parameter_equals("__array__", "\"bytestring\"");
+    }
+    else {
+      matches = (std::string(encoding_) == std::string("utf-8")  &&
+                 array.get()->parameter_equals("__array__", "\"string\""));
+    }
+    ContentPtr list = matches ? aslistoffsetarray64(array) : ContentPtr(nullptr);
+    if (list.get() == nullptr  ||  list.get()->kernels() != kernel::lib::cpu) {
+      return Builder::extend(array);
+    }
+    ListOffsetArray64* raw = dynamic_cast<ListOffsetArray64*>(list.get());
+    NumpyArray* chars = dynamic_cast<NumpyArray*>(raw->content().get());
+    if (chars == nullptr  ||  chars->itemsize() != 1) {
+      return Builder::extend(array);
+    }
+    Index64 offsets = raw->offsets();
+    const int64_t* rawoffsets = offsets.data();
+    int64_t length = raw->length();
+    int64_t start = rawoffsets[0];
+    int64_t stop = rawoffsets[length];
+    int64_t shift = content_.length() - start;
+    for (int64_t i = 1;  i <= length;  i++) {
+      offsets_.append(rawoffsets[i] + shift);
+    }
+    NumpyArray contiguous = chars->contiguous();
+    content_.extend(reinterpret_cast<const uint8_t*>(contiguous.data()) + start,
+                    stop - start);
+    return shared_from_this();
+  }
 }
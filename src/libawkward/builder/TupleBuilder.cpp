@@ -169,6 +169,69 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  TupleBuilder::typedinteger(int64_t x, util::dtype dtype) {
+    if (!begun_) {
+      BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+      out.get()->typedinteger(x, dtype);
+      return out;
+    }
+    else if (nextindex_ == -1) {
+      throw std::invalid_argument(
+        std::string("called 'integer' immediately after 'begin_tuple'; "
+                    "needs 'index' or 'end_tuple'") + FILENAME(__LINE__));
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->typedinteger(x, dtype));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->typedinteger(x, dtype);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  TupleBuilder::typedreal(double x, util::dtype dtype) {
+    if (!begun_) {
+      BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+      out.get()->typedreal(x, dtype);
+      return out;
+    }
+    else if (nextindex_ == -1) {
+      throw std::invalid_argument(
+        std::string("called 'real' immediately after 'begin_tuple'; "
+                    "needs 'index' or 'end_tuple'") + FILENAME(__LINE__));
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->typedreal(x, dtype));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->typedreal(x, dtype);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  TupleBuilder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    if (!begun_) {
+      BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
+      out.get()->typedcomplex(x, dtype);
+      return out;
+    }
+    else if (nextindex_ == -1) {
+      throw std::invalid_argument(
+        std::string("called 'complex' immediately after 'begin_tuple'; "
+                    "needs 'index' or 'end_tuple'") + FILENAME(__LINE__));
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->typedcomplex(x, dtype));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->typedcomplex(x, dtype);
+    }
+    return shared_from_this();
+  }
+
   const BuilderPtr
   TupleBuilder::string(const char* x, int64_t length, const char* encoding) {
     if (!begun_) {
@@ -396,6 +459,41 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  TupleBuilder::extend(const ContentPtr& array) {
+    RecordArray* raw = dynamic_cast<RecordArray*>(array.get());
+    if (begun_  ||  raw == nullptr  ||  !raw->istuple()  ||
+        raw->kernels() != kernel::lib::cpu) {
+      return Builder::extend(array);
+    }
+    else if (raw->length() == 0) {
+      return shared_from_this();
+    }
+    int64_t numfields = raw->numfields();
+    if (length_ == -1) {
+      for (int64_t i = 0;  i < numfields;  i++) {
+        contents_.push_back(BuilderPtr(UnknownBuilder::fromempty(options_)));
+      }
+      length_ = 0;
+    }
+    else if (numfields != (int64_t)contents_.size()) {
+      return Builder::extend(array);
+    }
+
+    int64_t length = raw->length();
+    for (int64_t i = 0;  i < numfields;  i++) {
+      maybeupdate(i, contents_[(size_t)i].get()->extend(
+        raw->field(i).get()->getitem_range_nowrap(0, length)));
+      if (contents_[(size_t)i].get()->length() != length_ + length) {
+        throw std::invalid_argument(
+          std::string("tuple index ") + std::to_string(i)
+          + std::string(" filled more than once") + FILENAME(__LINE__));
+      }
+    }
+    length_ += length;
+    return shared_from_this();
+  }
+
   void
   TupleBuilder::maybeupdate(int64_t i, const BuilderPtr& tmp) {
     if (tmp.get() != contents_[(size_t)i].get()) {
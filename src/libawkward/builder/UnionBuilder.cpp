@@ -11,6 +11,7 @@
 #include "awkward/builder/BoolBuilder.h"
 #include "awkward/builder/Int64Builder.h"
 #include "awkward/builder/Float64Builder.h"
+#include "awkward/builder/NumberBuilder.h"
 #include "awkward/builder/StringBuilder.h"
 #include "awkward/builder/ListBuilder.h"
 #include "awkward/builder/TupleBuilder.h"
@@ -194,6 +195,87 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  UnionBuilder::typedinteger(int64_t x, util::dtype dtype) {
+    if (current_ == -1) {
+      BuilderPtr tofill(nullptr);
+      int8_t i = 0;
+      for (auto content : contents_) {
+        if (numberbuilder_holds(content.get(), dtype)) {
+          tofill = content;
+          break;
+        }
+        i++;
+      }
+      if (tofill.get() == nullptr) {
+        tofill = numberbuilder_fromdtype(options_, dtype);
+        contents_.push_back(tofill);
+      }
+      int64_t length = tofill.get()->length();
+      tofill.get()->typedinteger(x, dtype);
+      tags_.append(i);
+      index_.append(length);
+    }
+    else {
+      contents_[(size_t)current_].get()->typedinteger(x, dtype);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  UnionBuilder::typedreal(double x, util::dtype dtype) {
+    if (current_ == -1) {
+      BuilderPtr tofill(nullptr);
+      int8_t i = 0;
+      for (auto content : contents_) {
+        if (numberbuilder_holds(content.get(), dtype)) {
+          tofill = content;
+          break;
+        }
+        i++;
+      }
+      if (tofill.get() == nullptr) {
+        tofill = numberbuilder_fromdtype(options_, dtype);
+        contents_.push_back(tofill);
+      }
+      int64_t length = tofill.get()->length();
+      tofill.get()->typedreal(x, dtype);
+      tags_.append(i);
+      index_.append(length);
+    }
+    else {
+      contents_[(size_t)current_].get()->typedreal(x, dtype);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  UnionBuilder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    if (current_ == -1) {
+      BuilderPtr tofill(nullptr);
+      int8_t i = 0;
+      for (auto content : contents_) {
+        if (numberbuilder_holds(content.get(), dtype)) {
+          tofill = content;
+          break;
+        }
+        i++;
+      }
+      if (tofill.get() == nullptr) {
+        tofill = numberbuilder_fromdtype(options_, dtype);
+        contents_.push_back(tofill);
+      }
+      int64_t length = tofill.get()->length();
+      tofill.get()->typedcomplex(x, dtype);
+      tags_.append(i);
+      index_.append(length);
+    }
+    else {
+      contents_[(size_t)current_].get()->typedcomplex(x, dtype);
+    }
+    return shared_from_this();
+  }
+
   const BuilderPtr
   UnionBuilder::string(const char* x, int64_t length, const char* encoding) {
     if (current_ == -1) {
@@ -201,7 +283,9 @@ namespace awkward {
       int8_t i = 0;
       for (auto content : contents_) {
         if (StringBuilder* raw = dynamic_cast<StringBuilder*>(content.get())) {
-          if (raw->encoding() == encoding) {
+          if (raw->encoding() == encoding  ||
+              (raw->encoding() != nullptr  &&  encoding != nullptr  &&
+               std::string(raw->encoding()) == std::string(encoding))) {
             tofill = content;
             break;
           }
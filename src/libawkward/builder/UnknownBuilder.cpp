@@ -8,11 +8,14 @@
 #include "awkward/Index.h"
 #include "awkward/array/EmptyArray.h"
 #include "awkward/array/IndexedArray.h"
+#include "awkward/array/NumpyArray.h"
+#include "awkward/array/RecordArray.h"
 #include "awkward/type/UnknownType.h"
 #include "awkward/builder/OptionBuilder.h"
 #include "awkward/builder/BoolBuilder.h"
 #include "awkward/builder/Int64Builder.h"
 #include "awkward/builder/Float64Builder.h"
+#include "awkward/builder/NumberBuilder.h"
 #include "awkward/builder/StringBuilder.h"
 #include "awkward/builder/ListBuilder.h"
 #include "awkward/builder/TupleBuilder.h"
@@ -110,6 +113,36 @@ namespace awkward {
     return out;
   }
 
+  const BuilderPtr
+  UnknownBuilder::typedinteger(int64_t x, util::dtype dtype) {
+    BuilderPtr out = numberbuilder_fromdtype(options_, dtype);
+    if (nullcount_ != 0) {
+      out = OptionBuilder::fromnulls(options_, nullcount_, out);
+    }
+    out.get()->typedinteger(x, dtype);
+    return out;
+  }
+
+  const BuilderPtr
+  UnknownBuilder::typedreal(double x, util::dtype dtype) {
+    BuilderPtr out = numberbuilder_fromdtype(options_, dtype);
+    if (nullcount_ != 0) {
+      out = OptionBuilder::fromnulls(options_, nullcount_, out);
+    }
+    out.get()->typedreal(x, dtype);
+    return out;
+  }
+
+  const BuilderPtr
+  UnknownBuilder::typedcomplex(std::complex<double> x, util::dtype dtype) {
+    BuilderPtr out = numberbuilder_fromdtype(options_, dtype);
+    if (nullcount_ != 0) {
+      out = OptionBuilder::fromnulls(options_, nullcount_, out);
+    }
+    out.get()->typedcomplex(x, dtype);
+    return out;
+  }
+
   const BuilderPtr
   UnknownBuilder::string(const char* x, int64_t length, const char* encoding) {
     BuilderPtr out = StringBuilder::fromempty(options_, encoding);
@@ -193,4 +226,40 @@ namespace awkward {
     out.get()->append(array, at);
     return out;
   }
+
+  const BuilderPtr
+  UnknownBuilder::extend(const ContentPtr& array) {
+    if (array.get()->length() == 0) {
+      return shared_from_this();
+    }
+    BuilderPtr out(nullptr);
+    NumpyArray* raw = dynamic_cast<NumpyArray*>(array.get());
+    if (raw != nullptr  &&  raw->ndim() == 1) {
+      out = numberbuilder_fromdtype(options_, raw->dtype());
+    }
+    else if (array.get()->parameter_equals("__array__", "\"string\"")) {
+      out = StringBuilder::fromempty(options_, "utf-8");
+    }
+    else if (array.get()->parameter_equals("__array__", "\"bytestring\"")) {
+      out = StringBuilder::fromempty(options_, nullptr);
+    }
+    else if (aslistoffsetarray64(array).get() != nullptr) {
+      out = ListBuilder::fromempty(options_);
+    }
+    else if (RecordArray* raw = dynamic_cast<RecordArray*>(array.get())) {
+      if (raw->istuple()) {
+        out = TupleBuilder::fromempty(options_);
+      }
+      else {
+        out = RecordBuilder::fromempty(options_);
+      }
+    }
+    else {
+      return Builder::extend(array);
+    }
+    if (nullcount_ != 0) {
+      out = OptionBuilder::fromnulls(options_, nullcount_, out);
+    }
+    return out.get()->extend(array);
+  }
 }
@@ -12,7 +12,20 @@
 #include "rapidjson/error/en.h"
 
 #include "awkward/builder/ArrayBuilder.h"
+#include "awkward/builder/GrowableBuffer.h"
 #include "awkward/Content.h"
+#include "awkward/Identities.h"
+#include "awkward/array/BitMaskedArray.h"
+#include "awkward/array/ByteMaskedArray.h"
+#include "awkward/array/EmptyArray.h"
+#include "awkward/array/IndexedArray.h"
+#include "awkward/array/ListArray.h"
+#include "awkward/array/ListOffsetArray.h"
+#include "awkward/array/NumpyArray.h"
+#include "awkward/array/RecordArray.h"
+#include "awkward/array/RegularArray.h"
+#include "awkward/array/UnmaskedArray.h"
+#include "awkward/array/VirtualArray.h"
 
 #include "awkward/io/json.h"
 
@@ -533,7 +546,8 @@ namespace awkward {
             const char* nan_string,
             const char* infinity_string,
             const char* minus_infinity_string)
-        : builder_(options)
+        : options_(options)
+        , builder_(options)
         , moved_(false)
         , nan_string_(nan_string)
         , infinity_string_(infinity_string)
@@ -651,7 +665,12 @@ namespace awkward {
       return builder_.snapshot();
     }
 
+    void reset_builder() {
+      builder_ = ArrayBuilder(options_);
+    }
+
   private:
+    const ArrayBuilderOptions options_;
     ArrayBuilder builder_;
     bool moved_;
     const char* nan_string_;
@@ -659,39 +678,1126 @@ namespace awkward {
     const char* minus_infinity_string_;
   };
 
-  template<typename HANDLER, typename STREAM>
-  const ContentPtr
-  do_parse(HANDLER& handler, rj::Reader& reader, STREAM& stream) {
-    int64_t number = 0;
-    while (stream.Peek() != 0) {
-      handler.reset_moved();
-      bool fully_parsed = reader.Parse<rj::kParseStopWhenDoneFlag>(stream, handler);
-      if (handler.moved()) {
-        if (!fully_parsed) {
-          if (stream.Peek() == 0) {
+  ////////// reading from JSON with a known Form
+
+  /// @brief Receives the values for one node of a Form and accumulates them
+  /// in typed GrowableBuffers.
+  ///
+  /// Each method raises an error if the JSON value does not match the node;
+  /// the default implementations do exactly that.
+  class FormFiller {
+  public:
+    FormFiller(const ArrayBuilderOptions& options, const std::string& name)
+        : options_(options)
+        , name_(name) { }
+
+    virtual ~FormFiller() = default;
+
+    virtual int64_t
+    length() const = 0;
+
+    virtual const ContentPtr
+    snapshot() const = 0;
+
+    virtual void
+    null() {
+      mismatch("null");
+    }
+
+    virtual void
+    boolean(bool x) {
+      mismatch("boolean");
+    }
+
+    virtual void
+    integer(int64_t x) {
+      mismatch("integer");
+    }
+
+    virtual void
+    uinteger(uint64_t x) {
+      if (x > (uint64_t)std::numeric_limits<int64_t>::max()) {
+        mismatch("integer");
+      }
+      integer((int64_t)x);
+    }
+
+    virtual void
+    real(double x) {
+      mismatch("real number");
+    }
+
+    virtual void
+    string(const char* x, int64_t length) {
+      mismatch("string");
+    }
+
+    /// @brief Starts a JSON array and returns the filler that receives its
+    /// items (through #item) and its end (through #endlist).
+    virtual FormFiller*
+    beginlist() {
+      mismatch("array");
+      return nullptr;
+    }
+
+    virtual FormFiller*
+    item(int64_t at) {
+      return nullptr;
+    }
+
+    virtual void
+    endlist(int64_t numitems) { }
+
+    /// @brief Starts a JSON object and returns the filler that receives its
+    /// fields (through #field) and its end (through #endrecord).
+    virtual FormFiller*
+    beginrecord() {
+      mismatch("object");
+      return nullptr;
+    }
+
+    /// @brief Returns the filler for the value of `key` or `nullptr` if
+    /// the value should be skipped.
+    virtual FormFiller*
+    field(const char* key) {
+      return nullptr;
+    }
+
+    virtual void
+    endrecord() { }
+
+  protected:
+    void
+    mismatch(const std::string& found) const {
+      throw std::invalid_argument(
+        std::string("JSON ") + found + std::string(" does not match form: ")
+        + std::string("expected ") + name_
+        + FILENAME(__LINE__));
+    }
+
+    const ArrayBuilderOptions options_;
+    const std::string name_;
+  };
+
+  using FormFillerPtr = std::shared_ptr<FormFiller>;
+
+  FormFillerPtr
+  form_filler(const FormPtr& form,
+              const ArrayBuilderOptions& options,
+              const char* nan_string,
+              const char* infinity_string,
+              const char* minus_infinity_string);
+
+  class BooleanFiller: public FormFiller {
+  public:
+    BooleanFiller(const ArrayBuilderOptions& options,
+                  const util::Parameters& parameters)
+        : FormFiller(options, "boolean")
+        , parameters_(parameters)
+        , buffer_(options) { }
+
+    int64_t
+    length() const override {
+      return buffer_.length();
+    }
+
+    const ContentPtr
+    snapshot() const override {
+      std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(bool) };
+      return std::make_shared<NumpyArray>(Identities::none(),
+                                          parameters_,
+                                          buffer_.ptr(),
+                                          shape,
+                                          strides,
+                                          0,
+                                          sizeof(bool),
+                                          "?",
+                                          util::dtype::boolean,
+                                          kernel::lib::cpu);
+    }
+
+    void
+    boolean(bool x) override {
+      buffer_.append(x);
+    }
+
+  private:
+    const util::Parameters parameters_;
+    GrowableBuffer<bool> buffer_;
+  };
+
+  template <typename T>
+  class NumberFiller: public FormFiller {
+  public:
+    NumberFiller(const ArrayBuilderOptions& options,
+                 const util::Parameters& parameters,
+                 util::dtype dtype,
+                 const char* nan_string,
+                 const char* infinity_string,
+                 const char* minus_infinity_string)
+        : FormFiller(options, util::dtype_to_name(dtype))
+        , parameters_(parameters)
+        , dtype_(dtype)
+        , nan_string_(nan_string)
+        , infinity_string_(infinity_string)
+        , minus_infinity_string_(minus_infinity_string)
+        , buffer_(options) { }
+
+    int64_t
+    length() const override {
+      return buffer_.length();
+    }
+
+    const ContentPtr
+    snapshot() const override {
+      std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(T) };
+      return std::make_shared<NumpyArray>(Identities::none(),
+                                          parameters_,
+                                          buffer_.ptr(),
+                                          shape,
+                                          strides,
+                                          0,
+                                          sizeof(T),
+                                          util::dtype_to_format(dtype_),
+                                          dtype_,
+                                          kernel::lib::cpu);
+    }
+
+    void
+    integer(int64_t x) override {
+      if (std::is_integral<T>::value  &&
+          (x < (int64_t)std::numeric_limits<T>::min()  ||
+           (x > 0  &&  (uint64_t)x > (uint64_t)std::numeric_limits<T>::max()))) {
+        out_of_range(std::to_string(x));
+      }
+      buffer_.append((T)x);
+    }
+
+    void
+    uinteger(uint64_t x) override {
+      if (std::is_integral<T>::value  &&
+          x > (uint64_t)std::numeric_limits<T>::max()) {
+        out_of_range(std::to_string(x));
+      }
+      buffer_.append((T)x);
+    }
+
+    void
+    real(double x) override {
+      if (std::is_integral<T>::value) {
+        mismatch("real number");
+      }
+      buffer_.append((T)x);
+    }
+
+    void
+    string(const char* x, int64_t length) override {
+      if (!std::is_integral<T>::value) {
+        if (nan_string_ != nullptr  &&  strcmp(x, nan_string_) == 0) {
+          buffer_.append((T)std::numeric_limits<double>::quiet_NaN());
+          return;
+        }
+        else if (infinity_string_ != nullptr  &&
+                 strcmp(x, infinity_string_) == 0) {
+          buffer_.append((T)std::numeric_limits<double>::infinity());
+          return;
+        }
+        else if (minus_infinity_string_ != nullptr  &&
+                 strcmp(x, minus_infinity_string_) == 0) {
+          buffer_.append((T)-std::numeric_limits<double>::infinity());
+          return;
+        }
+      }
+      mismatch("string");
+    }
+
+  private:
+    void
+    out_of_range(const std::string& x) const {
+      throw std::invalid_argument(
+        std::string("JSON integer ") + x + std::string(" is out of range for ")
+        + name_ + FILENAME(__LINE__));
+    }
+
+    const util::Parameters parameters_;
+    const util::dtype dtype_;
+    const char* nan_string_;
+    const char* infinity_string_;
+    const char* minus_infinity_string_;
+    GrowableBuffer<T> buffer_;
+  };
+
+  class StringFiller: public FormFiller {
+  public:
+    StringFiller(const ArrayBuilderOptions& options,
+                 const util::Parameters& parameters,
+                 const util::Parameters& char_parameters)
+        : FormFiller(options, "string")
+        , parameters_(parameters)
+        , char_parameters_(char_parameters)
+        , offsets_(options)
+        , content_(options) {
+      offsets_.append(0);
+    }
+
+    int64_t
+    length() const override {
+      return offsets_.length() - 1;
+    }
+
+    const ContentPtr
+    snapshot() const override {
+      Index64 offsets(offsets_.ptr(), 0, offsets_.length(), kernel::lib::cpu);
+      std::vector<ssize_t> shape = { (ssize_t)content_.length() };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(uint8_t) };
+      ContentPtr content = std::make_shared<NumpyArray>(Identities::none(),
+                                                        char_parameters_,
+                                                        content_.ptr(),
+                                                        shape,
+                                                        strides,
+                                                        0,
+                                                        sizeof(uint8_t),
+                                                        "B",
+                                                        util::dtype::uint8,
+                                                        kernel::lib::cpu);
+      return std::make_shared<ListOffsetArray64>(Identities::none(),
+                                                 parameters_,
+                                                 offsets,
+                                                 content);
+    }
+
+    void
+    string(const char* x, int64_t length) override {
+      for (int64_t i = 0;  i < length;  i++) {
+        content_.append((uint8_t)x[i]);
+      }
+      offsets_.append(content_.length());
+    }
+
+  private:
+    const util::Parameters parameters_;
+    const util::Parameters char_parameters_;
+    GrowableBuffer<int64_t> offsets_;
+    GrowableBuffer<uint8_t> content_;
+  };
+
+  class ListFiller: public FormFiller {
+  public:
+    ListFiller(const ArrayBuilderOptions& options,
+               const util::Parameters& parameters,
+               const FormFillerPtr& content)
+        : FormFiller(options, "array")
+        , parameters_(parameters)
+        , offsets_(options)
+        , content_(content) {
+      offsets_.append(0);
+    }
+
+    int64_t
+    length() const override {
+      return offsets_.length() - 1;
+    }
+
+    const ContentPtr
+    snapshot() const override {
+      Index64 offsets(offsets_.ptr(), 0, offsets_.length(), kernel::lib::cpu);
+      return std::make_shared<ListOffsetArray64>(Identities::none(),
+                                                 parameters_,
+                                                 offsets,
+                                                 content_.get()->snapshot());
+    }
+
+    const FormFillerPtr
+    content() const {
+      return content_;
+    }
+
+    FormFiller*
+    beginlist() override {
+      return this;
+    }
+
+    FormFiller*
+    item(int64_t at) override {
+      return content_.get();
+    }
+
+    void
+    endlist(int64_t numitems) override {
+      offsets_.append(content_.get()->length());
+    }
+
+  private:
+    const util::Parameters parameters_;
+    GrowableBuffer<int64_t> offsets_;
+    const FormFillerPtr content_;
+  };
+
+  class RegularFiller: public FormFiller {
+  public:
+    RegularFiller(const ArrayBuilderOptions& options,
+                  const util::Parameters& parameters,
+                  const FormFillerPtr& content,
+                  int64_t size)
+        : FormFiller(options, std::string("array of length ")
+                              + std::to_string(size))
+        , parameters_(parameters)
+        , content_(content)
+        , size_(size)
+        , length_(0) { }
+
+    int64_t
+    length() const override {
+      return length_;
+    }
+
+    const ContentPtr
+    snapshot() const override {
+      return std::make_shared<RegularArray>(Identities::none(),
+                                            parameters_,
+                                            content_.get()->snapshot(),
+                                            size_,
+                                            length_);
+    }
+
+    FormFiller*
+    beginlist() override {
+      return this;
+    }
+
+    FormFiller*
+    item(int64_t at) override {
+      if (at >= size_) {
+        mismatch("array with more items");
+      }
+      return content_.get();
+    }
+
+    void
+    endlist(int64_t numitems) override {
+      if (numitems != size_) {
+        mismatch(std::string("array of length ") + std::to_string(numitems));
+      }
+      length_++;
+    }
+
+  private:
+    const util::Parameters parameters_;
+    const FormFillerPtr content_;
+    const int64_t size_;
+    int64_t length_;
+  };
+
+  class RecordFiller: public FormFiller {
+  public:
+    RecordFiller(const ArrayBuilderOptions& options,
+                 const util::Parameters& parameters,
+                 const std::vector<FormFillerPtr>& contents,
+                 const std::vector<bool>& optional,
+                 const util::RecordLookupPtr& recordlookup)
+        : FormFiller(options, recordlookup.get() == nullptr ? "tuple (array)"
+                                                            : "record (object)")
+        , parameters_(parameters)
+        , contents_(contents)
+        , optional_(optional)
+        , recordlookup_(recordlookup)
+        , length_(0) { }
+
+    int64_t
+    length() const override {
+      return length_;
+    }
+
+    const ContentPtr
+    snapshot() const override {
+      ContentPtrVec contents;
+      for (auto content : contents_) {
+        contents.push_back(content.get()->snapshot());
+      }
+      return std::make_shared<RecordArray>(Identities::none(),
+                                           parameters_,
+                                           contents,
+                                           recordlookup_,
+                                           length_);
+    }
+
+    FormFiller*
+    beginlist() override {
+      if (recordlookup_.get() != nullptr) {
+        mismatch("array");
+      }
+      return this;
+    }
+
+    FormFiller*
+    item(int64_t at) override {
+      if (at >= (int64_t)contents_.size()) {
+        mismatch("array with more items");
+      }
+      return contents_[(size_t)at].get();
+    }
+
+    void
+    endlist(int64_t numitems) override {
+      if (numitems != (int64_t)contents_.size()) {
+        mismatch(std::string("array of length ") + std::to_string(numitems));
+      }
+      length_++;
+    }
+
+    FormFiller*
+    beginrecord() override {
+      if (recordlookup_.get() == nullptr) {
+        mismatch("object");
+      }
+      return this;
+    }
+
+    FormFiller*
+    field(const char* key) override {
+      for (size_t i = 0;  i < contents_.size();  i++) {
+        if (recordlookup_.get()->at(i) == key) {
+          if (contents_[i].get()->length() > length_) {
             throw std::invalid_argument(
-                std::string("incomplete JSON object at the end of the stream")
-                + FILENAME(__LINE__));
+              std::string("JSON object has more than one field ")
+              + util::quote(key) + FILENAME(__LINE__));
           }
-          else {
+          return contents_[i].get();
+        }
+      }
+      return nullptr;
+    }
+
+    void
+    endrecord() override {
+      for (size_t i = 0;  i < contents_.size();  i++) {
+        if (contents_[i].get()->length() == length_) {
+          if (!optional_[i]) {
             throw std::invalid_argument(
-              std::string("JSON File error at char ")
-              + std::to_string(stream.Tell()) + std::string(": \'")
-              + stream.Peek() + std::string("\'")
+              std::string("JSON object is missing field ")
+              + util::quote(recordlookup_.get()->at(i))
+              + std::string(", which is not an option type in the form")
               + FILENAME(__LINE__));
           }
-        }
-        else {
-          number++;
+          contents_[i].get()->null();
         }
       }
-      else if (stream.Peek() != 0) {
+      length_++;
+    }
+
+  private:
+    const util::Parameters parameters_;
+    const std::vector<FormFillerPtr> contents_;
+    const std::vector<bool> optional_;
+    const util::RecordLookupPtr recordlookup_;
+    int64_t length_;
+  };
+
+  class OptionFiller: public FormFiller {
+  public:
+    OptionFiller(const ArrayBuilderOptions& options,
+                 const util::Parameters& parameters,
+                 const FormFillerPtr& content)
+        : FormFiller(options, "option")
+        , parameters_(parameters)
+        , index_(options)
+        , content_(content) { }
+
+    int64_t
+    length() const override {
+      return index_.length();
+    }
+
+    const ContentPtr
+    snapshot() const override {
+      Index64 index(index_.ptr(), 0, index_.length(), kernel::lib::cpu);
+      return std::make_shared<IndexedOptionArray64>(Identities::none(),
+                                                    parameters_,
+                                                    index,
+                                                    content_.get()->snapshot());
+    }
+
+    void
+    null() override {
+      index_.append(-1);
+    }
+
+    void
+    boolean(bool x) override {
+      valid().boolean(x);
+    }
+
+    void
+    integer(int64_t x) override {
+      valid().integer(x);
+    }
+
+    void
+    uinteger(uint64_t x) override {
+      valid().uinteger(x);
+    }
+
+    void
+    real(double x) override {
+      valid().real(x);
+    }
+
+    void
+    string(const char* x, int64_t length) override {
+      valid().string(x, length);
+    }
+
+    FormFiller*
+    beginlist() override {
+      return valid().beginlist();
+    }
+
+    FormFiller*
+    beginrecord() override {
+      return valid().beginrecord();
+    }
+
+  private:
+    FormFiller&
+    valid() {
+      index_.append(content_.get()->length());
+      return *content_.get();
+    }
+
+    const util::Parameters parameters_;
+    GrowableBuffer<int64_t> index_;
+    const FormFillerPtr content_;
+  };
+
+  class EmptyFiller: public FormFiller {
+  public:
+    EmptyFiller(const ArrayBuilderOptions& options,
+                const util::Parameters& parameters)
+        : FormFiller(options, "nothing (empty array)")
+        , parameters_(parameters) { }
+
+    int64_t
+    length() const override {
+      return 0;
+    }
+
+    const ContentPtr
+    snapshot() const override {
+      return std::make_shared<EmptyArray>(Identities::none(), parameters_);
+    }
+
+  private:
+    const util::Parameters parameters_;
+  };
+
+  bool
+  form_isoption(const FormPtr& form) {
+    if (VirtualForm* raw = dynamic_cast<VirtualForm*>(form.get())) {
+      return raw->has_form()  &&  form_isoption(raw->form());
+    }
+    else {
+      return dynamic_cast<IndexedOptionForm*>(form.get())  ||
+             dynamic_cast<ByteMaskedForm*>(form.get())  ||
+             dynamic_cast<BitMaskedForm*>(form.get())  ||
+             dynamic_cast<UnmaskedForm*>(form.get());
+    }
+  }
+
+  FormFillerPtr
+  form_number_filler(const ArrayBuilderOptions& options,
+                     const util::Parameters& parameters,
+                     util::dtype dtype,
+                     const char* nan_string,
+                     const char* infinity_string,
+                     const char* minus_infinity_string) {
+    switch (dtype) {
+      case util::dtype::boolean:
+        return std::make_shared<BooleanFiller>(options, parameters);
+  #define NUMBER_FILLER(TYPE)                                         \
+        return std::make_shared<NumberFiller<TYPE>>(options,          \
+                                                    parameters,       \
+                                                    dtype,            \
+                                                    nan_string,       \
+                                                    infinity_string,  \
+                                                    minus_infinity_string)
+      case util::dtype::int8:
+        NUMBER_FILLER(int8_t);
+      case util::dtype::int16:
+        NUMBER_FILLER(int16_t);
+      case util::dtype::int32:
+        NUMBER_FILLER(int32_t);
+      case util::dtype::int64:
+        NUMBER_FILLER(int64_t);
+      case util::dtype::uint8:
+        NUMBER_FILLER(uint8_t);
+      case util::dtype::uint16:
+        NUMBER_FILLER(uint16_t);
+      case util::dtype::uint32:
+        NUMBER_FILLER(uint32_t);
+      case util::dtype::uint64:
+        NUMBER_FILLER(uint64_t);
+      case util::dtype::float32:
+        NUMBER_FILLER(float);
+      case util::dtype::float64:
+        NUMBER_FILLER(double);
+  #undef NUMBER_FILLER
+      default:
         throw std::invalid_argument(
-          std::string("JSON File error at char ")
-          + std::to_string(stream.Tell()) + std::string(": \'")
-          + stream.Peek() + std::string("\'")
+          std::string("cannot read JSON numbers as ")
+          + util::dtype_to_name(dtype) + FILENAME(__LINE__));
+    }
+  }
+
+  FormFillerPtr
+  form_list_filler(const FormPtr& content,
+                   const util::Parameters& parameters,
+                   const ArrayBuilderOptions& options,
+                   const char* nan_string,
+                   const char* infinity_string,
+                   const char* minus_infinity_string) {
+    if (util::parameter_equals(parameters, "__array__", "\"string\"")  ||
+        util::parameter_equals(parameters, "__array__", "\"bytestring\"")) {
+      return std::make_shared<StringFiller>(options,
+                                            parameters,
+                                            content.get()->parameters());
+    }
+    return std::make_shared<ListFiller>(options,
+                                        parameters,
+                                        form_filler(content,
+                                                    options,
+                                                    nan_string,
+                                                    infinity_string,
+                                                    minus_infinity_string));
+  }
+
+  FormFillerPtr
+  form_option_filler(const FormPtr& content,
+                     const util::Parameters& parameters,
+                     const ArrayBuilderOptions& options,
+                     const char* nan_string,
+                     const char* infinity_string,
+                     const char* minus_infinity_string) {
+    // every option type becomes an IndexedOptionArray, so that missing
+    // values do not need placeholders in the content
+    return std::make_shared<OptionFiller>(options,
+                                          parameters,
+                                          form_filler(content,
+                                                      options,
+                                                      nan_string,
+                                                      infinity_string,
+                                                      minus_infinity_string));
+  }
+
+  FormFillerPtr
+  form_filler(const FormPtr& form,
+              const ArrayBuilderOptions& options,
+              const char* nan_string,
+              const char* infinity_string,
+              const char* minus_infinity_string) {
+    const util::Parameters& parameters = form.get()->parameters();
+    if (NumpyForm* raw = dynamic_cast<NumpyForm*>(form.get())) {
+      // inner dimensions become RegularArrays, which have the same type
+      const std::vector<int64_t>& inner_shape = raw->inner_shape();
+      FormFillerPtr out = form_number_filler(options,
+                                             inner_shape.empty()
+                                               ? parameters
+                                               : util::Parameters(),
+                                             raw->dtype(),
+                                             nan_string,
+                                             infinity_string,
+                                             minus_infinity_string);
+      for (int64_t i = (int64_t)inner_shape.size() - 1;  i >= 0;  i--) {
+        out = std::make_shared<RegularFiller>(options,
+                                              i == 0 ? parameters
+                                                     : util::Parameters(),
+                                              out,
+                                              inner_shape[(size_t)i]);
+      }
+      return out;
+    }
+    else if (ListOffsetForm* raw = dynamic_cast<ListOffsetForm*>(form.get())) {
+      return form_list_filler(raw->content(),
+                              parameters,
+                              options,
+                              nan_string,
+                              infinity_string,
+                              minus_infinity_string);
+    }
+    else if (ListForm* raw = dynamic_cast<ListForm*>(form.get())) {
+      return form_list_filler(raw->content(),
+                              parameters,
+                              options,
+                              nan_string,
+                              infinity_string,
+                              minus_infinity_string);
+    }
+    else if (RegularForm* raw = dynamic_cast<RegularForm*>(form.get())) {
+      if (util::parameter_equals(parameters, "__array__", "\"string\"")  ||
+          util::parameter_equals(parameters, "__array__", "\"bytestring\"")) {
+        throw std::invalid_argument(
+          std::string("cannot read JSON strings as fixed-length strings")
           + FILENAME(__LINE__));
       }
+      return std::make_shared<RegularFiller>(
+        options,
+        parameters,
+        form_filler(raw->content(),
+                    options,
+                    nan_string,
+                    infinity_string,
+                    minus_infinity_string),
+        raw->size());
+    }
+    else if (RecordForm* raw = dynamic_cast<RecordForm*>(form.get())) {
+      std::vector<FormFillerPtr> contents;
+      std::vector<bool> optional;
+      for (auto content : raw->contents()) {
+        contents.push_back(form_filler(content,
+                                       options,
+                                       nan_string,
+                                       infinity_string,
+                                       minus_infinity_string));
+        optional.push_back(form_isoption(content));
+      }
+      return std::make_shared<RecordFiller>(options,
+                                            parameters,
+                                            contents,
+                                            optional,
+                                            raw->recordlookup());
+    }
+    else if (IndexedOptionForm* raw =
+             dynamic_cast<IndexedOptionForm*>(form.get())) {
+      return form_option_filler(raw->content(),
+                                parameters,
+                                options,
+                                nan_string,
+                                infinity_string,
+                                minus_infinity_string);
+    }
+    else if (ByteMaskedForm* raw = dynamic_cast<ByteMaskedForm*>(form.get())) {
+      return form_option_filler(raw->content(),
+                                parameters,
+                                options,
+                                nan_string,
+                                infinity_string,
+                                minus_infinity_string);
+    }
+    else if (BitMaskedForm* raw = dynamic_cast<BitMaskedForm*>(form.get())) {
+      return form_option_filler(raw->content(),
+                                parameters,
+                                options,
+                                nan_string,
+                                infinity_string,
+                                minus_infinity_string);
+    }
+    else if (UnmaskedForm* raw = dynamic_cast<UnmaskedForm*>(form.get())) {
+      return form_option_filler(raw->content(),
+                                parameters,
+                                options,
+                                nan_string,
+                                infinity_string,
+                                minus_infinity_string);
+    }
+    else if (IndexedForm* raw = dynamic_cast<IndexedForm*>(form.get())) {
+      return form_filler(raw->content(),
+                         options,
+                         nan_string,
+                         infinity_string,
+                         minus_infinity_string);
+    }
+    else if (VirtualForm* raw = dynamic_cast<VirtualForm*>(form.get())) {
+      if (!raw->has_form()) {
+        throw std::invalid_argument(
+          std::string("cannot read JSON with a VirtualForm that has no form")
+          + FILENAME(__LINE__));
+      }
+      return form_filler(raw->form(),
+                         options,
+                         nan_string,
+                         infinity_string,
+                         minus_infinity_string);
+    }
+    else if (dynamic_cast<EmptyForm*>(form.get())) {
+      return std::make_shared<EmptyFiller>(options, parameters);
+    }
+    else {
+      throw std::invalid_argument(
+        std::string("cannot read JSON with a form containing ")
+        + form.get()->tojson(false, false)
+        + std::string("; use no form to discover the type")
+        + FILENAME(__LINE__));
+    }
+  }
+
+  /// @brief SAX handler that passes JSON values to a tree of FormFillers.
+  ///
+  /// If `outer` is true, the data are the items of a single JSON array;
+  /// otherwise, each JSON document is an item.
+  class FormHandler: public rj::BaseReaderHandler<rj::UTF8<>, FormHandler> {
+  public:
+    FormHandler(const FormPtr& form,
+                const ArrayBuilderOptions& options,
+                bool outer,
+                const char* nan_string,
+                const char* infinity_string,
+                const char* minus_infinity_string)
+        : form_(form)
+        , options_(options)
+        , outer_(outer)
+        , nan_string_(nan_string)
+        , infinity_string_(infinity_string)
+        , minus_infinity_string_(minus_infinity_string)
+        , moved_(false) {
+      reset_builder();
+    }
+
+    void
+    reset_builder() {
+      FormFillerPtr filler = form_filler(form_,
+                                         options_,
+                                         nan_string_,
+                                         infinity_string_,
+                                         minus_infinity_string_);
+      if (outer_) {
+        root_ = std::make_shared<ListFiller>(options_,
+                                             util::Parameters(),
+                                             filler);
+      }
+      else {
+        root_ = filler;
+      }
+      frames_.clear();
+      skipping_ = 0;
+    }
+
+    void
+    reset_moved() {
+      moved_ = false;
+    }
+
+    bool
+    moved() const {
+      return moved_;
+    }
+
+    bool Null() {
+      if (FormFiller* filler = value()) {
+        filler->null();
+      }
+      return done();
+    }
+
+    bool Bool(bool x) {
+      if (FormFiller* filler = value()) {
+        filler->boolean(x);
+      }
+      return done();
+    }
+
+    bool Int(int x) {
+      if (FormFiller* filler = value()) {
+        filler->integer((int64_t)x);
+      }
+      return done();
+    }
+
+    bool Uint(unsigned int x) {
+      if (FormFiller* filler = value()) {
+        filler->integer((int64_t)x);
+      }
+      return done();
+    }
+
+    bool Int64(int64_t x) {
+      if (FormFiller* filler = value()) {
+        filler->integer(x);
+      }
+      return done();
+    }
+
+    bool Uint64(uint64_t x) {
+      if (FormFiller* filler = value()) {
+        filler->uinteger(x);
+      }
+      return done();
+    }
+
+    bool Double(double x) {
+      if (FormFiller* filler = value()) {
+        filler->real(x);
+      }
+      return done();
+    }
+
+    bool
+    String(const char* str, rj::SizeType length, bool copy) {
+      if (FormFiller* filler = value()) {
+        filler->string(str, (int64_t)length);
+      }
+      return done();
+    }
+
+    bool
+    StartArray() {
+      if (FormFiller* filler = value()) {
+        frames_.push_back(Frame(filler->beginlist(), false));
+      }
+      else {
+        skipping_++;
+      }
+      return true;
+    }
+
+    bool
+    EndArray(rj::SizeType numfields) {
+      if (skipping_ == 0) {
+        Frame frame = frames_.back();
+        frames_.pop_back();
+        frame.filler->endlist(frame.numitems);
+      }
+      else {
+        skipping_--;
+      }
+      return done();
+    }
+
+    bool
+    StartObject() {
+      if (FormFiller* filler = value()) {
+        frames_.push_back(Frame(filler->beginrecord(), true));
+      }
+      else {
+        skipping_++;
+      }
+      return true;
+    }
+
+    bool
+    EndObject(rj::SizeType numfields) {
+      if (skipping_ == 0) {
+        Frame frame = frames_.back();
+        frames_.pop_back();
+        frame.filler->endrecord();
+      }
+      else {
+        skipping_--;
+      }
+      return done();
+    }
+
+    bool
+    Key(const char* str, rj::SizeType length, bool copy) {
+      moved_ = true;
+      if (skipping_ == 0) {
+        frames_.back().field = frames_.back().filler->field(str);
+      }
+      return true;
+    }
+
+    const ContentPtr snapshot() const {
+      if (outer_) {
+        if (root_.get()->length() != 1) {
+          throw std::invalid_argument(
+            std::string("JSON data read with a form must be a single array")
+            + FILENAME(__LINE__));
+        }
+        return dynamic_cast<ListFiller*>(root_.get())->content().get()
+                                                              ->snapshot();
+      }
+      return root_.get()->snapshot();
+    }
+
+  private:
+    struct Frame {
+      Frame(FormFiller* f, bool r)
+          : filler(f), isrecord(r), field(nullptr), numitems(0) { }
+      FormFiller* filler;
+      bool isrecord;
+      FormFiller* field;
+      int64_t numitems;
+    };
+
+    /// @brief Returns the filler for the next value or `nullptr` if it is
+    /// being skipped.
+    FormFiller*
+    value() {
+      moved_ = true;
+      if (skipping_ != 0) {
+        return nullptr;
+      }
+      else if (frames_.empty()) {
+        return root_.get();
+      }
+      Frame& frame = frames_.back();
+      if (frame.isrecord) {
+        return frame.field;
+      }
+      return frame.filler->item(frame.numitems);
+    }
+
+    bool
+    done() {
+      if (skipping_ == 0  &&  !frames_.empty()) {
+        frames_.back().numitems++;
+        frames_.back().field = nullptr;
+      }
+      return true;
+    }
+
+    const FormPtr form_;
+    const ArrayBuilderOptions options_;
+    const bool outer_;
+    const char* nan_string_;
+    const char* infinity_string_;
+    const char* minus_infinity_string_;
+    bool moved_;
+    FormFillerPtr root_;
+    std::vector<Frame> frames_;
+    int64_t skipping_;
+  };
+
+  template<typename HANDLER, typename STREAM>
+  bool
+  parse_one(HANDLER& handler, rj::Reader& reader, STREAM& stream) {
+    handler.reset_moved();
+    bool fully_parsed = reader.Parse<rj::kParseStopWhenDoneFlag>(stream, handler);
+    if (handler.moved()) {
+      if (!fully_parsed) {
+        if (stream.Peek() == 0) {
+          throw std::invalid_argument(
+              std::string("incomplete JSON object at the end of the stream")
+              + FILENAME(__LINE__));
+        }
+        else {
+          throw std::invalid_argument(
+            std::string("JSON File error at char ")
+            + std::to_string(stream.Tell()) + std::string(": \'")
+            + stream.Peek() + std::string("\'")
+            + FILENAME(__LINE__));
+        }
+      }
+      return true;
+    }
+    else if (stream.Peek() != 0) {
+      throw std::invalid_argument(
+        std::string("JSON File error at char ")
+        + std::to_string(stream.Tell()) + std::string(": \'")
+        + stream.Peek() + std::string("\'")
+        + FILENAME(__LINE__));
+    }
+    return false;
+  }
+
+  template<typename HANDLER, typename STREAM>
+  const ContentPtr
+  do_parse(HANDLER& handler, rj::Reader& reader, STREAM& stream) {
+    int64_t number = 0;
+    while (stream.Peek() != 0) {
+      if (parse_one(handler, reader, stream)) {
+        number++;
+      }
     }
 
     ContentPtr obj = handler.snapshot();
@@ -703,14 +1809,33 @@ namespace awkward {
     }
   }
 
+  template<typename STREAM>
+  const ContentPtr
+  do_parse(FormHandler& handler, rj::Reader& reader, STREAM& stream) {
+    while (stream.Peek() != 0) {
+      parse_one(handler, reader, stream);
+    }
+    return handler.snapshot();
+  }
+
   const ContentPtr
   FromJsonString(const char* source,
                  const ArrayBuilderOptions& options,
                  const char* nan_string,
                  const char* infinity_string,
-                 const char* minus_infinity_string) {
+                 const char* minus_infinity_string,
+                 const FormPtr& form) {
     rj::Reader reader;
     rj::StringStream stream(source);
+    if (form.get() != nullptr) {
+      FormHandler handler(form,
+                          options,
+                          true,
+                          nan_string,
+                          infinity_string,
+                          minus_infinity_string);
+      return do_parse(handler, reader, stream);
+    }
     Handler handler(options, nan_string, infinity_string, minus_infinity_string);
     return do_parse(handler, reader, stream);
   }
@@ -721,13 +1846,119 @@ namespace awkward {
                int64_t buffersize,
                const char* nan_string,
                const char* infinity_string,
-               const char* minus_infinity_string) {
+               const char* minus_infinity_string,
+               const FormPtr& form) {
     rj::Reader reader;
     std::shared_ptr<char> buffer = kernel::malloc<char>(kernel::lib::cpu, buffersize);
     rj::FileReadStream stream(source,
                               buffer.get(),
                               ((size_t)buffersize)*sizeof(char));
+    if (form.get() != nullptr) {
+      FormHandler handler(form,
+                          options,
+                          true,
+                          nan_string,
+                          infinity_string,
+                          minus_infinity_string);
+      return do_parse(handler, reader, stream);
+    }
     Handler handler(options, nan_string, infinity_string, minus_infinity_string);
     return do_parse(handler, reader, stream);
   }
+
+  class FromJsonFileChunks::Impl {
+  public:
+    Impl(FILE* source,
+         const ArrayBuilderOptions& options,
+         int64_t buffersize,
+         const char* nan_string,
+         const char* infinity_string,
+         const char* minus_infinity_string,
+         const FormPtr& form)
+        : buffer_(kernel::malloc<char>(kernel::lib::cpu, buffersize))
+        , stream_(source,
+                  buffer_.get(),
+                  ((size_t)buffersize)*sizeof(char))
+        , handler_(options,
+                   nan_string,
+                   infinity_string,
+                   minus_infinity_string) {
+      if (form.get() != nullptr) {
+        form_handler_ = std::make_shared<FormHandler>(form,
+                                                      options,
+                                                      false,
+                                                      nan_string,
+                                                      infinity_string,
+                                                      minus_infinity_string);
+      }
+    }
+
+    const ContentPtr
+    next(int64_t maxentries, int64_t maxbytes) {
+      if (form_handler_.get() != nullptr) {
+        return next(*form_handler_.get(), maxentries, maxbytes);
+      }
+      return next(handler_, maxentries, maxbytes);
+    }
+
+    int64_t
+    tell() const {
+      return (int64_t)stream_.Tell();
+    }
+
+  private:
+    template<typename HANDLER>
+    const ContentPtr
+    next(HANDLER& handler, int64_t maxentries, int64_t maxbytes) {
+      handler.reset_builder();
+      size_t start = stream_.Tell();
+      int64_t number = 0;
+      while (stream_.Peek() != 0  &&
+             (maxentries < 0  ||  number < maxentries)  &&
+             (maxbytes < 0  ||  (int64_t)(stream_.Tell() - start) < maxbytes)) {
+        if (parse_one(handler, reader_, stream_)) {
+          number++;
+        }
+      }
+      if (number == 0) {
+        return ContentPtr(nullptr);
+      }
+      return handler.snapshot();
+    }
+
+    std::shared_ptr<char> buffer_;
+    rj::FileReadStream stream_;
+    rj::Reader reader_;
+    Handler handler_;
+    std::shared_ptr<FormHandler> form_handler_;
+  };
+
+  FromJsonFileChunks::FromJsonFileChunks(FILE* source,
+                                         const ArrayBuilderOptions& options,
+                                         int64_t buffersize,
+                                         const char* nan_string,
+                                         const char* infinity_string,
+                                         const char* minus_infinity_string,
+                                         const FormPtr& form)
+      : impl_(new FromJsonFileChunks::Impl(source,
+                                           options,
+                                           buffersize,
+                                           nan_string,
+                                           infinity_string,
+                                           minus_infinity_string,
+                                           form)) { }
+
+  FromJsonFileChunks::~FromJsonFileChunks() {
+    delete impl_;
+  }
+
+  const ContentPtr
+  FromJsonFileChunks::next(int64_t maxentries, int64_t maxbytes) {
+    return impl_->next(maxentries, maxbytes);
+  }
+
+  int64_t
+  FromJsonFileChunks::tell() const {
+    return impl_->tell();
+  }
 }
@@ -18257,6 +18257,74 @@ namespace awkward {
       }
     }
 
+    ERROR ListOffsetArray_argsort_strings(
+      kernel::lib ptr_lib,
+      int64_t* tocarry,
+      const uint8_t* stringdata,
+      const int64_t* stringstarts,
+      const int64_t* stringstops,
+      int64_t length,
+      const int64_t* offsets,
+      int64_t offsetslength,
+      bool ascending,
+      bool stable,
+      bool local) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_ListOffsetArray_argsort_strings(
+          tocarry,
+          stringdata,
+          stringstarts,
+          stringstops,
+          length,
+          offsets,
+          offsetslength,
+          ascending,
+          stable,
+          local);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_argsort_strings")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_argsort_strings")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    ERROR NumpyArray_dictionary_encode_uint8(
+      kernel::lib ptr_lib,
+      int64_t* tocodes,
+      int64_t* tolength,
+      const uint8_t* fromptr,
+      const int64_t* fromstarts,
+      const int64_t* fromstops,
+      int64_t length,
+      int64_t lencontent) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_NumpyArray_dictionary_encode_uint8(
+          tocodes,
+          tolength,
+          fromptr,
+          fromstarts,
+          fromstops,
+          length,
+          lencontent);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for NumpyArray_dictionary_encode_uint8")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for NumpyArray_dictionary_encode_uint8")
+          + FILENAME(__LINE__));
+      }
+    }
+
     template<>
     ERROR NumpyArray_sort_asstrings<uint8_t>(
       kernel::lib ptr_lib,
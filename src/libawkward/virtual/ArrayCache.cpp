@@ -1,6 +1,9 @@
 // BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/virtual/ArrayCache.cpp", line)
+
 #include <atomic>
+#include <sstream>
 
 #include "awkward/virtual/ArrayCache.h"
 
@@ -17,4 +20,206 @@ namespace awkward {
   // Note: if you're creating a pure C++ cache (and it's not ridiculously
   // large), define it in
   // include/awkward/virtual/ArrayCache.h and implement it in this file.
+
+  ////////// BoundedArrayCache
+
+  BoundedArrayCache::BoundedArrayCache(int64_t limit_bytes, Policy policy)
+      : limit_bytes_(limit_bytes)
+      , policy_(policy)
+      , clock_(0)
+      , hits_(0)
+      , misses_(0)
+      , evictions_(0)
+      , nbytes_(0) {
+    if (limit_bytes < 0) {
+      throw std::invalid_argument(
+        std::string("BoundedArrayCache limit_bytes must be non-negative")
+        + FILENAME(__LINE__));
+    }
+  }
+
+  BoundedArrayCache::Policy
+  BoundedArrayCache::policy_from_name(const std::string& name) {
+    if (name == std::string("lru")) {
+      return Policy::lru;
+    }
+    else if (name == std::string("lfu")) {
+      return Policy::lfu;
+    }
+    else {
+      throw std::invalid_argument(
+        std::string("BoundedArrayCache policy must be \"lru\" or \"lfu\", not ")
+        + util::quote(name) + FILENAME(__LINE__));
+    }
+  }
+
+  int64_t
+  BoundedArrayCache::limit_bytes() const {
+    return limit_bytes_;
+  }
+
+  BoundedArrayCache::Policy
+  BoundedArrayCache::policy() const {
+    return policy_;
+  }
+
+  const std::string
+  BoundedArrayCache::policy_name() const {
+    return policy_ == Policy::lru ? std::string("lru") : std::string("lfu");
+  }
+
+  int64_t
+  BoundedArrayCache::nbytes() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return nbytes_;
+  }
+
+  int64_t
+  BoundedArrayCache::length() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return (int64_t)entries_.size();
+  }
+
+  int64_t
+  BoundedArrayCache::hits() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return hits_;
+  }
+
+  int64_t
+  BoundedArrayCache::misses() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return misses_;
+  }
+
+  int64_t
+  BoundedArrayCache::evictions() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return evictions_;
+  }
+
+  const std::vector<std::string>
+  BoundedArrayCache::keys() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    std::vector<std::string> out;
+    for (auto item : order_) {
+      out.push_back(std::get<2>(item));
+    }
+    return out;
+  }
+
+  bool
+  BoundedArrayCache::contains(const std::string& key) const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return entries_.find(key) != entries_.end();
+  }
+
+  ContentPtr
+  BoundedArrayCache::get(const std::string& key) const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto found = entries_.find(key);
+    if (found == entries_.end()) {
+      misses_++;
+      return ContentPtr(nullptr);
+    }
+    hits_++;
+    Entry& entry = found->second;
+    order_.erase(order(key, entry));
+    entry.frequency++;
+    entry.tick = clock_++;
+    order_.insert(order(key, entry));
+    return entry.value;
+  }
+
+  void
+  BoundedArrayCache::set(const std::string& key, const ContentPtr& value) {
+    int64_t nbytes = value.get()->nbytes();
+    // declared before the lock, so the replaced and evicted arrays are
+    // destroyed after it is released (their deleters may take the GIL)
+    std::vector<ContentPtr> dropped;
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto found = entries_.find(key);
+    int64_t frequency = 0;
+    if (found != entries_.end()) {
+      frequency = found->second.frequency;
+      order_.erase(order(key, found->second));
+      nbytes_ -= found->second.nbytes;
+      dropped.push_back(found->second.value);
+      entries_.erase(found);
+    }
+    if (nbytes > limit_bytes_) {
+      return;
+    }
+    evict(limit_bytes_ - nbytes, dropped);
+    Entry entry = { value, nbytes, frequency + 1, clock_++ };
+    entries_[key] = entry;
+    order_.insert(order(key, entry));
+    nbytes_ += nbytes;
+  }
+
+  bool
+  BoundedArrayCache::remove(const std::string& key) {
+    ContentPtr dropped(nullptr);
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto found = entries_.find(key);
+    if (found == entries_.end()) {
+      return false;
+    }
+    order_.erase(order(key, found->second));
+    nbytes_ -= found->second.nbytes;
+    dropped = found->second.value;
+    entries_.erase(found);
+    return true;
+  }
+
+  void
+  BoundedArrayCache::clear() {
+    std::unordered_map<std::string, Entry> dropped;
+    std::lock_guard<std::mutex> lock(mutex_);
+    entries_.swap(dropped);
+    order_.clear();
+    nbytes_ = 0;
+    hits_ = 0;
+    misses_ = 0;
+    evictions_ = 0;
+  }
+
+  bool
+  BoundedArrayCache::is_broken() const {
+    return false;
+  }
+
+  const std::string
+  BoundedArrayCache::tostring_part(const std::string& indent,
+                                   const std::string& pre,
+                                   const std::string& post) const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    std::stringstream out;
+    out << indent << pre << "<BoundedArrayCache policy=\"" << policy_name()
+        << "\" nbytes=\"" << nbytes_ << "\" limit_bytes=\"" << limit_bytes_
+        << "\" length=\"" << entries_.size() << "\" hits=\"" << hits_
+        << "\" misses=\"" << misses_ << "\" evictions=\"" << evictions_
+        << "\"/>" << post;
+    return out.str();
+  }
+
+  const BoundedArrayCache::Order
+  BoundedArrayCache::order(const std::string& key, const Entry& entry) const {
+    return Order(policy_ == Policy::lfu ? entry.frequency : 0,
+                 entry.tick,
+                 key);
+  }
+
+  void
+  BoundedArrayCache::evict(int64_t limit, std::vector<ContentPtr>& dropped) {
+    while (nbytes_ > limit  &&  !order_.empty()) {
+      auto first = order_.begin();
+      auto found = entries_.find(std::get<2>(*first));
+      nbytes_ -= found->second.nbytes;
+      dropped.push_back(found->second.value);
+      entries_.erase(found);
+      order_.erase(first);
+      evictions_++;
+    }
+  }
 }
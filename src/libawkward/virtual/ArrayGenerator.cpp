@@ -9,6 +9,36 @@
 #include "awkward/virtual/ArrayGenerator.h"
 
 namespace awkward {
+  namespace {
+    // slices content, but if it is a VirtualArray whose generator accepts
+    // ranges, asks the generator for the range instead of materializing all
+    const ContentPtr
+    getitem_range_of(const ContentPtr& content, int64_t start, int64_t stop) {
+      if (VirtualArray* a = dynamic_cast<VirtualArray*>(content.get())) {
+        ContentPtr peek = a->peek_array();
+        if (peek.get() != nullptr) {
+          return peek.get()->getitem_range(start, stop);
+        }
+        ArrayGeneratorPtr generator = a->generator();
+        int64_t length = generator.get()->length();
+        if (generator.get()->accepts_range()  &&
+            length >= 0  &&
+            a->ptr_lib() == kernel::lib::cpu) {
+          int64_t regular_start = start;
+          int64_t regular_stop = stop;
+          kernel::regularize_rangeslice(&regular_start, &regular_stop,
+            true, start != Slice::none(), stop != Slice::none(), length);
+          return generator.get()->generate_range_and_check(regular_start,
+                                                           regular_stop);
+        }
+        return a->array().get()->getitem_range(start, stop);
+      }
+      else {
+        return content.get()->getitem_range(start, stop);
+      }
+    }
+  }
+
   ArrayGenerator::ArrayGenerator(const FormPtr& form, int64_t length)
       : form_(form)
       , length_(length) { }
@@ -51,6 +81,40 @@ namespace awkward {
     return out;
   }
 
+  bool
+  ArrayGenerator::accepts_range() const {
+    return false;
+  }
+
+  const ContentPtr
+  ArrayGenerator::generate_range(int64_t start, int64_t stop) const {
+    return generate().get()->getitem_range_nowrap(start, stop);
+  }
+
+  const ContentPtr
+  ArrayGenerator::generate_range_and_check(int64_t start, int64_t stop) const {
+    ContentPtr out = generate_range(start, stop);
+    if (stop - start > out.get()->length()) {
+      throw std::invalid_argument(
+          std::string(
+              "generated range does not have sufficient length: expected ") +
+          std::to_string(stop - start) + std::string(" but generated ") +
+          std::to_string(out.get()->length()) + FILENAME(__LINE__));
+    }
+    FormPtr expected = form();
+    if (expected.get() != nullptr  &&
+        !expected.get()->equal(out.get()->form(true), true, true, false, true)) {
+      throw std::invalid_argument(
+          std::string("generated range does not conform to expected form:\n\n")
+          + expected.get()->tostring() + std::string("\n\nbut generated:\n\n")
+          + out.get()->form(true).get()->tostring() + FILENAME(__LINE__));
+    }
+    if (out.get()->length() > stop - start) {
+      out = out.get()->getitem_range_nowrap(0, stop - start);
+    }
+    return out;
+  }
+
   SliceGenerator::SliceGenerator(const FormPtr& form,
                                  int64_t length,
                                  const ContentPtr& content,
@@ -75,12 +139,7 @@ namespace awkward {
       SliceItemPtr head = slice_.head();
       if (SliceRange* raw = dynamic_cast<SliceRange*>(head.get())) {
         if (raw->step() == 1) {
-          if (VirtualArray* a = dynamic_cast<VirtualArray*>(content_.get())) {
-            return a->array().get()->getitem_range(raw->start(), raw->stop());
-          }
-          else {
-            return content_.get()->getitem_range(raw->start(), raw->stop());
-          }
+          return getitem_range_of(content_, raw->start(), raw->stop());
         }
       }
     }
@@ -92,6 +151,30 @@ namespace awkward {
     }
   }
 
+  bool
+  SliceGenerator::accepts_range() const {
+    if (slice_.length() == 1) {
+      SliceItemPtr head = slice_.head();
+      if (SliceRange* raw = dynamic_cast<SliceRange*>(head.get())) {
+        return raw->step() == 1  &&
+               raw->start() >= 0  &&
+               raw->stop() >= raw->start();
+      }
+    }
+    return false;
+  }
+
+  const ContentPtr
+  SliceGenerator::generate_range(int64_t start, int64_t stop) const {
+    if (accepts_range()) {
+      SliceRange* raw = dynamic_cast<SliceRange*>(slice_.head().get());
+      return getitem_range_of(content_,
+                              raw->start() + start,
+                              raw->start() + stop);
+    }
+    return ArrayGenerator::generate_range(start, stop);
+  }
+
   const std::string
   SliceGenerator::tostring_part(const std::string& indent,
                                 const std::string& pre,
@@ -0,0 +1,101 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/virtual/VirtualArrayRecorder.cpp", line)
+
+#include <algorithm>
+#include <atomic>
+
+#include "awkward/virtual/VirtualArrayRecorder.h"
+
+namespace awkward {
+  std::mutex active_recorders_mutex;
+  std::vector<VirtualArrayRecorderPtr> active_recorders;
+  std::atomic<int64_t> num_active_recorders{0};
+
+  VirtualArrayRecorder::VirtualArrayRecorder() { }
+
+  const std::map<std::string, VirtualArrayRecorder::Entry>
+  VirtualArrayRecorder::entries() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return entries_;
+  }
+
+  void
+  VirtualArrayRecorder::clear() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    entries_.clear();
+  }
+
+  bool
+  VirtualArrayRecorder::active() const {
+    std::lock_guard<std::mutex> lock(active_recorders_mutex);
+    for (auto recorder : active_recorders) {
+      if (recorder.get() == this) {
+        return true;
+      }
+    }
+    return false;
+  }
+
+  void
+  VirtualArrayRecorder::start(const VirtualArrayRecorderPtr& recorder) {
+    std::lock_guard<std::mutex> lock(active_recorders_mutex);
+    if (std::find(active_recorders.begin(),
+                  active_recorders.end(),
+                  recorder) == active_recorders.end()) {
+      active_recorders.push_back(recorder);
+      num_active_recorders = (int64_t)active_recorders.size();
+    }
+  }
+
+  void
+  VirtualArrayRecorder::stop(const VirtualArrayRecorderPtr& recorder) {
+    std::lock_guard<std::mutex> lock(active_recorders_mutex);
+    active_recorders.erase(std::remove(active_recorders.begin(),
+                                       active_recorders.end(),
+                                       recorder),
+                           active_recorders.end());
+    num_active_recorders = (int64_t)active_recorders.size();
+  }
+
+  bool
+  VirtualArrayRecorder::recording() {
+    return num_active_recorders != 0;
+  }
+
+  void
+  VirtualArrayRecorder::record_hit(const std::string& cache_key) {
+    std::lock_guard<std::mutex> lock(active_recorders_mutex);
+    for (auto recorder : active_recorders) {
+      recorder.get()->hit(cache_key);
+    }
+  }
+
+  void
+  VirtualArrayRecorder::record_generated(const std::string& cache_key,
+                                         double seconds,
+                                         int64_t nbytes) {
+    std::lock_guard<std::mutex> lock(active_recorders_mutex);
+    for (auto recorder : active_recorders) {
+      recorder.get()->generated(cache_key, seconds, nbytes);
+    }
+  }
+
+  void
+  VirtualArrayRecorder::hit(const std::string& cache_key) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    Entry& entry = entries_[cache_key];
+    entry.hits++;
+  }
+
+  void
+  VirtualArrayRecorder::generated(const std::string& cache_key,
+                                  double seconds,
+                                  int64_t nbytes) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    Entry& entry = entries_[cache_key];
+    entry.generated++;
+    entry.seconds += seconds;
+    entry.nbytes += nbytes;
+  }
+}
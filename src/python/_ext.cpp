@@ -31,6 +31,9 @@ PYBIND11_MODULE(_ext, m) {
 
   make_lib_enum(m, "kernel_lib");
 
+  m.def("num_threads", &awkward_num_threads);
+  m.def("set_num_threads", &awkward_set_num_threads);
+
   ////////// index.h
 
   make_IndexOf<int8_t>(m,   "Index8");
@@ -122,11 +125,14 @@ PYBIND11_MODULE(_ext, m) {
   make_PyArrayGenerator(m, "ArrayGenerator");
   make_SliceGenerator(m, "SliceGenerator");
   make_PyArrayCache(m, "ArrayCache");
+  make_BoundedArrayCache(m, "BoundedArrayCache");
+  make_VirtualArrayRecorder(m, "VirtualArrayRecorder");
 
   ////////// io.h
 
   make_fromjson(m, "fromjson");
   make_fromjsonfile(m, "fromjsonfile");
+  make_fromjsonfilechunks(m, "FromJsonFileChunks");
   make_uproot_issue_90(m);
 
   ////////// partition.h
@@ -2,6 +2,7 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/python/content.cpp", line)
 
+#include <pybind11/complex.h>
 #include <pybind11/numpy.h>
 
 #include "awkward/kernel-utils.h"
@@ -750,6 +751,346 @@ tojson_file(const T& self,
   fclose(file);
 }
 
+////////// tolist
+
+void
+tolist_fill(const std::shared_ptr<ak::Content>& layout,
+            std::vector<py::object>& out);
+
+py::object
+tolist_steal(PyObject* obj) {
+  if (obj == nullptr) {
+    throw py::error_already_set();
+  }
+  return py::reinterpret_steal<py::object>(obj);
+}
+
+/// @brief Unwraps the content of a string or bytestring into a contiguous
+/// NumpyArray of bytes.
+const ak::NumpyArray
+tolist_chars(const std::shared_ptr<ak::Content>& content) {
+  if (ak::NumpyArray* raw =
+      dynamic_cast<ak::NumpyArray*>(content.get())) {
+    return raw->contiguous();
+  }
+  else if (ak::VirtualArray* raw =
+           dynamic_cast<ak::VirtualArray*>(content.get())) {
+    return tolist_chars(raw->array());
+  }
+  else if (ak::IndexedArray32* raw =
+           dynamic_cast<ak::IndexedArray32*>(content.get())) {
+    return tolist_chars(raw->project());
+  }
+  else if (ak::IndexedArrayU32* raw =
+           dynamic_cast<ak::IndexedArrayU32*>(content.get())) {
+    return tolist_chars(raw->project());
+  }
+  else if (ak::IndexedArray64* raw =
+           dynamic_cast<ak::IndexedArray64*>(content.get())) {
+    return tolist_chars(raw->project());
+  }
+  else {
+    throw std::invalid_argument(
+      std::string("strings and bytestrings must be lists of NumpyArray, not ")
+      + content.get()->classname() + FILENAME(__LINE__));
+  }
+}
+
+/// @brief Appends one Python object per list, for the lists defined by
+/// `starts` and `stops` (relative to the beginning of `content`).
+template <typename T>
+void
+tolist_lists(const std::shared_ptr<ak::Content>& content,
+             const T* starts,
+             const T* stops,
+             int64_t length,
+             std::vector<py::object>& out) {
+  if (length == 0) {
+    return;
+  }
+  int64_t low = (int64_t)starts[0];
+  int64_t high = (int64_t)stops[length - 1];
+  for (int64_t i = 0;  i < length;  i++) {
+    if (stops[i] < starts[i]  ||
+        (i + 1 < length  &&  stops[i] != starts[i + 1])) {
+      throw std::invalid_argument(
+        std::string("lists must be contiguous")
+        + FILENAME(__LINE__));
+    }
+  }
+
+  bool ischar = content.get()->parameter_equals("__array__", "\"char\"");
+  bool isbyte = content.get()->parameter_equals("__array__", "\"byte\"");
+  if (ischar  ||  isbyte) {
+    const ak::NumpyArray chars =
+      tolist_chars(content.get()->getitem_range_nowrap(low, high));
+    const char* data = reinterpret_cast<const char*>(chars.data());
+    for (int64_t i = 0;  i < length;  i++) {
+      const char* start = data + ((int64_t)starts[i] - low);
+      Py_ssize_t size = (Py_ssize_t)(stops[i] - starts[i]);
+      if (ischar) {
+        out.push_back(tolist_steal(
+          PyUnicode_DecodeUTF8(start, size, "surrogateescape")));
+      }
+      else {
+        out.push_back(tolist_steal(PyBytes_FromStringAndSize(start, size)));
+      }
+    }
+    return;
+  }
+
+  std::vector<py::object> items;
+  items.reserve((size_t)(high - low));
+  tolist_fill(content.get()->getitem_range_nowrap(low, high), items);
+  for (int64_t i = 0;  i < length;  i++) {
+    int64_t start = (int64_t)starts[i] - low;
+    int64_t size = (int64_t)(stops[i] - starts[i]);
+    py::list sublist((size_t)size);
+    for (int64_t j = 0;  j < size;  j++) {
+      PyList_SET_ITEM(sublist.ptr(),
+                      (Py_ssize_t)j,
+                      items[(size_t)(start + j)].release().ptr());
+    }
+    out.push_back(std::move(sublist));
+  }
+}
+
+template <typename T>
+void
+tolist_offsets(const std::shared_ptr<ak::Content>& content,
+               const ak::IndexOf<T>& offsets,
+               std::vector<py::object>& out) {
+  int64_t length = offsets.length() - 1;
+  tolist_lists<T>(content, offsets.data(), offsets.data() + 1, length, out);
+}
+
+template <typename T>
+void
+tolist_startsstops(const ak::ListArrayOf<T>* raw,
+                   std::vector<py::object>& out) {
+  const T* starts = raw->starts().data();
+  const T* stops = raw->stops().data();
+  int64_t length = raw->length();
+  for (int64_t i = 0;  i + 1 < length;  i++) {
+    if (stops[i] != starts[i + 1]) {
+      // non-contiguous or overlapping lists: copy the content into order
+      tolist_fill(raw->toListOffsetArray64(true), out);
+      return;
+    }
+  }
+  tolist_lists<T>(raw->content(), starts, stops, length, out);
+}
+
+/// @brief Appends `projected` with None wherever `bytemask` is nonzero.
+void
+tolist_option(const ak::Index8& bytemask,
+              const std::shared_ptr<ak::Content>& projected,
+              std::vector<py::object>& out) {
+  std::vector<py::object> items;
+  items.reserve((size_t)projected.get()->length());
+  tolist_fill(projected, items);
+  const int8_t* mask = bytemask.data();
+  size_t j = 0;
+  for (int64_t i = 0;  i < bytemask.length();  i++) {
+    if (mask[i] != 0) {
+      out.push_back(py::none());
+    }
+    else {
+      out.push_back(std::move(items[j]));
+      j++;
+    }
+  }
+}
+
+template <typename T, typename I>
+void
+tolist_union(const ak::UnionArrayOf<T, I>* raw,
+             std::vector<py::object>& out) {
+  std::vector<std::vector<py::object>> items((size_t)raw->numcontents());
+  std::vector<size_t> next((size_t)raw->numcontents(), 0);
+  for (int64_t k = 0;  k < raw->numcontents();  k++) {
+    tolist_fill(raw->project(k), items[(size_t)k]);
+  }
+  const T* tags = raw->tags().data();
+  for (int64_t i = 0;  i < raw->length();  i++) {
+    size_t tag = (size_t)tags[i];
+    out.push_back(std::move(items[tag][next[tag]]));
+    next[tag]++;
+  }
+}
+
+void
+tolist_record(const ak::RecordArray* raw,
+              std::vector<py::object>& out) {
+  int64_t length = raw->length();
+  size_t numfields = (size_t)raw->numfields();
+  std::vector<std::vector<py::object>> fields(numfields);
+  for (size_t j = 0;  j < numfields;  j++) {
+    fields[j].reserve((size_t)length);
+    tolist_fill(raw->field((int64_t)j).get()->getitem_range_nowrap(0, length),
+                fields[j]);
+  }
+  if (raw->istuple()) {
+    for (int64_t i = 0;  i < length;  i++) {
+      py::tuple tuple(numfields);
+      for (size_t j = 0;  j < numfields;  j++) {
+        PyTuple_SET_ITEM(tuple.ptr(),
+                         (Py_ssize_t)j,
+                         fields[j][(size_t)i].release().ptr());
+      }
+      out.push_back(std::move(tuple));
+    }
+  }
+  else {
+    std::vector<py::str> keys;
+    for (auto key : raw->keys()) {
+      keys.push_back(py::str(key));
+    }
+    for (int64_t i = 0;  i < length;  i++) {
+      py::dict dict;
+      for (size_t j = 0;  j < numfields;  j++) {
+        if (PyDict_SetItem(dict.ptr(),
+                           keys[j].ptr(),
+                           fields[j][(size_t)i].ptr()) != 0) {
+          throw py::error_already_set();
+        }
+      }
+      out.push_back(std::move(dict));
+    }
+  }
+}
+
+void
+tolist_fill(const std::shared_ptr<ak::Content>& layout,
+            std::vector<py::object>& out) {
+  if (ak::NumpyArray* raw =
+      dynamic_cast<ak::NumpyArray*>(layout.get())) {
+    py::object array = py::array(py::buffer_info(raw->data(),
+                                                 raw->itemsize(),
+                                                 raw->format(),
+                                                 raw->ndim(),
+                                                 raw->shape(),
+                                                 raw->strides()),
+                                 py::cast(*raw));
+    for (auto item : array.attr("tolist")()) {
+      out.push_back(py::reinterpret_borrow<py::object>(item));
+    }
+  }
+  else if (ak::EmptyArray* raw =
+           dynamic_cast<ak::EmptyArray*>(layout.get())) { }
+  else if (ak::RegularArray* raw =
+           dynamic_cast<ak::RegularArray*>(layout.get())) {
+    ak::Index64 offsets = raw->compact_offsets64(true);
+    tolist_offsets<int64_t>(raw->content(), offsets, out);
+  }
+  else if (ak::ListOffsetArray32* raw =
+           dynamic_cast<ak::ListOffsetArray32*>(layout.get())) {
+    tolist_offsets<int32_t>(raw->content(), raw->offsets(), out);
+  }
+  else if (ak::ListOffsetArrayU32* raw =
+           dynamic_cast<ak::ListOffsetArrayU32*>(layout.get())) {
+    tolist_offsets<uint32_t>(raw->content(), raw->offsets(), out);
+  }
+  else if (ak::ListOffsetArray64* raw =
+           dynamic_cast<ak::ListOffsetArray64*>(layout.get())) {
+    tolist_offsets<int64_t>(raw->content(), raw->offsets(), out);
+  }
+  else if (ak::ListArray32* raw =
+           dynamic_cast<ak::ListArray32*>(layout.get())) {
+    tolist_startsstops<int32_t>(raw, out);
+  }
+  else if (ak::ListArrayU32* raw =
+           dynamic_cast<ak::ListArrayU32*>(layout.get())) {
+    tolist_startsstops<uint32_t>(raw, out);
+  }
+  else if (ak::ListArray64* raw =
+           dynamic_cast<ak::ListArray64*>(layout.get())) {
+    tolist_startsstops<int64_t>(raw, out);
+  }
+  else if (ak::IndexedArray32* raw =
+           dynamic_cast<ak::IndexedArray32*>(layout.get())) {
+    tolist_fill(raw->project(), out);
+  }
+  else if (ak::IndexedArrayU32* raw =
+           dynamic_cast<ak::IndexedArrayU32*>(layout.get())) {
+    tolist_fill(raw->project(), out);
+  }
+  else if (ak::IndexedArray64* raw =
+           dynamic_cast<ak::IndexedArray64*>(layout.get())) {
+    tolist_fill(raw->project(), out);
+  }
+  else if (ak::IndexedOptionArray32* raw =
+           dynamic_cast<ak::IndexedOptionArray32*>(layout.get())) {
+    tolist_option(raw->bytemask(), raw->project(), out);
+  }
+  else if (ak::IndexedOptionArray64* raw =
+           dynamic_cast<ak::IndexedOptionArray64*>(layout.get())) {
+    tolist_option(raw->bytemask(), raw->project(), out);
+  }
+  else if (ak::ByteMaskedArray* raw =
+           dynamic_cast<ak::ByteMaskedArray*>(layout.get())) {
+    tolist_option(raw->bytemask(), raw->project(), out);
+  }
+  else if (ak::BitMaskedArray* raw =
+           dynamic_cast<ak::BitMaskedArray*>(layout.get())) {
+    tolist_option(raw->bytemask(), raw->project(), out);
+  }
+  else if (ak::UnmaskedArray* raw =
+           dynamic_cast<ak::UnmaskedArray*>(layout.get())) {
+    tolist_fill(raw->project(), out);
+  }
+  else if (ak::RecordArray* raw =
+           dynamic_cast<ak::RecordArray*>(layout.get())) {
+    tolist_record(raw, out);
+  }
+  else if (ak::UnionArray8_32* raw =
+           dynamic_cast<ak::UnionArray8_32*>(layout.get())) {
+    tolist_union<int8_t, int32_t>(raw, out);
+  }
+  else if (ak::UnionArray8_U32* raw =
+           dynamic_cast<ak::UnionArray8_U32*>(layout.get())) {
+    tolist_union<int8_t, uint32_t>(raw, out);
+  }
+  else if (ak::UnionArray8_64* raw =
+           dynamic_cast<ak::UnionArray8_64*>(layout.get())) {
+    tolist_union<int8_t, int64_t>(raw, out);
+  }
+  else if (ak::VirtualArray* raw =
+           dynamic_cast<ak::VirtualArray*>(layout.get())) {
+    tolist_fill(raw->array(), out);
+  }
+  else {
+    throw std::invalid_argument(
+      std::string("tolist not implemented for ")
+      + layout.get()->classname() + FILENAME(__LINE__));
+  }
+}
+
+py::object
+tolist(const std::shared_ptr<ak::Content>& layout) {
+  std::shared_ptr<ak::Content> cpu = layout;
+  if (layout.get()->kernels() != ak::kernel::lib::cpu) {
+    cpu = layout.get()->copy_to(ak::kernel::lib::cpu);
+  }
+  std::vector<py::object> items;
+  items.reserve((size_t)cpu.get()->length());
+  tolist_fill(cpu, items);
+  py::list out(items.size());
+  for (size_t i = 0;  i < items.size();  i++) {
+    PyList_SET_ITEM(out.ptr(), (Py_ssize_t)i, items[i].release().ptr());
+  }
+  return std::move(out);
+}
+
+py::object
+tolist(const ak::Record& self) {
+  std::vector<py::object> items;
+  tolist_fill(self.array().get()->getitem_range_nowrap(self.at(),
+                                                       self.at() + 1),
+              items);
+  return items[0];
+}
+
 template <typename T>
 py::object
 getitem(const T& self, const py::object& obj) {
@@ -799,8 +1140,30 @@ getitem(const T& self, const py::object& obj) {
 
 ////////// ArrayBuilder
 
+ak::util::dtype
+builder_dtype(const py::handle& dtype) {
+  return ak::util::name_to_dtype(
+    py::module::import("numpy").attr("dtype")(dtype).attr("name")
+                               .cast<std::string>());
+}
+
 void
-builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
+builder_typedinteger(ak::ArrayBuilder& self,
+                     const py::handle& x,
+                     ak::util::dtype dtype) {
+  if (dtype == ak::util::dtype::uint64) {
+    self.typedinteger((int64_t)x.cast<uint64_t>(), dtype);
+  }
+  else {
+    self.typedinteger(x.cast<int64_t>(), dtype);
+  }
+}
+
+void
+builder_fromiter_typed(ak::ArrayBuilder& self,
+                       const py::handle& obj,
+                       const std::map<std::string, ak::util::dtype>& fields,
+                       ak::util::dtype dtype) {
   if (obj.is(py::none())) {
     self.null();
   }
@@ -808,10 +1171,25 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     self.boolean(obj.cast<bool>());
   }
   else if (py::isinstance<py::int_>(obj)) {
-    self.integer(obj.cast<int64_t>());
+    if (dtype == ak::util::dtype::NOT_PRIMITIVE) {
+      self.integer(obj.cast<int64_t>());
+    }
+    else {
+      builder_typedinteger(self, obj, dtype);
+    }
   }
   else if (py::isinstance<py::float_>(obj)) {
-    self.real(obj.cast<double>());
+    if (dtype == ak::util::dtype::NOT_PRIMITIVE) {
+      self.real(obj.cast<double>());
+    }
+    else {
+      self.typedreal(obj.cast<double>(), dtype);
+    }
+  }
+  else if (PyComplex_Check(obj.ptr())) {
+    self.typedcomplex(obj.cast<std::complex<double>>(),
+                      dtype == ak::util::dtype::NOT_PRIMITIVE
+                          ? ak::util::dtype::complex128 : dtype);
   }
   else if (py::isinstance<py::bytes>(obj)) {
     self.bytestring(obj.cast<std::string>());
@@ -824,7 +1202,7 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     self.begintuple(tup.size());
     for (size_t i = 0;  i < tup.size();  i++) {
       self.index((int64_t)i);
-      builder_fromiter(self, tup[i]);
+      builder_fromiter_typed(self, tup[i], fields, dtype);
     }
     self.endtuple();
   }
@@ -839,7 +1217,19 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
       }
       std::string key = pair.first.cast<std::string>();
       self.field_check(key.c_str());
-      builder_fromiter(self, pair.second);
+      if (fields.empty()) {
+        builder_fromiter_typed(self, pair.second, fields, dtype);
+      }
+      else {
+        // each field has its own dtype, which applies to everything in it
+        auto found = fields.find(key);
+        builder_fromiter_typed(self,
+                               pair.second,
+                               fields,
+                               found == fields.end()
+                                   ? ak::util::dtype::NOT_PRIMITIVE
+                                   : found->second);
+      }
     }
     self.endrecord();
   }
@@ -847,7 +1237,7 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     py::iterable seq = obj.cast<py::iterable>();
     self.beginlist();
     for (auto x : seq) {
-      builder_fromiter(self, x);
+      builder_fromiter_typed(self, x, fields, dtype);
     }
     self.endlist();
   }
@@ -855,7 +1245,7 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     py::iterable seq = obj.attr("tolist")().cast<py::iterable>();
     self.beginlist();
     for (auto x : seq) {
-      builder_fromiter(self, x);
+      builder_fromiter_typed(self, x, fields, dtype);
     }
     self.endlist();
   }
@@ -863,10 +1253,26 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     self.boolean(obj.cast<bool>());
   }
   else if (py::isinstance(obj, py::module::import("numpy").attr("integer"))) {
-    self.integer(obj.cast<int64_t>());
+    if (dtype == ak::util::dtype::NOT_PRIMITIVE) {
+      self.integer(obj.cast<int64_t>());
+    }
+    else {
+      builder_typedinteger(self, obj, dtype);
+    }
   }
   else if (py::isinstance(obj, py::module::import("numpy").attr("floating"))) {
-    self.real(obj.cast<double>());
+    if (dtype == ak::util::dtype::NOT_PRIMITIVE) {
+      self.real(obj.cast<double>());
+    }
+    else {
+      self.typedreal(obj.cast<double>(), dtype);
+    }
+  }
+  else if (py::isinstance(obj,
+                          py::module::import("numpy").attr("complexfloating"))) {
+    self.typedcomplex(obj.cast<std::complex<double>>(),
+                      dtype == ak::util::dtype::NOT_PRIMITIVE
+                          ? ak::util::dtype::complex128 : dtype);
   }
   else {
     throw std::invalid_argument(
@@ -877,12 +1283,34 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
   }
 }
 
+void
+builder_fromiter(ak::ArrayBuilder& self,
+                 const py::handle& obj,
+                 const py::object& dtype) {
+  std::map<std::string, ak::util::dtype> fields;
+  ak::util::dtype all = ak::util::dtype::NOT_PRIMITIVE;
+  if (py::isinstance<py::dict>(dtype)) {
+    for (auto pair : dtype.cast<py::dict>()) {
+      fields[pair.first.cast<std::string>()] = builder_dtype(pair.second);
+    }
+  }
+  else if (!dtype.is(py::none())) {
+    all = builder_dtype(dtype);
+  }
+  builder_fromiter_typed(self, obj, fields, all);
+}
+
 py::class_<ak::ArrayBuilder>
 make_ArrayBuilder(const py::handle& m, const std::string& name) {
   return (py::class_<ak::ArrayBuilder>(m, name.c_str())
-      .def(py::init([](int64_t initial, double resize) -> ak::ArrayBuilder {
-        return ak::ArrayBuilder(ak::ArrayBuilderOptions(initial, resize));
-      }), py::arg("initial") = 1024, py::arg("resize") = 1.5)
+      .def(py::init([](int64_t initial,
+                       double resize,
+                       int64_t page_length) -> ak::ArrayBuilder {
+        return ak::ArrayBuilder(
+          ak::ArrayBuilderOptions(initial, resize, page_length));
+      }), py::arg("initial") = 1024,
+          py::arg("resize") = 1.5,
+          py::arg("page_length") = 0)
       .def_property_readonly("_ptr",
                              [](const ak::ArrayBuilder* self) -> size_t {
         return reinterpret_cast<size_t>(self);
@@ -900,8 +1328,35 @@ make_ArrayBuilder(const py::handle& m, const std::string& name) {
       })
       .def("null", &ak::ArrayBuilder::null)
       .def("boolean", &ak::ArrayBuilder::boolean)
-      .def("integer", &ak::ArrayBuilder::integer)
-      .def("real", &ak::ArrayBuilder::real)
+      .def("integer",
+           [](ak::ArrayBuilder& self,
+              const py::object& x,
+              const py::object& dtype) -> void {
+        if (dtype.is(py::none())) {
+          self.integer(x.cast<int64_t>());
+        }
+        else {
+          builder_typedinteger(self, x, builder_dtype(dtype));
+        }
+      }, py::arg("x"), py::arg("dtype") = py::none())
+      .def("real",
+           [](ak::ArrayBuilder& self,
+              double x,
+              const py::object& dtype) -> void {
+        if (dtype.is(py::none())) {
+          self.real(x);
+        }
+        else {
+          self.typedreal(x, builder_dtype(dtype));
+        }
+      }, py::arg("x"), py::arg("dtype") = py::none())
+      .def("complex",
+           [](ak::ArrayBuilder& self,
+              std::complex<double> x,
+              const py::object& dtype) -> void {
+        self.typedcomplex(x, dtype.is(py::none()) ? ak::util::dtype::complex128
+                                                  : builder_dtype(dtype));
+      }, py::arg("x"), py::arg("dtype") = py::none())
       .def("bytestring",
            [](ak::ArrayBuilder& self, const py::bytes& x) -> void {
         self.bytestring(x.cast<std::string>());
@@ -936,10 +1391,19 @@ make_ArrayBuilder(const py::handle& m, const std::string& name) {
       })
       .def("extend",
            [](ak::ArrayBuilder& self,
-              const std::shared_ptr<ak::Content>& array) {
-        self.extend(array);
-      })
-      .def("fromiter", &builder_fromiter)
+              const std::shared_ptr<ak::Content>& array,
+              bool copy) {
+        if (copy) {
+          self.extend_copy(array);
+        }
+        else {
+          self.extend(array);
+        }
+      }, py::arg("array"), py::arg("copy") = false)
+      .def("fromiter",
+           &builder_fromiter,
+           py::arg("obj"),
+           py::arg("dtype") = py::none())
   );
 }
 
@@ -1090,6 +1554,19 @@ parameters2dict(const ak::util::Parameters& in) {
   return out;
 }
 
+/// @brief Reduces with the GIL released, so that other threads (such as
+/// those processing other partitions) can run at the same time.
+template <typename T>
+ak::ContentPtr
+reduce_nogil(const T& self,
+             const ak::Reducer& reducer,
+             int64_t axis,
+             bool mask,
+             bool keepdims) {
+  py::gil_scoped_release release;
+  return self.reduce(reducer, axis, mask, keepdims);
+}
+
 template <typename T>
 py::dict
 getparameters(const T& self) {
@@ -1190,15 +1667,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
             self.caches(out1);
             py::list out2(out1.size());
             for (size_t i = 0;  i < out1.size();  i++) {
-              if (std::shared_ptr<PyArrayCache> ptr =
-                  std::dynamic_pointer_cast<PyArrayCache>(out1[i])) {
-                out2[i] = py::cast(ptr);
-              }
-              else {
-                throw std::invalid_argument(
-                  std::string("VirtualArray's cache is not a Python MutableMapping")
-                  + FILENAME(__LINE__));
-              }
+              out2[i] = box_cache(out1[i]);
             }
             return out2;
           })
@@ -1218,6 +1687,9 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                py::arg("nan_string") = nullptr,
                py::arg("infinity_string") = nullptr,
                py::arg("minus_infinity_string") = nullptr)
+          .def("tolist", [](const T& self) -> py::object {
+            return tolist(self.shallow_copy());
+          })
           .def_property_readonly("nbytes", &T::nbytes)
           .def("deep_copy",
                &T::deep_copy,
@@ -1325,7 +1797,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerCount reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
              py::arg("keepdims") = false)
@@ -1333,7 +1805,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerCountNonzero reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
              py::arg("keepdims") = false)
@@ -1341,7 +1813,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerSum reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
                py::arg("keepdims") = false)
@@ -1349,7 +1821,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerProd reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
              py::arg("keepdims") = false)
@@ -1357,7 +1829,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerAny reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
              py::arg("keepdims") = false)
@@ -1365,7 +1837,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerAll reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
              py::arg("keepdims") = false)
@@ -1376,14 +1848,14 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                          const py::object& initial) -> py::object {
             if (initial.is(py::none())) {
               ak::ReducerMin reducer;
-              return box(self.reduce(reducer, axis, mask, keepdims));
+              return box(reduce_nogil(self, reducer, axis, mask, keepdims));
             }
             else {
               double initial_f64 = initial.cast<double>();
               uint64_t initial_u64 = (initial_f64 > 0 ? initial.cast<uint64_t>() : 0);
               int64_t initial_i64 = initial.cast<int64_t>();
               ak::ReducerMin reducer(initial_f64, initial_u64, initial_i64);
-              return box(self.reduce(reducer, axis, mask, keepdims));
+              return box(reduce_nogil(self, reducer, axis, mask, keepdims));
             }
           }, py::arg("axis") = -1,
              py::arg("mask") = true,
@@ -1396,14 +1868,14 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                          const py::object& initial) -> py::object {
             if (initial.is(py::none())) {
               ak::ReducerMax reducer;
-              return box(self.reduce(reducer, axis, mask, keepdims));
+              return box(reduce_nogil(self, reducer, axis, mask, keepdims));
             }
             else {
               double initial_f64 = initial.cast<double>();
               uint64_t initial_u64 = (initial_f64 > 0 ? initial.cast<uint64_t>() : 0);
               int64_t initial_i64 = initial.cast<int64_t>();
               ak::ReducerMax reducer(initial_f64, initial_u64, initial_i64);
-              return box(self.reduce(reducer, axis, mask, keepdims));
+              return box(reduce_nogil(self, reducer, axis, mask, keepdims));
             }
           }, py::arg("axis") = -1,
              py::arg("mask") = true,
@@ -1413,7 +1885,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerArgmin reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = true,
              py::arg("keepdims") = false)
@@ -1421,7 +1893,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerArgmax reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = true,
              py::arg("keepdims") = false)
@@ -1463,14 +1935,24 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                   int64_t axis,
                   bool ascending,
                   bool stable) -> py::object {
-               return box(self.sort(axis, ascending, stable));
+               ak::ContentPtr out;
+               {
+                 py::gil_scoped_release release;
+                 out = self.sort(axis, ascending, stable);
+               }
+               return box(out);
           })
           .def("argsort",
                [](const T& self,
                   int64_t axis,
                   bool ascending,
                   bool stable) -> py::object {
-               return box(self.argsort(axis, ascending, stable));
+               ak::ContentPtr out;
+               {
+                 py::gil_scoped_release release;
+                 out = self.argsort(axis, ascending, stable);
+               }
+               return box(out);
           })
           .def("numbers_to_type",
                [](const T& self,
@@ -1968,6 +2450,9 @@ make_NumpyArray(const py::handle& m, const std::string& name) {
 
       .def_property_readonly("iscontiguous", &ak::NumpyArray::iscontiguous)
       .def("contiguous", &ak::NumpyArray::contiguous)
+      .def("dictionary_encode", &ak::NumpyArray::dictionary_encode,
+           py::arg("starts"),
+           py::arg("stops"))
       .def("simplify", [](const ak::NumpyArray& self) {
         return box(self.shallow_simplify());
       })
@@ -2049,18 +2534,13 @@ make_Record(const py::handle& m, const std::string& name) {
         self.caches(out1);
         py::list out2(out1.size());
         for (size_t i = 0;  i < out1.size();  i++) {
-          if (std::shared_ptr<PyArrayCache> ptr =
-              std::dynamic_pointer_cast<PyArrayCache>(out1[i])) {
-            out2[i] = py::cast(ptr);
-          }
-          else {
-            throw std::invalid_argument(
-              std::string("VirtualArray's cache is not a Python MutableMapping")
-              + FILENAME(__LINE__));
-          }
+          out2[i] = box_cache(out1[i]);
         }
         return out2;
       })
+      .def("tolist", [](const ak::Record& self) -> py::object {
+        return tolist(self);
+      })
       .def("tojson",
            &tojson_string<ak::Record>,
            py::arg("pretty") = false,
@@ -2273,6 +2753,13 @@ make_RecordArray(const py::handle& m, const std::string& name) {
         }
       }, py::arg("where"), py::arg("what"))
 
+      .def("argsort_by", &ak::RecordArray::argsort_by,
+           py::arg("offsets"),
+           py::arg("keys"),
+           py::arg("ascending"),
+           py::arg("stable") = true,
+           py::arg("local") = true)
+
       .def("field",
            [](const ak::RecordArray& self, int64_t fieldindex)
            -> std::shared_ptr<ak::Content> {
@@ -2442,17 +2929,7 @@ make_VirtualArray(const py::handle& m, const std::string& name) {
                           "SliceGenerator") + FILENAME(__LINE__));
           }
         }
-        std::shared_ptr<PyArrayCache> cppcache(nullptr);
-        if (!cache.is(py::none())) {
-          try {
-            cppcache = cache.cast<std::shared_ptr<PyArrayCache>>();
-          }
-          catch (py::cast_error err) {
-            throw std::invalid_argument(
-              std::string("VirtualArray 'cache' must be an ArrayCache or None")
-              + FILENAME(__LINE__));
-          }
-        }
+        ak::ArrayCachePtr cppcache = unbox_cache(cache);
         if (!cache_key.is(py::none())) {
           std::string cppcache_key;
           try {
@@ -2501,19 +2978,7 @@ make_VirtualArray(const py::handle& m, const std::string& name) {
       })
       .def_property_readonly("cache", [](const ak::VirtualArray& self)
                                       -> py::object {
-        std::shared_ptr<ak::ArrayCache> cache = self.cache();
-        if (cache.get() == nullptr) {
-          return py::none();
-        }
-        if (std::shared_ptr<PyArrayCache> ptr =
-               std::dynamic_pointer_cast<PyArrayCache>(cache)) {
-          return py::cast(ptr);
-        }
-        else {
-          throw std::invalid_argument(
-            std::string("VirtualArray's cache is not a Python MutableMapping")
-            + FILENAME(__LINE__));
-        }
+        return box_cache(self.cache());
       })
       .def_property_readonly("peek_array", [](const ak::VirtualArray& self)
                                            -> py::object {
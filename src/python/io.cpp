@@ -18,6 +18,21 @@ namespace ak = awkward;
 
 ////////// fromjson
 
+ak::FormPtr
+fromjson_form(const py::object& form) {
+  if (form.is(py::none())) {
+    return ak::FormPtr(nullptr);
+  }
+  try {
+    return form.cast<ak::Form*>()->shallow_copy();
+  }
+  catch (py::cast_error err) {
+    throw std::invalid_argument(
+      std::string("JSON 'form' must be an ak.forms.Form or None")
+      + FILENAME(__LINE__));
+  }
+}
+
 void
 make_fromjson(py::module& m, const std::string& name) {
   m.def(name.c_str(),
@@ -27,12 +42,15 @@ make_fromjson(py::module& m, const std::string& name) {
            const char* minus_infinity_string,
            int64_t initial,
            double resize,
-           int64_t buffersize) -> py::object {
+           int64_t page_length,
+           int64_t buffersize,
+           const py::object& form) -> py::object {
     ak::ContentPtr out = ak::FromJsonString(source.c_str(),
-                                            ak::ArrayBuilderOptions(initial, resize),
+                                            ak::ArrayBuilderOptions(initial, resize, page_length),
                                             nan_string,
                                             infinity_string,
-                                            minus_infinity_string);
+                                            minus_infinity_string,
+                                            fromjson_form(form));
     return box(out);
   }, py::arg("source"),
      py::arg("nan_string") = nullptr,
@@ -40,7 +58,9 @@ make_fromjson(py::module& m, const std::string& name) {
      py::arg("minus_infinity_string") = nullptr,
      py::arg("initial") = 1024,
      py::arg("resize") = 1.5,
-     py::arg("buffersize") = 65536);
+     py::arg("page_length") = 0,
+     py::arg("buffersize") = 65536,
+     py::arg("form") = py::none());
 }
 
 void
@@ -52,7 +72,9 @@ make_fromjsonfile(py::module& m, const std::string& name) {
            const char* minus_infinity_string,
            int64_t initial,
            double resize,
-           int64_t buffersize) -> py::object {
+           int64_t page_length,
+           int64_t buffersize,
+           const py::object& form) -> py::object {
 #ifdef _MSC_VER
       FILE* file;
       if (fopen_s(&file, source.c_str(), "rb") != 0) {
@@ -68,11 +90,12 @@ make_fromjsonfile(py::module& m, const std::string& name) {
       std::shared_ptr<ak::Content> out(nullptr);
       try {
         out = FromJsonFile(file,
-                           ak::ArrayBuilderOptions(initial, resize),
+                           ak::ArrayBuilderOptions(initial, resize, page_length),
                            buffersize,
                            nan_string,
                            infinity_string,
-                           minus_infinity_string);
+                           minus_infinity_string,
+                           fromjson_form(form));
       }
       catch (...) {
         fclose(file);
@@ -86,7 +109,137 @@ make_fromjsonfile(py::module& m, const std::string& name) {
      py::arg("minus_infinity_string") = nullptr,
      py::arg("initial") = 1024,
      py::arg("resize") = 1.5,
-     py::arg("buffersize") = 65536);
+     py::arg("page_length") = 0,
+     py::arg("buffersize") = 65536,
+     py::arg("form") = py::none());
+}
+
+////////// FromJsonFileChunks
+
+/// @brief Owns the file handle that an ak::FromJsonFileChunks reads from.
+class PyFromJsonFileChunks {
+public:
+  PyFromJsonFileChunks(const std::string& source,
+                       const char* nan_string,
+                       const char* infinity_string,
+                       const char* minus_infinity_string,
+                       int64_t initial,
+                       double resize,
+                       int64_t page_length,
+                       int64_t buffersize,
+                       const py::object& form)
+      : nan_string_(nan_string == nullptr ? "" : nan_string)
+      , infinity_string_(infinity_string == nullptr ? "" : infinity_string)
+      , minus_infinity_string_(minus_infinity_string == nullptr
+                               ? "" : minus_infinity_string) {
+    // convert the form before opening the file, so that a bad form can't
+    // leak the file handle
+    ak::FormPtr cppform = fromjson_form(form);
+#ifdef _MSC_VER
+    if (fopen_s(&file_, source.c_str(), "rb") != 0) {
+#else
+    file_ = fopen(source.c_str(), "rb");
+    if (file_ == nullptr) {
+#endif
+      throw std::invalid_argument(
+        std::string("file \"") + source
+        + std::string("\" could not be opened for reading")
+        + FILENAME(__LINE__));
+    }
+    // the strings are copied because the reader keeps pointers to them
+    try {
+      chunks_ = std::make_shared<ak::FromJsonFileChunks>(
+        file_,
+        ak::ArrayBuilderOptions(initial, resize, page_length),
+        buffersize,
+        nan_string == nullptr ? nullptr : nan_string_.c_str(),
+        infinity_string == nullptr ? nullptr : infinity_string_.c_str(),
+        minus_infinity_string == nullptr ? nullptr
+                                         : minus_infinity_string_.c_str(),
+        cppform);
+    }
+    catch (...) {
+      // the destructor does not run if the constructor throws
+      fclose(file_);
+      file_ = nullptr;
+      throw;
+    }
+  }
+
+  ~PyFromJsonFileChunks() {
+    close();
+  }
+
+  py::object
+  next(int64_t maxentries, int64_t maxbytes) {
+    check_open();
+    ak::ContentPtr out = chunks_.get()->next(maxentries, maxbytes);
+    if (out.get() == nullptr) {
+      return py::none();
+    }
+    return box(out);
+  }
+
+  int64_t
+  tell() const {
+    check_open();
+    return chunks_.get()->tell();
+  }
+
+  void
+  close() {
+    if (file_ != nullptr) {
+      chunks_ = std::shared_ptr<ak::FromJsonFileChunks>(nullptr);
+      fclose(file_);
+      file_ = nullptr;
+    }
+  }
+
+private:
+  void
+  check_open() const {
+    if (file_ == nullptr) {
+      throw std::invalid_argument(
+        std::string("FromJsonFileChunks is closed")
+        + FILENAME(__LINE__));
+    }
+  }
+
+  FILE* file_;
+  std::shared_ptr<ak::FromJsonFileChunks> chunks_;
+  const std::string nan_string_;
+  const std::string infinity_string_;
+  const std::string minus_infinity_string_;
+};
+
+void
+make_fromjsonfilechunks(py::module& m, const std::string& name) {
+  py::class_<PyFromJsonFileChunks>(m, name.c_str())
+      .def(py::init<const std::string&,
+                    const char*,
+                    const char*,
+                    const char*,
+                    int64_t,
+                    double,
+                    int64_t,
+                    int64_t,
+                    const py::object&>(),
+           py::arg("source"),
+           py::arg("nan_string") = nullptr,
+           py::arg("infinity_string") = nullptr,
+           py::arg("minus_infinity_string") = nullptr,
+           py::arg("initial") = 1024,
+           py::arg("resize") = 1.5,
+           py::arg("page_length") = 0,
+           py::arg("buffersize") = 65536,
+           py::arg("form") = py::none())
+      .def("next",
+           &PyFromJsonFileChunks::next,
+           py::arg("maxentries") = -1,
+           py::arg("maxbytes") = -1)
+      .def("tell", &PyFromJsonFileChunks::tell)
+      .def("close", &PyFromJsonFileChunks::close)
+  ;
 }
 
 ////////// Uproot connector
@@ -5,6 +5,7 @@
 #include <sstream>
 
 #include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
 
 #include "awkward/python/content.h"
 
@@ -16,11 +17,13 @@ PyArrayGenerator::PyArrayGenerator(const ak::FormPtr& form,
                                    int64_t length,
                                    const py::object& callable,
                                    const py::tuple& args,
-                                   const py::dict& kwargs)
+                                   const py::dict& kwargs,
+                                   bool accepts_range)
     : ArrayGenerator(form, length)
     , callable_(callable)
     , args_(args)
-    , kwargs_(kwargs) { }
+    , kwargs_(kwargs)
+    , accepts_range_(accepts_range) { }
 
 const py::object
 PyArrayGenerator::callable() const {
@@ -39,12 +42,35 @@ PyArrayGenerator::kwargs() const {
 
 const ak::ContentPtr
 PyArrayGenerator::generate() const {
+  // may be called by C++ code that has released the GIL
+  py::gil_scoped_acquire acquire;
   py::object out = callable_(*args_, **kwargs_);
   py::object layout = py::module::import("awkward").attr("to_layout")(
                                         out, py::cast(false), py::cast(false));
   return unbox_content(layout);
 }
 
+bool
+PyArrayGenerator::accepts_range() const {
+  return accepts_range_;
+}
+
+const ak::ContentPtr
+PyArrayGenerator::generate_range(int64_t start, int64_t stop) const {
+  if (!accepts_range_) {
+    return ArrayGenerator::generate_range(start, stop);
+  }
+  // may be called by C++ code that has released the GIL
+  py::gil_scoped_acquire acquire;
+  py::dict kwargs(kwargs_.attr("copy")());
+  kwargs["start"] = py::cast(start);
+  kwargs["stop"] = py::cast(stop);
+  py::object out = callable_(*args_, **kwargs);
+  py::object layout = py::module::import("awkward").attr("to_layout")(
+                                        out, py::cast(false), py::cast(false));
+  return unbox_content(layout);
+}
+
 const std::string
 PyArrayGenerator::tostring_part(const std::string& indent,
                                 const std::string& pre,
@@ -59,6 +85,9 @@ PyArrayGenerator::tostring_part(const std::string& indent,
     out << " kwargs=\"" << kwargs_.attr("__repr__")().cast<std::string>()
         << "\"";
   }
+  if (accepts_range_) {
+    out << " accepts_range=\"true\"";
+  }
   if (form_.get() == nullptr  &&  length_ < 0) {
     out << "/>";
   }
@@ -91,7 +120,8 @@ PyArrayGenerator::shallow_copy() const {
                                             length_,
                                             callable_,
                                             args_,
-                                            kwargs_);
+                                            kwargs_,
+                                            accepts_range_);
 }
 
 const std::shared_ptr<ak::ArrayGenerator>
@@ -100,7 +130,8 @@ PyArrayGenerator::with_form(const std::shared_ptr<ak::Form>& form) const {
                                             length_,
                                             callable_,
                                             args_,
-                                            kwargs_);
+                                            kwargs_,
+                                            accepts_range_);
 }
 
 const std::shared_ptr<ak::ArrayGenerator>
@@ -109,7 +140,8 @@ PyArrayGenerator::with_length(int64_t length) const {
                                             length,
                                             callable_,
                                             args_,
-                                            kwargs_);
+                                            kwargs_,
+                                            accepts_range_);
 }
 
 
@@ -119,7 +151,8 @@ PyArrayGenerator::with_callable(const py::object& callable) const {
                                             length_,
                                             callable,
                                             args_,
-                                            kwargs_);
+                                            kwargs_,
+                                            accepts_range_);
 }
 
 const std::shared_ptr<ak::ArrayGenerator>
@@ -128,7 +161,8 @@ PyArrayGenerator::with_args(const py::tuple& args) const {
                                             length_,
                                             callable_,
                                             args,
-                                            kwargs_);
+                                            kwargs_,
+                                            accepts_range_);
 }
 
 const std::shared_ptr<ak::ArrayGenerator>
@@ -137,7 +171,8 @@ PyArrayGenerator::with_kwargs(const py::dict& kwargs) const {
                                             length_,
                                             callable_,
                                             args_,
-                                            kwargs);
+                                            kwargs,
+                                            accepts_range_);
 }
 
 bool
@@ -169,7 +204,8 @@ PyArrayGenerator::referentially_equal(const ak::ArrayGeneratorPtr& other) const
   if (PyArrayGenerator* raw = dynamic_cast<PyArrayGenerator*>(other.get())) {
     return callable_.is(raw->callable())  &&
            args_.is(raw->args())  &&
-           kwargs_.is(raw->kwargs());
+           kwargs_.is(raw->kwargs())  &&
+           accepts_range_ == raw->accepts_range();
   }
   else {
     return false;
@@ -184,7 +220,8 @@ make_PyArrayGenerator(const py::handle& m, const std::string& name) {
                        const py::tuple& args,
                        const py::dict& kwargs,
                        const py::object& form,
-                       const py::object& length) -> PyArrayGenerator {
+                       const py::object& length,
+                       bool accepts_range) -> PyArrayGenerator {
         ak::FormPtr cppform(nullptr);
         if (!form.is(py::none())) {
           try {
@@ -207,15 +244,22 @@ make_PyArrayGenerator(const py::handle& m, const std::string& name) {
               + FILENAME(__LINE__));
           }
         }
-        return PyArrayGenerator(cppform, cpplength, callable, args, kwargs);
+        return PyArrayGenerator(cppform,
+                                cpplength,
+                                callable,
+                                args,
+                                kwargs,
+                                accepts_range);
       }), py::arg("callable")
         , py::arg("args") = py::tuple(0)
         , py::arg("kwargs") = py::dict()
         , py::arg("form") = py::none()
-        , py::arg("length") = py::none())
+        , py::arg("length") = py::none()
+        , py::arg("accepts_range") = false)
       .def_property_readonly("callable", &PyArrayGenerator::callable)
       .def_property_readonly("args", &PyArrayGenerator::args)
       .def_property_readonly("kwargs", &PyArrayGenerator::kwargs)
+      .def_property_readonly("accepts_range", &PyArrayGenerator::accepts_range)
       .def_property_readonly("form", [](const PyArrayGenerator& self)
                                      -> py::object {
         ak::FormPtr form = self.form();
@@ -360,6 +404,7 @@ PyArrayCache::PyArrayCache(const py::object& mutablemapping)
 
 bool
 PyArrayCache::is_broken() const {
+  py::gil_scoped_acquire acquire;
   if (mutablemapping_.is(py::none())) {
     return false;
   }
@@ -386,6 +431,7 @@ PyArrayCache::mutablemapping() const {
 
 ak::ContentPtr
 PyArrayCache::get(const std::string& key) const {
+  py::gil_scoped_acquire acquire;
   py::str pykey(PyUnicode_DecodeUTF8(key.data(),
                                      key.length(),
                                      "surrogateescape"));
@@ -401,6 +447,7 @@ PyArrayCache::get(const std::string& key) const {
 
 void
 PyArrayCache::set(const std::string& key, const ak::ContentPtr& value) {
+  py::gil_scoped_acquire acquire;
   py::str pykey(PyUnicode_DecodeUTF8(key.data(),
                                      key.length(),
                                      "surrogateescape"));
@@ -466,3 +513,145 @@ make_PyArrayCache(const py::handle& m, const std::string& name) {
 
   );
 }
+
+////////// BoundedArrayCache
+
+py::class_<ak::BoundedArrayCache, std::shared_ptr<ak::BoundedArrayCache>>
+make_BoundedArrayCache(const py::handle& m, const std::string& name) {
+  return (py::class_<ak::BoundedArrayCache,
+                     std::shared_ptr<ak::BoundedArrayCache>>(m, name.c_str())
+      .def(py::init([](int64_t limit_bytes, const std::string& policy)
+                    -> std::shared_ptr<ak::BoundedArrayCache> {
+        return std::make_shared<ak::BoundedArrayCache>(
+          limit_bytes, ak::BoundedArrayCache::policy_from_name(policy));
+      }), py::arg("limit_bytes"), py::arg("policy") = "lru")
+      .def_property_readonly("is_broken", &ak::BoundedArrayCache::is_broken)
+      .def_property_readonly("limit_bytes",
+                             &ak::BoundedArrayCache::limit_bytes)
+      .def_property_readonly("policy", &ak::BoundedArrayCache::policy_name)
+      .def_property_readonly("nbytes", &ak::BoundedArrayCache::nbytes)
+      .def_property_readonly("hits", &ak::BoundedArrayCache::hits)
+      .def_property_readonly("misses", &ak::BoundedArrayCache::misses)
+      .def_property_readonly("evictions", &ak::BoundedArrayCache::evictions)
+      .def("keys", &ak::BoundedArrayCache::keys)
+      .def("clear", &ak::BoundedArrayCache::clear)
+      .def("__repr__", [](const ak::BoundedArrayCache& self) -> std::string {
+        return self.tostring_part("", "", "");
+      })
+      .def("__getitem__", [](const ak::BoundedArrayCache& self,
+                             const std::string& key) -> py::object {
+        ak::ContentPtr out = self.get(key);
+        if (out.get() == nullptr) {
+          throw py::key_error(key);
+        }
+        return box(out);
+      })
+      .def("__setitem__", [](ak::BoundedArrayCache& self,
+                             const std::string& key,
+                             const py::object& value) -> void {
+        self.set(key, unbox_content(value));
+      })
+      .def("__delitem__", [](ak::BoundedArrayCache& self,
+                             const std::string& key) -> void {
+        if (!self.remove(key)) {
+          throw py::key_error(key);
+        }
+      })
+      .def("__contains__", &ak::BoundedArrayCache::contains)
+      .def("__iter__", [](const ak::BoundedArrayCache& self) -> py::object {
+        return py::iter(py::cast(self.keys()));
+      })
+      .def("__len__", &ak::BoundedArrayCache::length)
+  );
+}
+
+////////// VirtualArrayRecorder
+
+py::class_<ak::VirtualArrayRecorder, std::shared_ptr<ak::VirtualArrayRecorder>>
+make_VirtualArrayRecorder(const py::handle& m, const std::string& name) {
+  return (py::class_<ak::VirtualArrayRecorder,
+                     std::shared_ptr<ak::VirtualArrayRecorder>>(m, name.c_str())
+      .def(py::init([]() -> std::shared_ptr<ak::VirtualArrayRecorder> {
+        return std::make_shared<ak::VirtualArrayRecorder>();
+      }))
+      .def_property_readonly("active", &ak::VirtualArrayRecorder::active)
+      .def("start", [](const std::shared_ptr<ak::VirtualArrayRecorder>& self)
+                    -> void {
+        ak::VirtualArrayRecorder::start(self);
+      })
+      .def("stop", [](const std::shared_ptr<ak::VirtualArrayRecorder>& self)
+                   -> void {
+        ak::VirtualArrayRecorder::stop(self);
+      })
+      .def("__enter__", [](const std::shared_ptr<ak::VirtualArrayRecorder>& self)
+                        -> std::shared_ptr<ak::VirtualArrayRecorder> {
+        ak::VirtualArrayRecorder::start(self);
+        return self;
+      })
+      .def("__exit__", [](const std::shared_ptr<ak::VirtualArrayRecorder>& self,
+                          const py::object& exc_type,
+                          const py::object& exc_value,
+                          const py::object& traceback) -> void {
+        ak::VirtualArrayRecorder::stop(self);
+      })
+      .def("clear", &ak::VirtualArrayRecorder::clear)
+      .def("entries", [](const ak::VirtualArrayRecorder& self) -> py::dict {
+        py::dict out;
+        for (auto pair : self.entries()) {
+          py::dict entry;
+          entry["hits"] = py::cast(pair.second.hits);
+          entry["generated"] = py::cast(pair.second.generated);
+          entry["seconds"] = py::cast(pair.second.seconds);
+          entry["nbytes"] = py::cast(pair.second.nbytes);
+          out[py::str(pair.first)] = entry;
+        }
+        return out;
+      })
+      .def("__repr__", [](const ak::VirtualArrayRecorder& self) -> std::string {
+        std::stringstream out;
+        out << "<VirtualArrayRecorder active=\""
+            << (self.active() ? "true" : "false") << "\" keys=\""
+            << self.entries().size() << "\"/>";
+        return out.str();
+      })
+  );
+}
+
+py::object
+box_cache(const ak::ArrayCachePtr& cache) {
+  if (cache.get() == nullptr) {
+    return py::none();
+  }
+  else if (std::shared_ptr<PyArrayCache> ptr =
+           std::dynamic_pointer_cast<PyArrayCache>(cache)) {
+    return py::cast(ptr);
+  }
+  else if (std::shared_ptr<ak::BoundedArrayCache> ptr =
+           std::dynamic_pointer_cast<ak::BoundedArrayCache>(cache)) {
+    return py::cast(ptr);
+  }
+  else {
+    throw std::invalid_argument(
+      std::string("VirtualArray's cache is not an ArrayCache or a "
+                  "BoundedArrayCache") + FILENAME(__LINE__));
+  }
+}
+
+ak::ArrayCachePtr
+unbox_cache(const py::object& cache) {
+  if (cache.is(py::none())) {
+    return ak::ArrayCachePtr(nullptr);
+  }
+  try {
+    return cache.cast<std::shared_ptr<PyArrayCache>>();
+  }
+  catch (py::cast_error err) { }
+  try {
+    return cache.cast<std::shared_ptr<ak::BoundedArrayCache>>();
+  }
+  catch (py::cast_error err) {
+    throw std::invalid_argument(
+      std::string("VirtualArray 'cache' must be an ArrayCache, a "
+                  "BoundedArrayCache, or None") + FILENAME(__LINE__));
+  }
+}
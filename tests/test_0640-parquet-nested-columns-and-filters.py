@@ -0,0 +1,95 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+def write_events(tmp_path):
+    array = ak.Array(
+        [
+            {"run": 1, "jets": [{"pt": 1.1, "eta": 0.1}, {"pt": 2.2, "eta": 0.2}]},
+            {"run": 2, "jets": []},
+            {"run": 3, "jets": [{"pt": 3.3, "eta": 0.3}]},
+            {"run": 4, "jets": [{"pt": 4.4, "eta": 0.4}, {"pt": 5.5, "eta": 0.5}]},
+            {"run": 5, "jets": [{"pt": 6.6, "eta": 0.6}]},
+            {"run": 6, "jets": []},
+        ]
+    )
+    filename = os.path.join(tmp_path, "events.parquet")
+    ak.to_parquet(ak.repartition(array, 2), filename)
+    return array, filename
+
+
+def test_nested_columns(tmp_path):
+    array, filename = write_events(tmp_path)
+
+    for lazy in (False, True):
+        out = ak.from_parquet(filename, columns=["jets.pt"], lazy=lazy)
+        assert out.fields == ["jets"]
+        assert ak.fields(out.jets) == ["pt"]
+        assert out.jets.pt.tolist() == array.jets.pt.tolist()
+
+        out = ak.from_parquet(filename, columns=["run", "jets.eta"], lazy=lazy)
+        assert set(out.fields) == set(["run", "jets"])
+        assert ak.fields(out.jets) == ["eta"]
+        assert out.run.tolist() == array.run.tolist()
+        assert out.jets.eta.tolist() == array.jets.eta.tolist()
+
+        out = ak.from_parquet(filename, columns=["jets.pt", "jets"], lazy=lazy)
+        assert set(ak.fields(out.jets)) == set(["pt", "eta"])
+
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, columns=["jets.phi"])
+
+
+def test_row_groups(tmp_path):
+    array, filename = write_events(tmp_path)
+
+    for lazy in (False, True):
+        assert ak.from_parquet(
+            filename, row_groups=[0, 2], lazy=lazy
+        ).run.tolist() == [1, 2, 5, 6]
+        assert ak.from_parquet(filename, row_groups=1, lazy=lazy).run.tolist() == [
+            3,
+            4,
+        ]
+
+
+def test_filters(tmp_path):
+    array, filename = write_events(tmp_path)
+
+    for lazy in (False, True):
+        out = ak.from_parquet(filename, filters=[("run", ">", 2)], lazy=lazy)
+        assert out.run.tolist() == [3, 4, 5, 6]
+
+        out = ak.from_parquet(
+            filename, filters=[("run", ">", 2), ("run", "<", 5)], lazy=lazy
+        )
+        assert out.run.tolist() == [3, 4]
+
+        out = ak.from_parquet(
+            filename,
+            filters=[[("run", "==", 1)], [("run", "in", [6, 7])]],
+            lazy=lazy,
+        )
+        assert out.run.tolist() == [1, 2, 5, 6]
+
+        out = ak.from_parquet(
+            filename, columns=["jets.pt"], filters=[("jets.pt", ">=", 6)], lazy=lazy
+        )
+        assert out.jets.pt.tolist() == [[6.6], []]
+
+        out = ak.from_parquet(filename, filters=[("run", ">", 100)], lazy=lazy)
+        assert len(out) == 0
+
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, filters=[("jets", ">", 2)])
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, filters=[("run", "~", 2)])
@@ -0,0 +1,96 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+def write_dataset(tmp_path):
+    array = ak.Array(
+        [
+            {"x": 1, "y": [1.1]},
+            {"x": 2, "y": []},
+            {"x": 3, "y": [3.3, 3.3]},
+            {"x": 4, "y": [4.4]},
+            {"x": 5, "y": []},
+            {"x": 6, "y": [6.6, 6.6, 6.6]},
+            {"x": 7, "y": [7.7]},
+        ]
+    )
+    os.mkdir(os.path.join(tmp_path, "sub"))
+    ak.to_parquet(array[:2], os.path.join(tmp_path, "part0.parquet"))
+    ak.to_parquet(
+        ak.repartition(array[2:5], 2), os.path.join(tmp_path, "part1.parquet")
+    )
+    ak.to_parquet(array[5:], os.path.join(tmp_path, "sub", "part2.parquet"))
+    return array
+
+
+def test_directory(tmp_path):
+    array = write_dataset(tmp_path)
+
+    out = ak.from_parquet(tmp_path)
+    assert out.tolist() == array.tolist()
+
+    out = ak.from_parquet(tmp_path, lazy=True)
+    assert isinstance(out.layout, ak.partition.PartitionedArray)
+    assert out.layout.lengths == [2, 2, 1, 2]
+    assert out.tolist() == array.tolist()
+
+
+def test_glob_and_list(tmp_path):
+    array = write_dataset(tmp_path)
+
+    out = ak.from_parquet(os.path.join(tmp_path, "part*.parquet"), lazy=True)
+    assert out.x.tolist() == [1, 2, 3, 4, 5]
+
+    out = ak.from_parquet(
+        [
+            os.path.join(tmp_path, "sub", "part2.parquet"),
+            os.path.join(tmp_path, "part0.parquet"),
+        ]
+    )
+    assert out.x.tolist() == [6, 7, 1, 2]
+
+
+def test_metadata_index(tmp_path):
+    array = write_dataset(tmp_path)
+    ak.to_parquet.dataset(tmp_path)
+    assert os.path.exists(os.path.join(tmp_path, "_metadata"))
+    assert os.path.exists(os.path.join(tmp_path, "_common_metadata"))
+
+    for lazy in (False, True):
+        out = ak.from_parquet(tmp_path, lazy=lazy)
+        assert out.tolist() == array.tolist()
+
+        out = ak.from_parquet(tmp_path, row_groups=[1, 3], lazy=lazy)
+        assert out.x.tolist() == [3, 4, 6, 7]
+
+        out = ak.from_parquet(
+            tmp_path, columns=["y"], filters=[("x", ">=", 5)], lazy=lazy
+        )
+        assert out.y.tolist() == [[], [6.6, 6.6, 6.6], [7.7]]
+
+    # the index alone determines the partitions, without opening the files
+    os.rename(
+        os.path.join(tmp_path, "part1.parquet"), os.path.join(tmp_path, "moved")
+    )
+    out = ak.from_parquet(tmp_path, lazy=True)
+    assert out.layout.lengths == [2, 2, 1, 2]
+    assert out[-2:].x.tolist() == [6, 7]
+
+
+def test_errors(tmp_path):
+    write_dataset(tmp_path)
+    ak.to_parquet(ak.Array([1, 2, 3]), os.path.join(tmp_path, "other.parquet"))
+
+    with pytest.raises(ValueError):
+        ak.from_parquet(tmp_path)
+    with pytest.raises(ValueError):
+        ak.from_parquet(os.path.join(tmp_path, "nothing*.parquet"))
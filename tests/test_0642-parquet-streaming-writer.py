@@ -0,0 +1,97 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+def generate(n):
+    for i in range(n):
+        yield ak.Array([{"x": i, "y": [float(i)] * (i % 3)}])
+
+
+def row_group_lengths(filename):
+    metadata = pyarrow_parquet.ParquetFile(filename).metadata
+    return [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+
+
+def test_iterator(tmp_path):
+    filename = os.path.join(tmp_path, "generated.parquet")
+    expected = ak.concatenate(list(generate(10))).tolist()
+
+    ak.to_parquet(generate(10), filename)
+    assert row_group_lengths(filename) == [1] * 10
+    assert ak.from_parquet(filename).tolist() == expected
+
+    ak.to_parquet(generate(10), filename, row_group_size=4)
+    assert row_group_lengths(filename) == [4, 4, 2]
+    assert ak.from_parquet(filename).tolist() == expected
+
+    with pytest.raises(ValueError):
+        ak.to_parquet(generate(0), filename)
+
+
+def test_split_partitions(tmp_path):
+    filename = os.path.join(tmp_path, "split.parquet")
+    array = ak.repartition(ak.Array([[1, 2, 3], [], [4, 5]] * 5), 6)
+
+    ak.to_parquet(array, filename, row_group_size=4)
+    assert row_group_lengths(filename) == [4, 4, 4, 3]
+    assert ak.from_parquet(filename).tolist() == array.tolist()
+
+
+def test_row_group_bytes(tmp_path):
+    filename = os.path.join(tmp_path, "bytes.parquet")
+    array = ak.Array(np.arange(1000, dtype=np.int64))
+
+    ak.to_parquet(array, filename, row_group_bytes=800)
+    assert row_group_lengths(filename) == [100] * 10
+
+    ak.to_parquet(array, filename, row_group_bytes=800, row_group_size=50)
+    assert row_group_lengths(filename) == [50] * 20
+
+
+def test_writer(tmp_path):
+    filename = os.path.join(tmp_path, "writer.parquet")
+
+    with ak.to_parquet.writer(filename, row_group_size=3) as writer:
+        writer.write(ak.Array([1, None]))
+        writer.write(ak.Array([3, 4]))
+        writer.write(ak.Array([None, 6]))
+        assert writer.num_entries == 6
+    assert row_group_lengths(filename) == [3, 3]
+    assert ak.from_parquet(filename).tolist() == [1, None, 3, 4, None, 6]
+
+    with pytest.raises(ValueError):
+        writer.write(ak.Array([7]))
+
+    with ak.to_parquet.writer(filename) as writer:
+        writer.write(ak.Array([1, 2]))
+        with pytest.raises(ValueError):
+            writer.write(ak.Array([[1, 2]]))
+        with pytest.raises(ValueError):
+            writer.write(ak.Array([None, 3]))
+
+
+def test_column_options(tmp_path):
+    filename = os.path.join(tmp_path, "options.parquet")
+    array = ak.Array(
+        [{"x": 1, "jets": [{"pt": 1.1, "eta": 2.2}]}, {"x": 2, "jets": []}]
+    )
+
+    ak.to_parquet(
+        array,
+        filename,
+        compression={"x": "gzip", "jets.pt": "zstd", "jets.eta": "none"},
+        use_dictionary=["jets.pt"],
+    )
+    metadata = pyarrow_parquet.ParquetFile(filename).metadata.row_group(0)
+    compression = [metadata.column(i).compression for i in range(3)]
+    assert compression == ["GZIP", "ZSTD", "UNCOMPRESSED"]
+    assert ak.from_parquet(filename).tolist() == array.tolist()
@@ -0,0 +1,103 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_lists():
+    content = ak.layout.NumpyArray(np.array([1.1, 2.2, 3.3, 4.4, 5.5, 6.6]))
+    offsets = ak.layout.Index64(np.array([0, 3, 3, 5, 6]))
+    listoffsetarray = ak.layout.ListOffsetArray64(offsets, content)
+    assert listoffsetarray.tolist() == [[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6]]
+    assert listoffsetarray[1:].tolist() == [[], [4.4, 5.5], [6.6]]
+
+    starts = ak.layout.Index32(np.array([4, 0, 3], np.int32))
+    stops = ak.layout.Index32(np.array([6, 2, 3], np.int32))
+    listarray = ak.layout.ListArray32(starts, stops, content)
+    assert listarray.tolist() == [[5.5, 6.6], [1.1, 2.2], []]
+
+    regulararray = ak.layout.RegularArray(content, 2)
+    assert regulararray.tolist() == [[1.1, 2.2], [3.3, 4.4], [5.5, 6.6]]
+    assert regulararray[1:].tolist() == [[3.3, 4.4], [5.5, 6.6]]
+
+    assert ak.layout.NumpyArray(np.arange(6).reshape(3, 2)).tolist() == [
+        [0, 1],
+        [2, 3],
+        [4, 5],
+    ]
+    assert ak.layout.EmptyArray().tolist() == []
+
+
+def test_strings():
+    array = ak.Array(["one", "two", "", "thréé"])
+    assert array.layout.tolist() == ["one", "two", "", "thréé"]
+    assert ak.to_list(array[[3, 0]]) == ["thréé", "one"]
+
+    array = ak.Array([b"one", b"\xff\x00", b""])
+    assert array.layout.tolist() == [b"one", b"\xff\x00", b""]
+
+    array = ak.Array([["one", "two"], [], ["three"]])
+    assert array.layout.tolist() == [["one", "two"], [], ["three"]]
+
+
+def test_options():
+    array = ak.Array([1, None, 3, None, 5])
+    assert isinstance(array.layout, ak.layout.IndexedOptionArray64)
+    assert array.layout.tolist() == [1, None, 3, None, 5]
+
+    mask = ak.layout.Index8(np.array([0, 1, 0], np.int8))
+    content = ak.layout.NumpyArray(np.array([1, 2, 3]))
+    bytemasked = ak.layout.ByteMaskedArray(mask, content, valid_when=True)
+    assert bytemasked.tolist() == [None, 2, None]
+
+    assert ak.layout.UnmaskedArray(content).tolist() == [1, 2, 3]
+
+    array = ak.Array([[1, None], None, [None, "two"]])
+    assert ak.to_list(array) == [[1, None], None, [None, "two"]]
+
+
+def test_records():
+    array = ak.Array(
+        [{"x": 1, "y": [1.1]}, {"x": 2, "y": []}, {"x": 3, "y": [3.3, 3.3]}]
+    )
+    assert array.layout.tolist() == [
+        {"x": 1, "y": [1.1]},
+        {"x": 2, "y": []},
+        {"x": 3, "y": [3.3, 3.3]},
+    ]
+    assert array.layout[2].tolist() == {"x": 3, "y": [3.3, 3.3]}
+    assert ak.to_list(array[1]) == {"x": 2, "y": []}
+    assert array[1:].layout.tolist() == [{"x": 2, "y": []}, {"x": 3, "y": [3.3, 3.3]}]
+
+    array = ak.Array([(1, "one"), (2, "two")])
+    assert array.layout.tolist() == [(1, "one"), (2, "two")]
+    assert array.layout[1].tolist() == (2, "two")
+
+    empty = ak.layout.RecordArray([], keys=[], length=2)
+    assert empty.tolist() == [{}, {}]
+
+
+def test_unions():
+    array = ak.Array([1, "two", [3], {"x": 4}, 5.5])
+    assert isinstance(array.layout, ak.layout.UnionArray8_64)
+    assert array.layout.tolist() == [1, "two", [3], {"x": 4}, 5.5]
+    assert ak.to_list(array[::-1]) == [5.5, {"x": 4}, [3], "two", 1]
+
+
+def test_virtual_and_partitioned():
+    generator = ak.layout.ArrayGenerator(
+        lambda: ak.Array([[1, 2], [], [3]]).layout, form=None, length=3
+    )
+    virtual = ak.layout.VirtualArray(generator)
+    assert virtual.tolist() == [[1, 2], [], [3]]
+
+    partitioned = ak.repartition(ak.Array([[1, 2], [], [3], [4, 5]]), 3)
+    assert ak.to_list(partitioned) == [[1, 2], [], [3], [4, 5]]
+
+    builder = ak.ArrayBuilder()
+    builder.append("one")
+    builder.append(2)
+    assert ak.to_list(builder) == ["one", 2]
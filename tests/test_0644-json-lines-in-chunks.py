@@ -0,0 +1,66 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def write_lines(tmp_path, n):
+    filename = os.path.join(tmp_path, "records.jsonl")
+    with open(filename, "w") as file:
+        for i in range(n):
+            file.write('{"x": %d, "y": [%s]}\n' % (i, ", ".join(["1.5"] * (i % 3))))
+    return filename
+
+
+def test_chunk_size(tmp_path):
+    filename = write_lines(tmp_path, 10)
+    expected = [{"x": i, "y": [1.5] * (i % 3)} for i in range(10)]
+    assert ak.from_json(filename).tolist() == expected
+
+    chunks = list(ak.from_json(filename, chunk_size=4))
+    assert [len(x) for x in chunks] == [4, 4, 2]
+    assert all(isinstance(x, ak.Array) for x in chunks)
+    assert ak.concatenate(chunks).tolist() == expected
+
+    chunks = list(ak.from_json(filename, chunk_size=1, highlevel=False))
+    assert len(chunks) == 10
+    assert isinstance(chunks[0], ak.layout.RecordArray)
+    assert ak.to_list(chunks[3]) == [{"x": 3, "y": []}]
+
+
+def test_chunk_bytes(tmp_path):
+    filename = write_lines(tmp_path, 10)
+    lengths = [len(x) for x in ak.from_json(filename, chunk_bytes=60)]
+    assert sum(lengths) == 10
+    assert len(lengths) > 1
+
+    lengths = [len(x) for x in ak.from_json(filename, chunk_bytes=60, chunk_size=2)]
+    assert lengths == [2, 2, 2, 2, 2]
+
+
+def test_small_buffer(tmp_path):
+    filename = write_lines(tmp_path, 100)
+    chunks = ak.from_json(filename, chunk_size=30, buffersize=16)
+    assert ak.concatenate(list(chunks)).x.tolist() == list(range(100))
+
+
+def test_errors(tmp_path):
+    filename = os.path.join(tmp_path, "broken.jsonl")
+    with open(filename, "w") as file:
+        file.write('{"x": 1}\n{"x": 2}\n{"x": \n')
+
+    chunks = ak.from_json(filename, chunk_size=1)
+    assert next(chunks).tolist() == [{"x": 1}]
+    assert next(chunks).tolist() == [{"x": 2}]
+    with pytest.raises(ValueError):
+        next(chunks)
+
+    with pytest.raises(ValueError):
+        ak.from_json('{"x": 1}', chunk_size=1)
+    with pytest.raises(ValueError):
+        ak.from_json(filename, chunk_size=0)
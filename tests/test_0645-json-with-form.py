@@ -0,0 +1,157 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_primitives():
+    for dtype in ["int8", "uint16", "int32", "int64", "float32", "float64"]:
+        array = ak.from_json("[1, 2, 3]", form='"%s"' % dtype, highlevel=False)
+        assert isinstance(array, ak.layout.NumpyArray)
+        assert np.asarray(array).dtype == np.dtype(dtype)
+        assert ak.to_list(array) == [1, 2, 3]
+
+    array = ak.from_json("[true, false]", form='"bool"', highlevel=False)
+    assert np.asarray(array).dtype == np.dtype(np.bool_)
+    assert ak.to_list(array) == [True, False]
+
+    array = ak.from_json('[1.5, "nan", 3]', form='"float64"', nan_string="nan")
+    assert np.isnan(array[1])
+
+    array = ak.from_json(
+        "[[1, 2, 3], [4, 5, 6]]",
+        form={
+            "class": "NumpyArray",
+            "inner_shape": [3],
+            "itemsize": 8,
+            "format": "l",
+            "primitive": "int64",
+        },
+    )
+    assert ak.to_list(array) == [[1, 2, 3], [4, 5, 6]]
+    assert str(ak.type(array)) == "2 * 3 * int64"
+
+    with pytest.raises(ValueError):
+        ak.from_json("[1, 2.5]", form='"int64"')
+    with pytest.raises(ValueError):
+        ak.from_json("[1, 300]", form='"uint8"')
+    with pytest.raises(ValueError):
+        ak.from_json("[1, -1]", form='"uint64"')
+    with pytest.raises(ValueError):
+        ak.from_json("[1, null]", form='"int64"')
+    with pytest.raises(ValueError):
+        ak.from_json('[1, "two"]', form='"int64"')
+
+
+def test_lists_and_strings():
+    form = {"class": "ListOffsetArray64", "offsets": "i64", "content": "float64"}
+    array = ak.from_json("[[1.1, 2.2], [], [3]]", form=form, highlevel=False)
+    assert isinstance(array, ak.layout.ListOffsetArray64)
+    assert ak.to_list(array) == [[1.1, 2.2], [], [3.0]]
+
+    form = {"class": "RegularArray", "size": 2, "content": "int64"}
+    array = ak.from_json("[[1, 2], [3, 4]]", form=form, highlevel=False)
+    assert isinstance(array, ak.layout.RegularArray)
+    assert ak.to_list(array) == [[1, 2], [3, 4]]
+    with pytest.raises(ValueError):
+        ak.from_json("[[1, 2], [3]]", form=form)
+    with pytest.raises(ValueError):
+        ak.from_json("[[1, 2], [3, 4, 5]]", form=form)
+
+    form = ak.forms.Form.fromjson(ak.Array(["one", "two"]).layout.form.tojson())
+    array = ak.from_json('["one", "", "thréé"]', form=form)
+    assert ak.to_list(array) == ["one", "", "thréé"]
+    assert ak.type(array) == ak.type(ak.Array(["one", "", "thréé"]))
+    with pytest.raises(ValueError):
+        ak.from_json('["one", 2]', form=form)
+
+
+def test_records():
+    form = ak.Array(
+        [{"x": 1, "y": [1.1], "z": None}, {"x": 2, "y": [], "z": "two"}]
+    ).layout.form
+    array = ak.from_json(
+        '[{"y": [1.1], "x": 1, "ignored": {"a": [1, {"b": 2}]}, "z": "one"},'
+        ' {"x": 2, "y": [], "z": null}, {"x": 3, "y": [3.3, 3.3]}]',
+        form=form,
+    )
+    assert ak.to_list(array) == [
+        {"x": 1, "y": [1.1], "z": "one"},
+        {"x": 2, "y": [], "z": None},
+        {"x": 3, "y": [3.3, 3.3], "z": None},
+    ]
+    assert ak.fields(array) == ["x", "y", "z"]
+
+    with pytest.raises(ValueError):
+        ak.from_json('[{"y": []}]', form=form)
+    with pytest.raises(ValueError):
+        ak.from_json('[{"x": 1, "x": 2, "y": []}]', form=form)
+    with pytest.raises(ValueError):
+        ak.from_json('[{"x": 1, "y": 2}]', form=form)
+
+    form = ak.Array([(1, "one")]).layout.form
+    array = ak.from_json('[[1, "one"], [2, "two"]]', form=form)
+    assert ak.to_list(array) == [(1, "one"), (2, "two")]
+    with pytest.raises(ValueError):
+        ak.from_json('[[1, "one", 3]]', form=form)
+
+
+def test_options():
+    form = {
+        "class": "ByteMaskedArray",
+        "mask": "i8",
+        "valid_when": True,
+        "content": {
+            "class": "ListOffsetArray64",
+            "offsets": "i64",
+            "content": {"class": "UnmaskedArray", "content": "int64"},
+        },
+    }
+    array = ak.from_json("[[1, 2], null, []]", form=form, highlevel=False)
+    assert isinstance(array, ak.layout.IndexedOptionArray64)
+    assert ak.to_list(array) == [[1, 2], None, []]
+
+
+def test_single_array_and_chunks(tmp_path):
+    with pytest.raises(ValueError):
+        ak.from_json("[1, 2]\n[3]", form='"int64"')
+    with pytest.raises(ValueError):
+        ak.from_json("1", form='"int64"')
+    with pytest.raises(ValueError):
+        ak.from_json(
+            '[{"class": "UnionArray8_64"}]',
+            form={
+                "class": "UnionArray8_64",
+                "tags": "i8",
+                "index": "i64",
+                "contents": ["int64", "bool"],
+            },
+        )
+
+    filename = os.path.join(tmp_path, "records.jsonl")
+    with open(filename, "w") as file:
+        for i in range(5):
+            file.write('{"x": %d, "extra": "skipped"}\n' % i)
+    form = {"class": "RecordArray", "contents": {"x": "int16"}}
+
+    array = ak.from_json(
+        filename,
+        form={
+            "class": "ListOffsetArray64",
+            "offsets": "i64",
+            "content": "int64",
+        },
+        chunk_size=10,
+    )
+    with pytest.raises(ValueError):
+        list(array)
+
+    chunks = list(ak.from_json(filename, form=form, chunk_size=2))
+    assert [len(x) for x in chunks] == [2, 2, 1]
+    assert ak.to_list(ak.concatenate(chunks)) == [{"x": i} for i in range(5)]
+    assert str(ak.type(chunks[-1])) == '1 * {"x": int16}'
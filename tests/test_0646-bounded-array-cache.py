@@ -0,0 +1,154 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def array(n):
+    return ak.layout.NumpyArray(np.arange(n, dtype=np.int64))
+
+
+def test_lru():
+    cache = ak.layout.BoundedArrayCache(200)
+    assert cache.policy == "lru"
+    cache["a"] = array(10)
+    cache["b"] = array(10)
+    assert cache.nbytes == 160
+    assert ak.to_list(cache["a"]) == list(range(10))
+
+    cache["c"] = array(10)
+    assert cache.keys() == ["a", "c"]
+    assert "b" not in cache
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.nbytes == 160
+
+    with pytest.raises(KeyError):
+        cache["b"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache["huge"] = array(100)
+    assert "huge" not in cache
+    assert cache.keys() == ["a", "c"]
+
+    del cache["a"]
+    assert list(cache) == ["c"]
+    cache.clear()
+    assert (len(cache), cache.nbytes, cache.hits, cache.misses) == (0, 0, 0, 0)
+
+
+def test_lfu():
+    cache = ak.layout.BoundedArrayCache(200, "lfu")
+    cache["a"] = array(10)
+    cache["b"] = array(10)
+    cache["a"]
+    cache["a"]
+    cache["b"]
+    cache["c"] = array(10)
+    assert cache.keys() == ["c", "a"]
+
+    with pytest.raises(ValueError):
+        ak.layout.BoundedArrayCache(100, "fifo")
+    with pytest.raises(ValueError):
+        ak.layout.BoundedArrayCache(-1)
+
+
+def test_virtual():
+    cache = ak.layout.BoundedArrayCache(1000)
+    calls = []
+
+    def generate():
+        calls.append(None)
+        return array(10)
+
+    virtual = ak.virtual(generate, length=10, cache=cache, cache_key="x")
+    assert virtual.layout.cache is cache
+    assert virtual.caches == ()
+    assert ak.to_list(virtual) == list(range(10))
+    assert ak.to_list(virtual) == list(range(10))
+    assert len(calls) == 1
+    assert cache.hits >= 1
+    assert cache.keys() == ["x"]
+
+    cache.clear()
+    assert ak.to_list(virtual) == list(range(10))
+    assert len(calls) == 2
+
+
+def test_threads():
+    cache = ak.layout.BoundedArrayCache(8 * 10 * 20)
+
+    def work(i):
+        for j in range(200):
+            key = str((i * j) % 50)
+            try:
+                cache[key]
+            except KeyError:
+                cache[key] = array(10)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) <= 20
+    assert cache.nbytes == 80 * len(cache)
+    assert cache.hits + cache.misses == 8 * 200
+
+
+def test_threads_with_python_buffers():
+    # reductions release the GIL and may fill the cache (evicting arrays whose
+    # buffers belong to NumPy) while other threads use the cache with the GIL
+    cache = ak.layout.BoundedArrayCache(8 * 10 * 2)
+
+    def generate():
+        return ak.layout.NumpyArray(np.arange(10, dtype=np.int64))
+
+    def reduce(i):
+        for j in range(100):
+            virtual = ak.layout.VirtualArray(
+                ak.layout.ArrayGenerator(generate, form=array(10).form, length=10),
+                cache,
+                cache_key="reduce-{0}-{1}".format(i, j),
+            )
+            assert ak.to_list(virtual.sum(axis=-1)) == 45
+
+    def access(i):
+        for j in range(100):
+            key = "access-{0}-{1}".format(i, j % 5)
+            try:
+                cache[key]
+            except KeyError:
+                cache[key] = generate()
+
+    threads = [threading.Thread(target=reduce, args=(i,)) for i in range(4)]
+    threads += [threading.Thread(target=access, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join(60)
+        assert not thread.is_alive()
+
+    assert len(cache) <= 2
+    assert cache.nbytes == 80 * len(cache)
+
+
+def test_from_parquet(tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+    filename = str(tmp_path / "data.parquet")
+    ak.to_parquet(
+        ak.repartition(ak.Array([{"x": i} for i in range(100)]), 10), filename
+    )
+
+    cache = ak.layout.BoundedArrayCache(200)
+    array = ak.from_parquet(filename, lazy=True, lazy_cache=cache)
+    assert ak.to_list(array.x) == list(range(100))
+    assert cache.nbytes <= 200
+    assert cache.evictions > 0
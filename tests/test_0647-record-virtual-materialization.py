@@ -0,0 +1,84 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_context_manager():
+    cache = {}
+    one = ak.virtual(lambda: [1.1, 2.2, 3.3], length=3, cache=cache, cache_key="one")
+    two = ak.virtual(lambda: [1, 2, 3], length=3, cache=None, cache_key="two")
+
+    assert ak.to_list(one) == [1.1, 2.2, 3.3]
+    with ak.record_virtual() as recorder:
+        assert recorder.active
+        assert ak.to_list(one) == [1.1, 2.2, 3.3]
+        assert ak.to_list(two) == [1, 2, 3]
+        assert ak.to_list(two) == [1, 2, 3]
+    assert not recorder.active
+
+    entries = recorder.entries()
+    assert set(entries) == set(["one", "two"])
+    assert entries["one"]["hits"] == 1
+    assert entries["one"]["generated"] == 0
+    assert entries["one"]["nbytes"] == 0
+    assert entries["two"]["hits"] == 0
+    assert entries["two"]["generated"] == 2
+    assert entries["two"]["nbytes"] == 2 * 3 * 8
+    assert entries["two"]["seconds"] >= 0
+
+    # not recording outside of the block
+    ak.to_list(two)
+    assert recorder.entries()["two"]["generated"] == 2
+
+    recorder.clear()
+    assert recorder.entries() == {}
+
+
+def test_peeking_is_not_a_hit():
+    cache = {}
+    array = ak.virtual(lambda: [1, 2, 3], length=3, cache=cache, cache_key="x")
+    assert ak.to_list(array) == [1, 2, 3]
+
+    with ak.record_virtual() as recorder:
+        repr(array.layout)
+        array.layout[1:]
+        array.layout[:-1]
+    assert recorder.entries() == {}
+
+    with ak.record_virtual() as recorder:
+        ak.to_list(array)
+    assert recorder.entries()["x"]["hits"] == 1
+
+
+def test_nested_and_manual():
+    array = ak.virtual(lambda: [1, 2, 3], length=3, cache=None, cache_key="x")
+    outer = ak.layout.VirtualArrayRecorder()
+    outer.start()
+    with ak.record_virtual() as inner:
+        ak.to_list(array)
+    ak.to_list(array)
+    outer.stop()
+    assert inner.entries()["x"]["generated"] == 1
+    assert outer.entries()["x"]["generated"] == 2
+
+
+def test_lazy_parquet(tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+    filename = os.path.join(tmp_path, "data.parquet")
+    ak.to_parquet(ak.Array([{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}]), filename)
+
+    array = ak.from_parquet(filename, lazy=True, lazy_cache_key="data")
+    with ak.record_virtual() as recorder:
+        assert ak.to_list(array) == [{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}]
+        assert ak.to_list(array) == [{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}]
+    entries = recorder.entries()
+    assert sorted(entries) == ["data.x[0]", "data.y[0]"]
+    assert entries["data.x[0]"]["generated"] == 1
+    assert entries["data.x[0]"]["hits"] == 1
+    assert entries["data.y[0]"]["nbytes"] == 16
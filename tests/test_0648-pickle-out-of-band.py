@@ -0,0 +1,76 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pickle
+import sys
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="pickle protocol 5 requires Python 3.8"
+)
+
+
+def test_array():
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]] * 100)
+    buffers = []
+    data = pickle.dumps(array, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 2
+    assert len(data) < 1000
+
+    out = pickle.loads(data, buffers=buffers)
+    assert isinstance(out, ak.Array)
+    assert out.tolist() == array.tolist()
+    assert np.shares_memory(
+        np.asarray(out.layout.content), np.asarray(array.layout.content)
+    )
+
+
+def test_record():
+    array = ak.Array([{"x": 1, "y": "one"}, {"x": 2, "y": "two"}])
+    buffers = []
+    data = pickle.dumps(array[1], protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 3
+    out = pickle.loads(data, buffers=buffers)
+    assert isinstance(out, ak.Record)
+    assert out.tolist() == {"x": 2, "y": "two"}
+
+
+def test_in_band():
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(array, protocol=protocol)).tolist() == [
+            [1, 2, 3],
+            [],
+            [4, 5],
+        ]
+
+    readonly = np.arange(10)
+    readonly.flags.writeable = False
+    array = ak.Array(readonly)
+    assert pickle.loads(pickle.dumps(array, protocol=5)).tolist() == list(range(10))
+
+
+class Point(ak.Record):
+    def magnitude(self):
+        return self.x + self.y
+
+
+def test_behavior():
+    behavior = {"point": Point}
+    array = ak.Array(
+        [{"x": 1, "y": 2}, {"x": 3, "y": 4}], with_name="point", behavior=behavior
+    )
+    buffers = []
+    data = pickle.dumps(array, protocol=5, buffer_callback=buffers.append)
+    out = pickle.loads(data, buffers=buffers)
+    assert out[1].magnitude() == 7
+
+
+def test_from_buffers_bytes():
+    form, length, container = ak.to_buffers(ak.Array([[1, 2, 3], [], [4, 5]]))
+    container = dict((key, value.tobytes()) for key, value in container.items())
+    assert ak.from_buffers(form, length, container).tolist() == [[1, 2, 3], [], [4, 5]]
@@ -0,0 +1,58 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+numexpr = pytest.importorskip("numexpr")
+
+
+def test_record():
+    a = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    b = ak.Array([100, 200, 300])
+    out = ak.numexpr.evaluate_many({"sum": "a + b", "prod": "a * b", "neg": "-b"})
+    assert ak.fields(out) == ["sum", "prod", "neg"]
+    assert ak.to_list(out.sum) == [[101.1, 102.2, 103.3], [], [304.4, 305.5]]
+    assert ak.to_list(ak.flatten(out.prod)) == pytest.approx(
+        [110, 220, 330, 1320, 1650]
+    )
+    assert ak.to_list(out.neg) == [[-100, -100, -100], [], [-300, -300]]
+
+
+def test_dict():
+    a = ak.Array([[1, 2, 3], [], [4, 5]])
+    c = 2
+    out = ak.numexpr.evaluate_many(
+        [("double", "a * c"), ("square", "a**2")], as_record=False
+    )
+    assert list(out) == ["double", "square"]
+    assert ak.to_list(out["double"]) == [[2, 4, 6], [], [8, 10]]
+    assert ak.to_list(out["square"]) == [[1, 4, 9], [], [16, 25]]
+
+    out = ak.numexpr.evaluate_many(
+        {"x": "x + y"}, local_dict={"x": np.arange(3), "y": 10}, as_record=False
+    )
+    assert ak.to_list(out["x"]) == [10, 11, 12]
+
+
+def test_matches_evaluate():
+    a = ak.Array([[1.1, None, 3.3], None, [4.4, 5.5]])
+    b = ak.Array([[1, 2, 3], [], [4, 5]])
+    out = ak.numexpr.evaluate_many({"one": "a + b", "two": "sin(a) * b"})
+    assert ak.to_list(out.one) == ak.to_list(ak.numexpr.evaluate("a + b"))
+    assert ak.to_list(out.two) == ak.to_list(ak.numexpr.evaluate("sin(a) * b"))
+
+    with pytest.raises(ValueError):
+        ak.numexpr.evaluate_many({})
+
+
+def test_names_cache_is_bounded():
+    entries = ak._connect._numexpr.names_cache.entries
+    size = ak._connect._numexpr.names_cache_size
+    a = ak.Array([1, 2, 3])  # noqa: F841
+    for i in range(size + 10):
+        ak.numexpr.evaluate("a + {0}".format(i))
+    assert len(entries) == size
+    assert not any(key[0] == "a + 0" for key in entries)
@@ -0,0 +1,82 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def jagged(length, seed=12345):
+    random = np.random.RandomState(seed)
+    counts = random.poisson(20, length)
+    return ak.unflatten(random.normal(size=counts.sum()), counts)
+
+
+def test_setting():
+    assert ak.num_threads() == 1
+    with ak.set_num_threads(4):
+        assert ak.num_threads() == 4
+        with ak.set_num_threads(None):
+            assert ak.num_threads() >= 1
+        assert ak.num_threads() == 4
+    assert ak.num_threads() == 1
+
+    for bad in (0, -1, 2.5, "4"):
+        with pytest.raises(ValueError):
+            ak.set_num_threads(bad)
+
+
+def test_sort():
+    array = jagged(20000)
+    expected_sort = ak.flatten(ak.sort(array, ascending=False))
+    expected_argsort = ak.flatten(ak.argsort(array, stable=True))
+    with ak.set_num_threads(8):
+        assert np.array_equal(
+            ak.to_numpy(ak.flatten(ak.sort(array, ascending=False))),
+            ak.to_numpy(expected_sort),
+        )
+        assert np.array_equal(
+            ak.to_numpy(ak.flatten(ak.argsort(array, stable=True))),
+            ak.to_numpy(expected_argsort),
+        )
+
+
+def test_reducers():
+    array = jagged(20000)
+    for reducer in (ak.sum, ak.prod, ak.min, ak.max):
+        expected = ak.to_numpy(reducer(array, axis=1))
+        with ak.set_num_threads(8):
+            assert np.array_equal(
+                ak.to_numpy(reducer(array, axis=1)), expected, equal_nan=True
+            )
+
+    expected = ak.to_numpy(ak.sum(array, axis=0))
+    with ak.set_num_threads(8):
+        assert np.array_equal(ak.to_numpy(ak.sum(array, axis=0)), expected)
+
+
+def test_combinations():
+    array = jagged(2000)
+    for replacement in (False, True):
+        expected = ak.combinations(array, 3, replacement=replacement)
+        with ak.set_num_threads(8):
+            out = ak.combinations(array, 3, replacement=replacement)
+        assert ak.to_list(ak.num(out)) == ak.to_list(ak.num(expected))
+        for field in ("0", "1", "2"):
+            assert np.array_equal(
+                ak.to_numpy(ak.flatten(out[field])),
+                ak.to_numpy(ak.flatten(expected[field])),
+            )
+
+
+def test_small():
+    with ak.set_num_threads(8):
+        array = ak.Array([[3.3, 1.1, 2.2], [], [5.5, 4.4]])
+        assert ak.to_list(ak.sort(array)) == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+        assert ak.to_list(ak.sum(array, axis=1)) == pytest.approx([6.6, 0, 9.9])
+        assert ak.to_list(ak.combinations(array, 2)) == [
+            [(3.3, 1.1), (3.3, 2.2), (1.1, 2.2)],
+            [],
+            [(5.5, 4.4)],
+        ]
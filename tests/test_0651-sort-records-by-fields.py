@@ -0,0 +1,127 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+particles = ak.Array(
+    [
+        [
+            {"charge": 1, "pt": 10.0, "id": 0},
+            {"charge": -1, "pt": 30.0, "id": 1},
+            {"charge": 1, "pt": 20.0, "id": 2},
+            {"charge": -1, "pt": 30.0, "id": 3},
+        ],
+        [],
+        [{"charge": 1, "pt": 5.0, "id": 4}, {"charge": -1, "pt": 5.0, "id": 5}],
+    ]
+)
+
+
+def test_sort():
+    out = ak.sort(particles, by=["charge", "pt"])
+    assert ak.to_list(out.id) == [[1, 3, 0, 2], [], [5, 4]]
+
+    out = ak.sort(particles, by=["charge", "pt"], ascending=[True, False])
+    assert ak.to_list(out.id) == [[1, 3, 2, 0], [], [5, 4]]
+
+    out = ak.sort(particles, by="pt", ascending=False)
+    assert ak.to_list(out.id) == [[1, 3, 2, 0], [], [4, 5]]
+    assert ak.to_list(out.pt) == [[30, 30, 20, 10], [], [5, 5]]
+
+    out = ak.sort(particles, by=["pt", "charge"], axis=1, highlevel=False)
+    assert isinstance(out, ak.layout.ListOffsetArray64)
+    assert ak.to_list(out)[2] == [
+        {"charge": -1, "pt": 5.0, "id": 5},
+        {"charge": 1, "pt": 5.0, "id": 4},
+    ]
+
+
+def test_argsort():
+    index = ak.argsort(particles, by=["charge", "pt"], ascending=[True, False])
+    assert ak.to_list(index) == [[1, 3, 2, 0], [], [1, 0]]
+    assert ak.to_list(particles[index].id) == [[1, 3, 2, 0], [], [5, 4]]
+
+    # equivalent to sorting by the least significant key first, then stably
+    # by the more significant keys
+    first = ak.argsort(particles.pt, ascending=False, stable=True)
+    second = ak.argsort(particles[first].charge, stable=True)
+    assert ak.to_list(particles[first][second].id) == ak.to_list(particles[index].id)
+
+
+def test_structure():
+    flat = particles[0]
+    assert ak.to_list(ak.argsort(flat, by=["charge", "id"])) == [1, 3, 0, 2]
+
+    sliced = particles[::-1, ::-1]
+    assert ak.to_list(ak.sort(sliced, by="id").id) == [[4, 5], [], [0, 1, 2, 3]]
+
+    regular = ak.to_regular(particles[[0, 0]], axis=1)
+    out = ak.sort(regular, by="pt", highlevel=False)
+    assert isinstance(out, ak.layout.RegularArray)
+    assert [x["id"] for x in ak.to_list(out[1])] == [0, 2, 1, 3]
+
+    events = ak.zip({"particles": particles, "n": [4, 0, 2]}, depth_limit=1)
+    out = ak.sort(events, by="pt")
+    assert ak.to_list(out.particles.id) == [[0, 2, 1, 3], [], [4, 5]]
+    assert ak.to_list(out.n) == [4, 0, 2]
+
+    with ak.set_num_threads(4):
+        big = ak.concatenate([particles] * 20000)
+        assert ak.to_list(ak.argsort(big, by=["charge", "pt"])[:3]) == [
+            [1, 3, 0, 2],
+            [],
+            [1, 0],
+        ]
+
+
+def test_nan():
+    array = ak.Array(
+        [
+            [
+                {"k": np.nan, "i": 0},
+                {"k": 1.0, "i": 1},
+                {"k": np.nan, "i": 2},
+                {"k": 0.5, "i": 3},
+            ]
+        ]
+    )
+    assert ak.to_list(ak.argsort(array, by="k", stable=True)) == [[3, 1, 0, 2]]
+    assert ak.to_list(ak.argsort(array, by="k", ascending=False, stable=True)) == [
+        [1, 3, 0, 2]
+    ]
+    out = ak.sort(array, by=["k", "i"], ascending=[True, False], stable=False)
+    assert ak.to_list(out.i) == [[3, 1, 2, 0]]
+
+
+def test_parameters():
+    layout = ak.to_layout(particles)
+    listoffsetarray = ak.layout.ListOffsetArray64(
+        layout.offsets, layout.content, parameters={"foo": "bar"}
+    )
+    out = ak.sort(listoffsetarray, by="pt", highlevel=False)
+    assert out.parameters == {"foo": "bar"}
+    assert ak.to_list(ak.Array(out).id) == [[0, 2, 1, 3], [], [4, 5]]
+
+    regular = ak.to_regular(particles[[0, 0]], axis=1, highlevel=False)
+    regular = ak.layout.RegularArray(
+        regular.content, regular.size, parameters={"foo": "bar"}
+    )
+    out = ak.sort(regular, by="pt", highlevel=False)
+    assert out.parameters == {"foo": "bar"}
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak.sort(particles, by="nope")
+    with pytest.raises(ValueError):
+        ak.sort(particles, by=["charge", "pt"], ascending=[True])
+    with pytest.raises(ValueError):
+        ak.sort(ak.Array([[1, 2, 3]]), by="x")
+    with pytest.raises(ValueError):
+        ak.sort(ak.Array([[{"x": 1}, None]]), by="x")
+    with pytest.raises(ValueError):
+        ak.sort(ak.Array([[{"x": [1]}]]), by="x")
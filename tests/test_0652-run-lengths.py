@@ -0,0 +1,112 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_run_lengths():
+    array = ak.Array([[1, 1, 2, 2, 2, 1], [], [3, 3], [4]])
+    assert ak.run_lengths(array).tolist() == [[2, 3, 1], [], [2], [1]]
+    assert ak.run_lengths(array[1:]).tolist() == [[], [2], [1]]
+    assert ak.run_lengths(ak.Array([1, 1, 2, 1])).tolist() == [2, 1, 1]
+    assert ak.run_lengths(ak.Array(np.array([], np.int64))).tolist() == []
+
+    nested = ak.Array([[[1, 1], [2]], [], [[3, 3, 3], []]])
+    assert ak.run_lengths(nested).tolist() == [[[2], [1]], [], [[3], []]]
+
+    regular = ak.Array(np.array([[1, 1, 2], [2, 2, 2]]))
+    assert ak.run_lengths(regular).tolist() == [[2, 1], [3]]
+
+    listarray = ak.layout.ListArray64(
+        ak.layout.Index64(np.array([3, 0])),
+        ak.layout.Index64(np.array([5, 3])),
+        ak.layout.NumpyArray(np.array([1, 1, 2, 2, 2])),
+    )
+    assert ak.run_lengths(listarray).tolist() == [[2], [2, 1]]
+
+
+def test_strings():
+    array = ak.Array([["aa", "aa", "ab", "b", "", ""], [""], ["x", "x"]])
+    assert ak.run_lengths(array).tolist() == [[2, 1, 1, 2], [1], [2]]
+    assert ak.run_lengths(ak.Array(["b", "b", "a", "b"])).tolist() == [2, 1, 1]
+    assert ak.group_runs(array).tolist() == [
+        [["aa", "aa"], ["ab"], ["b"], ["", ""]],
+        [[""]],
+        [["x", "x"]],
+    ]
+
+
+def test_group_runs():
+    array = ak.Array([[1, 1, 2, 2, 2, 1], [], [3, 3]])
+    assert ak.group_runs(array).tolist() == [[[1, 1], [2, 2, 2], [1]], [], [[3, 3]]]
+    assert ak.group_runs(ak.Array([1, 1, 2])).tolist() == [[1, 1], [2]]
+
+    grouped = ak.group_runs(array, highlevel=False)
+    assert isinstance(grouped.content, ak.layout.ListOffsetArray64)
+
+
+def test_group_by_fields():
+    jets = ak.Array(
+        [
+            [
+                {"flavour": 5, "charge": 1, "pt": 1.1},
+                {"flavour": 1, "charge": 1, "pt": 2.2},
+                {"flavour": 5, "charge": -1, "pt": 3.3},
+            ],
+            [],
+            [{"flavour": 0, "charge": 1, "pt": 4.4}],
+        ]
+    )
+    grouped = ak.group_runs(ak.sort(jets, by="flavour", stable=True), by="flavour")
+    assert grouped.pt.tolist() == [[[2.2], [1.1, 3.3]], [], [[4.4]]]
+    assert grouped.flavour[:, :, 0].tolist() == [[1, 5], [], [0]]
+
+    grouped = ak.group_runs(jets[:, ::-1], by=["flavour", "charge"])
+    assert grouped.pt.tolist() == [[[3.3], [2.2], [1.1]], [], [[4.4]]]
+
+
+def test_axis():
+    array = ak.Array([[1, 2], [1, 2], [3], [1, 2], [], []])
+    assert ak.run_lengths(array, axis=0).tolist() == [2, 1, 1, 2]
+    assert ak.run_lengths(array, axis=-2).tolist() == [2, 1, 1, 2]
+    assert ak.run_lengths(array, axis=1).tolist() == ak.run_lengths(array).tolist()
+    assert ak.group_runs(array, axis=0).tolist() == [
+        [[1, 2], [1, 2]],
+        [[3]],
+        [[1, 2]],
+        [[], []],
+    ]
+
+    nested = ak.Array([[[1], [1], [2]], [], [[3, 3], [3, 3], [3]]])
+    assert ak.run_lengths(nested, axis=1).tolist() == [[2, 1], [], [2, 1]]
+    assert ak.run_lengths(nested, axis=2).tolist() == ak.run_lengths(nested).tolist()
+    assert ak.run_lengths(nested, axis=0).tolist() == [1, 1, 1]
+
+    strings = ak.Array([["a", "a"], ["a", "a"], ["b"]])
+    assert ak.run_lengths(strings, axis=0).tolist() == [2, 1]
+
+    records = ak.Array(
+        [
+            {"x": [1, 2], "y": 1},
+            {"x": [1, 2], "y": 2},
+            {"x": [1], "y": 3},
+        ]
+    )
+    assert ak.group_runs(records, by="x", axis=0).y.tolist() == [[1, 2], [3]]
+
+    with pytest.raises(ValueError):
+        ak.run_lengths(ak.Array([[1, 2]]), axis=2)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak.run_lengths(ak.Array([[1, None, 1]]))
+    with pytest.raises(ValueError):
+        ak.run_lengths(ak.Array([[{"x": 1}]]))
+    with pytest.raises(ValueError):
+        ak.group_runs(ak.Array([[{"x": 1}]]))
+    with pytest.raises(ValueError):
+        ak.group_runs(ak.Array([[{"x": [1]}]]), by="x")
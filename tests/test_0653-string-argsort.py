@@ -0,0 +1,62 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_flat():
+    array = ak.Array(["b", "a", "", "ab", "a", "ba"])
+    assert ak.argsort(array).tolist() == [2, 1, 4, 3, 0, 5]
+    assert ak.argsort(array, ascending=False).tolist() == [5, 0, 3, 1, 4, 2]
+    assert ak.sort(array).tolist() == ["", "a", "a", "ab", "b", "ba"]
+    assert ak.sort(array, ascending=False).tolist() == [
+        "ba",
+        "b",
+        "ab",
+        "a",
+        "a",
+        "",
+    ]
+
+    array = ak.Array([b"\xff", b"\x00a", b"\x00", b""])
+    assert ak.sort(array).tolist() == [b"", b"\x00", b"\x00a", b"\xff"]
+
+
+def test_jagged():
+    array = ak.Array([["b", "a", "c", "a"], [], ["z", "y", "zz", ""]])
+    assert ak.argsort(array).tolist() == [[1, 3, 0, 2], [], [3, 1, 0, 2]]
+    assert ak.argsort(array, ascending=False).tolist() == [
+        [2, 0, 1, 3],
+        [],
+        [2, 0, 1, 3],
+    ]
+    assert ak.sort(array).tolist() == [["a", "a", "b", "c"], [], ["", "y", "z", "zz"]]
+    assert array[ak.argsort(array)].tolist() == ak.sort(array).tolist()
+
+    nested = ak.Array([[["b", "a"], ["d", "c"]], [["x", "w"]]])
+    assert ak.argsort(nested).tolist() == [[[1, 0], [1, 0]], [[1, 0]]]
+
+    listarray = ak.Array(["one", "two", "three", "four"])[[3, 2, 1, 0]]
+    assert ak.argsort(listarray).tolist() == [0, 3, 1, 2]
+
+
+def test_axis0():
+    array = ak.Array([["b", "a", "c"], ["a"], ["z", "y"]])
+    assert ak.argsort(array, axis=0).tolist() == [[1, 0, 0], [0], [2, 1]]
+    assert ak.sort(array, axis=0).tolist() == [["a", "a", "c"], ["b"], ["z", "y"]]
+
+
+def test_long_and_many():
+    words = ["x" * 300 + str(i % 7) + "y" * (i % 5) for i in range(1000)]
+    array = ak.Array(words)
+    expected = sorted(range(len(words)), key=words.__getitem__)
+    assert ak.argsort(array).tolist() == expected
+    assert ak.sort(array).tolist() == sorted(words)
+
+    expected = sorted(range(len(words)), key=words.__getitem__, reverse=True)
+    stable = sorted(range(len(words)), key=lambda i: (words[i], -i), reverse=True)
+    assert ak.argsort(array, ascending=False).tolist() == stable
+    assert ak.sort(array, ascending=False).tolist() == [words[i] for i in expected]
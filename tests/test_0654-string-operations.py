@@ -0,0 +1,105 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+words = ["one", "thréé", "HLT_IsoMu24", "", "Ünïcode", "HLT_Ele32", "Mu"]
+
+
+def test_length():
+    array = ak.Array(words)
+    assert ak.strings.length(array).tolist() == [len(x) for x in words]
+    assert ak.strings.length(array[2:]).tolist() == [len(x) for x in words[2:]]
+
+    bytestrings = ak.Array([x.encode("utf-8") for x in words])
+    assert ak.strings.length(bytestrings).tolist() == [
+        len(x.encode("utf-8")) for x in words
+    ]
+
+
+def test_matching():
+    array = ak.Array(words)
+    for pattern in ["HLT_", "", "thr", "Mu", "é", "24", "xyz", "HLT_IsoMu24!"]:
+        assert ak.strings.startswith(array, pattern).tolist() == [
+            x.startswith(pattern) for x in words
+        ]
+        assert ak.strings.endswith(array, pattern).tolist() == [
+            x.endswith(pattern) for x in words
+        ]
+        assert ak.strings.contains(array, pattern).tolist() == [
+            pattern in x for x in words
+        ]
+        assert ak.strings.contains(array[1:], pattern).tolist() == [
+            pattern in x for x in words[1:]
+        ]
+
+    # a match must not cross from one string into the next
+    array = ak.Array(["ab", "cd"])
+    assert ak.strings.contains(array, "bc").tolist() == [False, False]
+    assert ak.strings.contains(array, b"cd").tolist() == [False, True]
+
+    with pytest.raises(TypeError):
+        ak.strings.contains(array, 1)
+
+
+def test_case():
+    array = ak.Array(words)
+    assert ak.strings.lower(array).tolist() == [
+        "one",
+        "thréé",
+        "hlt_isomu24",
+        "",
+        "Ünïcode",
+        "hlt_ele32",
+        "mu",
+    ]
+    assert ak.strings.upper(array[:3]).tolist() == ["ONE", "THRéé", "HLT_ISOMU24"]
+    assert str(ak.type(ak.strings.upper(array))) == "7 * string"
+
+
+def test_substring():
+    array = ak.Array(words)
+    for start, stop in [
+        (None, None),
+        (1, None),
+        (None, -1),
+        (-2, None),
+        (2, 1),
+        (4, 100),
+        (-100, 2),
+    ]:
+        expected = [x[start:stop] for x in words]
+        assert ak.strings.substring(array, start, stop).tolist() == expected
+        assert ak.strings.substring(array[1:], start, stop).tolist() == expected[1:]
+
+    bytestrings = ak.Array([b"ab\xff", b"\xc3\xa9"])
+    assert ak.strings.substring(bytestrings, 1).tolist() == [b"b\xff", b"\xa9"]
+
+    with pytest.raises(TypeError):
+        ak.strings.substring(array, 1.5)
+
+
+def test_nested():
+    array = ak.Array(
+        [
+            {"x": 1, "triggers": ["HLT_IsoMu24", "HLT_Ele32"]},
+            {"x": 2, "triggers": []},
+            {"x": 3, "triggers": [None, "HLT_Mu50"]},
+        ]
+    )
+    assert ak.strings.contains(array.triggers, "Mu").tolist() == [
+        [True, False],
+        [],
+        [None, True],
+    ]
+    assert ak.strings.length(array[["triggers"]]).tolist() == [
+        {"triggers": [11, 9]},
+        {"triggers": []},
+        {"triggers": [None, 8]},
+    ]
+
+    with pytest.raises(ValueError):
+        ak.strings.length(array)
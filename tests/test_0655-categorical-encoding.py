@@ -0,0 +1,105 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def index_of(categorical):
+    return np.asarray(categorical.layout.index).tolist()
+
+
+def test_numbers():
+    array = ak.Array([3, 1, 3, 2, 1, 3])
+    categorical = ak.to_categorical(array)
+    assert ak.categories(categorical).tolist() == [3, 1, 2]
+    assert index_of(categorical) == [0, 1, 0, 2, 1, 0]
+    assert categorical.tolist() == array.tolist()
+
+    nan = float("nan")
+    categorical = ak.to_categorical(ak.Array([1.1, -0.0, 0.0, nan, 1.1, nan]))
+    assert ak.categories(categorical).tolist()[:2] == [1.1, 0.0]
+    assert np.isnan(ak.categories(categorical).tolist()[2])
+    assert index_of(categorical) == [0, 1, 1, 2, 0, 2]
+
+    regular = ak.to_categorical(np.array([[1, 2], [3, 4], [1, 2]]))
+    assert ak.categories(regular).tolist() == [1, 2, 3, 4]
+
+
+def test_strings():
+    array = ak.Array([["one", "two", "", "one"], [], ["", "two", "three"]])
+    categorical = ak.to_categorical(array)
+    assert ak.categories(categorical).tolist() == ["one", "two", "", "three"]
+    assert categorical.tolist() == array.tolist()
+    assert categorical[1:].tolist() == array[1:].tolist()
+
+    bytestrings = ak.to_categorical(ak.Array([b"\x00", b"", b"\x00\x00", b"\x00"]))
+    assert index_of(bytestrings) == [0, 1, 2, 0]
+
+
+def test_options():
+    array = ak.Array(["one", None, "two", "one", None])
+    categorical = ak.to_categorical(array)
+    assert ak.categories(categorical).tolist() == ["one", "two"]
+    assert index_of(categorical) == [0, -1, 1, 0, -1]
+
+
+def test_records():
+    array = ak.Array(
+        [
+            {"x": 1, "y": "a", "z": [1.1, 2.2]},
+            {"x": 1, "y": "a", "z": [1.1]},
+            {"x": 1, "y": "a", "z": [1.1, 2.2]},
+            {"x": 2, "y": None, "z": []},
+            {"x": 2, "y": None, "z": []},
+            {"x": 2, "y": "b", "z": []},
+        ]
+    )
+    categorical = ak.to_categorical(array)
+    assert len(ak.categories(categorical)) == 4
+    assert index_of(categorical) == [0, 1, 0, 2, 2, 3]
+    assert categorical.tolist() == array.tolist()
+
+
+def test_empty():
+    categorical = ak.to_categorical(ak.Array(np.array([], np.float64)))
+    assert ak.categories(categorical).tolist() == []
+    assert index_of(categorical) == []
+
+    regular = ak.to_categorical(np.zeros((0, 3), np.int32))
+    assert ak.categories(regular).tolist() == []
+
+    array = ak.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": []}])[:0]
+    categorical = ak.to_categorical(array)
+    assert index_of(categorical) == []
+    assert categorical.tolist() == []
+
+
+def test_equal():
+    one = ak.to_categorical(ak.Array(["x", "y", "z", "x", None]))
+    two = ak.to_categorical(ak.Array(["z", "x", "w", "x", "y"]))
+    assert (one == two).tolist() == [False, False, False, True, False]
+    assert (one == one).tolist() == [True, True, True, True, True]
+
+    three = ak.to_categorical(ak.Array([[1, 2], [3], [1, 2]]))
+    four = ak.to_categorical(ak.Array([[2, 2], [3], [1, 1]]))
+    assert (three == four).tolist() == [[False, True], [True], [True, False]]
+
+
+def test_dictionary_encode_ranges():
+    data = ak.layout.NumpyArray(np.array([97, 98, 99, 97, 98], np.uint8))
+
+    def encode(starts, stops):
+        return np.asarray(
+            data.dictionary_encode(
+                ak.layout.Index64(np.array(starts, np.int64)),
+                ak.layout.Index64(np.array(stops, np.int64)),
+            )
+        ).tolist()
+
+    assert encode([0, 3, 1, 2], [2, 5, 3, 2]) == [0, 0, 1, 2]
+    for starts, stops in [([0, 0], [3, 100000]), ([-1], [1]), ([2], [1]), ([0], [6])]:
+        with pytest.raises(ValueError):
+            encode(starts, stops)
@@ -0,0 +1,91 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_against_numpy():
+    data = np.random.RandomState(12345).normal(1000, 3, (5, 7))
+    weight = np.random.RandomState(54321).uniform(0, 1, (5, 7))
+    array = ak.Array(data.tolist())
+
+    assert np.allclose(ak.to_numpy(ak.mean(array, axis=1)), np.mean(data, axis=1))
+    assert np.allclose(ak.to_numpy(ak.var(array, axis=1)), np.var(data, axis=1))
+    assert np.allclose(
+        ak.to_numpy(ak.std(array, axis=1, ddof=1)), np.std(data, axis=1, ddof=1)
+    )
+    assert np.allclose(ak.to_numpy(ak.var(array, axis=0)), np.var(data, axis=0))
+    assert np.allclose(ak.to_numpy(ak.var(array)), np.var(data))
+    assert np.allclose(
+        ak.to_numpy(ak.mean(array, weight=weight, axis=1)),
+        np.average(data, weights=weight, axis=1),
+    )
+
+    x, y = data, 2 * data + np.random.RandomState(0).normal(0, 1, (5, 7))
+    for i in range(5):
+        assert np.allclose(
+            ak.covar(ak.Array(x.tolist()), ak.Array(y.tolist()), axis=1)[i],
+            np.cov(x[i], y[i], bias=True)[0, 1],
+        )
+        assert np.allclose(
+            ak.corr(ak.Array(x.tolist()), ak.Array(y.tolist()), axis=1)[i],
+            np.corrcoef(x[i], y[i])[0, 1],
+        )
+        slope, intercept = np.polyfit(x[i], y[i], 1)
+        fit = ak.linear_fit(ak.Array(x.tolist()), ak.Array(y.tolist()), axis=1)[i]
+        assert np.allclose(fit.slope, slope)
+        assert np.allclose(fit.intercept, intercept)
+
+
+def test_jagged_and_missing():
+    array = ak.Array([[0, 1, 2, 3], [], [4, None, 5], [7, 7, 7]])
+    assert ak.mean(array, axis=1).tolist() == [1.5, None, 4.5, 7.0]
+    assert ak.var(array, axis=1).tolist() == [1.25, None, 0.25, 0.0]
+    assert ak.std(array, axis=1).tolist() == [np.sqrt(1.25), None, 0.5, 0.0]
+    assert ak.var(array, axis=1, keepdims=True).tolist() == [
+        [1.25],
+        [None],
+        [0.25],
+        [0.0],
+    ]
+    unmasked = ak.var(array, axis=1, mask_identity=False).tolist()
+    assert np.isnan(unmasked[1])
+    assert unmasked[:1] + unmasked[2:] == [1.25, 0.25, 0.0]
+
+    values = [0, 1, 2, 3, 4, 5, 7, 7, 7]
+    assert ak.mean(array) == pytest.approx(np.mean(values))
+    assert ak.var(array) == pytest.approx(np.var(values))
+    assert ak.var(array, weight=array) == pytest.approx(
+        np.average((values - np.average(values, weights=values)) ** 2, weights=values)
+    )
+
+
+def test_moments():
+    array = ak.Array([[0, 1, 2, 3], [], [4, 5]])
+    assert ak.moments(array, axis=1).tolist() == [
+        {"sumw": 4.0, "mean": 1.5, "var": 1.25, "std": np.sqrt(1.25)},
+        {"sumw": None, "mean": None, "var": None, "std": None},
+        {"sumw": 2.0, "mean": 4.5, "var": 0.25, "std": 0.5},
+    ]
+
+    out = ak.moments(array, array * 2 + 1, weight=2)
+    assert out.sumw == 12
+    assert out.mean == pytest.approx(2.5)
+    assert out.var == pytest.approx(np.var([0, 1, 2, 3, 4, 5]))
+    assert out.covar == pytest.approx(2 * np.var([0, 1, 2, 3, 4, 5]))
+    assert out.corr == pytest.approx(1.0)
+
+    out = ak.moments(array, ddof=1, axis=1)
+    assert out.var.tolist() == ak.var(array, ddof=1, axis=1).tolist()
+
+
+def test_partitioned():
+    array = ak.repartition(ak.Array([[1, 2], [3], [4.0, 5, 6]]), 2)
+    assert isinstance(array.layout, ak.partition.PartitionedArray)
+    assert ak.var(array, axis=1).tolist() == pytest.approx([0.25, 0, 2 / 3.0])
+    out = ak.moments(array, axis=1)
+    assert isinstance(out.layout, ak.partition.PartitionedArray)
+    assert out.mean.tolist() == [1.5, 3.0, 5.0]
@@ -0,0 +1,117 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_against_numpy():
+    random = np.random.RandomState(12345)
+    data = random.normal(0, 1, 1000)
+    counts = random.poisson(3, 300)
+    counts = counts[counts.cumsum() <= len(data)]
+    array = ak.unflatten(data[: counts.sum()], counts)
+
+    for selection in (slice(None), slice(5, 50), [3, 1, 2, 100]):
+        x = array[selection]
+        flat = ak.to_numpy(ak.flatten(x))
+
+        counts, edges = ak.histogram(x, bins=20)
+        expected_counts, expected_edges = np.histogram(flat, bins=20)
+        assert counts.tolist() == expected_counts.tolist()
+        assert np.allclose(edges, expected_edges)
+
+        counts, edges = ak.histogram(x, bins=[-3, -1, 0, 0.5, 3])
+        assert (
+            counts.tolist() == np.histogram(flat, bins=[-3, -1, 0, 0.5, 3])[0].tolist()
+        )
+
+        counts, edges = ak.histogram(x, bins=7, range=(-2, 2), axis=-1)
+        assert counts.tolist() == [
+            np.histogram(y, bins=7, range=(-2, 2))[0].tolist() for y in x.tolist()
+        ]
+
+
+def test_missing_and_nested():
+    array = ak.Array([[1.1, 2.2, None, 3.3], [], [4.4, 5.5]])
+    counts, edges = ak.histogram(array, bins=2, range=(0, 6))
+    assert counts.tolist() == [2, 3]
+    assert edges.tolist() == [0, 3, 6]
+
+    counts, edges = ak.histogram(array, bins=2, range=(0, 6), axis=-1)
+    assert str(counts.type) == "3 * 2 * int64"
+    assert counts.tolist() == [[2, 1], [0, 0], [0, 2]]
+
+    array = ak.Array([[[1, 2], [3]], None, [[4, None, 5]]])
+    counts, edges = ak.histogram(array, bins=5, range=(0.5, 5.5), axis=-1)
+    assert counts.tolist() == [
+        [[1, 1, 0, 0, 0], [0, 0, 1, 0, 0]],
+        None,
+        [[0, 0, 0, 1, 1]],
+    ]
+    counts, edges = ak.histogram(array[[2, 0]], bins=5, range=(0.5, 5.5))
+    assert counts.tolist() == [1, 1, 1, 1, 1]
+
+    union = ak.layout.UnionArray8_64(
+        ak.layout.Index8(np.array([0, 1, 0, 1], np.int8)),
+        ak.layout.Index64(np.array([0, 0, 1, 1], np.int64)),
+        [
+            ak.layout.NumpyArray(np.array([1, 2], np.int64)),
+            ak.layout.NumpyArray(np.array([0.5, 2.5])),
+        ],
+    )
+    counts, edges = ak.histogram(union, bins=3, range=(0, 3))
+    assert counts.tolist() == [1, 1, 2]
+
+
+def test_weights_and_masks():
+    array = ak.Array([[1.1, 2.2, None, 3.3], [], [4.4, 5.5]])
+    weight = ak.Array([[1, 2, 3, 4], [], [5, 6]])
+
+    counts, edges = ak.histogram(array, bins=2, range=(0, 6), weight=weight)
+    assert counts.tolist() == [3, 15]
+    counts, edges = ak.histogram(array, bins=2, range=(0, 6), weight=weight, axis=-1)
+    assert counts.tolist() == [[3, 4], [0, 0], [0, 11]]
+    counts, edges = ak.histogram(array, bins=2, range=(0, 6), weight=0.5)
+    assert counts.tolist() == [1, 1.5]
+
+    counts, edges = ak.histogram(array, bins=2, range=(0, 6), mask=array > 2)
+    assert counts.tolist() == [1, 3]
+    counts, edges = ak.histogram(array, bins=2, range=(0, 6), mask=array > 2, axis=-1)
+    assert counts.tolist() == [[1, 1], [0, 0], [0, 2]]
+    counts, edges = ak.histogram(array, bins=2, range=(0, 6), mask=False)
+    assert counts.tolist() == [0, 0]
+
+
+def test_rectangular_numpy():
+    data = np.arange(24, dtype=np.float64).reshape(2, 3, 4)
+
+    counts, edges = ak.histogram(ak.Array(data[0]), bins=2, range=(0, 12), axis=-1)
+    assert counts.tolist() == [
+        np.histogram(x, bins=2, range=(0, 12))[0].tolist() for x in data[0]
+    ]
+
+    counts, edges = ak.histogram(ak.Array(data), bins=3, range=(0, 24), axis=-1)
+    assert counts.tolist() == [
+        [np.histogram(x, bins=3, range=(0, 24))[0].tolist() for x in y] for y in data
+    ]
+
+    counts, edges = ak.histogram(ak.Array(data), bins=3, range=(0, 24))
+    assert counts.tolist() == np.histogram(data, bins=3, range=(0, 24))[0].tolist()
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak.histogram(ak.Array(["one", "two"]))
+    with pytest.raises(ValueError):
+        ak.histogram(ak.Array([[1, 2]]), axis=0)
+    with pytest.raises(ValueError):
+        ak.histogram(ak.Array([1, 2]), bins=[2, 1])
+    with pytest.raises(ValueError):
+        ak.histogram(ak.Array([{"x": 1, "y": 2}]))
+    with pytest.raises(ValueError):
+        ak.histogram(ak.Array([[{"y": 1}], []]), axis=-1)
+    with pytest.raises(ValueError):
+        ak.histogram(ak.Array([{"x": 1, "y": 2}]), weight=ak.Array([1.0]))
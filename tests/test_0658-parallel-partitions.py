@@ -0,0 +1,101 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+futures = pytest.importorskip("concurrent.futures")
+ThreadPoolExecutor = futures.ThreadPoolExecutor
+
+
+def partitioned(length, seed=12345):
+    random = np.random.RandomState(seed)
+    counts = random.poisson(5, length)
+    array = ak.unflatten(random.normal(size=counts.sum()), counts)
+    return ak.repartition(array, length // 10)
+
+
+def test_setting():
+    executor = ThreadPoolExecutor(4)
+    with ak.partition.set_executor(executor, 2):
+        assert ak.partition._executor is executor
+        assert ak.partition._max_in_flight == 2
+        with ak.partition.set_executor(None):
+            assert ak.partition._executor is None
+        assert ak.partition._executor is executor
+    assert ak.partition._executor is None
+    assert ak.partition._max_in_flight is None
+    executor.shutdown()
+
+    for bad in (0, -1, 2.5, "4"):
+        with pytest.raises(ValueError):
+            ak.partition.set_executor(None, bad)
+
+
+def test_order_and_in_flight():
+    lock = threading.Lock()
+    state = {"running": 0, "most": 0}
+
+    def function(x):
+        with lock:
+            state["running"] += 1
+            state["most"] = max(state["most"], state["running"])
+        try:
+            return x * 10
+        finally:
+            with lock:
+                state["running"] -= 1
+
+    with ThreadPoolExecutor(8) as executor:
+        with ak.partition.set_executor(executor, 3):
+            assert ak.partition.map_partitions(function, range(100)) == [
+                x * 10 for x in range(100)
+            ]
+    assert state["most"] <= 3
+
+
+def test_exception():
+    def function(x):
+        if x == 5:
+            raise ValueError("five")
+        return x
+
+    with ThreadPoolExecutor(4) as executor:
+        with ak.partition.set_executor(executor, 2):
+            with pytest.raises(ValueError):
+                ak.partition.map_partitions(function, range(10))
+
+
+def test_operations():
+    array = partitioned(1000)
+    expected = {
+        "sum": ak.to_list(ak.sum(array, axis=1)),
+        "max": ak.to_list(ak.max(array, axis=1)),
+        "min": ak.to_list(ak.min(ak.repartition(array, None), axis=1, initial=0)),
+        "num": ak.to_list(ak.num(array)),
+        "ufunc": ak.to_list(np.sqrt(array * array)),
+        "flatten": ak.to_list(ak.flatten(array)),
+        "pairs": ak.to_list(ak.num(ak.combinations(array, 2))),
+        "fill_none": ak.to_list(ak.fill_none(ak.pad_none(array, 3), 0)),
+    }
+    with ThreadPoolExecutor(4) as executor:
+        with ak.partition.set_executor(executor, 4):
+            out = ak.sum(array, axis=1)
+            assert ak.partitions(out) == ak.partitions(array)
+            assert ak.to_list(out) == expected["sum"]
+            assert ak.to_list(ak.max(array, axis=1)) == expected["max"]
+            assert ak.to_list(ak.min(array, axis=1, initial=0)) == expected["min"]
+            assert ak.to_list(ak.num(array)) == expected["num"]
+            assert ak.to_list(np.sqrt(array * array)) == expected["ufunc"]
+            assert ak.to_list(ak.flatten(array)) == expected["flatten"]
+            assert (
+                ak.to_list(ak.num(ak.combinations(array, 2))) == expected["pairs"]
+            )
+            assert (
+                ak.to_list(ak.fill_none(ak.pad_none(array, 3), 0))
+                == expected["fill_none"]
+            )
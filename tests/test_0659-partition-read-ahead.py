@@ -0,0 +1,119 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+futures = pytest.importorskip("concurrent.futures")
+
+
+class Cache(MutableMapping):
+    # ArrayCache keeps a weak reference to its mapping, which a dict can't have
+    def __init__(self):
+        self.data = {}
+
+    def __getitem__(self, where):
+        return self.data[where]
+
+    def __setitem__(self, where, what):
+        self.data[where] = what
+
+    def __delitem__(self, where):
+        del self.data[where]
+
+    def __iter__(self):
+        for x in self.data:
+            yield x
+
+    def __len__(self):
+        return len(self.data)
+
+
+def lazy_records(numpartitions, cache, calls):
+    def generate(field, partition):
+        calls.append((field, partition, threading.current_thread().name))
+        return ak.layout.NumpyArray(np.arange(10) + 100 * partition)
+
+    cache = ak.layout.ArrayCache(cache)
+    partitions = []
+    for partition in range(numpartitions):
+        fields = []
+        for field in ("x", "y"):
+            generator = ak.layout.ArrayGenerator(
+                generate,
+                (field, partition),
+                form=ak.forms.NumpyForm([], 8, "l"),
+                length=10,
+            )
+            fields.append(
+                ak.layout.VirtualArray(
+                    generator, cache, "{0}[{1}]".format(field, partition)
+                )
+            )
+        partitions.append(ak.layout.RecordArray(fields, ["x", "y"]))
+    return ak.Array(ak.partition.IrregularlyPartitionedArray(partitions))
+
+
+def test_touched_columns():
+    cache = Cache()
+    calls = []
+    array = lazy_records(6, cache, calls)
+
+    out = []
+    for partition in ak.partition.read_ahead(array, 2):
+        assert isinstance(partition, ak.Array)
+        out.append(ak.sum(partition.x))
+    assert out == [45 + 1000 * i for i in range(6)]
+
+    assert sorted((field, i) for field, i, name in calls) == [
+        ("x", i) for i in range(6)
+    ]
+    main = threading.current_thread().name
+    assert [name == main for field, i, name in sorted(calls)] == [
+        True,
+        False,
+        False,
+        False,
+        False,
+        False,
+    ]
+    assert set(cache) == set("x[{0}]".format(i) for i in range(6))
+
+
+def test_nothing_touched():
+    cache = Cache()
+    calls = []
+    array = lazy_records(4, cache, calls)
+    assert len(list(ak.partition.read_ahead(array, 3))) == 4
+    assert calls == []
+
+
+def test_executor_and_layouts():
+    cache = Cache()
+    calls = []
+    layout = lazy_records(4, cache, calls).layout
+    with futures.ThreadPoolExecutor(2) as executor:
+        for partition in ak.partition.read_ahead(layout, 1, executor=executor):
+            assert isinstance(partition, ak.layout.RecordArray)
+            ak.to_list(partition)
+    assert len(calls) == 8
+    assert set(cache) == set(
+        "{0}[{1}]".format(field, i) for field in ("x", "y") for i in range(4)
+    )
+
+
+def test_bad_numpartitions():
+    cache = Cache()
+    array = lazy_records(2, cache, [])
+    for bad in (0, -1, 1.5):
+        with pytest.raises(ValueError):
+            list(ak.partition.read_ahead(array, bad))
@@ -0,0 +1,175 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+form = ak.forms.Form.fromjson(
+    """
+{"class": "ListOffsetArray64",
+ "offsets": "i64",
+ "content": {"class": "RecordArray",
+             "contents": {"x": "int64",
+                          "y": {"class": "IndexedOptionArray64",
+                                "index": "i64",
+                                "content": "float64"},
+                          "z": {"class": "RegularArray",
+                                "size": 2,
+                                "content": "int32"}}}}
+"""
+)
+
+
+def fill(builder):
+    records = builder.content
+    for i in range(3):
+        builder.begin_list()
+        for j in range(i):
+            records.begin_record()
+            records.field("x").append(i + j - 1)
+            if (i + j) % 2 == 0:
+                records.field("y").valid()
+                records.field("y").content.append(i + j - 1.5)
+            else:
+                records.field("y").null()
+            z = records.field("z")
+            z.begin_list()
+            z.content.append(i + j - 1)
+            z.content.append(2 * (i + j - 1))
+            z.end_list()
+            records.end_record()
+        builder.end_list()
+
+
+def test_python():
+    builder = ak.TypedArrayBuilder(form, initial=16)
+    fill(builder)
+    assert len(builder) == 3
+    assert len(builder.content) == 3
+    array = builder.snapshot()
+    assert array.tolist() == [
+        [],
+        [{"x": 0, "y": None, "z": [0, 0]}],
+        [{"x": 1, "y": 0.5, "z": [1, 2]}, {"x": 2, "y": None, "z": [2, 4]}],
+    ]
+    assert array.layout.form.tojson() == form.tojson()
+    assert str(array.type) == '3 * var * {"x": int64, "y": ?float64, "z": 2 * int32}'
+
+
+def test_growth_and_snapshots():
+    builder = ak.TypedArrayBuilder(
+        '{"class": "ListOffsetArray32", "offsets": "i32", "content": "float32"}',
+        initial=16,
+    )
+    for i in range(100):
+        builder.begin_list()
+        for j in range(i % 5):
+            builder.content.append(j)
+        builder.end_list()
+        if i == 10:
+            old = builder.snapshot()
+    assert len(old) == 11
+    out = builder.snapshot()
+    assert out.tolist() == [list(range(i % 5)) for i in range(100)]
+    assert str(out.type) == "100 * var * float32"
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        ak.TypedArrayBuilder(
+            '{"class": "UnionArray8_64", "tags": "i8", "index": "i64", '
+            '"contents": ["int64"]}'
+        )
+
+    builder = ak.TypedArrayBuilder(form)
+    with pytest.raises(TypeError):
+        builder.append(1)
+    with pytest.raises(ValueError):
+        builder.content.field("nope")
+
+    z = builder.content.field("z")
+    z.content.append(1)
+    with pytest.raises(ValueError):
+        z.end_list()
+
+    with pytest.raises(ValueError):
+        builder.content.snapshot()
+
+    # a record whose fields have not all been filled
+    records = builder.content
+    builder.begin_list()
+    records.field("x").append(1)
+    records.end_record()
+    builder.end_list()
+    with pytest.raises(ValueError):
+        builder.snapshot()
+
+
+def test_numba():
+    numba = pytest.importorskip("numba")
+
+    @numba.njit
+    def fill_numba(builder):
+        records = builder.content
+        for i in range(3):
+            builder.begin_list()
+            for j in range(i):
+                records.begin_record()
+                records.field("x").append(i + j - 1)
+                y = records.field("y")
+                if (i + j) % 2 == 0:
+                    y.valid()
+                    y.content.append(i + j - 1.5)
+                else:
+                    y.null()
+                z = records.field("z")
+                z.begin_list()
+                z.content.append(i + j - 1)
+                z.content.append(2 * (i + j - 1))
+                z.end_list()
+                records.end_record()
+            builder.end_list()
+        return builder
+
+    python = ak.TypedArrayBuilder(form)
+    fill(python)
+
+    builder = ak.TypedArrayBuilder(form, initial=16)
+    out = fill_numba(builder)
+    assert builder.snapshot().tolist() == python.snapshot().tolist()
+    assert out.snapshot().tolist() == python.snapshot().tolist()
+
+    fill_numba(builder)
+    assert len(builder) == 6
+
+    # filling continues in Python after Numba has replaced the buffers
+    fill(builder)
+    assert len(builder) == 9
+    assert builder.snapshot().tolist() == 3 * python.snapshot().tolist()
+
+    builder = ak.TypedArrayBuilder(form)
+    assert isinstance(builder.numba_type, numba.types.Type)
+    assert isinstance(builder._root._buffers, list)
+
+
+def test_numba_many():
+    numba = pytest.importorskip("numba")
+
+    @numba.njit
+    def fill_numba(builder, n):
+        for i in range(n):
+            builder.begin_list()
+            for j in range(i % 4):
+                builder.content.append(j * 1.5)
+            builder.end_list()
+        return len(builder)
+
+    builder = ak.TypedArrayBuilder(
+        '{"class": "ListOffsetArray64", "offsets": "i64", "content": "float64"}'
+    )
+    assert fill_numba(builder, 100000) == 100000
+    out = builder.snapshot()
+    assert ak.to_list(ak.num(out)[:8]) == [0, 1, 2, 3, 0, 1, 2, 3]
+    assert ak.sum(out) == 25000 * (1.5 + 1.5 + 3.0)
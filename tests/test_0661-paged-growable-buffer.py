@@ -0,0 +1,65 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import json
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def records(n):
+    out = []
+    for i in range(n):
+        out.append(
+            {
+                "x": i,
+                "y": [j * 1.1 for j in range(i % 7)],
+                "z": None if i % 3 == 0 else str(i),
+                "w": i % 2 == 0,
+            }
+        )
+    return out
+
+
+@pytest.mark.parametrize("page_length", [1, 7, 64, 1000])
+def test_from_iter(page_length):
+    data = records(1000)
+    expected = ak.from_iter(data, initial=8)
+    paged = ak.from_iter(data, initial=8, page_length=page_length)
+    assert ak.to_list(paged) == data
+    assert paged.layout.form == expected.layout.form
+
+
+def test_snapshots_while_paging():
+    builder = ak.ArrayBuilder(initial=4, page_length=16)
+    snapshots = []
+    for i in range(200):
+        builder.begin_list()
+        for j in range(i % 5):
+            builder.real(i + j * 0.5)
+        builder.end_list()
+        if i % 37 == 0:
+            snapshots.append((i + 1, builder.snapshot()))
+
+    expected = [[i + j * 0.5 for j in range(i % 5)] for i in range(200)]
+    assert ak.to_list(builder.snapshot()) == expected
+    for length, snapshot in snapshots:
+        assert ak.to_list(snapshot) == expected[:length]
+
+
+def test_int_to_float_promotion():
+    builder = ak.ArrayBuilder(initial=2, page_length=3)
+    for i in range(10):
+        builder.integer(i)
+    builder.real(10.5)
+    assert ak.to_list(builder.snapshot()) == list(range(10)) + [10.5]
+
+
+def test_from_json():
+    data = records(500)
+    text = json.dumps(data)
+    expected = ak.from_json(text, initial=8)
+    paged = ak.from_json(text, initial=8, page_length=10)
+    assert ak.to_list(paged) == ak.to_list(expected)
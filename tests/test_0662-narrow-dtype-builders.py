@@ -0,0 +1,131 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [np.int8, np.int16, np.int32, np.uint8, np.uint16, np.uint32, np.uint64],
+)
+def test_integers(dtype):
+    builder = ak.ArrayBuilder()
+    for i in range(10):
+        builder.integer(i, dtype)
+    out = builder.snapshot()
+    assert ak.to_list(out) == list(range(10))
+    assert ak.to_numpy(out).dtype == np.dtype(dtype)
+
+
+def test_reals_and_complex():
+    builder = ak.ArrayBuilder()
+    builder.begin_list()
+    builder.real(1.5, np.float32)
+    builder.real(2.5, "float32")
+    builder.end_list()
+    builder.begin_list()
+    builder.end_list()
+    out = builder.snapshot()
+    assert ak.to_list(out) == [[1.5, 2.5], []]
+    assert str(out.type) == "2 * var * float32"
+
+    builder = ak.ArrayBuilder()
+    builder.complex(1 + 2j, np.complex64)
+    builder.complex(3, np.complex64)
+    out = builder.snapshot()
+    assert ak.to_list(out) == [1 + 2j, 3 + 0j]
+    assert ak.to_numpy(out).dtype == np.dtype(np.complex64)
+
+    builder = ak.ArrayBuilder()
+    builder.complex(1 + 2j)
+    assert ak.to_numpy(builder.snapshot()).dtype == np.dtype(np.complex128)
+
+
+def test_options_and_mixing():
+    builder = ak.ArrayBuilder()
+    builder.null()
+    builder.integer(1, np.int16)
+    builder.null()
+    builder.integer(2, np.int16)
+    out = builder.snapshot()
+    assert ak.to_list(out) == [None, 1, None, 2]
+    assert str(out.type) == "4 * ?int16"
+
+    builder = ak.ArrayBuilder()
+    builder.integer(1, np.int8)
+    builder.integer(1000)
+    out = builder.snapshot()
+    assert ak.to_list(out) == [1, 1000]
+    assert ak.to_numpy(out).dtype == np.dtype(np.int64)
+
+    builder = ak.ArrayBuilder()
+    builder.integer(5, np.int64)
+    builder.real(1.5, np.float64)
+    out = builder.snapshot()
+    assert ak.to_list(out) == [5, 1.5]
+    assert str(out.type) == "2 * float64"
+
+    with pytest.raises(ValueError):
+        ak.ArrayBuilder().integer(1, np.float16)
+
+
+def test_from_iter():
+    data = [
+        {"flag": 1, "adc": [1.5, 2.5], "id": 123},
+        {"flag": 0, "adc": [], "id": 124},
+    ]
+    out = ak.from_iter(data, dtype={"flag": np.uint8, "adc": np.float32})
+    assert ak.to_list(out) == data
+    assert str(out.type) == '2 * {"flag": uint8, "adc": var * float32, "id": int64}'
+
+    out = ak.from_iter([[1, 2, 3], [], [4]], dtype=np.int32)
+    assert ak.to_list(out) == [[1, 2, 3], [], [4]]
+    assert str(out.type) == "3 * var * int32"
+
+    out = ak.from_iter([1 + 1j, 2.5, np.complex64(3)])
+    assert ak.to_list(out) == [1 + 1j, 2.5 + 0j, 3 + 0j]
+
+
+def test_numba():
+    numba = pytest.importorskip("numba")
+
+    @numba.njit
+    def fill(builder, n):
+        for i in range(n):
+            builder.begin_list()
+            for j in range(i % 3):
+                builder.integer(j, np.int8)
+            builder.end_list()
+            builder.real(i * 0.5, np.float32)
+            builder.complex(i + 1j, np.complex64)
+        return builder
+
+    builder = fill(ak.ArrayBuilder(), 4)
+    out = builder.snapshot()
+    assert ak.to_list(out) == [
+        [],
+        0.0,
+        1j,
+        [0],
+        0.5,
+        1 + 1j,
+        [0, 1],
+        1.0,
+        2 + 1j,
+        [],
+        1.5,
+        3 + 1j,
+    ]
+
+    @numba.njit
+    def fill_flags(builder, flags):
+        for flag in flags:
+            builder.integer(flag, np.uint8)
+        return builder
+
+    out = fill_flags(ak.ArrayBuilder(), np.array([1, 0, 255], np.uint8)).snapshot()
+    assert ak.to_numpy(out).dtype == np.dtype(np.uint8)
+    assert ak.to_list(out) == [1, 0, 255]
@@ -0,0 +1,139 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.mark.parametrize("page_length", [0, 7])
+def test_numpy(page_length):
+    builder = ak.ArrayBuilder(initial=4, page_length=page_length)
+    builder.extend(np.arange(10, dtype=np.float32))
+    builder.extend(np.arange(10, 20, dtype=np.float32)[::2])
+    out = builder.snapshot()
+    assert ak.to_list(out) == list(range(10)) + list(range(10, 20, 2))
+    assert str(out.type) == "15 * float32"
+
+    builder = ak.ArrayBuilder()
+    builder.extend(np.array([1, 2, 3]))
+    builder.null()
+    builder.extend(np.array([4.5]))
+    assert ak.to_list(builder.snapshot()) == [1, 2, 3, None, 4.5]
+
+    builder = ak.ArrayBuilder()
+    builder.extend(np.arange(6, dtype=np.int16).reshape(3, 2))
+    out = builder.snapshot()
+    assert ak.to_list(out) == [[0, 1], [2, 3], [4, 5]]
+    assert str(out.type) == "3 * var * int16"
+
+    with pytest.raises(TypeError):
+        builder.extend(np.int16(3))
+    with pytest.raises(TypeError):
+        builder.extend([1, 2, 3])
+
+
+def test_append_numpy():
+    builder = ak.ArrayBuilder()
+    builder.append(np.array([1.5, 2.5], np.float32))
+    builder.append(np.array([], np.float32))
+    builder.begin_list()
+    builder.real(3.5, np.float32)
+    builder.end_list()
+    out = builder.snapshot()
+    assert ak.to_list(out) == [[1.5, 2.5], [], [3.5]]
+    assert str(out.type) == "3 * var * float32"
+
+
+def test_copy_awkward():
+    one = ak.Array([[1.1, 2.2], [], [3.3]])
+    two = ak.Array([[4.4], [5.5, 6.6]])
+    builder = ak.ArrayBuilder()
+    builder.extend(one, copy=True)
+    builder.extend(two[1:], copy=True)
+    builder.extend(one[1:], copy=True)
+    out = builder.snapshot()
+    assert ak.to_list(out) == [[1.1, 2.2], [], [3.3], [5.5, 6.6], [], [3.3]]
+    assert isinstance(out.layout, ak.layout.ListOffsetArray64)
+    assert isinstance(out.layout.content, ak.layout.NumpyArray)
+
+    builder = ak.ArrayBuilder()
+    builder.extend(one)
+    assert isinstance(builder.snapshot().layout, ak.layout.IndexedArray64)
+
+
+def test_copy_mixed():
+    array = ak.Array(
+        [
+            {"x": 1, "y": "one", "z": [1.1]},
+            {"x": 2, "y": "two", "z": None},
+            None,
+            {"x": 3, "y": "three", "z": [3.3, 4.4]},
+        ]
+    )
+    builder = ak.ArrayBuilder()
+    builder.extend(array, copy=True)
+    builder.extend(array[:1], copy=True)
+    out = builder.snapshot()
+    assert ak.to_list(out) == ak.to_list(array) + ak.to_list(array[:1])
+
+    strings = ak.Array(["one", "two", "three"])
+    builder = ak.ArrayBuilder()
+    builder.extend(strings, copy=True)
+    builder.string("four")
+    builder.extend(strings[::-1], copy=True)
+    out = builder.snapshot()
+    assert ak.to_list(out) == ["one", "two", "three", "four", "three", "two", "one"]
+    assert str(out.type) == "7 * string"
+
+
+def test_copy_record_name():
+    points = ak.with_name(ak.Array([{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}]), "Point")
+    nested = ak.Array([[{"x": 3, "y": 3.3}], []])
+    nested = ak.with_name(nested, "Point")
+
+    builder = ak.ArrayBuilder()
+    builder.extend(points, copy=True)
+    builder.extend(points[1:], copy=True)
+    out = builder.snapshot()
+    assert ak.to_list(out) == ak.to_list(points) + ak.to_list(points[1:])
+    assert out.layout.parameter("__record__") == "Point"
+
+    builder = ak.ArrayBuilder()
+    builder.extend(nested, copy=True)
+    out = builder.snapshot()
+    assert ak.to_list(out) == ak.to_list(nested)
+    assert out.layout.content.parameter("__record__") == "Point"
+
+    categories = ak.to_categorical(ak.Array(["one", "two", "one"]))
+    builder = ak.ArrayBuilder()
+    builder.extend(categories, copy=True)
+    out = builder.snapshot()
+    assert ak.to_list(out) == ["one", "two", "one"]
+    assert out.layout.parameter("__array__") == "string"
+
+
+def test_copy_records_by_field():
+    one = ak.Array([{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}])
+    two = ak.Array([{"y": 3.3, "z": [3]}])
+    builder = ak.ArrayBuilder()
+    builder.extend(one, copy=True)
+    builder.extend(two, copy=True)
+    builder.extend(one[:0], copy=True)
+    out = builder.snapshot()
+    assert ak.to_list(out) == [
+        {"x": 1, "y": 1.1, "z": None},
+        {"x": 2, "y": 2.2, "z": None},
+        {"x": None, "y": 3.3, "z": [3]},
+    ]
+    assert isinstance(out.layout, ak.layout.RecordArray)
+
+    tuples = ak.Array([(1, [1.1]), (2, [])])
+    builder = ak.ArrayBuilder()
+    builder.extend(tuples, copy=True)
+    builder.extend(tuples[::-1], copy=True)
+    out = builder.snapshot()
+    assert ak.to_list(out) == [(1, [1.1]), (2, []), (2, []), (1, [1.1])]
+    assert isinstance(out.layout, ak.layout.RecordArray)
+    assert out.layout.istuple
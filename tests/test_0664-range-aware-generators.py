@@ -0,0 +1,105 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_virtual():
+    calls = []
+
+    def generate(start=None, stop=None):
+        calls.append((start, stop))
+        return ak.Array(np.arange(100) * 1.1)[start:stop]
+
+    array = ak.virtual(generate, length=100, form="float64", accepts_range=True)
+    assert array.layout.generator.accepts_range
+
+    assert ak.to_list(array[10:13]) == ak.to_list(np.arange(10, 13) * 1.1)
+    assert calls == [(10, 13)]
+    del calls[:]
+
+    assert ak.to_list(array[50:60][-3:]) == ak.to_list(np.arange(57, 60) * 1.1)
+    assert calls == [(57, 60)]
+    del calls[:]
+
+    assert len(array[95:200]) == 5
+    assert ak.to_list(array[95:200]) == ak.to_list(np.arange(95, 100) * 1.1)
+    assert calls == [(95, 100)]
+    del calls[:]
+
+    assert ak.to_list(array) == ak.to_list(np.arange(100) * 1.1)
+    assert calls == [(None, None)]
+    del calls[:]
+
+    # once the whole array is in the cache, slices take it from there
+    assert ak.to_list(array[10:13]) == ak.to_list(np.arange(10, 13) * 1.1)
+    assert calls == []
+
+    array = ak.virtual(generate, length=100, form="float64")
+    assert not array.layout.generator.accepts_range
+    assert ak.to_list(array[10:11]) == ak.to_list(np.arange(10, 11) * 1.1)
+    assert calls == [(None, None)]
+
+
+class Buffer(object):
+    def __init__(self, data, log):
+        self.data = data
+        self.log = log
+        self.dtype = data.dtype
+        self.ndim = data.ndim
+
+    def __getitem__(self, where):
+        self.log.append((where.start, where.stop))
+        return self.data[where]
+
+    def __array__(self, *args, **kwargs):
+        self.log.append(None)
+        return self.data
+
+
+def test_from_buffers():
+    array = ak.Array(
+        [
+            {"x": [1.1, 2.2], "y": 1},
+            {"x": [], "y": 2},
+            {"x": [3.3], "y": 3},
+            {"x": [4.4, 5.5, 6.6], "y": 4},
+            {"x": [7.7], "y": 5},
+        ]
+    )
+    form, length, container = ak.to_buffers(array)
+    log = []
+    container = dict(
+        (key, Buffer(np.asarray(value).view(np.uint8), log))
+        for key, value in container.items()
+    )
+
+    lazy = ak.from_buffers(form, length, container, lazy=True)
+    assert ak.to_list(lazy[2:4]) == ak.to_list(array[2:4])
+    assert len(log) != 0
+    assert None not in log
+
+    del log[:]
+    assert ak.to_list(lazy.x[3:]) == [[4.4, 5.5, 6.6], [7.7]]
+    assert None not in log
+
+    del log[:]
+    assert ak.to_list(lazy) == ak.to_list(array)
+    assert None in log
+
+
+def test_from_buffers_partitioned():
+    array = ak.repartition(ak.Array([[1, 2, 3], [], [4, 5], [6], [], [7, 8, 9]]), 3)
+    form, length, container = ak.to_buffers(array)
+    log = []
+    container = dict(
+        (key, Buffer(np.asarray(value).view(np.uint8), log))
+        for key, value in container.items()
+    )
+
+    lazy = ak.from_buffers(form, length, container, lazy=True)
+    assert ak.to_list(lazy[2:4]) == [[4, 5], [6]]
+    assert None not in log